@@ -0,0 +1,127 @@
+"""
+Execution history listing at scale.
+
+Fills a scratch database with N execution rows (with output/logs blobs), then compares the
+old unbounded ``SELECT *`` listing against Dashboard._get_execution_history, which pages by
+(started_at, id) over composite indexes and leaves the blobs out by default.
+
+Usage:
+    python demo/benchmarks/history_benchmark.py --rows 1000000 --blob 512
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from remoteinfra.blobs import OutputStore
+from remoteinfra.dashboard import Dashboard
+from remoteinfra.storage import Storage
+
+LEGACY_SCHEMA = """
+    CREATE TABLE execution_history (
+        id TEXT PRIMARY KEY, machine_id TEXT, type TEXT, status TEXT, command TEXT, output TEXT,
+        started_at TIMESTAMP, completed_at TIMESTAMP, duration REAL, logs TEXT
+    )
+"""
+
+
+def timed(fn, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def populate(storage, rows, blob, machines=50):
+    types = ["command", "python", "terraform", "ansible", "docker_run", "pipeline"]
+    statuses = ["success"] * 8 + ["failed", "cancelled"]
+    start = datetime.datetime.utcnow() - datetime.timedelta(days=365)
+    step = datetime.timedelta(days=365) / rows
+    payload = "x" * blob
+    with storage.transaction() as conn:
+        conn.execute(LEGACY_SCHEMA)
+        batch = []
+        for i in range(rows):
+            started = (start + step * i).strftime("%Y-%m-%d %H:%M:%S")
+            batch.append((str(uuid.uuid4()), f"m{random.randrange(machines)}", random.choice(types),
+                          random.choice(statuses), "echo benchmark", payload, started, started, 1.0, payload))
+            if len(batch) == 10000:
+                conn.executemany("INSERT INTO execution_history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                batch = []
+        if batch:
+            conn.executemany("INSERT INTO execution_history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--blob", type=int, default=512, help="bytes of output and of logs per row")
+    parser.add_argument("--pages", type=int, default=100, help="pages to walk for the deep-page timing")
+    parser.add_argument("--dir", default=None, help="directory for the scratch database")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".sqlite3", dir=args.dir)
+    os.close(fd)
+    os.remove(path)
+    storage = Storage(path)
+    try:
+        start = time.perf_counter()
+        populate(storage, args.rows, args.blob)
+        print(f"populated {args.rows} rows in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(path) / 2**20:.0f} MiB)")
+
+        # Old behaviour: every row, every column, no index
+        t, rows = timed(lambda: [dict(r) for r in storage.query(
+            "SELECT * FROM execution_history ORDER BY started_at DESC")], repeat=1)
+        print(f"legacy   full list                    {t * 1000:10.1f} ms  ({len(rows)} rows)")
+        rows = None
+        t, rows = timed(lambda: [dict(r) for r in storage.query(
+            "SELECT * FROM execution_history WHERE machine_id = ? AND status = ? ORDER BY started_at DESC",
+            ("m7", "failed"))], repeat=1)
+        print(f"legacy   machine+status filter        {t * 1000:10.1f} ms  ({len(rows)} rows)")
+        rows = None
+
+        # Same table after the dashboard's schema migration adds the indexes
+        dashboard = Dashboard.__new__(Dashboard)
+        dashboard.storage = storage
+        dashboard.outputs = OutputStore(storage)
+        start = time.perf_counter()
+        dashboard._init_db()
+        print(f"index build                           {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+        t, (page, cursor) = timed(lambda: dashboard._get_execution_history(limit=50))
+        print(f"keyset   first page (50)              {t * 1000:10.1f} ms")
+
+        def walk():
+            next_cursor = None
+            for _ in range(args.pages):
+                _, next_cursor = dashboard._get_execution_history(limit=50, cursor=next_cursor)
+            return next_cursor
+
+        deep_cursor = walk()
+        t, _ = timed(lambda: dashboard._get_execution_history(limit=50, cursor=deep_cursor))
+        print(f"keyset   page {args.pages + 1:<4d}(50)              {t * 1000:10.1f} ms")
+        t, _ = timed(lambda: dashboard._get_execution_history(
+            {"machine_id": "m7", "status": "failed"}, limit=50))
+        print(f"keyset   machine+status first page    {t * 1000:10.1f} ms")
+        t, _ = timed(lambda: dashboard._get_execution_history(
+            {"type": "terraform", "status": "failed"}, limit=50))
+        print(f"keyset   type+status first page       {t * 1000:10.1f} ms")
+        t, _ = timed(lambda: dashboard._get_execution_history(limit=50, fields=["id", "started_at", "output"]))
+        print(f"keyset   first page with output       {t * 1000:10.1f} ms")
+    finally:
+        storage.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+HTTP throughput of the dashboard's serving modes.
+
+Starts a dashboard with a scratch database and ``--machines`` machines in a subprocess, then
+has ``--clients`` threads (each with a keep-alive connection, spread over ``--load-processes``
+processes) request the endpoints the UI polls most for ``--duration`` seconds, and reports
+requests/sec and latency percentiles.
+Runs:
+
+* development - Flask-SocketIO's development server (Werkzeug, a new thread per connection)
+* production  - Dashboard.serve(mode="production"): pooled threads, no access log
+* production xN - the same with ``--workers`` processes sharing the port
+
+Each server is stopped with SIGTERM, which exercises the graceful shutdown.
+
+Usage:
+    PYTHONPATH=. python demo/benchmarks/serve_benchmark.py --clients 32 --duration 10 --workers 4
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import pty
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ENDPOINTS = ("/api/machines", "/api/execution-history?limit=50", "/api/machines/health")
+
+SERVER = """
+import sys
+from remoteinfra import Dashboard
+
+if __name__ == "__main__":
+    dashboard = Dashboard(host="127.0.0.1", port=int(sys.argv[1]))
+    dashboard.health.interval = 3600  # keep probes of the fake machines out of the measurement
+    dashboard.serve(mode=sys.argv[2], workers=int(sys.argv[3]))
+"""
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/machines")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("dashboard did not start")
+
+
+def seed(port, machines):
+    rows = [{"host": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}", "username": "bench", "port": 22}
+            for i in range(machines)]
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    conn.request("POST", "/api/machines/import", body=json.dumps({"machines": rows}),
+                 headers={"Content-Type": "application/json"})
+    conn.getresponse().read()
+
+
+def load(port, clients, duration):
+    """Latencies of successful requests and the error count of ``clients`` threads."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.time() + duration
+
+    def client(n):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        mine = []
+        i = n
+        while time.time() < stop_at:
+            path = ENDPOINTS[i % len(ENDPOINTS)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise OSError(response.status)
+                mine.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, errors[0]
+
+
+def measure(port, clients, duration, processes):
+    """Run the load from ``processes`` processes so the client side is not the bottleneck."""
+    shares = [clients // processes + (1 if n < clients % processes else 0) for n in range(processes)]
+    start = time.time()
+    with multiprocessing.Pool(processes) as pool:
+        parts = pool.starmap(load, [(port, share, duration) for share in shares if share])
+    elapsed = time.time() - start
+    latencies = sorted(latency for part, _ in parts for latency in part)
+    errors = sum(e for _, e in parts)
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {"rps": len(latencies) / elapsed, "p50": pct(0.50), "p99": pct(0.99), "errors": errors}
+
+
+def run(mode, workers, args):
+    workdir = tempfile.mkdtemp(prefix="remoteinfra-serve-")
+    script = os.path.join(workdir, "server.py")
+    with open(script, "w") as f:
+        f.write(SERVER)
+    port = free_port()
+    # The development server refuses to start without a terminal on stdin
+    master, slave = pty.openpty()
+    process = subprocess.Popen([sys.executable, script, str(port), mode, str(workers)], cwd=workdir,
+                               stdin=slave, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    try:
+        wait_ready(port)
+        seed(port, args.machines)
+        time.sleep(1)  # let other processes pick up the imported machines
+        result = measure(port, args.clients, args.duration, args.load_processes)
+        started = time.time()
+        process.send_signal(signal.SIGTERM if mode == "production" else signal.SIGINT)
+        process.wait(timeout=60)
+        result["stop"] = time.time() - started
+        return result
+    finally:
+        if process.poll() is None:
+            process.kill()
+        os.close(master)
+        os.close(slave)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32, help="concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of load per mode")
+    parser.add_argument("--machines", type=int, default=200, help="machines in the scratch fleet")
+    parser.add_argument("--workers", type=int, default=4, help="processes of the multi-process run")
+    parser.add_argument("--load-processes", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="processes generating the load")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.duration:g}s per mode, {args.machines} machines, GET {', '.join(ENDPOINTS)}")
+    runs = [("development", "development", 1), ("production", "production", 1)]
+    if args.workers > 1:
+        runs.append((f"production x{args.workers}", "production", args.workers))
+    for name, mode, workers in runs:
+        r = run(mode, workers, args)
+        print(f"{name:16s} req/s {r['rps']:8.1f}  p50 {r['p50']:7.1f}ms  p99 {r['p99']:7.1f}ms  "
+              f"errors {r['errors']}  stopped in {r['stop']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
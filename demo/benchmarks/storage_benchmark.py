@@ -0,0 +1,151 @@
+"""
+Concurrent read/write throughput of the dashboard database.
+
+Simulates N executing jobs (each inserting its history row, then issuing status and step
+updates) while reader threads poll the history list and the stats counters, the way the
+dashboard UI does. Runs the workload against:
+
+* legacy  - one shared sqlite3 connection (check_same_thread=False) with a lock around writes,
+            rollback journal, as the dashboard used before remoteinfra.storage
+* storage - remoteinfra.storage.Storage (WAL, pooled per-thread connections, group commit)
+
+Usage:
+    python demo/benchmarks/storage_benchmark.py --jobs 12 --updates 50 --readers 4
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from remoteinfra.storage import Storage
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS execution_history (
+        id TEXT PRIMARY KEY, machine_id TEXT, type TEXT, status TEXT, command TEXT,
+        output TEXT, started_at TIMESTAMP, completed_at TIMESTAMP, duration REAL, logs TEXT
+    );
+    CREATE TABLE IF NOT EXISTS machines (id TEXT PRIMARY KEY, name TEXT, host TEXT);
+"""
+INSERT = ("INSERT INTO execution_history (id, machine_id, type, status, command, output, started_at) "
+          "VALUES (?, ?, 'command', 'queued', 'echo', '', datetime('now'))")
+UPDATE = "UPDATE execution_history SET status = ?, output = ? WHERE id = ?"
+HISTORY = "SELECT * FROM execution_history ORDER BY started_at DESC LIMIT 50"
+STATS = "SELECT COUNT(*) FROM execution_history WHERE status = 'success' AND started_at >= datetime('now', '-1 day')"
+
+
+class Legacy:
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def write(self, sql, params):
+        with self.lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
+
+    def read(self, sql):
+        # Reads were not synchronized in the old code; they share the connection
+        return self.conn.execute(sql).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+class Pooled:
+    def __init__(self, path):
+        self.storage = Storage(path)
+        with self.storage.transaction() as conn:
+            for statement in SCHEMA.strip().split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+
+    def write(self, sql, params):
+        self.storage.write(sql, params)
+
+    def read(self, sql):
+        return self.storage.query(sql)
+
+    def close(self):
+        self.storage.close()
+
+
+def run(backend_cls, jobs, updates, readers, payload):
+    fd, path = tempfile.mkstemp(suffix=".sqlite3")
+    os.close(fd)
+    backend = backend_cls(path)
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    counts_lock = threading.Lock()
+    done = threading.Event()
+
+    def bump(key, n=1):
+        with counts_lock:
+            counts[key] += n
+
+    def job():
+        execution_id = str(uuid.uuid4())
+        try:
+            backend.write(INSERT, (execution_id, "m1"))
+            bump("writes")
+            for i in range(updates):
+                status = "success" if i == updates - 1 else "running"
+                backend.write(UPDATE, (status, payload, execution_id))
+                bump("writes")
+        except Exception as e:
+            bump("errors")
+            print(f"write error: {e}")
+
+    def reader():
+        while not done.is_set():
+            try:
+                backend.read(HISTORY)
+                backend.read(STATS)
+                bump("reads", 2)
+            except Exception as e:
+                bump("errors")
+                print(f"read error: {e}")
+
+    reader_threads = [threading.Thread(target=reader) for _ in range(readers)]
+    job_threads = [threading.Thread(target=job) for _ in range(jobs)]
+    start = time.time()
+    for t in reader_threads + job_threads:
+        t.start()
+    for t in job_threads:
+        t.join()
+    elapsed = time.time() - start
+    done.set()
+    for t in reader_threads:
+        t.join()
+    backend.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return {
+        "elapsed": elapsed,
+        "writes_per_s": counts["writes"] / elapsed,
+        "reads_per_s": counts["reads"] / elapsed,
+        "errors": counts["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=12, help="concurrently executing jobs")
+    parser.add_argument("--updates", type=int, default=50, help="status updates per job")
+    parser.add_argument("--readers", type=int, default=4, help="threads polling history/stats")
+    parser.add_argument("--payload", type=int, default=2048, help="bytes of output written per update")
+    args = parser.parse_args()
+
+    payload = "x" * args.payload
+    print(f"{args.jobs} jobs x {args.updates + 1} writes, {args.readers} readers, {args.payload}B payload")
+    for name, backend_cls in (("legacy", Legacy), ("storage", Pooled)):
+        r = run(backend_cls, args.jobs, args.updates, args.readers, payload)
+        print(f"{name:8s} {r['elapsed']:7.2f}s  writes/s {r['writes_per_s']:9.1f}  "
+              f"reads/s {r['reads_per_s']:9.1f}  errors {r['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+// Ansible section: playbooks, ad-hoc commands and the Ansible overview
+RemoteRunApp.defineModule('ansible', class {
+    async saveAnsibleScript() {
+        const scriptContent = document.getElementById('ansible-editor').value;
+        const filename = document.getElementById('ansible-filename').value;
+
+        if (!scriptContent || !filename) {
+            alert('Please enter script content and filename');
+            return;
+        }
+
+        try {
+            let response;
+
+            // Check if we're editing a directory file
+            if (this.editingContext && this.editingContext.isDirectoryFile && this.editingContext.type === 'ansible') {
+                // Save to directory using directory API
+                const { directory } = this.editingContext;
+                response = await fetch(`/api/directories/ansible/${directory}/files/${filename}`, {
+                    method: 'PUT',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({ content: scriptContent })
+                });
+
+                if (response.ok) {
+                    this.addLog(`Ansible script saved to directory '${directory}': ${filename}`, 'success');
+                    // Update editing context
+                    this.editingContext.originalContent = scriptContent;
+                    this.updateTabName('ansible-tab-name', `${filename} (saved)`);
+                    // Refresh directory contents
+                    this.loadDirectoryContents('ansible', directory);
+                } else {
+                    const error = await response.json();
+                    alert(`Failed to save to directory: ${error.error}`);
+                }
+            } else {
+                // Save as regular script file
+                response = await fetch('/api/save-script', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({
+                        type: 'ansible',
+                        filename: filename,
+                        content: scriptContent
+                    })
+                });
+
+                if (response.ok) {
+                    this.addLog(`Ansible script saved: ${filename}`, 'success');
+                    this.loadExistingFiles('ansible');
+                } else {
+                    const error = await response.json();
+                    alert(`Failed to save script: ${error.error}`);
+                }
+            }
+        } catch (error) {
+            this.addLog('Failed to save Ansible script: ' + (error.message || error), 'error');
+            alert('Failed to save Ansible script: ' + (error.message || error));
+        }
+    }
+
+    async runAnsible() {
+        const machineId = document.getElementById('ansible-machine-select').value;
+
+        if (!machineId) {
+            alert('Please select a machine');
+            return;
+        }
+
+        // Determine mode based on active main tab instead of mode buttons
+        const activeMainTab = document.querySelector('#ansible-section .tab-btn.active').dataset.tab;
+        const mode = activeMainTab === 'adhoc-ansible' ? 'adhoc' : 'playbook';
+        let payload = { machine_id: machineId, mode: mode };
+
+        if (mode === 'adhoc') {
+            payload.module = document.getElementById('ansible-module').value;
+            payload.args = document.getElementById('ansible-args').value;
+            payload.become = document.getElementById('ansible-adhoc-become').checked;
+        } else {
+            const scriptContent = document.getElementById('ansible-editor').value;
+            const filename = document.getElementById('ansible-filename').value || 'playbook.yml';
+            payload.script_content = scriptContent;
+            payload.filename = filename;
+
+            // Check which playbook tab is active and get the become checkbox accordingly
+            const activeTab = document.querySelector('.upload-tabs .tab-btn.active').dataset.tab;
+            if (activeTab === 'upload-ansible') {
+                payload.become = document.getElementById('ansible-upload-become').checked;
+            } else if (activeTab === 'editor-ansible') {
+                payload.become = document.getElementById('ansible-editor-become').checked;
+            } else {
+                payload.become = false; // Default for other tabs
+            }
+        }
+
+        this.startExecution(`ansible-${mode}`);
+        this.showLoading('ansible', mode === 'adhoc' ? 'Running Ansible Ad-hoc' : 'Running Ansible Playbook');
+        try {
+            const response = await fetch('/api/run-ansible', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(payload)
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                this.addLog(`Ansible ${mode} finished with status: ${result.status}`, 'success');
+                if (result.output) {
+                    const formatted = typeof result.output === 'string' ? result.output : JSON.stringify(result.output, null, 2);
+                    this.addLog(`Output:\n${formatted}`, 'info');
+                }
+                if (result.errors) {
+                    this.addLog(`Errors:\n${result.errors}`, 'error');
+                }
+                this.endExecution(!result.errors);
+            } else {
+                const errMsg = result.errors || result.message || 'Unknown error';
+                this.addLog(`Ansible ${mode} failed: ${errMsg}`, 'error');
+                alert('Failed to run Ansible: ' + errMsg);
+                this.endExecution(false);
+            }
+        } catch (error) {
+            this.addLog('Failed to run Ansible: ' + (error.message || error), 'error');
+            alert('Failed to run Ansible: ' + (error.message || error));
+            this.endExecution(false);
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    clearAnsible() {
+        // Clear playbook editor fields
+        document.getElementById('ansible-editor').value = '';
+        document.getElementById('ansible-filename').value = '';
+        document.getElementById('ansible-machine-select').value = '';
+        document.getElementById('ansible-file-input').value = '';
+        this.updateLineNumbers('ansible-editor');
+        this.updateTabName('ansible-tab-name', 'playbook.yml');
+
+        // Clear ad-hoc command fields
+        document.getElementById('ansible-module').value = '';
+        document.getElementById('ansible-args').value = '';
+
+        // Clear all become checkboxes
+        document.getElementById('ansible-adhoc-become').checked = false;
+        document.getElementById('ansible-upload-become').checked = false;
+        document.getElementById('ansible-editor-become').checked = false;
+
+        // Clear privilege control visual states
+        const privilegeControls = [
+            'ansible-adhoc-privilege-control',
+            'ansible-upload-privilege-control',
+            'ansible-editor-privilege-control'
+        ];
+        privilegeControls.forEach(controlId => {
+            const control = document.getElementById(controlId);
+            if (control) {
+                this.updatePrivilegeControlState(control, false);
+            }
+        });
+    }
+
+    async saveAnsible() {
+        // Determine mode based on active main tab instead of mode buttons
+        const activeMainTab = document.querySelector('#ansible-section .tab-btn.active').dataset.tab;
+        const mode = activeMainTab === 'adhoc-ansible' ? 'adhoc' : 'playbook'; if (mode === 'adhoc') {
+            const module = document.getElementById('ansible-module').value;
+            const args = document.getElementById('ansible-args').value;
+
+            if (!module || !args) {
+                alert('Please enter module and arguments');
+                return;
+            }
+
+            const content = `---
+- name: Ad-hoc command
+  hosts: all
+  tasks:
+    - name: Execute ${module}
+      ${module}: ${args}`;
+
+            try {
+                const response = await fetch('/api/save-script', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({
+                        type: 'ansible',
+                        filename: `adhoc_${module}_${Date.now()}.yml`,
+                        content: content
+                    })
+                });
+
+                if (response.ok) {
+                    this.addLog('Ansible ad-hoc command saved', 'success');
+                    this.loadExistingFiles('ansible');
+                } else {
+                    this.addLog('Failed to save Ansible command', 'error');
+                }
+            } catch (error) {
+                this.addLog('Failed to save Ansible command', 'error');
+            }
+        }
+    }
+
+    async saveAnsiblePlaybookFromEditor() {
+        const content = document.getElementById('ansible-editor').value;
+        const filename = document.getElementById('ansible-filename').value;
+        if (!content || !filename) {
+            alert('Please enter playbook content and filename');
+            return;
+        }
+        try {
+            const response = await fetch('/api/save-script', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    type: 'ansible',
+                    filename: filename,
+                    content: content
+                })
+            });
+            if (response.ok) {
+                this.addLog(`Ansible playbook saved: ${filename}`, 'success');
+                this.loadExistingFiles('ansible');
+            } else {
+                const error = await response.json().catch(() => ({}));
+                this.addLog('Failed to save Ansible playbook' + (error.message ? ': ' + error.message : ''), 'error');
+                alert('Failed to save Ansible playbook' + (error.message ? ': ' + error.message : ''));
+            }
+        } catch (error) {
+            this.addLog('Failed to save Ansible playbook: ' + (error.message || error), 'error');
+            alert('Failed to save Ansible playbook: ' + (error.message || error));
+        }
+    }
+
+    async refreshAnsibleOverview(forceRefresh = false) {
+        const machineId = document.getElementById('ansible-machine-select').value;
+        if (!machineId) {
+            this.resetAnsibleOverview();
+            return;
+        }
+
+        try {
+            this.showLoading();
+
+            const response = await fetch('/api/ansible/overview', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    machine_id: machineId,
+                    force_refresh: forceRefresh
+                })
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                this.displayAnsibleOverview(result.overview);
+            } else {
+                this.resetAnsibleOverview(`Error: ${result.error}`);
+            }
+        } catch (error) {
+            this.resetAnsibleOverview(`Error: ${error.message}`);
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    displayAnsibleOverview(overview) {
+        const container = document.getElementById('ansible-overview-content');
+        if (!container) return;
+
+        const isInstalled = overview.ansible_version !== 'Not installed';
+
+        container.innerHTML = `
+            <div class="enterprise-overview-panel">
+                <div class="overview-header">
+                    <div class="status-primary">
+                        <div class="tech-brand">
+                            <i class="fas fa-cogs"></i>
+                            <span class="brand-text">Ansible Environment</span>
+                        </div>
+                        <div class="version-badge">${this.escapeHtml(overview.ansible_version || 'Not installed')}</div>
+                    </div>
+                    <div class="health-indicator ${isInstalled ? 'healthy' : 'unhealthy'}">
+                        <div class="health-dot"></div>
+                        <span class="health-text">${isInstalled ? 'Available' : 'Not Available'}</span>
+                    </div>
+                </div>
+
+                <div class="metrics-dashboard">
+                    <div class="metric-card primary">
+                        <div class="metric-icon">
+                            <i class="fas fa-play-circle"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${overview.playbook_available || 'None'}</div>
+                            <div class="metric-label">Playbook Support</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card secondary">
+                        <div class="metric-icon">
+                            <i class="fas fa-star"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${overview.galaxy_available || 'None'}</div>
+                            <div class="metric-label">Galaxy Support</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card tertiary">
+                        <div class="metric-icon">
+                            <i class="fas fa-shield-alt"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${overview.vault_available || 'None'}</div>
+                            <div class="metric-label">Vault Support</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card quaternary">
+                        <div class="metric-icon">
+                            <i class="fas fa-cube"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${overview.installed_collections || 0}</div>
+                            <div class="metric-label">Collections</div>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="system-info-grid">
+                    <div class="info-section">
+                        <div class="section-header">
+                            <i class="fas fa-cogs" style="color: #fff"></i>
+                            <span style="color: #fff">Ansible Details</span>
+                        </div>
+                        <div class="info-items">
+                            <div class="info-row">
+                                <span class="info-key">Ansible Version</span>
+                                <span class="info-value">${this.escapeHtml(overview.ansible_version || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Core Version</span>
+                                <span class="info-value">${this.escapeHtml(overview.ansible_core_version || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Config File</span>
+                                <span class="info-value">${this.escapeHtml(overview.config_file || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Python Version</span>
+                                <span class="info-value">${this.escapeHtml(overview.python_version || 'None')}</span>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div class="info-section">
+                        <div class="section-header">
+                            <i class="fas fa-tools" style="color: #fff"></i>
+                            <span style="color: #fff">Available Tools</span>
+                        </div>
+                        <div class="info-items">
+                            <div class="info-row">
+                                <span class="info-key">Executable Location</span>
+                                <span class="info-value">${this.escapeHtml(overview.executable_location || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Playbook Available</span>
+                                <span class="info-value">${this.escapeHtml(overview.playbook_available || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Galaxy Available</span>
+                                <span class="info-value">${this.escapeHtml(overview.galaxy_available || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Vault Available</span>
+                                <span class="info-value">${this.escapeHtml(overview.vault_available || 'None')}</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        `;
+    }
+
+    resetAnsibleOverview(message = 'Select a machine to view Ansible environment information') {
+        const container = document.getElementById('ansible-overview-content');
+        if (!container) return;
+
+        container.innerHTML = `
+            <div class="info-placeholder">
+                <i class="fas fa-cogs"></i>
+                <p>${message}</p>
+            </div>
+        `;
+    }
+});
@@ -0,0 +1,382 @@
+// Dashboard section: execution stats, history, details and live output
+RemoteRunApp.defineModule('executions', class {
+    // --- Dashboard logic ---
+    initDashboard() {
+        // Initial load
+        this.loadDashboardStats();
+        this.loadDashboardHistory();
+        // Update running executions display
+        this.updateRunningExecutionsDisplay();
+        // Populate machine filter
+        this.populateDashboardMachineFilter();
+        // Filter change listeners
+        document.getElementById('machine-filter').addEventListener('change', (e) => {
+            this.dashboardFilters.machine_id = e.target.value;
+            this.loadDashboardHistory();
+        });
+        document.getElementById('type-filter').addEventListener('change', (e) => {
+            this.dashboardFilters.type = e.target.value;
+            this.loadDashboardHistory();
+        });
+        document.getElementById('status-filter').addEventListener('change', (e) => {
+            this.dashboardFilters.status = e.target.value;
+            this.loadDashboardHistory();
+        });
+        document.getElementById('refresh-dashboard-btn').addEventListener('click', () => {
+            this.loadDashboardStats(true);
+            this.loadDashboardHistory();
+        });
+        document.getElementById('load-more-history-btn').addEventListener('click', () => {
+            this.loadDashboardHistory(true);
+        });
+        document.getElementById('clear-history-btn').addEventListener('click', () => {
+            if (confirm('Clear all execution history?')) {
+                this.clearExecutionHistory();
+            }
+        });
+    }
+
+    async loadDashboardStats(force = false) {
+        if (!force && this.statsSubscribed) {
+            // Stats are pushed by the server; only the client-side running count needs refreshing
+            document.getElementById('running-executions').textContent = this.runningExecutions.size;
+            return;
+        }
+        try {
+            const res = await fetch('/api/execution-stats');
+            if (!res.ok) return;
+            this.renderDashboardStats(await res.json());
+        } catch (e) {
+            // ignore
+        }
+    }
+
+    subscribeStats() {
+        if (this.socket && this.socket.connected) {
+            this.socket.emit('subscribe_stats', { sections: ['executions'] });
+        }
+    }
+
+    unsubscribeStats() {
+        if (this.socket && this.statsSubscribed) {
+            this.socket.emit('unsubscribe_stats', { sections: ['executions'] });
+        }
+        this.statsSubscribed = false;
+    }
+
+    handleStatsUpdate(event) {
+        if (!event || event.section !== 'executions') return;
+        if (this.currentSection !== 'dashboard') return;
+        this.statsSubscribed = true;
+        this.renderDashboardStats(event.data || {});
+    }
+
+    renderDashboardStats(stats) {
+        try {
+            document.getElementById('successful-executions').textContent = stats.successful_executions || 0;
+            document.getElementById('failed-executions').textContent = stats.failed_executions || 0;
+            document.getElementById('active-machines').textContent = stats.active_machines || 0;
+            document.getElementById('recent-executions').textContent = stats.recent_executions || 0;
+            // Use client-side running executions count instead of backend
+            document.getElementById('running-executions').textContent = this.runningExecutions.size;
+        } catch (e) {
+            // ignore
+        }
+    }
+
+    async loadDashboardHistory(append = false) {
+        const params = ['limit=' + this.historyPageSize];
+        if (append && this.historyNextCursor) params.push('cursor=' + encodeURIComponent(this.historyNextCursor));
+        if (this.dashboardFilters.machine_id) params.push('machine_id=' + encodeURIComponent(this.dashboardFilters.machine_id));
+        if (this.dashboardFilters.type) params.push('type=' + encodeURIComponent(this.dashboardFilters.type));
+        if (this.dashboardFilters.status) params.push('status=' + encodeURIComponent(this.dashboardFilters.status));
+        // Always show last 24h by default
+        params.push('last_24h=1');
+        const url = '/api/execution-history' + (params.length ? '?' + params.join('&') : '');
+        try {
+            const res = await fetch(url);
+            if (!res.ok) return;
+            const history = await res.json();
+            this.historyNextCursor = res.headers.get('X-Next-Cursor');
+            document.getElementById('load-more-history-btn').style.display = this.historyNextCursor ? '' : 'none';
+            this.renderDashboardHistory(history, append);
+        } catch (e) {
+            // ignore
+        }
+    }
+
+    renderDashboardHistory(history, append = false) {
+        const list = document.getElementById('execution-list');
+        // Rows are keyed by execution id; refreshes (every execution event) only touch changed rows
+        this.historyItems = append ? (this.historyItems || []).concat(history || []) : (history || []);
+        if (!this.historyItems.length) {
+            list.innerHTML = `<div class="empty-state"><i class="fas fa-inbox"></i><p>No executions found</p></div>`;
+            return;
+        }
+        this.patchList(list, this.historyItems, item => item.id, item => {
+            let host = '';
+            if (item.machine_id === "local" && item.type === "terraform") {
+                // For terraform local executions, show "Local" as host
+                host = `<b>(Local)</b>`;
+            } else {
+                const machine = this.machines.find(m => m.id === item.machine_id);
+                if (machine) host = `<b>(${this.escapeHtml(machine.host)})</b>`;
+            }
+            return `
+                <div class="execution-item" data-exec-id="${item.id}" data-execution-id="${item.id}">
+                    <div class="execution-status ${item.status === 'success' ? 'success' : (item.status === 'failed' ? 'failed' : 'running')}"></div>
+                    <div class="execution-info">
+                        <div class="execution-main">
+                            <div class="execution-title">${item.command ? this.escapeHtml(item.command.substring(0, 40)) : ''}</div>
+                            <div class="execution-subtitle">${item.machine_id || ''} <span class="machine-host">${host}</span></div>
+                        </div>
+                        <div class="execution-type ${item.type}">${item.type || ''}</div>
+                        <div class="execution-duration">${item.duration ? item.duration.toFixed(1) + 's' : ''}</div>
+                        <div class="execution-time">${item.started_at ? this.formatDate(item.started_at) : ''}</div>
+                        <div class="execution-time">${item.status || ''}</div>
+                    </div>
+                    <div class="execution-actions"></div>
+                </div>`;
+        }, (div, item) => {
+            // Click to show details modal
+            div.addEventListener('click', () => this.showExecutionDetails(item.id));
+        });
+
+        // Apply running status indicators after rendering
+        this.updateExecutionHistoryWithRunningStatus();
+    }
+
+    async showExecutionDetails(execId) {
+        try {
+            this.showLoading();
+            const res = await fetch(`/api/execution/${execId}`);
+            if (!res.ok) {
+                alert('Failed to load execution details');
+                this.hideLoading();
+                return;
+            }
+            const data = await res.json();
+            // Fill modal fields
+            document.getElementById('execution-modal-title').textContent = `Execution Details`;
+            document.getElementById('detail-machine').textContent = data.machine_name
+                ? `${data.machine_name} (${data.machine_host})`
+                : data.machine_host || data.machine_id;
+            document.getElementById('detail-type').textContent = data.type || '';
+            document.getElementById('detail-status').textContent = data.status || '';
+            document.getElementById('detail-duration').textContent = data.duration ? data.duration.toFixed(1) + 's' : '';
+            document.getElementById('detail-started').textContent = data.started_at || '';
+            document.getElementById('detail-completed').textContent = data.completed_at || '';
+            document.getElementById('detail-command').textContent = data.command || '';
+            document.getElementById('detail-output').textContent = data.output || '';
+            document.getElementById('detail-logs').textContent = data.logs || '';
+
+            // Store current execution data for downloads
+            this.currentExecutionData = data;
+
+            // Follow the output of an execution that is still going
+            this.unwatchExecutionLog();
+            if (data.status === 'running' || data.status === 'queued') {
+                this.watchExecutionLog(execId);
+            }
+
+            this.showModal('execution-details-modal');
+        } catch (e) {
+            alert('Failed to load execution details');
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    watchExecutionLog(execId) {
+        if (!this.socket) return;
+        this.liveLog = { id: execId, offset: 0, frames: Promise.resolve() };
+        document.getElementById('detail-output').textContent = '';
+        document.getElementById('detail-logs').textContent = '';
+        this.socket.emit('join_execution', this.liveLogJoin());
+    }
+
+    liveLogJoin() {
+        // Frames are acknowledged as applied; compressed ones only where the browser can inflate them
+        return {
+            execution_id: this.liveLog.id,
+            offset: this.liveLog.offset,
+            ack: true,
+            binary: typeof DecompressionStream !== 'undefined',
+        };
+    }
+
+    unwatchExecutionLog() {
+        if (this.liveLog && this.socket) {
+            this.socket.emit('leave_execution', { execution_id: this.liveLog.id });
+        }
+        this.liveLog = null;
+    }
+
+    appendExecutionLogChunks(chunks) {
+        const encoder = new TextEncoder();
+        const decoder = new TextDecoder();
+        for (const chunk of chunks) {
+            if (!this.liveLog || chunk.end_offset <= this.liveLog.offset) continue;
+            let text = chunk.data;
+            if (chunk.offset < this.liveLog.offset) {
+                text = decoder.decode(encoder.encode(text).slice(this.liveLog.offset - chunk.offset));
+            }
+            const target = document.getElementById(chunk.stream === 'stderr' ? 'detail-logs' : 'detail-output');
+            if (target) target.textContent += text;
+            this.liveLog.offset = chunk.end_offset;
+        }
+    }
+
+    handleExecutionLog(data) {
+        const live = this.liveLog;
+        if (!live || live.id !== data.execution_id) return;
+        // Inflating and gap fetches are async; frames still apply one at a time, in order
+        live.frames = live.frames.then(() => this.applyExecutionLogFrame(live, data)).catch(() => {});
+    }
+
+    async decodeExecutionLogFrame(data) {
+        if (data.encoding !== 'zlib') return data.chunks || [];
+        const stream = new Blob([data.payload]).stream().pipeThrough(new DecompressionStream('deflate'));
+        return new Response(stream).json();
+    }
+
+    async applyExecutionLogFrame(live, data) {
+        const chunks = await this.decodeExecutionLogFrame(data);
+        if (this.liveLog !== live) return;
+        const first = chunks.length ? chunks[0].offset : data.next_offset;
+        if (data.gap && data.gap[1] - Math.max(data.gap[0], live.offset) > 256 * 1024) {
+            // Summarized frame for a client that fell behind: note the skip rather than fetch it all
+            const skipped = data.gap[1] - Math.max(data.gap[0], live.offset);
+            const target = document.getElementById('detail-output');
+            if (target) target.textContent += `\n[... ${Math.round(skipped / 1024)} KB of output skipped; shown in full once the execution ends ...]\n`;
+            live.offset = Math.max(live.offset, data.gap[1]);
+        } else if (first > live.offset || data.gap) {
+            // Output was skipped (rate limit or late join); fetch it before going on live
+            let offset = live.offset;
+            for (;;) {
+                const res = await fetch(`/api/executions/${live.id}/log?offset=${offset}`);
+                if (!res.ok) break;
+                const page = await res.json();
+                if (this.liveLog !== live) return;
+                this.appendExecutionLogChunks(page.chunks || []);
+                if (!page.chunks || !page.chunks.length || page.next_offset <= offset) break;
+                offset = page.next_offset;
+            }
+        }
+        this.appendExecutionLogChunks(chunks);
+        if (this.socket) this.socket.emit('ack_log', { execution_id: live.id, offset: live.offset });
+    }
+
+    downloadExecutionData(type) {
+        if (!this.currentExecutionData) {
+            alert('No execution data available');
+            return;
+        }
+
+        let content = '';
+        let filename = '';
+        let mimeType = 'text/plain';
+
+        const executionInfo = {
+            machine: this.currentExecutionData.machine_name
+                ? `${this.currentExecutionData.machine_name} (${this.currentExecutionData.machine_host})`
+                : this.currentExecutionData.machine_host || this.currentExecutionData.machine_id,
+            type: this.currentExecutionData.type || 'unknown',
+            status: this.currentExecutionData.status || 'unknown',
+            started: this.currentExecutionData.started_at || 'unknown',
+            completed: this.currentExecutionData.completed_at || 'unknown',
+            duration: this.currentExecutionData.duration ? this.currentExecutionData.duration.toFixed(1) + 's' : 'unknown'
+        };
+
+        const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
+
+        // Create professional filename with machine info
+        const machineIdentifier = this.currentExecutionData.machine_name
+            ? this.currentExecutionData.machine_name.replace(/[^a-zA-Z0-9-_]/g, '_')
+            : (this.currentExecutionData.machine_host || this.currentExecutionData.machine_id || 'unknown')
+                .replace(/[^a-zA-Z0-9-_.]/g, '_');
+
+        const executionType = (this.currentExecutionData.type || 'command').replace(/[^a-zA-Z0-9-_]/g, '_');
+        const statusSuffix = this.currentExecutionData.status === 'success' ? 'SUCCESS' :
+            this.currentExecutionData.status === 'failed' ? 'FAILED' : 'UNKNOWN';
+
+        if (type === 'output') {
+            content = `# Execution Output Report\n`;
+            content += `# Generated: ${new Date().toLocaleString()}\n`;
+            content += `# remoteinfra Enterprise Edition\n`;
+            content += `${'='.repeat(60)}\n\n`;
+            content += `Machine: ${executionInfo.machine}\n`;
+            content += `Type: ${executionInfo.type}\n`;
+            content += `Status: ${executionInfo.status}\n`;
+            content += `Started: ${executionInfo.started}\n`;
+            content += `Completed: ${executionInfo.completed}\n`;
+            content += `Duration: ${executionInfo.duration}\n`;
+            content += `\n${'='.repeat(60)}\n`;
+            content += `# COMMAND/SCRIPT EXECUTED:\n${'='.repeat(60)}\n${this.currentExecutionData.command || 'N/A'}\n`;
+            content += `\n${'='.repeat(60)}\n`;
+            content += `# EXECUTION OUTPUT:\n${'='.repeat(60)}\n${this.currentExecutionData.output || 'No output available'}`;
+            filename = `remoteinfra_${machineIdentifier}_${executionType}_OUTPUT_${statusSuffix}_${timestamp}.txt`;
+        } else if (type === 'logs') {
+            content = `# Execution Logs Report\n`;
+            content += `# Generated: ${new Date().toLocaleString()}\n`;
+            content += `# remoteinfra Enterprise Edition\n`;
+            content += `${'='.repeat(60)}\n\n`;
+            content += `Machine: ${executionInfo.machine}\n`;
+            content += `Type: ${executionInfo.type}\n`;
+            content += `Status: ${executionInfo.status}\n`;
+            content += `Started: ${executionInfo.started}\n`;
+            content += `Completed: ${executionInfo.completed}\n`;
+            content += `Duration: ${executionInfo.duration}\n`;
+            content += `\n${'='.repeat(60)}\n`;
+            content += `# EXECUTION LOGS:\n${'='.repeat(60)}\n${this.currentExecutionData.logs || 'No logs available'}`;
+            filename = `remoteinfra_${machineIdentifier}_${executionType}_LOGS_${statusSuffix}_${timestamp}.txt`;
+        }
+
+        // Create and trigger download
+        const blob = new Blob([content], { type: mimeType });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = filename;
+        document.body.appendChild(a);
+        a.click();
+        document.body.removeChild(a);
+        URL.revokeObjectURL(url);
+
+        this.addLog(`Downloaded ${type} for execution`, 'info');
+    }
+
+    async populateDashboardMachineFilter() {
+        // Populate machine filter dropdown
+        try {
+            const res = await fetch('/api/machines');
+            if (!res.ok) return;
+            const machines = await res.json();
+            const sel = document.getElementById('machine-filter');
+            sel.innerHTML = '<option value="">All Machines</option>';
+            for (const m of machines) {
+                const opt = document.createElement('option');
+                opt.value = m.id;
+                opt.textContent = m.name ? `${m.name} (${m.host})` : m.host;
+                sel.appendChild(opt);
+            }
+        } catch (e) { }
+    }
+
+    async clearExecutionHistory() {
+        // Call backend to clear all execution history
+        try {
+            const res = await fetch('/api/execution-history', { method: 'DELETE' });
+            if (res.ok) {
+                this.historyItems = [];
+                document.getElementById('execution-list').innerHTML = `<div class="empty-state"><i class="fas fa-inbox"></i><p>No executions found</p></div>`;
+                // Refresh dashboard stats after clearing
+                this.loadDashboardStats();
+            } else {
+                alert('Failed to clear execution history');
+            }
+        } catch (e) {
+            alert('Failed to clear execution history');
+        }
+    }
+}, app => app.initDashboard());
@@ -0,0 +1,1875 @@
+// File browser shared by the script sections: saved files, project directories and
+// project execution
+RemoteRunApp.defineModule('files', class {
+    handleFileUpload(files, acceptedTypes) {
+        files.forEach(file => {
+            const extension = '.' + file.name.split('.').pop().toLowerCase();
+
+            if (acceptedTypes.includes(extension)) {
+                this.addLog(`File uploaded: ${file.name}`, 'success');
+
+                // Read file content and load into editor
+                const reader = new FileReader();
+                reader.onload = (e) => {
+                    const content = e.target.result;
+
+                    if (extension === '.py') {
+                        document.getElementById('python-editor').value = content;
+                        document.getElementById('python-filename').value = file.name;
+                        this.updateLineNumbers('python-editor');
+                        this.updateTabName('python-tab-name', file.name);
+                        // Switch to editor tab
+                        document.querySelector('[data-tab="editor"]').click();
+                    } else if (extension === '.yml' || extension === '.yaml') {
+                        // Check if it's a docker-compose file
+                        const isDockerCompose = file.name.toLowerCase().includes('docker-compose') ||
+                            file.name.toLowerCase().includes('compose');
+
+                        if (isDockerCompose) {
+                            document.getElementById('docker-editor').value = content;
+                            document.getElementById('docker-filename').value = file.name;
+                            this.updateLineNumbers('docker-editor');
+                            this.updateTabName('docker-tab-name', file.name);
+                            // Switch to docker editor tab
+                            document.querySelector('[data-tab="editor-docker"]').click();
+                        } else {
+                            document.getElementById('ansible-editor').value = content;
+                            document.getElementById('ansible-filename').value = file.name;
+                            this.updateLineNumbers('ansible-editor');
+                            this.updateTabName('ansible-tab-name', file.name);
+                            // Switch to editor tab
+                            document.querySelector('[data-tab="editor-ansible"]').click();
+                        }
+                    } else if (extension === '.tf' || extension === '.tfvars') {
+                        document.getElementById('terraform-editor').value = content;
+                        document.getElementById('terraform-filename').value = file.name;
+                        this.updateLineNumbers('terraform-editor');
+                        this.updateTabName('terraform-tab-name', file.name);
+                        // Switch to editor tab
+                        document.querySelector('[data-tab="editor-tf"]').click();
+                    } else if (file.name.toLowerCase().match(/^dockerfile/i) ||
+                        file.name.toLowerCase().includes('dockerfile')) {
+                        // Handle Dockerfile
+                        document.getElementById('docker-editor').value = content;
+                        document.getElementById('docker-filename').value = file.name;
+                        this.updateLineNumbers('docker-editor');
+                        this.updateTabName('docker-tab-name', file.name);
+                        // Switch to docker editor tab
+                        document.querySelector('[data-tab="editor-docker"]').click();
+                    }
+                };
+                reader.readAsText(file);
+            } else {
+                this.addLog(`Invalid file type: ${file.name}`, 'warning');
+            }
+        });
+    }
+
+    async loadExistingFiles(type) {
+        try {
+            console.log(`Loading existing ${type} files...`);
+            const response = await fetch(`/api/files/${type}`);
+            if (response.ok) {
+                const files = await response.json();
+                console.log(`Loaded ${files.length} ${type} files:`, files);
+                this.renderFileList(files, type);
+            } else {
+                console.error(`Failed to load ${type} files, status:`, response.status);
+                this.addLog(`Failed to load ${type} files (status: ${response.status})`, 'error');
+            }
+        } catch (error) {
+            console.error(`Error loading ${type} files:`, error);
+            this.addLog(`Failed to load ${type} files: ${error.message}`, 'error');
+        }
+    }
+
+    renderFileList(files, type) {
+        const listId = `${type}-file-list`;
+        const list = document.getElementById(listId);
+        if (!list) return;
+        list.innerHTML = '';
+        if (!Array.isArray(files) || files.length === 0) {
+            list.innerHTML = '<li class="empty">No files found</li>';
+            return;
+        }
+        files.forEach(file => {
+            // file: { filename }
+            const li = document.createElement('li');
+            li.className = 'file-item';
+
+            // Create file info container
+            const fileInfo = document.createElement('div');
+            fileInfo.className = 'file-info';
+            fileInfo.textContent = file.filename;
+            fileInfo.title = file.filename;
+            fileInfo.addEventListener('click', () => this.loadFile(file.filename, type));
+
+            // Create action buttons container
+            const actionButtons = document.createElement('div');
+            actionButtons.className = 'file-actions';
+
+            // Edit button
+            const editBtn = document.createElement('button');
+            editBtn.className = 'edit-file-btn';
+            editBtn.innerHTML = '<i class="fas fa-edit"></i>';
+            editBtn.title = 'Edit file';
+            editBtn.addEventListener('click', (e) => {
+                e.stopPropagation();
+                this.editSavedFile(file.filename, type);
+            });
+            actionButtons.appendChild(editBtn);
+
+            // Rename button
+            const renameBtn = document.createElement('button');
+            renameBtn.className = 'rename-file-btn';
+            renameBtn.innerHTML = '<i class="fas fa-tag"></i>';
+            renameBtn.title = 'Rename file';
+            renameBtn.addEventListener('click', (e) => {
+                e.stopPropagation();
+                this.showRenameSavedFileDialog(file.filename, type);
+            });
+            actionButtons.appendChild(renameBtn);
+
+            // Delete button
+            const delBtn = document.createElement('button');
+            delBtn.className = 'delete-file-btn';
+            delBtn.innerHTML = '<i class="fas fa-trash"></i>';
+            delBtn.title = 'Delete file';
+            delBtn.addEventListener('click', (e) => {
+                e.stopPropagation();
+                this.deleteFile(file.filename, type);
+            });
+            actionButtons.appendChild(delBtn);
+
+            li.appendChild(fileInfo);
+            li.appendChild(actionButtons);
+            list.appendChild(li);
+        });
+    }
+
+    async loadFile(fileId, type) {
+        try {
+            const response = await fetch(`/api/files/${type}/${fileId}`);
+            if (response.ok) {
+                const data = await response.json();
+
+                if (type === 'python') {
+                    document.getElementById('python-editor').value = data.content;
+                    document.getElementById('python-filename').value = data.name;
+                    this.updateLineNumbers('python-editor');
+                    this.updateTabName('python-tab-name', data.name);
+                    document.querySelector('[data-tab="editor"]').click();
+                } else if (type === 'ansible') {
+                    document.getElementById('ansible-editor').value = data.content;
+                    document.getElementById('ansible-filename').value = data.name;
+                    this.updateLineNumbers('ansible-editor');
+                    this.updateTabName('ansible-tab-name', data.name);
+                    document.querySelector('[data-tab="editor-ansible"]').click();
+                } else if (type === 'terraform') {
+                    document.getElementById('terraform-editor').value = data.content;
+                    document.getElementById('terraform-filename').value = data.name;
+                    this.updateLineNumbers('terraform-editor');
+                    this.updateTabName('terraform-tab-name', data.name);
+                    document.querySelector('[data-tab="editor-tf"]').click();
+                } else if (type === 'docker') {
+                    document.getElementById('docker-editor').value = data.content;
+                    document.getElementById('docker-filename').value = data.name;
+                    this.updateLineNumbers('docker-editor');
+                    this.updateTabName('docker-tab-name', data.name);
+                    document.querySelector('[data-tab="editor-docker"]').click();
+                }
+
+                this.addLog(`File loaded: ${data.name}`, 'success');
+            } else {
+                this.addLog(`Failed to load ${type} file`, 'error');
+            }
+        } catch (error) {
+            this.addLog(`Failed to load ${type} file`, 'error');
+        }
+    }
+
+    async deleteFile(fileId, type) {
+        if (!confirm(`Are you sure you want to delete this ${type} file?`)) return;
+        try {
+            const response = await fetch(`/api/files/${type}/${fileId}`, {
+                method: 'DELETE'
+            });
+            if (response.ok) {
+                this.addLog(`Deleted ${type} file: ${fileId}`, 'success');
+                this.loadExistingFiles(type);
+            } else {
+                this.addLog(`Failed to delete ${type} file`, 'error');
+            }
+        } catch (error) {
+            this.addLog(`Failed to delete ${type} file`, 'error');
+        }
+    }
+
+    async editSavedFile(filename, type) {
+        try {
+            // Load file content for editing
+            const response = await fetch(`/api/files/${type}/${filename}`);
+            if (!response.ok) {
+                const error = await response.json();
+                alert(`Failed to load file: ${error.error}`);
+                return;
+            }
+
+            const fileData = await response.json();
+
+            // Switch to the appropriate section and load content into editor
+            this.switchSection(type);
+
+            // Set the content in the editor
+            const editorId = `${type}-editor`;
+            const filenameInput = `${type}-filename`;
+            const editor = document.getElementById(editorId);
+            const filenameInputElement = document.getElementById(filenameInput);
+
+            if (editor) {
+                editor.value = fileData.content;
+                this.updateLineNumbers(editorId);
+                this.autoResizeEditor(editorId);
+            }
+
+            if (filenameInputElement) {
+                filenameInputElement.value = fileData.name;
+            }
+
+            // Update tab name to show we're editing a file
+            const tabNameId = `${type}-tab-name`;
+            this.updateTabName(tabNameId, `${filename} (editing)`);
+
+            // Store editing context for saved files
+            this.savedFileEditingContext = {
+                type: type,
+                filename: filename,
+                originalContent: fileData.content
+            };
+
+            // Add save button specifically for editing saved files
+            this.showSavedFileEditingSaveButton(type);
+
+            // Switch to editor tab
+            const editorTabSelector = type === 'python' ? '[data-tab="editor"]' :
+                type === 'ansible' ? '[data-tab="editor-ansible"]' :
+                    '[data-tab="editor-tf"]';
+            const editorTab = document.querySelector(editorTabSelector);
+            if (editorTab) {
+                editorTab.click();
+            }
+
+            this.addLog(`Loaded '${filename}' for editing`, 'info');
+        } catch (error) {
+            this.addLog(`Error loading file for editing: ${error.message}`, 'error');
+        }
+    }
+
+    showSavedFileEditingSaveButton(type) {
+        // Add a special save button for editing saved files
+        const actionsContainer = document.querySelector(`#${type}-section .form-actions`);
+        if (actionsContainer && !document.getElementById(`save-editing-saved-${type}-btn`)) {
+            const saveEditingBtn = document.createElement('button');
+            saveEditingBtn.className = 'btn btn-success';
+            saveEditingBtn.id = `save-editing-saved-${type}-btn`;
+            saveEditingBtn.innerHTML = '<i class="fas fa-save"></i> Save Changes to File';
+            saveEditingBtn.onclick = () => this.saveSavedFileEdits();
+
+            // Insert at the beginning
+            actionsContainer.insertBefore(saveEditingBtn, actionsContainer.firstChild);
+        }
+    }
+
+    async saveSavedFileEdits() {
+        if (!this.savedFileEditingContext) {
+            alert('No saved file is currently being edited');
+            return;
+        }
+
+        const { type, filename } = this.savedFileEditingContext;
+        const editorId = `${type}-editor`;
+        const editor = document.getElementById(editorId);
+        const newContent = editor.value;
+
+        try {
+            const response = await fetch(`/api/files/${type}/${filename}`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ content: newContent })
+            });
+
+            if (response.ok) {
+                this.addLog(`File '${filename}' saved successfully`, 'success');
+                this.savedFileEditingContext.originalContent = newContent;
+                this.updateTabName(`${type}-tab-name`, `${filename} (saved)`);
+
+                // Remove the editing save button
+                const saveEditingBtn = document.getElementById(`save-editing-saved-${type}-btn`);
+                if (saveEditingBtn) {
+                    saveEditingBtn.remove();
+                }
+
+                // Clear editing context
+                this.savedFileEditingContext = null;
+
+                // Refresh file list
+                this.loadExistingFiles(type);
+            } else {
+                const error = await response.json();
+                alert(`Failed to save file: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error saving file: ${error.message}`, 'error');
+        }
+    }
+
+    showRenameSavedFileDialog(filename, type) {
+        const newName = prompt(`Rename file '${filename}' to:`, filename);
+
+        if (newName && newName.trim() && newName.trim() !== filename) {
+            this.renameSavedFile(filename, type, newName.trim());
+        }
+    }
+
+    async renameSavedFile(oldName, type, newName) {
+        try {
+            const response = await fetch(`/api/files/${type}/${oldName}/rename`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ new_name: newName })
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.addLog(`File renamed from '${oldName}' to '${newName}'`, 'success');
+                this.loadExistingFiles(type);
+            } else {
+                const error = await response.json();
+                alert(`Failed to rename file: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error renaming file: ${error.message}`, 'error');
+        }
+    }
+
+    // --- Directory Management Methods ---
+    initDirectoryManagement() {
+        // Initialize directory management for python, ansible, terraform and docker
+        this.currentDirectories = {
+            python: null,
+            ansible: null,
+            terraform: null,
+            docker: null
+        };
+        // Track current sub-path inside an opened project directory ('' = at project root)
+        this.currentSubPaths = { python: '', ansible: '', terraform: '', docker: '' };
+
+        // Python directory management
+        this.setupDirectoryManagement('python');
+
+        // Ansible directory management
+        this.setupDirectoryManagement('ansible');
+
+        // Terraform directory management  
+        this.setupDirectoryManagement('terraform');
+
+        // Docker directory management
+        this.setupDirectoryManagement('docker');
+
+        // Setup enhanced project execution
+        this.setupProjectExecution();
+    }
+
+    setupDirectoryManagement(type) {
+        // Create directory button
+        const createBtn = document.getElementById(`create-${type}-dir-btn`);
+        if (createBtn) {
+            createBtn.addEventListener('click', () => this.createDirectory(type));
+        }
+
+        // Upload to directory button
+        const uploadBtn = document.getElementById(`${type}-upload-to-dir-btn`);
+        if (uploadBtn) {
+            uploadBtn.addEventListener('click', () => {
+                document.getElementById(`${type}-dir-file-input`).click();
+            });
+        }
+
+        // File input for directory uploads
+        const fileInput = document.getElementById(`${type}-dir-file-input`);
+        if (fileInput) {
+            fileInput.addEventListener('change', (e) => {
+                this.handleDirectoryFileUpload(type, e.target.files);
+            });
+        }
+
+        // Refresh directory button
+        const refreshBtn = document.getElementById(`${type}-refresh-dir-btn`);
+        if (refreshBtn) {
+            refreshBtn.addEventListener('click', () => {
+                if (this.currentDirectories[type]) {
+                    this.browseProjectDirectory(type, this.currentSubPaths[type] || '');
+                }
+            });
+        }
+
+        // Close directory view button
+        const closeBtn = document.getElementById(`${type}-close-dir-btn`);
+        if (closeBtn) {
+            closeBtn.addEventListener('click', () => this.closeDirectoryView(type));
+        }
+
+        // Execute file button
+        const executeBtn = document.getElementById(`${type}-execute-file-btn`);
+        if (executeBtn) {
+            executeBtn.addEventListener('click', () => this.executeDirectoryFile(type));
+        }
+
+        // Select all button
+        const selectAllBtn = document.getElementById(`${type}-select-all-btn`);
+        if (selectAllBtn) {
+            selectAllBtn.addEventListener('click', () => this.selectAllFiles(type));
+        }
+
+        // Clear selection button
+        const clearSelectionBtn = document.getElementById(`${type}-clear-selection-btn`);
+        if (clearSelectionBtn) {
+            clearSelectionBtn.addEventListener('click', () => this.clearFileSelection(type));
+        }
+
+        // Execution mode radio buttons
+        const executionModeRadios = document.querySelectorAll(`input[name="${type}-exec-mode"]`);
+        executionModeRadios.forEach(radio => {
+            radio.addEventListener('change', () => this.updateExecutionControls(type));
+        });
+
+        // File selector dropdown change
+        const fileSelector = document.getElementById(`${type}-selected-file`);
+        if (fileSelector) {
+            fileSelector.addEventListener('change', () => this.updateExecutionControls(type));
+        }
+
+        // Terraform-specific directory action buttons
+        // Terraform directory specific buttons removed (Init/Plan/Apply). Unified workflow used instead.
+
+        // Enter key for directory name input
+        const dirNameInput = document.getElementById(`${type}-new-dir-name`);
+        if (dirNameInput) {
+            dirNameInput.addEventListener('keypress', (e) => {
+                if (e.key === 'Enter') {
+                    this.createDirectory(type);
+                }
+            });
+        }
+
+        // Load initial directories
+        this.loadDirectories(type);
+    }
+
+    async loadDirectories(type) {
+        try {
+            const response = await fetch(`/api/directories/${type}`);
+            if (response.ok) {
+                const directories = await response.json();
+                this.renderDirectories(type, directories);
+            } else {
+                this.addLog(`Failed to load ${type} directories`, 'error');
+            }
+        } catch (error) {
+            this.addLog(`Error loading ${type} directories: ${error.message}`, 'error');
+        }
+    }
+
+    renderDirectories(type, directories) {
+        const grid = document.getElementById(`${type}-directories-grid`);
+        grid.innerHTML = '';
+
+        if (!directories || directories.length === 0) {
+            grid.innerHTML = `
+                <div class="empty-directory">
+                    <i class="fas fa-folder-open"></i>
+                    <p>No project directories found</p>
+                    <small>Create your first ${type} project directory above</small>
+                </div>
+            `;
+            return;
+        }
+
+        directories.forEach(dir => {
+            const card = document.createElement('div');
+            card.className = 'directory-card';
+            card.innerHTML = `
+                <div class="directory-card-header">
+                    <div class="directory-name">
+                        <i class="fas fa-folder"></i>
+                        ${dir.name}
+                    </div>
+                    <div class="directory-actions">
+                        <button class="directory-rename" onclick="app.showRenameDirectoryDialog('${type}', '${dir.name}')" title="Rename Directory">
+                            <i class="fas fa-tag"></i>
+                        </button>
+                        <button class="directory-delete" onclick="app.deleteDirectory('${type}', '${dir.name}')" title="Delete Directory">
+                            <i class="fas fa-trash"></i>
+                        </button>
+                    </div>
+                </div>
+                <div class="directory-info">
+                    <span>${dir.files_count} files</span>
+                    <span class="directory-meta">Modified: ${new Date(dir.modified * 1000).toLocaleDateString()}</span>
+                </div>
+            `;
+
+            card.addEventListener('click', () => this.openDirectory(type, dir.name));
+            grid.appendChild(card);
+        });
+    }
+
+    async createDirectory(type) {
+        const nameInput = document.getElementById(`${type}-new-dir-name`);
+        const dirName = nameInput.value.trim();
+
+        if (!dirName) {
+            alert('Please enter a directory name');
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/directories/${type}`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ name: dirName })
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.addLog(`Directory '${result.name}' created successfully`, 'success');
+                nameInput.value = '';
+                this.loadDirectories(type);
+            } else {
+                const error = await response.json();
+                alert(`Failed to create directory: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error creating directory: ${error.message}`, 'error');
+            alert('Failed to create directory');
+        }
+    }
+
+    async deleteDirectory(type, dirName) {
+        if (!confirm(`Are you sure you want to delete directory '${dirName}' and all its files?`)) {
+            return;
+        }
+
+        try {
+            const response = await fetch(`/api/directories/${type}/${dirName}`, {
+                method: 'DELETE'
+            });
+
+            if (response.ok) {
+                this.addLog(`Directory '${dirName}' deleted successfully`, 'success');
+                this.loadDirectories(type);
+
+                // Close directory view if it was open
+                if (this.currentDirectories[type] === dirName) {
+                    this.closeDirectoryView(type);
+                }
+            } else {
+                const error = await response.json();
+                alert(`Failed to delete directory: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error deleting directory: ${error.message}`, 'error');
+            alert('Failed to delete directory');
+        }
+    }
+
+    async openDirectory(type, dirName) {
+        this.currentDirectories[type] = dirName;
+        this.currentSubPaths[type] = '';
+
+        // Update UI
+        document.getElementById(`${type}-current-directory`).textContent = `Directory: ${dirName}`;
+        document.getElementById(`${type}-directory-details`).style.display = 'block';
+
+        // Highlight selected directory
+        document.querySelectorAll(`#${type}-directories-grid .directory-card`).forEach(card => {
+            card.classList.remove('selected');
+        });
+        event.currentTarget.classList.add('selected');
+
+        // Load hierarchical directory contents (project root)
+        this.browseProjectDirectory(type);
+    }
+
+    // Browse within an opened project directory using hierarchical backend
+    async browseProjectDirectory(type, subPath = '') {
+        const baseDir = this.currentDirectories[type];
+        if (!baseDir) return;
+        this.currentSubPaths[type] = subPath;
+        const relPath = baseDir + (subPath ? '/' + subPath : '');
+        try {
+            const response = await fetch(`/api/directories/${type}/browse?path=${encodeURIComponent(relPath)}`);
+            if (response.ok) {
+                const data = await response.json();
+                this.renderProjectDirectory(type, data, baseDir);
+            } else {
+                const err = await response.json().catch(() => ({ error: 'Failed' }));
+                this.addLog(`Failed to browse path: ${err.error || relPath}`, 'error');
+            }
+        } catch (e) {
+            this.addLog(`Error browsing directory: ${e.message}`, 'error');
+        }
+    }
+
+    renderProjectDirectory(type, data, baseDir) {
+        // Render breadcrumbs relative to project root
+        const bcEl = document.getElementById(`${type}-breadcrumbs`);
+        if (bcEl) {
+            const crumbs = (data.breadcrumbs || []).filter(c => c.path && c.path.startsWith(baseDir));
+            // Ensure baseDir crumb present
+            const baseCrumb = { name: baseDir, path: baseDir };
+            const finalCrumbs = [baseCrumb];
+            crumbs.forEach(c => { if (c.path === baseDir) return; finalCrumbs.push(c); });
+            bcEl.innerHTML = finalCrumbs.map((c, i) => {
+                const relSub = c.path === baseDir ? '' : c.path.slice(baseDir.length + 1);
+                return `<span class="breadcrumb-seg" data-subpath="${relSub}" style="cursor:pointer;color:${i === finalCrumbs.length - 1 ? '#fff' : '#4aa3ff'};">${c.name}</span>${i < finalCrumbs.length - 1 ? '<span class="breadcrumb-sep" style="opacity:0.6;">/</span>' : ''}`;
+            }).join('');
+            bcEl.querySelectorAll('.breadcrumb-seg').forEach(seg => {
+                seg.addEventListener('click', (e) => {
+                    const sp = e.currentTarget.getAttribute('data-subpath');
+                    this.browseProjectDirectory(type, sp);
+                });
+            });
+        }
+
+        // Render directories + files list
+        const container = document.getElementById(`${type}-directory-files`);
+        if (!container) return;
+        // Ensure a toolbar + filter region exists just once
+        if (!container._enhanced) {
+            const toolbar = document.createElement('div');
+            toolbar.className = 'directory-toolbar';
+            toolbar.innerHTML = `
+                <div class="dir-path-label" id="${type}-path-label"></div>
+                <div class="dir-tools">
+                    <button class="btn btn-sm btn-secondary" data-action="up" title="Go Up One Level" aria-label="Go up one level"><i class="fas fa-level-up-alt"></i></button>
+                    <button class="btn btn-sm btn-secondary" data-action="refresh" title="Refresh" aria-label="Refresh directory"><i class="fas fa-sync"></i></button>
+                    <button class="btn btn-sm btn-secondary" data-action="upload" title="Upload Files" aria-label="Upload files"><i class="fas fa-upload"></i></button>
+                    <button class="btn btn-sm btn-secondary" data-action="new-folder" title="New Subdirectory" aria-label="Create subdirectory"><i class="fas fa-folder-plus"></i></button>
+                    <button class="btn btn-sm btn-secondary" data-action="zip" title="Upload & Extract ZIP" aria-label="Upload ZIP and extract"><i class="fas fa-file-zipper"></i></button>
+                    <div class="filter-wrapper">
+                        <input type="text" id="${type}-file-filter" class="form-control file-filter" placeholder="Filter files..." aria-label="Filter files" />
+                        <i class="fas fa-filter filter-icon"></i>
+                    </div>
+                </div>`;
+            container.parentElement?.insertBefore(toolbar, container);
+            // Event delegation for toolbar actions
+            toolbar.addEventListener('click', (e) => {
+                const btn = e.target.closest('button[data-action]');
+                if (!btn) return;
+                const action = btn.getAttribute('data-action');
+                const currentSub = this.currentSubPaths[type] || '';
+                if (action === 'refresh') this.browseProjectDirectory(type, currentSub);
+                else if (action === 'up') {
+                    if (!currentSub) return; // already at root
+                    const parts = currentSub.split('/').filter(Boolean); parts.pop();
+                    this.browseProjectDirectory(type, parts.join('/'));
+                } else if (action === 'new-folder') {
+                    const subInput = document.getElementById(`${type}-new-subdir-name`);
+                    if (subInput) subInput.focus();
+                } else if (action === 'upload') {
+                    const fileInput = document.getElementById(`${type}-dir-file-input`);
+                    if (fileInput) fileInput.click();
+                } else if (action === 'zip') {
+                    const zipInput = document.getElementById(`${type}-zip-upload-input`);
+                    if (zipInput) zipInput.click();
+                }
+            });
+            const filterInput = toolbar.querySelector(`#${type}-file-filter`);
+            filterInput.addEventListener('input', (e) => {
+                this.filterDirectoryList(type, e.target.value.trim().toLowerCase());
+            });
+            container._enhanced = true;
+        }
+
+        // Update path label
+        const pathLabel = document.getElementById(`${type}-path-label`);
+        if (pathLabel) {
+            const subPath = this.currentSubPaths[type] || '';
+            pathLabel.textContent = subPath ? `/${subPath}` : '/';
+        }
+
+        container.innerHTML = '';
+        const dirs = data.directories || [];
+        const files = data.files || [];
+        if (!dirs.length && !files.length) {
+            container.innerHTML = `<div class="empty-directory"><i class="fas fa-folder-open"></i><p>Empty</p><small>Upload or create content</small></div>`;
+            return;
+        }
+        // Directories
+        dirs.forEach(d => {
+            const el = document.createElement('div');
+            el.className = 'directory-file-item';
+            el.style.cursor = 'pointer';
+            el.innerHTML = `
+                <div class="file-info-left">
+                    <div class="file-icon" style="background:#2d5a9e;">DIR</div>
+                    <div>
+                        <div class="file-name">${d.name}</div>
+                        <div class="file-meta">Modified: ${new Date(d.modified * 1000).toLocaleString()}</div>
+                    </div>
+                </div>
+                <div class="file-actions">
+                    <button class="file-action-btn rename" title="Rename" data-path="${d.path}"><i class="fas fa-tag"></i></button>
+                </div>`;
+            el.addEventListener('dblclick', () => this.browseProjectDirectory(type, d.path.slice(baseDir.length + 1)));
+            el.addEventListener('click', (e) => { if (e.detail === 2) return; });
+            const renameBtn = el.querySelector('.rename');
+            renameBtn.addEventListener('click', (e) => { e.stopPropagation(); this.renamePathPrompt(type, d.path); });
+            container.appendChild(el);
+        });
+        // Files
+        files.forEach(f => {
+            const extension = (f.extension || '').toLowerCase();
+            let iconBg = '#555';
+            if (extension === '.py') iconBg = '#3776ab'; else if (['.yml', '.yaml'].includes(extension)) iconBg = '#996515'; else if (extension === '.tf') iconBg = '#844fba'; else if (extension.includes('docker')) iconBg = '#0db7ed';
+            const el = document.createElement('div');
+            el.className = 'directory-file-item';
+            el.innerHTML = `
+                <div class="file-info-left">
+                    <div class="file-icon" style="background:${iconBg};">${extension.replace('.', '').toUpperCase() || 'FILE'}</div>
+                    <div>
+                        <div class="file-name">${f.name}</div>
+                        <div class="file-meta">${this.formatFileSize(f.size || 0)} • Modified: ${new Date(f.modified * 1000).toLocaleString()}</div>
+                    </div>
+                </div>
+                <div class="file-actions">
+                    <button class="file-action-btn" title="View" data-path="${f.path}" data-action="view"><i class="fas fa-eye"></i></button>
+                    <button class="file-action-btn edit" title="Edit" data-path="${f.path}" data-action="edit"><i class="fas fa-edit"></i></button>
+                    <button class="file-action-btn rename" title="Rename" data-path="${f.path}" data-action="rename"><i class="fas fa-tag"></i></button>
+                    <button class="file-action-btn delete" title="Delete" data-path="${f.path}" data-action="delete"><i class="fas fa-trash"></i></button>
+                </div>`;
+            el.addEventListener('click', () => {
+                // Toggle selection highlight (single select)
+                container.querySelectorAll('.directory-file-item.selected').forEach(sel => sel.classList.remove('selected'));
+                el.classList.add('selected');
+            });
+            el.querySelectorAll('.file-action-btn').forEach(btn => {
+                btn.addEventListener('click', (e) => {
+                    e.stopPropagation();
+                    const action = btn.getAttribute('data-action');
+                    const p = btn.getAttribute('data-path');
+                    if (action === 'view') this.viewPathFile(type, p);
+                    else if (action === 'edit') this.editPathFile(type, p);
+                    else if (action === 'rename') this.renamePathPrompt(type, p);
+                    else if (action === 'delete') this.deletePathFile(type, p);
+                });
+            });
+            container.appendChild(el);
+        });
+        // Apply existing filter if user typed something
+        const existingFilter = document.getElementById(`${type}-file-filter`);
+        if (existingFilter && existingFilter.value) this.filterDirectoryList(type, existingFilter.value.trim().toLowerCase());
+    }
+
+    filterDirectoryList(type, term) {
+        const container = document.getElementById(`${type}-directory-files`); if (!container) return;
+        const items = container.querySelectorAll('.directory-file-item');
+        items.forEach(item => {
+            if (!term) { item.style.display = ''; return; }
+            const name = (item.querySelector('.file-name')?.textContent || '').toLowerCase();
+            item.style.display = name.includes(term) ? '' : 'none';
+        });
+    }
+
+    renamePathPrompt(type, relPath) {
+        const baseName = relPath.split('/').pop();
+        const newName = prompt(`Rename '${baseName}' to:`, baseName);
+        if (!newName || newName.trim() === baseName) return;
+        fetch(`/api/directories/${type}/rename`, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ path: relPath, new_name: newName.trim() }) })
+            .then(r => r.json().then(j => ({ ok: r.ok, json: j })))
+            .then(res => {
+                if (res.ok) { this.addLog(`Renamed to ${res.json.new_path}`, 'success'); this.browseProjectDirectory(type, this.currentSubPaths[type]); }
+                else alert(`Rename failed: ${res.json.error}`);
+            }).catch(e => this.addLog(`Rename error: ${e.message}`, 'error'));
+    }
+
+    async viewPathFile(type, relFilePath) {
+        try {
+            const r = await fetch(`/api/directories/${type}/file?path=${encodeURIComponent(relFilePath)}`);
+            const data = await r.json();
+            if (!r.ok) { alert(data.error || 'Failed'); return; }
+            this.showFileContentModal(data.path.split('/').pop(), data.content);
+        } catch (e) { this.addLog(`View file error: ${e.message}`, 'error'); }
+    }
+
+    async editPathFile(type, relFilePath) {
+        try {
+            const r = await fetch(`/api/directories/${type}/file?path=${encodeURIComponent(relFilePath)}`);
+            const data = await r.json(); if (!r.ok) { alert(data.error || 'Failed'); return; }
+            // Switch to editor tab and populate
+            this.switchSection(type);
+            const editorTabSelector = type === 'python' ? `#${type}-section [data-tab="editor"]` : type === 'ansible' ? `#${type}-section [data-tab="editor-ansible"]` : type === 'terraform' ? `#${type}-section [data-tab="editor-tf"]` : type === 'docker' ? `#${type}-section [data-tab="editor-docker"]` : '';
+            const editorTab = document.querySelector(editorTabSelector); if (editorTab) editorTab.click();
+            const editor = document.getElementById(`${type}-editor`); if (editor) editor.value = data.content;
+            const filenameInput = document.getElementById(`${type}-filename`); if (filenameInput) filenameInput.value = data.path.split('/').pop();
+            // Track editing context for save (reuse existing logic if any)
+            this.editingContext = { type, filename: data.path.split('/').pop(), directory: this.currentDirectories[type] };
+        } catch (e) { this.addLog(`Edit file error: ${e.message}`, 'error'); }
+    }
+
+    async deletePathFile(type, relFilePath) {
+        if (!confirm(`Delete file '${relFilePath.split('/').pop()}'?`)) return;
+        try {
+            const r = await fetch(`/api/directories/${type}/file?path=${encodeURIComponent(relFilePath)}`, { method: 'DELETE' });
+            const data = await r.json(); if (!r.ok) { alert(data.error || 'Failed'); return; }
+            this.addLog(`Deleted ${data.deleted}`, 'success');
+            this.browseProjectDirectory(type, this.currentSubPaths[type]);
+        } catch (e) { this.addLog(`Delete file error: ${e.message}`, 'error'); }
+    }
+
+    // Subdirectory creation within project
+    createSubdirectory(type) {
+        const baseDir = this.currentDirectories[type]; if (!baseDir) return;
+        const nameInput = document.getElementById(`${type}-new-subdir-name`); if (!nameInput) return;
+        const name = nameInput.value.trim(); if (!name) return;
+        const subPath = this.currentSubPaths[type];
+        const parentRel = baseDir + (subPath ? '/' + subPath : '');
+        fetch(`/api/directories/${type}/mkdir`, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ path: parentRel, name }) })
+            .then(r => r.json().then(j => ({ ok: r.ok, json: j })))
+            .then(res => { if (res.ok) { nameInput.value = ''; this.addLog(`Created folder ${res.json.created}`, 'success'); this.browseProjectDirectory(type, subPath); } else alert(res.json.error || 'Failed'); })
+            .catch(e => this.addLog(`Create subdir error: ${e.message}`, 'error'));
+    }
+
+    // ZIP upload & extract for current path
+    setupZipAndSubdirListeners() {
+        ['python', 'ansible', 'terraform', 'docker'].forEach(type => {
+            const createBtn = document.getElementById(`${type}-create-subdir-btn`);
+            if (createBtn) { createBtn.addEventListener('click', () => this.createSubdirectory(type)); }
+            const subInput = document.getElementById(`${type}-new-subdir-name`);
+            if (subInput) { subInput.addEventListener('keypress', e => { if (e.key === 'Enter') this.createSubdirectory(type); }); }
+            const zipBtn = document.getElementById(`${type}-upload-zip-btn`);
+            const zipInput = document.getElementById(`${type}-zip-upload-input`);
+            if (zipBtn && zipInput) {
+                zipBtn.addEventListener('click', () => zipInput.click());
+                zipInput.addEventListener('change', (e) => { const file = e.target.files?.[0]; if (file) this.extractZipUpload(type, file); });
+            }
+        });
+    }
+
+    async extractZipUpload(type, file) {
+        // Show spinner/message during ZIP processing
+        const spinnerId = `${type}-zip-spinner`;
+        let spinner = document.getElementById(spinnerId);
+        if (!spinner) {
+            spinner = document.createElement('div');
+            spinner.id = spinnerId;
+            spinner.className = 'zip-upload-spinner';
+            spinner.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing ZIP...';
+            const container = document.getElementById(`${type}-directory-files`);
+            if (container) container.prepend(spinner);
+        }
+        try {
+            const arrayBuf = await file.arrayBuffer();
+            const b64 = this.arrayBufferToBase64(arrayBuf);
+            const baseDir = this.currentDirectories[type];
+            const sub = this.currentSubPaths[type];
+            const relPath = baseDir + (sub ? '/' + sub : '');
+            const r = await fetch(`/api/directories/${type}/extract-zip`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ path: relPath, zip_content: b64, overwrite: true })
+            });
+            const data = await r.json();
+            if (!r.ok) {
+                this.addLog(data.error || 'ZIP extract failed', 'error');
+                spinner.innerHTML = `<span style="color:red"><i class='fas fa-exclamation-circle'></i> ZIP extract failed: ${this.escapeHtml(data.error || 'Unknown error')}</span>`;
+                setTimeout(() => spinner.remove(), 3000);
+                return;
+            }
+            this.addLog(`Extracted ${data.count} items from ZIP`, 'success');
+            spinner.innerHTML = `<span style="color:green"><i class='fas fa-check-circle'></i> ZIP extracted: ${data.count} items</span>`;
+            setTimeout(() => spinner.remove(), 2000);
+            this.browseProjectDirectory(type, sub);
+        } catch (e) {
+            this.addLog(`ZIP extract error: ${e.message}`, 'error');
+            if (spinner) {
+                spinner.innerHTML = `<span style="color:red"><i class='fas fa-exclamation-circle'></i> ZIP extract error: ${this.escapeHtml(e.message)}</span>`;
+                setTimeout(() => spinner.remove(), 3000);
+            }
+        }
+    }
+
+    arrayBufferToBase64(buffer) {
+        let binary = ''; const bytes = new Uint8Array(buffer); const len = bytes.byteLength; for (let i = 0; i < len; i++) { binary += String.fromCharCode(bytes[i]); }
+        return btoa(binary);
+    }
+
+    // Ensure listeners setup after init
+    async loadDirectoryContents(type, dirName) { // Backward compatibility wrapper
+        this.browseProjectDirectory(type, this.currentSubPaths[type] || '');
+    }
+
+    renderDirectoryFiles(type, files) {
+        const container = document.getElementById(`${type}-directory-files`);
+        container.innerHTML = '';
+
+        if (!files || files.length === 0) {
+            container.innerHTML = `
+                <div class="empty-directory">
+                    <i class="fas fa-file"></i>
+                    <p>No files in this directory</p>
+                    <small>Upload files using the Upload Files button above</small>
+                </div>
+            `;
+            this.updateExecutionControls(type);
+            return;
+        }
+
+        files.forEach(file => {
+            const fileItem = document.createElement('div');
+            fileItem.className = 'directory-file-item';
+            fileItem.dataset.filename = file.name;
+
+            const extension = file.extension.toLowerCase();
+            let iconClass = 'default';
+            let fileStatus = 'executable';
+
+            if (['.yml', '.yaml'].includes(extension)) {
+                iconClass = 'yml';
+            } else if (extension === '.tf') {
+                iconClass = 'tf';
+            } else if (extension === '.py') {
+                iconClass = 'py';
+            }
+
+            // Determine file status
+            const isReadonly = file.name.includes('README') || file.name.includes('.backup');
+            if (isReadonly) fileStatus = 'readonly';
+
+            fileItem.innerHTML = `
+                <input type="checkbox" class="file-checkbox" data-filename="${file.name}">
+                <div class="file-info-left">
+                    <div class="file-icon ${iconClass}">
+                        ${extension.replace('.', '').toUpperCase()}
+                    </div>
+                    <div>
+                        <div class="file-name">${file.name}</div>
+                        <div class="file-meta">
+                            ${this.formatFileSize(file.size)} • Modified: ${new Date(file.modified * 1000).toLocaleString()}
+                        </div>
+                        <div class="file-status ${fileStatus}">
+                            <i class="fas ${fileStatus === 'executable' ? 'fa-play-circle' : fileStatus === 'readonly' ? 'fa-lock' : 'fa-edit'}"></i>
+                            ${fileStatus === 'executable' ? 'Ready to execute' : fileStatus === 'readonly' ? 'Read-only file' : 'Modified'}
+                        </div>
+                    </div>
+                </div>
+                <div class="file-actions">
+                    <button class="file-action-btn" onclick="app.viewDirectoryFile('${type}', '${file.name}')" title="View">
+                        <i class="fas fa-eye"></i>
+                    </button>
+                    <button class="file-action-btn edit" onclick="app.editDirectoryFile('${type}', '${file.name}')" title="Edit">
+                        <i class="fas fa-edit"></i>
+                    </button>
+                    <button class="file-action-btn rename" onclick="app.showRenameFileDialog('${type}', '${file.name}')" title="Rename">
+                        <i class="fas fa-tag"></i>
+                    </button>
+                    <button class="file-action-btn delete" onclick="app.deleteDirectoryFile('${type}', '${file.name}')" title="Delete">
+                        <i class="fas fa-trash"></i>
+                    </button>
+                </div>
+                <div class="file-selection-indicator">
+                    <i class="fas fa-check"></i>
+                </div>
+            `;
+
+            // Add event listeners
+            const checkbox = fileItem.querySelector('.file-checkbox');
+            checkbox.addEventListener('change', (e) => {
+                e.stopPropagation();
+                this.handleFileSelection(type, file.name, fileItem, checkbox.checked);
+            });
+
+            fileItem.addEventListener('click', (e) => {
+                if (!e.target.closest('.file-actions') && !e.target.closest('.file-checkbox')) {
+                    checkbox.checked = !checkbox.checked;
+                    this.handleFileSelection(type, file.name, fileItem, checkbox.checked);
+                }
+            });
+
+            container.appendChild(fileItem);
+        });
+
+        // Update the file selector dropdown
+        this.updateFileSelector(type, files);
+        // Update execution controls
+        this.updateExecutionControls(type);
+    }
+
+    updateFileSelector(type, files) {
+        // Handle different selector IDs for different types
+        let selectorId;
+        if (type === 'docker') {
+            selectorId = `${type}-main-file`;
+        } else {
+            selectorId = `${type}-selected-file`;
+        }
+
+        const selector = document.getElementById(selectorId);
+        if (!selector) {
+            return; // Selector doesn't exist for this type
+        }
+
+        // Clear and set default option
+        if (type === 'docker') {
+            selector.innerHTML = '<option value="">Select docker-compose.yml or Dockerfile...</option>';
+        } else {
+            selector.innerHTML = '<option value="">Select a file...</option>';
+        }
+
+        // Add files as options
+        files.forEach(file => {
+            const option = document.createElement('option');
+            option.value = file.name;
+            option.textContent = file.name;
+            selector.appendChild(option);
+        });
+
+        // For Docker, auto-detect and select main file if possible
+        if (type === 'docker') {
+            this.autoSelectDockerMainFile(files);
+        }
+    }
+
+    autoSelectDockerMainFile(files) {
+        const selector = document.getElementById('docker-main-file');
+        if (!selector) return;
+
+        // Look for docker-compose files first (higher priority)
+        const composeFiles = files.filter(file =>
+            file.name.match(/^(docker-)?compose\.(yml|yaml)$/i)
+        );
+
+        if (composeFiles.length > 0) {
+            selector.value = composeFiles[0].name;
+            return;
+        }
+
+        // Look for Dockerfile
+        const dockerfiles = files.filter(file =>
+            file.name.match(/^dockerfile$/i) || file.name.startsWith('Dockerfile')
+        );
+
+        if (dockerfiles.length > 0) {
+            selector.value = dockerfiles[0].name;
+            return;
+        }
+    }
+
+    selectDirectoryFile(type, filename, fileItem) {
+        // Remove previous selection
+        document.querySelectorAll(`#${type}-directory-files .directory-file-item`).forEach(item => {
+            item.classList.remove('selected');
+        });
+
+        // Add selection to clicked item
+        fileItem.classList.add('selected');
+
+        // Update selector
+        document.getElementById(`${type}-selected-file`).value = filename;
+
+        // Update execution controls
+        this.updateExecutionControls(type);
+    }
+
+    handleFileSelection(type, filename, fileItem, isSelected) {
+        if (isSelected) {
+            fileItem.classList.add('selected');
+        } else {
+            fileItem.classList.remove('selected');
+        }
+
+        this.updateExecutionControls(type);
+        this.updateSelectionSummary(type);
+    }
+
+    updateSelectionSummary(type) {
+        const selectedFiles = document.querySelectorAll(`#${type}-directory-files .file-checkbox:checked`);
+        const countElement = document.getElementById(`${type}-selected-count`);
+        const count = selectedFiles.length;
+
+        if (countElement) {
+            countElement.textContent = `${count} file${count !== 1 ? 's' : ''} selected`;
+        }
+    }
+
+    updateExecutionControls(type) {
+        const executeBtn = document.getElementById(`${type}-execute-file-btn`);
+        const selectedFileDropdown = document.getElementById(`${type}-selected-file`);
+        const selectedFiles = document.querySelectorAll(`#${type}-directory-files .file-checkbox:checked`);
+        const singleMode = document.querySelector(`input[name="${type}-exec-mode"][value="single"]`);
+        const batchMode = document.querySelector(`input[name="${type}-exec-mode"][value="batch"]`);
+
+        if (!executeBtn) return;
+
+        let canExecute = false;
+        let buttonText = 'Execute Selected';
+
+        if (singleMode && singleMode.checked) {
+            // Single file mode - check if dropdown has selection
+            canExecute = selectedFileDropdown && selectedFileDropdown.value !== '';
+            buttonText = 'Execute File';
+        } else if (batchMode && batchMode.checked) {
+            // Batch mode - check if any files are selected
+            canExecute = selectedFiles.length > 0;
+            buttonText = `Execute ${selectedFiles.length} Files`;
+        }
+
+        executeBtn.disabled = !canExecute;
+        executeBtn.innerHTML = `<i class="fas fa-play"></i> ${buttonText}`;
+    }
+
+    async handleDirectoryFileUpload(type, files) {
+        if (!this.currentDirectories[type]) { alert('Please select a directory first'); return; }
+        const baseDir = this.currentDirectories[type];
+        const sub = this.currentSubPaths ? this.currentSubPaths[type] : '';
+        const relPath = baseDir + (sub ? '/' + sub : '');
+        const filesData = [];
+        for (const file of files) {
+            const content = await this.readFileContent(file);
+            filesData.push({ name: file.name, content });
+        }
+        try {
+            const response = await fetch(`/api/directories/${type}/upload`, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ path: relPath, files: filesData, overwrite: true }) });
+            const result = await response.json();
+            if (response.ok) {
+                this.addLog(`Uploaded ${result.count || filesData.length} files to '${relPath}'`, 'success');
+                this.browseProjectDirectory(type, sub);
+            } else {
+                alert(`Failed to upload files: ${result.error || 'Unknown error'}`);
+            }
+        } catch (error) {
+            this.addLog(`Error uploading files: ${error.message}`, 'error');
+            alert('Failed to upload files');
+        }
+    }
+
+    async readFileContent(file) {
+        return new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = (e) => resolve(e.target.result);
+            reader.onerror = (e) => reject(e);
+            reader.readAsText(file);
+        });
+    }
+
+    async viewDirectoryFile(type, filename) {
+        const dirName = this.currentDirectories[type];
+        try {
+            const response = await fetch(`/api/directories/${type}/${dirName}/files/${filename}`);
+            if (response.ok) {
+                const data = await response.json();
+                // Show file content in a modal or editor
+                this.showFileContentModal(data.name, data.content);
+            } else {
+                const error = await response.json();
+                alert(`Failed to load file: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error loading file: ${error.message}`, 'error');
+        }
+    }
+
+    showFileContentModal(filename, content) {
+        // Create a simple modal to show file content
+        const modal = document.createElement('div');
+        modal.className = 'modal show';
+        modal.innerHTML = `
+            <div class="modal-content" style="max-width: 800px;">
+                <div class="modal-header">
+                    <h3><i class="fas fa-file"></i> ${filename}</h3>
+                    <button class="modal-close">&times;</button>
+                </div>
+                <div class="modal-body">
+                    <div class="code-editor-container">
+                        <div class="code-editor-wrapper">
+                            <pre style="background: #1e1e1e; color: #d4d4d4; padding: 20px; border-radius: 4px; max-height: 400px; overflow-y: auto; white-space: pre-wrap;">${content}</pre>
+                        </div>
+                    </div>
+                </div>
+                <div class="modal-footer">
+                    <button class="btn btn-secondary modal-close-btn">Close</button>
+                </div>
+            </div>
+        `;
+
+        document.body.appendChild(modal);
+
+        // Close modal handlers
+        modal.querySelector('.modal-close').addEventListener('click', () => {
+            document.body.removeChild(modal);
+        });
+        modal.querySelector('.modal-close-btn').addEventListener('click', () => {
+            document.body.removeChild(modal);
+        });
+        modal.addEventListener('click', (e) => {
+            if (e.target === modal) {
+                document.body.removeChild(modal);
+            }
+        });
+    }
+
+    async deleteDirectoryFile(type, filename) {
+        if (!confirm(`Are you sure you want to delete '${filename}'?`)) {
+            return;
+        }
+
+        const dirName = this.currentDirectories[type];
+        try {
+            const response = await fetch(`/api/directories/${type}/${dirName}/files/${filename}`, {
+                method: 'DELETE'
+            });
+
+            if (response.ok) {
+                this.addLog(`File '${filename}' deleted successfully`, 'success');
+                this.browseProjectDirectory(type, this.currentSubPaths[type] || '');
+            } else {
+                const error = await response.json();
+                alert(`Failed to delete file: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error deleting file: ${error.message}`, 'error');
+        }
+    }
+
+    async editDirectoryFile(type, filename) {
+        const dirName = this.currentDirectories[type];
+
+        // Debug logging and validation
+        console.log('editDirectoryFile called with:', { type, filename, dirName });
+        this.addLog(`Attempting to edit file: ${filename} in directory: ${dirName || 'none'}`, 'info');
+
+        if (!dirName) {
+            alert(`No ${type} directory is currently selected. Please open a directory first.`);
+            return;
+        }
+
+        try {
+            // Load file content
+            const response = await fetch(`/api/directories/${type}/${dirName}/files/${filename}`);
+            if (!response.ok) {
+                const error = await response.json();
+                alert(`Failed to load file: ${error.error}`);
+                return;
+            }
+
+            const fileData = await response.json();
+
+            // Switch to the appropriate section and load content into editor
+            this.switchSection(type);
+
+            // Switch to editor tab
+            const editorTabSelector = type === 'python' ? `#${type}-section [data-tab="editor"]` :
+                type === 'ansible' ? `#${type}-section [data-tab="editor-ansible"]` :
+                    type === 'terraform' ? `#${type}-section [data-tab="editor-tf"]` :
+                        type === 'docker' ? `#${type}-section [data-tab="editor-docker"]` :
+                            `#${type}-section [data-tab="editor-tf"]`;
+
+            console.log('Looking for editor tab with selector:', editorTabSelector);
+            const editorTab = document.querySelector(editorTabSelector);
+            if (editorTab) {
+                editorTab.click();
+                this.addLog(`Switched to ${type} editor tab`, 'info');
+            } else {
+                this.addLog(`Warning: Could not find editor tab for ${type} with selector: ${editorTabSelector}`, 'warning');
+                // Try alternative approach - look for the tab button directly
+                const dockerEditorTab = document.querySelector('[data-tab="editor-docker"]');
+                if (dockerEditorTab && type === 'docker') {
+                    dockerEditorTab.click();
+                    this.addLog(`Found and clicked Docker editor tab using alternative method`, 'info');
+                }
+            }
+
+            // Wait for the editor to be available with retries
+            await this.waitForEditor(type, fileData, dirName, filename);
+
+        } catch (error) {
+            this.addLog(`Error loading file for editing: ${error.message}`, 'error');
+            alert(`Error loading file for editing: ${error.message}`);
+        }
+    }
+
+    async waitForEditor(type, fileData, dirName, filename, maxRetries = 5) {
+        const editorId = `${type}-editor`;
+
+        for (let attempt = 0; attempt < maxRetries; attempt++) {
+            await new Promise(resolve => setTimeout(resolve, 100 + (attempt * 100))); // Increasing delay
+
+            const editor = document.getElementById(editorId);
+            if (editor) {
+                editor.value = fileData.content;
+                this.updateLineNumbers(editorId);
+                this.autoResizeEditor(editorId);
+
+                // Set the filename in the filename input field
+                const filenameInputId = `${type}-filename`;
+                const filenameInput = document.getElementById(filenameInputId);
+                if (filenameInput) {
+                    filenameInput.value = filename;
+                    this.addLog(`Set filename in input field: ${filename}`, 'info');
+                } else {
+                    this.addLog(`Warning: Could not find filename input field: ${filenameInputId}`, 'warning');
+                }
+
+                // Update tab name to show we're editing a file
+                this.updateTabName(`${type}-tab-name`, `${filename} (editing)`);
+
+                // Store editing context
+                this.editingContext = {
+                    type: type,
+                    directory: dirName,
+                    filename: filename,
+                    originalContent: fileData.content,
+                    isDirectoryFile: true // Flag to indicate this is a directory file edit
+                };
+
+                // Add save button specifically for editing
+                this.showEditingSaveButton(type);
+
+                this.addLog(`Loaded '${filename}' for editing from directory '${dirName}' (attempt ${attempt + 1})`, 'success');
+                return;
+            }
+
+            this.addLog(`Editor for ${type} not found on attempt ${attempt + 1}, retrying...`, 'warning');
+        }
+
+        // If we get here, all retries failed
+        this.addLog(`Error: Could not find editor for ${type} after ${maxRetries} attempts. Please ensure the section is loaded properly.`, 'error');
+        alert(`Error: Could not find editor for ${type}. Please ensure the section is loaded properly.`);
+    }
+
+    showEditingSaveButton(type) {
+        // Add a special save button for editing mode
+        const actionsContainer = document.querySelector(`#${type}-section .form-actions`);
+        if (actionsContainer && !document.getElementById(`save-editing-${type}-btn`)) {
+            const saveEditingBtn = document.createElement('button');
+            saveEditingBtn.className = 'btn btn-primary';
+            saveEditingBtn.id = `save-editing-${type}-btn`;
+            saveEditingBtn.innerHTML = '<i class="fas fa-save"></i> Save Changes';
+            saveEditingBtn.onclick = () => this.saveEditedFile();
+
+            // Insert at the beginning
+            actionsContainer.insertBefore(saveEditingBtn, actionsContainer.firstChild);
+        }
+    }
+
+    async saveEditedFile() {
+        if (!this.editingContext) {
+            alert('No file is currently being edited');
+            this.addLog('Save attempted but no file is being edited', 'warning');
+            return;
+        }
+
+        const { type, directory, filename } = this.editingContext;
+        const editorId = `${type}-editor`;
+        const editor = document.getElementById(editorId);
+
+        if (!editor) {
+            alert(`Could not find editor for ${type}`);
+            this.addLog(`Error: Could not find editor ${editorId}`, 'error');
+            return;
+        }
+
+        const newContent = editor.value;
+
+        this.addLog(`Saving file '${filename}' to directory '${directory}'...`, 'info');
+        console.log('saveEditedFile:', { type, directory, filename, contentLength: newContent.length });
+
+        try {
+            const response = await fetch(`/api/directories/${type}/${directory}/files/${filename}`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ content: newContent })
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.addLog(`✓ File '${filename}' saved successfully`, 'success');
+                this.editingContext.originalContent = newContent;
+                this.updateTabName(`${type}-tab-name`, `${filename} (saved)`);
+
+                // Remove the editing save button
+                const saveEditingBtn = document.getElementById(`save-editing-${type}-btn`);
+                if (saveEditingBtn) {
+                    saveEditingBtn.remove();
+                }
+
+                // Clear editing context
+                this.editingContext = null;
+
+                // Refresh directory contents to show the updated file
+                this.addLog(`Refreshing directory contents for '${directory}'...`, 'info');
+                this.browseProjectDirectory(type, this.currentSubPaths[type] || '');
+
+                alert(`File '${filename}' saved successfully!`);
+            } else {
+                const error = await response.json();
+                const errorMsg = `Failed to save file: ${error.error}`;
+                this.addLog(`✗ ${errorMsg}`, 'error');
+                alert(errorMsg);
+            }
+        } catch (error) {
+            const errorMsg = `Error saving file: ${error.message}`;
+            this.addLog(`✗ ${errorMsg}`, 'error');
+            alert(errorMsg);
+        }
+    }
+
+    showRenameFileDialog(type, filename) {
+        const dirName = this.currentDirectories[type];
+        const newName = prompt(`Rename file '${filename}' to:`, filename);
+
+        if (newName && newName.trim() && newName.trim() !== filename) {
+            this.renameFile(type, dirName, filename, newName.trim());
+        }
+    }
+
+    async renameFile(type, dirName, oldName, newName) {
+        try {
+            const response = await fetch(`/api/directories/${type}/${dirName}/files/${oldName}/rename`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ new_name: newName })
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.addLog(`File renamed from '${oldName}' to '${newName}'`, 'success');
+                this.browseProjectDirectory(type, this.currentSubPaths[type] || '');
+            } else {
+                const error = await response.json();
+                alert(`Failed to rename file: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error renaming file: ${error.message}`, 'error');
+        }
+    }
+
+    showRenameDirectoryDialog(type, dirName) {
+        const newName = prompt(`Rename directory '${dirName}' to:`, dirName);
+
+        if (newName && newName.trim() && newName.trim() !== dirName) {
+            this.renameDirectory(type, dirName, newName.trim());
+        }
+    }
+
+    async renameDirectory(type, oldName, newName) {
+        try {
+            const response = await fetch(`/api/directories/${type}/${oldName}/rename`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ new_name: newName })
+            });
+
+            if (response.ok) {
+                const result = await response.json();
+                this.addLog(`Directory renamed from '${oldName}' to '${newName}'`, 'success');
+
+                // Update current directory if it was the one being renamed
+                if (this.currentDirectories[type] === oldName) {
+                    this.currentDirectories[type] = newName;
+                }
+
+                this.loadDirectories(type);
+            } else {
+                const error = await response.json();
+                alert(`Failed to rename directory: ${error.error}`);
+            }
+        } catch (error) {
+            this.addLog(`Error renaming directory: ${error.message}`, 'error');
+        }
+    }
+
+    async executeDirectoryFile(type) {
+        const machineSelect = document.getElementById(`${type}-machine-select`);
+        const customCommandInput = document.getElementById(`${type}-custom-command`);
+        const dirName = this.currentDirectories[type];
+
+        const singleMode = document.querySelector(`input[name="${type}-exec-mode"][value="single"]`);
+        const isSingleMode = singleMode && singleMode.checked;
+
+        if (!dirName) {
+            alert('No directory selected');
+            return;
+        }
+
+        let machineId = machineSelect ? machineSelect.value : 'local';
+        let customCommand = customCommandInput ? customCommandInput.value.trim() : '';
+        let filesToExecute = [];
+
+        if (isSingleMode) {
+            // Single file mode
+            const fileSelect = document.getElementById(`${type}-selected-file`);
+            const filename = fileSelect ? fileSelect.value : '';
+
+            if (!filename) {
+                alert('Please select a file to execute');
+                return;
+            }
+            filesToExecute = [filename];
+        } else {
+            // Batch mode
+            const selectedCheckboxes = document.querySelectorAll(`#${type}-directory-files .file-checkbox:checked`);
+            if (selectedCheckboxes.length === 0) {
+                alert('Please select at least one file to execute');
+                return;
+            }
+            filesToExecute = Array.from(selectedCheckboxes).map(cb => cb.dataset.filename);
+        }
+
+        if (!machineId) {
+            alert('Please select a machine');
+            return;
+        }
+
+        this.addLog(`🚀 Starting execution of ${filesToExecute.length} file(s) from ${dirName} directory...`, 'info');
+
+        // Execute files sequentially but in background
+        for (const filename of filesToExecute) {
+            try {
+                this.addLog(`▶️ Starting: ${filename}`, 'info');
+
+                const response = await fetch(`/api/execute-directory/${type}`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({
+                        machine_id: machineId,
+                        directory: dirName,
+                        filename: filename,
+                        custom_command: customCommand || null
+                    })
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    this.addLog(`✅ ${filename} execution started: ${result.execution_id}`, 'info');
+                } else {
+                    this.addLog(`❌ Failed to start ${filename} execution: ${result.error}`, 'error');
+                }
+            } catch (error) {
+                this.addLog(`❌ Error starting ${filename} execution: ${error.message}`, 'error');
+            }
+        }
+
+        this.addLog(`📋 All ${filesToExecute.length} file(s) submitted for execution. Check Dashboard for progress.`, 'info');
+    }
+
+    // Removed executeTerraformDirectoryAction in favor of unified workflow execution
+
+    // --- Enhanced Project Execution Methods ---
+    async executeProject(projectType) {
+        // Handle Docker project execution differently
+        if (projectType === 'docker') {
+            return this.executeDockerProject();
+        }
+
+        const dirName = this.currentDirectories[projectType];
+        if (!dirName) {
+            alert(`No ${projectType} directory selected`);
+            return;
+        }
+
+        // Get execution parameters
+        const machineId = document.getElementById(`${projectType}-machine-select`).value;
+        const mainFile = document.getElementById(`${projectType}-main-file`).value;
+
+        // Handle different command type element names for different project types
+        let commandType;
+        if (projectType === 'terraform') {
+            const workflowElement = document.getElementById(`${projectType}-workflow-type`);
+            commandType = workflowElement ? workflowElement.value : 'full';
+        } else {
+            const commandTypeElement = document.getElementById(`${projectType}-command-type`);
+            commandType = commandTypeElement ? commandTypeElement.value : 'auto';
+        }
+
+        let customCommand = null;
+        let extraArgs = null;
+        let remote = true;
+
+        if (projectType === 'python') {
+            // Execution always targets the selected machine now (remote). Require machine selection.
+            remote = true;
+            if (!machineId) {
+                alert('Please select a machine for execution');
+                return;
+            }
+        } else if (projectType === 'ansible') {
+            // Ansible always needs a target machine
+            if (!machineId) {
+                alert('Please select a target machine for Ansible execution');
+                return;
+            }
+            remote = false; // Ansible runs locally but targets remote
+        } else if (projectType === 'terraform') {
+            // Terraform runs locally
+            remote = false;
+        }
+
+        // Get command parameters
+        if (commandType === 'custom') {
+            customCommand = document.getElementById(`${projectType}-custom-full-command`).value.trim();
+            if (!customCommand) {
+                alert('Please enter a custom command');
+                return;
+            }
+        } else {
+            extraArgs = document.getElementById(`${projectType}-extra-args`).value.trim();
+
+            // For terraform, handle workflow type
+            if (projectType === 'terraform') {
+                const workflowType = document.getElementById('terraform-workflow-type').value;
+                if (workflowType !== 'full') {
+                    extraArgs = (extraArgs ? `${extraArgs} ` : '') + workflowType;
+                }
+            }
+        }
+
+        // For Ansible, check become option
+        let becomeOption = false;
+        if (projectType === 'ansible') {
+            becomeOption = document.getElementById('ansible-project-become').checked;
+            if (becomeOption) {
+                extraArgs = (extraArgs ? `${extraArgs} ` : '') + '--become';
+            }
+        }
+
+        try {
+            const payload = {
+                project_type: projectType,
+                directory_name: dirName,
+                main_file: mainFile || null,
+                custom_command: customCommand,
+                remote: remote,
+                extra_args: extraArgs,
+                machine_id: machineId || null
+            };
+
+            const response = await fetch('/api/execute-project', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(payload)
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                this.addLog(`🚀 ${projectType.toUpperCase()} project execution started: ${result.execution_id}`, 'info');
+                this.addLog(`📁 Project: ${dirName}${mainFile ? ` (main: ${mainFile})` : ''}`, 'info');
+                // No loading overlay or endExecution - execution runs in background
+            } else {
+                this.addLog(`❌ Failed to start ${projectType} project execution: ${result.message}`, 'error');
+                alert(`Failed to start project execution: ${result.message}`);
+            }
+
+        } catch (error) {
+            this.addLog(`❌ Error starting ${projectType} project execution: ${error.message}`, 'error');
+            alert(`Failed to start project execution: ${error.message}`);
+        }
+    }
+
+    async detectMainFile(projectType) {
+        // Handle Docker project type differently
+        if (projectType === 'docker') {
+            return this.detectDockerMainFile();
+        }
+
+        const dirName = this.currentDirectories[projectType];
+        if (!dirName) {
+            alert(`No ${projectType} directory selected`);
+            return;
+        }
+
+        try {
+            const response = await fetch('/api/detect-main-file', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    project_type: projectType,
+                    directory_name: dirName
+                })
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                const mainFileSelect = document.getElementById(`${projectType}-main-file`);
+
+                // Clear existing options
+                mainFileSelect.innerHTML = '<option value="">Auto-detect main file...</option>';
+
+                // Add detected main file as first option if found
+                if (result.main_file) {
+                    const mainOption = document.createElement('option');
+                    mainOption.value = result.main_file;
+                    mainOption.textContent = `${result.main_file} (detected)`;
+                    mainOption.selected = true;
+                    mainFileSelect.appendChild(mainOption);
+                }
+
+                // Add all suitable files
+                result.suitable_files.forEach(file => {
+                    if (file !== result.main_file) { // Don't duplicate the main file
+                        const option = document.createElement('option');
+                        option.value = file;
+                        option.textContent = file;
+                        mainFileSelect.appendChild(option);
+                    }
+                });
+
+                if (result.main_file) {
+                    this.addLog(`✓ Detected main file: ${result.main_file}`, 'success');
+                } else {
+                    this.addLog(`! No main file detected for ${projectType} project`, 'warning');
+                }
+
+            } else {
+                this.addLog(`Failed to detect main file: ${result.message}`, 'error');
+                alert(`Failed to detect main file: ${result.message}`);
+            }
+
+        } catch (error) {
+            this.addLog(`Error detecting main file: ${error.message}`, 'error');
+            alert(`Failed to detect main file: ${error.message}`);
+        }
+    }
+
+    setupProjectExecution() {
+        // Setup project execution for each type
+        ['python', 'ansible', 'terraform', 'docker'].forEach(type => {
+            // Execute project button
+            const executeBtn = document.getElementById(`${type}-execute-project-btn`);
+            if (executeBtn) {
+                executeBtn.addEventListener('click', () => this.executeProject(type));
+            }
+
+            // Detect main file button
+            const detectBtn = document.getElementById(`${type}-detect-main-btn`);
+            if (detectBtn) {
+                detectBtn.addEventListener('click', () => this.detectMainFile(type));
+            }
+
+            // Command type selector - handle terraform's different naming
+            const commandTypeSelect = type === 'terraform' ?
+                document.getElementById('terraform-workflow-type') :
+                document.getElementById(`${type}-command-type`);
+            const customCommandInput = document.getElementById(`${type}-custom-full-command`);
+            const extraArgsInput = document.getElementById(`${type}-extra-args`);
+
+            if (commandTypeSelect && customCommandInput && extraArgsInput) {
+                commandTypeSelect.addEventListener('change', () => {
+                    const isCustom = type === 'terraform' ?
+                        commandTypeSelect.value === 'custom' :
+                        commandTypeSelect.value === 'custom';
+
+                    if (isCustom) {
+                        customCommandInput.style.display = 'block';
+                        extraArgsInput.style.display = 'none';
+                    } else {
+                        customCommandInput.style.display = 'none';
+                        extraArgsInput.style.display = 'block';
+                    }
+                });
+            }
+
+            // For Terraform, handle workflow type selector
+            if (type === 'terraform') {
+                const workflowSelect = document.getElementById('terraform-workflow-type');
+                const customCommandInput = document.getElementById('terraform-custom-full-command');
+                const extraArgsInput = document.getElementById('terraform-extra-args');
+
+                if (workflowSelect && customCommandInput && extraArgsInput) {
+                    workflowSelect.addEventListener('change', () => {
+                        if (workflowSelect.value === 'custom') {
+                            customCommandInput.style.display = 'block';
+                            extraArgsInput.style.display = 'none';
+                        } else {
+                            customCommandInput.style.display = 'none';
+                            extraArgsInput.style.display = 'block';
+                        }
+                    });
+                }
+            }
+
+            // For Docker, handle project action buttons
+            if (type === 'docker') {
+                const stopProjectBtn = document.getElementById('docker-stop-project-btn');
+                if (stopProjectBtn) {
+                    stopProjectBtn.addEventListener('click', () => this.executeDockerProjectAction('stop'));
+                }
+
+                const downProjectBtn = document.getElementById('docker-down-project-btn');
+                if (downProjectBtn) {
+                    downProjectBtn.addEventListener('click', () => this.executeDockerProjectAction('down'));
+                }
+            }
+        });
+    }
+
+    selectAllFiles(type) {
+        const checkboxes = document.querySelectorAll(`#${type}-directory-files .file-checkbox`);
+        checkboxes.forEach(checkbox => {
+            if (!checkbox.checked) {
+                checkbox.checked = true;
+                const fileItem = checkbox.closest('.directory-file-item');
+                this.handleFileSelection(type, checkbox.dataset.filename, fileItem, true);
+            }
+        });
+        this.updateSelectionSummary(type);
+    }
+
+    clearFileSelection(type) {
+        const checkboxes = document.querySelectorAll(`#${type}-directory-files .file-checkbox`);
+        checkboxes.forEach(checkbox => {
+            if (checkbox.checked) {
+                checkbox.checked = false;
+                const fileItem = checkbox.closest('.directory-file-item');
+                this.handleFileSelection(type, checkbox.dataset.filename, fileItem, false);
+            }
+        });
+        this.updateSelectionSummary(type);
+    }
+
+    closeDirectoryView(type) {
+        this.currentDirectories[type] = null;
+        document.getElementById(`${type}-directory-details`).style.display = 'none';
+
+        // Remove selection from directories
+        document.querySelectorAll(`#${type}-directories-grid .directory-card`).forEach(card => {
+            card.classList.remove('selected');
+        });
+    }
+}, app => {
+    app.initDirectoryManagement();
+    // Hierarchical directory enhancements (breadcrumbs, subdirectory + ZIP)
+    app.setupZipAndSubdirListeners();
+});
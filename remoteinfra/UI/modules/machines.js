@@ -0,0 +1,490 @@
+// Machines section: machine cards, OS info and the add/edit machine dialog
+RemoteRunApp.defineModule('machines', class {
+    renderMachines() {
+        const grid = document.getElementById('machines-grid');
+        // Cards are keyed by machine id; a status event redraws one card, not the fleet
+        const added = [];
+        this.patchList(grid, this.machines, machine => machine.id, machine => {
+            // Fallbacks for missing fields
+            const name = machine.name || machine.host || '';
+            const port = machine.port || 22;
+            const authType = machine.auth_type || 'password';
+            const status = machine.status === 'online' ? 'online' : 'offline';
+            const statusText = machine.status ? machine.status : 'offline';
+
+            return `
+                <div class="machine-card">
+                    <div class="machine-header">
+                        <div class="machine-name">${name}</div>
+                        <div class="machine-status status-${status}">
+                            ${statusText}
+                        </div>
+                    </div>
+                    <div class="machine-info">
+                        <p><strong>Host:</strong> ${machine.host}:${port}</p>
+                        <p><strong>Username:</strong> ${machine.username || ''}</p>
+                        <p><strong>Auth:</strong> ${authType}</p>
+                        <p><strong>OS:</strong> <span id="os-info-${machine.id}" class="loading-text">Loading...</span></p>
+                    </div>
+                    <div class="machine-actions">
+                        <button class="action-btn" onclick="app.testMachineConnection('${machine.id}')" title="Test Connection">
+                            <i class="fas fa-plug"></i>
+                        </button>
+                        <button class="action-btn" onclick="app.editMachine('${machine.id}')" title="Edit">
+                            <i class="fas fa-edit"></i>
+                        </button>
+                        <button class="action-btn" onclick="app.executeMachineCommand('${machine.id}')" title="Execute Command">
+                            <i class="fas fa-terminal"></i>
+                        </button>
+                        <button class="action-btn" onclick="app.deleteMachine('${machine.id}')" title="Delete">
+                            <i class="fas fa-trash"></i>
+                        </button>
+                    </div>
+                </div>`;
+        }, (card, machine, previous) => {
+            // A redrawn card keeps the OS info already fetched
+            const osInfo = previous && previous.querySelector('.machine-info p span');
+            if (osInfo) {
+                card.querySelector('.machine-info p span').replaceWith(osInfo);
+            } else {
+                added.push(machine);
+            }
+        });
+
+        // Load OS information asynchronously, once the cards are in the page
+        added.forEach(machine => this.loadMachineOSInfo(machine.id, machine.host));
+    }
+
+    async loadMachineOSInfo(machineId, machineHost) {
+        const osInfoElement = document.getElementById(`os-info-${machineId}`);
+        if (!osInfoElement) return;
+
+        try {
+            const response = await fetch('/api/machine/os-info', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ machine_id: machineId })
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+
+            const data = await response.json();
+
+            if (data.success && data.os_info) {
+                const osInfo = data.os_info;
+                let osDisplay = 'None';
+
+                // Try different fields to build a meaningful display
+                if (osInfo.distribution && osInfo.distribution !== 'Unknown') {
+                    osDisplay = osInfo.distribution;
+
+                    // Add kernel/version info if available and meaningful
+                    if (osInfo.kernel_version && osInfo.kernel_version !== 'Unknown') {
+                        // For Windows, kernel_version might contain version info
+                        if (osInfo.os_type === 'windows') {
+                            // Don't repeat if distribution already contains version info
+                            if (!osInfo.distribution.includes(osInfo.kernel_version)) {
+                                osDisplay += ` (${osInfo.kernel_version})`;
+                            }
+                        } else {
+                            // For Linux, show kernel version separately
+                            osDisplay += ` (${osInfo.kernel_version})`;
+                        }
+                    }
+                } else if (osInfo.os_type && osInfo.os_type !== 'Unknown') {
+                    osDisplay = osInfo.os_type.charAt(0).toUpperCase() + osInfo.os_type.slice(1);
+                } else if (osInfo.platform) {
+                    osDisplay = osInfo.platform;
+                }
+
+                osInfoElement.textContent = osDisplay;
+                osInfoElement.className = 'os-info-loaded';
+                osInfoElement.title = `OS: ${osInfo.os_type || 'Unknown'}\nDistribution: ${osInfo.distribution || 'Unknown'}\nArchitecture: ${osInfo.architecture || 'Unknown'}\nMemory: ${osInfo.total_memory || 'Unknown'}`;
+            } else {
+                osInfoElement.textContent = 'None';
+                osInfoElement.className = 'os-info-error';
+                console.warn('OS info response:', data);
+            }
+        } catch (error) {
+            console.warn(`Failed to load OS info for machine ${machineId}:`, error);
+            osInfoElement.textContent = 'None';
+            osInfoElement.className = 'os-info-error';
+        }
+    }
+
+    /**
+     * Initialize Add Machine modal controls (cancel button)
+     */
+    initAddMachineModal() {
+        const cancelBtn = document.getElementById('cancel-machine-btn');
+        if (cancelBtn && !cancelBtn._bound) {
+            cancelBtn.addEventListener('click', (e) => {
+                e.preventDefault();
+                // Reset form fields
+                const form = document.getElementById('add-machine-form');
+                if (form) form.reset();
+                // Clear id & key path
+                const idEl = document.getElementById('machine-id');
+                if (idEl) idEl.value = '';
+                const keyEl = document.getElementById('machine-key');
+                if (keyEl) keyEl.value = '';
+                const clearKeyBtn = document.getElementById('clear-key-btn');
+                if (clearKeyBtn) clearKeyBtn.style.display = 'none';
+                // Reset auth selection to password and hide key group
+                const authSelect = document.getElementById('machine-auth-type');
+                const keyGroup = document.getElementById('key-group');
+                const passwordGroup = document.getElementById('password-group');
+                if (authSelect) authSelect.value = 'password';
+                if (keyGroup) keyGroup.classList.add('hidden');
+                if (passwordGroup) passwordGroup.classList.remove('hidden');
+                this.hideModal('add-machine-modal');
+            });
+            cancelBtn._bound = true;
+        }
+    }
+
+    async saveMachine() {
+        const formData = {
+            id: document.getElementById('machine-id').value,
+            name: document.getElementById('machine-name').value,
+            host: document.getElementById('machine-host').value.trim(),
+            port: document.getElementById('machine-port').value,
+            username: document.getElementById('machine-username').value.trim(),
+            auth_type: document.getElementById('machine-auth-type').value,
+            password: document.getElementById('machine-password').value,
+            key_path: document.getElementById('machine-key').value
+        };
+
+        if (!formData.name || !formData.host || !formData.username) {
+            alert('Please fill in all required fields');
+            return;
+        }
+
+        // Only check for duplicates if adding a new machine (no id)
+        if (!formData.id) {
+            const duplicate = this.machines.find(m =>
+                m.host.trim().toLowerCase() === formData.host.toLowerCase() &&
+                m.username.trim().toLowerCase() === formData.username.toLowerCase()
+            );
+            if (duplicate) {
+                alert('Machine with the same host and username already exists.');
+                return;
+            }
+        }
+
+        // Show generic loading for machine save (previously referenced undefined 'mode')
+        this.showLoading('generic', formData.id ? 'Updating Machine' : 'Adding Machine');
+
+        try {
+            const method = formData.id ? 'PUT' : 'POST';
+            const url = formData.id ? `/api/machines/${formData.id}` : '/api/machines';
+
+            const response = await fetch(url, {
+                method: method,
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(formData)
+            });
+
+            if (response.ok) {
+                // Fetch the updated list of machines from the backend
+                await this.loadMachines();
+
+                const result = await response.json();
+                const machine = result.machine ? result.machine : result;
+
+                if (method === 'POST') {
+                    this.addLog(`Machine ${machine.name} added successfully`, 'success');
+                } else {
+                    this.addLog(`Machine ${machine.name} updated successfully`, 'success');
+                }
+
+                this.hideModal('add-machine-modal');
+            } else {
+                const error = await response.json();
+                alert(`Error: ${error.message}`);
+            }
+        } catch (error) {
+            alert('Failed to save machine');
+            this.addLog('Failed to save machine', 'error');
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    executeMachineCommand(machineId) {
+        const select = document.getElementById('command-machine-select');
+        if (select) {
+            select.value = machineId;
+        }
+        this.switchSection('commands');
+        const cmdInput = document.getElementById('command-input');
+        if (cmdInput) {
+            cmdInput.focus();
+        }
+    }
+
+    async testConnection() {
+        // Use the selected machine from the machines list, not the modal form
+        let machineId = document.getElementById('machine-id')?.value;
+        // If not present, try to get from the select dropdown (for add)
+        if (!machineId) {
+            const select = document.getElementById('command-machine-select');
+            if (select) machineId = select.value;
+        }
+        if (!machineId) {
+            alert('No machine selected for connection test');
+            return;
+        }
+        this.showLoading('generic', 'Testing Connection');
+        try {
+            const response = await fetch('/api/test-connection', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ machine_id: machineId })
+            });
+            // Accept both 200 and 404 as valid responses to parse JSON
+            let result = {};
+            try {
+                result = await response.json();
+            } catch (e) { }
+            if (response.ok && result.success) {
+                alert('Connection successful!');
+                this.addLog('Connection test successful', 'success');
+            } else {
+                alert(`Connection failed: ${result.message || 'Unknown error'}`);
+                this.addLog('Connection test failed: ' + (result.message || 'Unknown error'), 'error');
+            }
+        } catch (error) {
+            alert('Connection test failed');
+            this.addLog('Connection test failed', 'error');
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    toggleAuthType(authType) {
+        const passwordGroup = document.getElementById('password-group');
+        const keyGroup = document.getElementById('key-group');
+
+        if (authType === 'password') {
+            passwordGroup.classList.remove('hidden');
+            keyGroup.classList.add('hidden');
+        } else {
+            passwordGroup.classList.add('hidden');
+            keyGroup.classList.remove('hidden');
+        }
+    }
+
+    async uploadSSHKeyFile(file) {
+        if (!file) return null;
+        try {
+            const formData = new FormData();
+            formData.append('key_file', file);
+            this.showLoading('generic', 'Uploading SSH key');
+            const res = await fetch('/api/upload-key', { method: 'POST', body: formData });
+            const data = await res.json();
+            if (res.ok && data.success) {
+                document.getElementById('machine-key').value = data.path;
+                this.addLog('SSH key uploaded and stored securely', 'success');
+                const clearBtn = document.getElementById('clear-key-btn');
+                if (clearBtn) clearBtn.style.display = 'inline-flex';
+                return data.path;
+            } else {
+                this.addLog('SSH key upload failed: ' + (data.error || 'Unknown error'), 'error');
+                alert('Key upload failed: ' + (data.error || 'Unknown error'));
+            }
+        } catch (e) {
+            this.addLog('SSH key upload exception: ' + e.message, 'error');
+            alert('SSH key upload error: ' + e.message);
+        } finally {
+            this.hideLoading();
+        }
+        return null;
+    }
+
+    // Machine-specific actions
+    async testMachineConnection(machineId) {
+        // Fix: Always use the correct endpoint and pass the machineId
+        if (!machineId) {
+            alert('No machine selected for connection test');
+            return;
+        }
+        this.showLoading();
+        const machine = this.machines.find(m => m.id === machineId);
+        if (!machine) {
+            this.addLog('Machine not found', 'error');
+            this.hideLoading();
+            return;
+        }
+        this.addLog(`Testing connection to ${machine.name || machine.host}`, 'info');
+        try {
+            const response = await fetch('/api/test-connection', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({ machine_id: machineId })
+            });
+            let result = {};
+            try {
+                result = await response.json();
+            } catch (e) { }
+            if (response.ok && result.success) {
+                this.addLog(`Connection to ${machine.name || machine.host} successful`, 'success');
+                machine.status = 'online';
+                this.renderMachines();
+            } else {
+                this.addLog(`Connection to ${machine.name || machine.host} failed: ${result.message || 'Unknown error'}`, 'error');
+                machine.status = 'offline';
+                this.renderMachines();
+            }
+        } catch (error) {
+            this.addLog(`Connection test failed for ${machine.name || machine.host}`, 'error');
+            machine.status = 'offline';
+            this.renderMachines();
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    editMachine(machineId) {
+        const machine = this.machines.find(m => m.id === machineId);
+        if (!machine) return;
+
+        document.getElementById('machine-id').value = machine.id;
+        document.getElementById('machine-name').value = machine.name;
+        document.getElementById('machine-host').value = machine.host;
+        document.getElementById('machine-port').value = machine.port;
+        document.getElementById('machine-username').value = machine.username;
+        document.getElementById('machine-auth-type').value = machine.auth_type;
+        document.getElementById('machine-password').value = machine.password || '';
+        document.getElementById('machine-key').value = machine.key_path || '';
+
+        this.toggleAuthType(machine.auth_type);
+        this.showModal('add-machine-modal');
+
+        const saveBtn = document.getElementById('save-machine-btn');
+        saveBtn.textContent = 'Update Machine';
+        // Remove previous event listeners to avoid stacking
+        const newSaveHandler = () => {
+            this.updateMachine(machineId);
+            // Restore default after update
+            saveBtn.textContent = 'Save Machine';
+            saveBtn.onclick = () => this.saveMachine();
+        };
+        saveBtn.onclick = null;
+        saveBtn.removeEventListener('click', this._saveMachineHandler);
+        saveBtn.onclick = newSaveHandler;
+        this._saveMachineHandler = newSaveHandler;
+    }
+
+    async updateMachine(machineId) {
+        const formData = {
+            name: document.getElementById('machine-name').value,
+            host: document.getElementById('machine-host').value,
+            port: document.getElementById('machine-port').value,
+            username: document.getElementById('machine-username').value,
+            auth_type: document.getElementById('machine-auth-type').value,
+            password: document.getElementById('machine-password').value,
+            key_path: document.getElementById('machine-key').value
+        };
+
+        if (!formData.name || !formData.host || !formData.username) {
+            alert('Please fill in all required fields');
+            return;
+        }
+
+        this.showLoading();
+
+        try {
+            const response = await fetch(`/api/machines/${machineId}`, {
+                method: 'PUT',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(formData)
+            });
+            if (response.ok) {
+                await this.loadMachines();
+                this.hideModal('add-machine-modal');
+                this.addLog(`Machine ${formData.name} updated successfully`, 'success');
+                // Reset save button
+                const saveBtn = document.getElementById('save-machine-btn');
+                saveBtn.textContent = 'Save Machine';
+                saveBtn.onclick = () => this.saveMachine();
+            } else {
+                const error = await response.json();
+                alert(`Error: ${error.message}`);
+            }
+        } catch (error) {
+            alert('Failed to update machine');
+            this.addLog('Failed to update machine', 'error');
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    async deleteMachine(machineId) {
+        const machine = this.machines.find(m => m.id === machineId);
+        if (!machine) return;
+
+        if (!confirm(`Are you sure you want to delete the machine: ${machine.name}?`)) {
+            return;
+        }
+
+        this.showLoading();
+
+        try {
+            const response = await fetch(`/api/machines/${machineId}`, {
+                method: 'DELETE',
+                headers: {
+                    'Content-Type': 'application/json'
+                }
+            });
+            if (response.ok) {
+                this.machines = this.machines.filter(m => m.id !== machineId);
+                this.renderMachines();
+                this.populateMachineSelects();
+                this.addLog(`Machine ${machine.name} deleted successfully`, 'success');
+            } else {
+                const error = await response.json();
+                alert(`Error: ${error.message}`);
+            }
+        } catch (error) {
+            alert('Failed to delete machine');
+            this.addLog('Failed to delete machine', 'error');
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    async refreshMachineOSInfo(machineId) {
+        try {
+            const response = await fetch('/api/machine/os-info', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ machine_id: machineId })
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                return result.os_info;
+            } else {
+                console.error('Failed to get OS info:', result.error);
+                return null;
+            }
+        } catch (error) {
+            console.error('Error getting machine OS info:', error);
+            return null;
+        }
+    }
+}, app => app.renderMachines());
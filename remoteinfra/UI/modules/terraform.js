@@ -0,0 +1,366 @@
+// Terraform section: plans and applies and the Terraform overview
+RemoteRunApp.defineModule('terraform', class {
+    async runTerraform(action) {
+        let machineId = document.getElementById('terraform-machine-select').value;
+        if (machineId === 'local') {
+            machineId = 'localhost';
+            document.getElementById('terraform-machine-select').value = 'localhost';
+        }
+
+        if (!machineId) {
+            alert('Please select a machine (used for tracking purposes - Terraform runs locally)');
+            return;
+        }
+
+        const scriptContent = document.getElementById('terraform-editor').value;
+        const filename = document.getElementById('terraform-filename').value || 'main.tf';
+
+        // Validate that we have content for non-init actions
+        if (action !== 'init' && !scriptContent.trim()) {
+            alert('Please enter Terraform configuration content before running ' + action);
+            return;
+        }
+
+        this.startExecution(`terraform-${action}`);
+        this.showLoading('terraform', `Terraform ${action} in progress`);
+        try {
+            const payload = {
+                machine_id: machineId || 'localhost',
+                action: action,
+                filename: filename
+            };
+
+            // Only include script content for non-init actions or when we have content
+            if (scriptContent.trim()) {
+                payload.script_content = scriptContent;
+            }
+
+            const response = await fetch('/api/run-terraform', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(payload)
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                this.addLog(`Terraform ${action} executed successfully on dashboard host`, 'success');
+
+                // Display the actual output from Terraform
+                if (result.output) {
+                    // Format the output for better readability
+                    const formattedOutput = result.output.replace(/\n/g, '\n    ');
+                    this.addLog(`Terraform Output:\n    ${formattedOutput}`, 'info');
+                }
+
+                // Show appropriate success messages based on action
+                if (action === 'init') {
+                    this.addLog('✓ Terraform has been initialized locally. You can now run plan and apply.', 'success');
+                } else if (action === 'plan') {
+                    this.addLog('✓ Terraform plan completed locally. Review the changes above before applying.', 'success');
+                } else if (action === 'apply') {
+                    this.addLog('✓ Terraform apply completed locally. Infrastructure changes have been applied.', 'success');
+                }
+
+                // Refresh dashboard stats after successful execution
+                if (this.currentSection === 'dashboard') {
+                    this.loadDashboardStats();
+                    this.loadDashboardHistory();
+                }
+                this.endExecution(true);
+            } else {
+                this.addLog(`Terraform ${action} failed: ${result.message || 'Unknown error'}`, 'error');
+
+                // Display error output if available
+                if (result.output) {
+                    const formattedOutput = result.output.replace(/\n/g, '\n    ');
+                    this.addLog(`Error Details:\n    ${formattedOutput}`, 'error');
+                }
+
+                alert('Failed to run Terraform ' + action + ': ' + (result.message || 'Unknown error'));
+                this.endExecution(false);
+            }
+        } catch (error) {
+            this.addLog('Failed to run Terraform: ' + (error.message || error), 'error');
+            alert('Failed to run Terraform: ' + (error.message || error));
+            this.endExecution(false);
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    async saveTerraformScript() {
+        const scriptContent = document.getElementById('terraform-editor').value;
+        const filename = document.getElementById('terraform-filename').value;
+
+        if (!scriptContent || !filename) {
+            alert('Please enter script content and filename');
+            return;
+        }
+
+        try {
+            let response;
+
+            // Check if we're editing a directory file
+            if (this.editingContext && this.editingContext.isDirectoryFile && this.editingContext.type === 'terraform') {
+                // Save to directory using directory API
+                const { directory } = this.editingContext;
+                response = await fetch(`/api/directories/terraform/${directory}/files/${filename}`, {
+                    method: 'PUT',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({ content: scriptContent })
+                });
+
+                if (response.ok) {
+                    this.addLog(`Terraform script saved to directory '${directory}': ${filename}`, 'success');
+                    // Update editing context
+                    this.editingContext.originalContent = scriptContent;
+                    this.updateTabName('terraform-tab-name', `${filename} (saved)`);
+                    // Refresh directory contents
+                    this.loadDirectoryContents('terraform', directory);
+                } else {
+                    const error = await response.json();
+                    alert(`Failed to save to directory: ${error.error}`);
+                }
+            } else {
+                // Save as regular script file
+                response = await fetch('/api/save-script', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({
+                        type: 'terraform',
+                        filename: filename,
+                        content: scriptContent
+                    })
+                });
+
+                if (response.ok) {
+                    this.addLog(`Terraform script saved: ${filename}`, 'success');
+                    this.loadExistingFiles('terraform');
+                } else {
+                    const error = await response.json();
+                    alert(`Failed to save script: ${error.error}`);
+                }
+            }
+        } catch (error) {
+            this.addLog('Failed to save Terraform script: ' + (error.message || error), 'error');
+            alert('Failed to save Terraform script: ' + (error.message || error));
+        }
+    }
+
+    clearTerraform() {
+        document.getElementById('terraform-editor').value = '';
+        document.getElementById('terraform-filename').value = '';
+        document.getElementById('terraform-machine-select').value = '';
+        document.getElementById('terraform-file-input').value = '';
+        this.updateLineNumbers('terraform-editor');
+        this.updateTabName('terraform-tab-name', 'main.tf');
+    }
+
+    async refreshTerraformOverview(forceRefresh = false) {
+        let machineId = document.getElementById('terraform-machine-select').value;
+        if (machineId === 'local') {
+            // Backward compatibility mapping
+            machineId = 'localhost';
+            document.getElementById('terraform-machine-select').value = 'localhost';
+        }
+        if (!machineId) {
+            this.resetTerraformOverview();
+            return;
+        }
+
+        try {
+            this.showLoading();
+
+            const response = await fetch('/api/terraform/overview', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    machine_id: machineId,
+                    force_refresh: forceRefresh
+                })
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                this.displayTerraformOverview(result.overview);
+            } else {
+                this.resetTerraformOverview(`Error: ${result.error}`);
+            }
+        } catch (error) {
+            this.resetTerraformOverview(`Error: ${error.message}`);
+        } finally {
+            this.hideLoading();
+        }
+    }
+
+    displayTerraformOverview(overview) {
+        let container = document.getElementById('terraform-overview-content');
+        if (!container) {
+            const overviewTab = document.getElementById('overview-terraform-tab');
+            if (overviewTab) {
+                container = document.createElement('div');
+                container.id = 'terraform-overview-content';
+                overviewTab.appendChild(container);
+            } else {
+                console.warn('Terraform overview container not found');
+                return;
+            }
+        }
+
+        const isInstalled = overview.terraform_version !== 'Not installed';
+        const additionalTools = overview.additional_tools || {};
+        const availableToolsCount = Object.values(additionalTools).filter(status => status === 'Available').length;
+
+        container.innerHTML = `
+            <div class="enterprise-overview-panel">
+                <div class="overview-header">
+                    <div class="status-primary">
+                        <div class="tech-brand">
+                            <i class="fas fa-cloud"></i>
+                            <span class="brand-text">Terraform Environment</span>
+                        </div>
+                        <div class="version-badge">${this.escapeHtml(overview.terraform_version || 'Not installed')}</div>
+                    </div>
+                    <div class="health-indicator ${isInstalled ? 'healthy' : 'unhealthy'}">
+                        <div class="health-dot"></div>
+                        <span class="health-text">${isInstalled ? 'Available' : 'Not Available'}</span>
+                    </div>
+                </div>
+
+                <div class="metrics-dashboard">
+                    <div class="metric-card primary">
+                        <div class="metric-icon">
+                            <i class="fas fa-layer-group"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${Object.keys(overview.provider_versions || {}).length}</div>
+                            <div class="metric-label">Providers</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card secondary">
+                        <div class="metric-icon">
+                            <i class="fas fa-workspace"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${this.escapeHtml(overview.current_workspace || 'default')}</div>
+                            <div class="metric-label">Current Workspace</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card tertiary">
+                        <div class="metric-icon">
+                            <i class="fas fa-cloud"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${overview.cloud_cli_available || 'None'}</div>
+                            <div class="metric-label">Cloud CLI</div>
+                        </div>
+                    </div>
+                    
+                    <div class="metric-card quaternary">
+                        <div class="metric-icon">
+                            <i class="fas fa-tools"></i>
+                        </div>
+                        <div class="metric-content">
+                            <div class="metric-value">${availableToolsCount}</div>
+                            <div class="metric-label">Additional Tools</div>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="system-info-grid">
+                    <div class="info-section">
+                        <div class="section-header">
+                            <i class="fas fa-cloud" style="color: #fff"></i>
+                            <span style="color: #fff">Terraform Details</span>
+                        </div>
+                        <div class="info-items">
+                            <div class="info-row">
+                                <span class="info-key">Terraform Version</span>
+                                <span class="info-value">${this.escapeHtml(overview.terraform_version || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Platform</span>
+                                <span class="info-value">${this.escapeHtml(overview.platform || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Architecture</span>
+                                <span class="info-value">${this.escapeHtml(overview.architecture || 'None')}</span>
+                            </div>
+                            <div class="info-row">
+                                <span class="info-key">Current Workspace</span>
+                                <span class="info-value">${this.escapeHtml(overview.current_workspace || 'None')}</span>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div class="info-section">
+                        <div class="section-header">
+                            <i class="fas fa-tools" style="color: #fff"></i>
+                            <span style="color: #fff">Additional Tools</span>
+                        </div>
+                        <div class="info-items">
+                            ${Object.entries(additionalTools).map(([tool, status]) => `
+                                <div class="info-row">
+                                    <span class="info-key">${this.escapeHtml(tool)}</span>
+                                    <span class="info-value ${status === 'Available' ? 'status-available' : 'status-unavailable'}">${this.escapeHtml(status)}</span>
+                                </div>
+                            `).join('')}
+                            ${Object.keys(additionalTools).length === 0 ? `
+                                <div class="info-row">
+                                    <span class="info-key">No additional tools detected</span>
+                                    <span class="info-value">None</span>
+                                </div>
+                            ` : ''}
+                        </div>
+                    </div>
+                </div>
+                
+                ${Object.keys(overview.provider_versions || {}).length > 0 ? `
+                <div class="system-info-grid">
+                    <div class="info-section full-width">
+                        <div class="section-header">
+                            <i class="fas fa-plug" style="color: #fff"></i>
+                            <span style="color: #fff">Installed Providers</span>
+                        </div>
+                        <div class="info-items">
+                            ${Object.entries(overview.provider_versions || {}).map(([provider, status]) => `
+                                <div class="info-row">
+                                    <span class="info-key">${this.escapeHtml(provider)}</span>
+                                    <span class="info-value">${this.escapeHtml(status)}</span>
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                </div>
+                ` : ''}
+            </div>
+        `;
+    }
+
+    resetTerraformOverview(message = 'Select a machine to view Terraform environment information') {
+        const container = document.getElementById('terraform-overview-content');
+        if (!container) return;
+
+        container.innerHTML = `
+            <div class="info-placeholder">
+                <i class="fas fa-cloud"></i>
+                <p>${message}</p>
+            </div>
+        `;
+    }
+}, app => {
+    // Terraform defaults to the dashboard host, so its overview can be shown straight away
+    if (document.getElementById('terraform-machine-select')?.value === 'localhost') {
+        app.refreshTerraformOverview();
+    }
+});
@@ -0,0 +1,166 @@
+import math
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity``."""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def consume(self, tokens=1):
+        """Take ``tokens`` from the bucket. Returns (allowed, seconds_until_allowed)."""
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (tokens - self.tokens) / self.rate
+
+    def is_full(self):
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+class AdmissionDecision:
+    """Result of an admission check."""
+
+    def __init__(self, admitted, reason="", retry_after=0):
+        self.admitted = admitted
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def __bool__(self):
+        return self.admitted
+
+
+class AdmissionController:
+    """
+    Bounded admission for execution submissions.
+
+    Every submission must pass the submitting client's token bucket and find a free
+    slot in the execution queue (submitted but not yet started). Rejected submissions
+    carry a ``retry_after`` hint in seconds, suitable for a ``Retry-After`` header.
+    """
+
+    MAX_BUCKETS = 1000
+
+    def __init__(self, max_queue_depth=100, client_rate=1.0, client_burst=30, workers=10):
+        if client_rate <= 0:
+            raise ValueError("client_rate must be positive (submissions per second)")
+        self.max_queue_depth = max_queue_depth
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.workers = max(1, workers)
+
+        self._lock = threading.Lock()
+        self._buckets = {}   # {client_id: TokenBucket}
+        self._queued = {}    # {execution_id: enqueue time}
+        self._running = {}   # {execution_id: start time}
+
+        # Counters and moving averages for metrics
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_rate_limited = 0
+        self._avg_wait = 0.0
+        self._avg_service = 0.0
+        self._max_wait = 0.0
+
+    def admit(self, client_id, execution_id):
+        """Check and reserve a queue slot for ``execution_id`` submitted by ``client_id``."""
+        with self._lock:
+            if self.max_queue_depth is not None and len(self._queued) >= self.max_queue_depth:
+                self._rejected_queue_full += 1
+                return AdmissionDecision(False, "queue_full", self._estimate_drain_time())
+
+            bucket = self._buckets.get(client_id)
+            if bucket is None:
+                if len(self._buckets) >= self.MAX_BUCKETS:
+                    self._prune_buckets()
+                bucket = TokenBucket(self.client_rate, self.client_burst)
+                self._buckets[client_id] = bucket
+            allowed, wait = bucket.consume()
+            if not allowed:
+                self._rejected_rate_limited += 1
+                return AdmissionDecision(False, "rate_limited", max(1, int(math.ceil(wait))))
+
+            self._queued[execution_id] = time.time()
+            self._admitted += 1
+            return AdmissionDecision(True)
+
+    def mark_started(self, execution_id):
+        """Move an execution from the queue to the running set."""
+        now = time.time()
+        with self._lock:
+            queued_at = self._queued.pop(execution_id, None)
+            if queued_at is not None:
+                wait = now - queued_at
+                self._avg_wait = self._ewma(self._avg_wait, wait)
+                self._max_wait = max(self._max_wait, wait)
+            self._running[execution_id] = now
+
+    def mark_finished(self, execution_id):
+        """Release whatever slot ``execution_id`` holds."""
+        now = time.time()
+        with self._lock:
+            self._queued.pop(execution_id, None)
+            started_at = self._running.pop(execution_id, None)
+            if started_at is not None:
+                self._avg_service = self._ewma(self._avg_service, now - started_at)
+
+    def queue_depth(self):
+        with self._lock:
+            return len(self._queued)
+
+    def metrics(self):
+        """Snapshot of queue depth/age and admission counters."""
+        now = time.time()
+        with self._lock:
+            oldest = min(self._queued.values()) if self._queued else None
+            return {
+                "queue_depth": len(self._queued),
+                "max_queue_depth": self.max_queue_depth,
+                "running": len(self._running),
+                "workers": self.workers,
+                "oldest_queued_age": round(now - oldest, 3) if oldest else 0,
+                "avg_queue_wait": round(self._avg_wait, 3),
+                "max_queue_wait": round(self._max_wait, 3),
+                "avg_service_time": round(self._avg_service, 3),
+                "admitted": self._admitted,
+                "rejected_queue_full": self._rejected_queue_full,
+                "rejected_rate_limited": self._rejected_rate_limited,
+                "tracked_clients": len(self._buckets),
+                "client_rate": self.client_rate,
+                "client_burst": self.client_burst,
+            }
+
+    @staticmethod
+    def _ewma(current, sample, alpha=0.2):
+        return sample if current == 0 else (1 - alpha) * current + alpha * sample
+
+    def _estimate_drain_time(self):
+        # Time for the workers to free one queue slot, based on observed service time
+        service = self._avg_service or 1.0
+        return max(1, int(math.ceil(service / self.workers)))
+
+    def _prune_buckets(self):
+        # Drop buckets that have fully refilled; they carry no rate-limit state
+        for client_id in [c for c, b in self._buckets.items() if b.is_full()]:
+            del self._buckets[client_id]
+        # Still at the cap (many clients submitting at once): forget the least recently used ones
+        excess = len(self._buckets) - self.MAX_BUCKETS + 1
+        if excess > 0:
+            for client_id in sorted(self._buckets, key=lambda c: self._buckets[c].updated)[:excess]:
+                del self._buckets[client_id]
@@ -0,0 +1,132 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+
+try:
+    import brotli
+except ImportError:  # optional; without it only gzip variants are built
+    brotli = None
+
+# Content-hashed URLs never change meaning, so browsers may keep them for a year unasked
+IMMUTABLE = "public, max-age=31536000, immutable"
+MIMETYPES = {".js": "application/javascript", ".css": "text/css", ".html": "text/html"}
+
+
+class Asset:
+    __slots__ = ("name", "url", "etag", "mimetype", "variants", "mtime")
+
+    def __init__(self, name, url, body, mimetype, mtime):
+        self.name = name
+        self.url = url
+        self.etag = hashlib.sha256(body).hexdigest()[:16]
+        self.mimetype = mimetype
+        self.mtime = mtime
+        # Compressed once at the highest level, since every later request reuses the result
+        self.variants = {None: body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=11)
+
+    def select(self, accept_encodings):
+        """``(body, content_encoding)`` of the smallest variant the client accepts."""
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and accept_encodings.quality(encoding) > 0:
+                return self.variants[encoding], encoding
+        return self.variants[None], None
+
+
+class AssetBundle:
+    """
+    The UI's static files (``.js``, ``.css`` and the page), read and compressed once and
+    kept in memory.
+
+    Every script and stylesheet gets a content-hashed URL (``/assets/script.<hash>.js``)
+    that can be cached as immutable. ``index.html`` is rewritten to reference those URLs and
+    is revalidated with its ETag instead, so a changed file reaches browsers on the next page
+    load and an unchanged one is never fetched again. Files edited on disk are picked up when
+    the page is next requested.
+
+    Files in ``subdirs`` (the UI's lazily loaded section modules) are included under their
+    relative name (``modules/docker.js``); the page gets the URLs of all assets as
+    ``window.UI_ASSETS`` so scripts can load them by name, and ``settings`` (server options
+    the scripts must follow) as ``window.UI_SETTINGS``.
+    """
+
+    def __init__(self, directory, index="index.html", prefix="/assets/", subdirs=("modules",), settings=None):
+        self.directory = directory
+        self.index_name = index
+        self.prefix = prefix
+        self.subdirs = subdirs
+        self.settings = settings or {}
+        self._assets = {}  # file name -> Asset
+        self._by_url = {}  # hashed file name -> Asset
+        self._index = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Reload files changed since they were read; rebuild the page if any did."""
+        with self._lock:
+            names = self._names()
+            changed = False
+            for name in set(self._assets) - set(names):
+                # Deleted from disk
+                self._by_url.pop(self._assets.pop(name).url[len(self.prefix):], None)
+                changed = True
+            for name in names:
+                root, ext = os.path.splitext(name)
+                path = os.path.join(self.directory, name)
+                mtime = os.path.getmtime(path)
+                current = self._assets.get(name)
+                if current is not None and current.mtime == mtime:
+                    continue
+                with open(path, "rb") as f:
+                    body = f.read()
+                digest = hashlib.sha256(body).hexdigest()[:12]
+                asset = Asset(name, f"{self.prefix}{root}.{digest}{ext}", body, MIMETYPES[ext], mtime)
+                if current is not None:
+                    self._by_url.pop(current.url[len(self.prefix):], None)
+                self._assets[name] = asset
+                self._by_url[asset.url[len(self.prefix):]] = asset
+                changed = True
+            path = os.path.join(self.directory, self.index_name)
+            mtime = os.path.getmtime(path)
+            if changed or self._index is None or self._index.mtime != mtime:
+                with open(path, "rb") as f:
+                    html = f.read().decode("utf-8")
+                html = re.sub(r'(src|href)="([^":/?#]+)"', self._rewrite, html)
+                manifest = json.dumps(self.manifest()).replace("</", "<\\/")
+                settings = json.dumps(self.settings).replace("</", "<\\/")
+                html = html.replace("</head>", f"<script>window.UI_ASSETS = {manifest}; "
+                                               f"window.UI_SETTINGS = {settings};</script>\n</head>", 1)
+                self._index = Asset(self.index_name, "/", html.encode("utf-8"), MIMETYPES[".html"], mtime)
+
+    def _names(self):
+        names = [name for name in os.listdir(self.directory) if name != self.index_name]
+        for subdir in self.subdirs:
+            path = os.path.join(self.directory, subdir)
+            if os.path.isdir(path):
+                names.extend(f"{subdir}/{name}" for name in os.listdir(path))
+        return sorted(name for name in names if os.path.splitext(name)[1] in MIMETYPES)
+
+    def _rewrite(self, match):
+        asset = self._assets.get(match.group(2))
+        return f'{match.group(1)}="{asset.url}"' if asset else match.group(0)
+
+    def index(self):
+        self.refresh()
+        return self._index
+
+    def get(self, name):
+        """An asset by hashed file name (as under ``/assets/``) or plain file name, or None."""
+        return self._by_url.get(name) or self._assets.get(name)
+
+    def url(self, name):
+        asset = self._assets.get(name)
+        return asset.url if asset else None
+
+    def manifest(self):
+        """{file name: hashed URL} of every asset."""
+        return {name: asset.url for name, asset in self._assets.items()}
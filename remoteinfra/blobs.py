@@ -0,0 +1,77 @@
+import zlib
+
+
+class OutputStore:
+    """
+    Compressed store for execution output and logs, kept out of ``execution_history``.
+
+    Each text is UTF-8 encoded, cut into ``frame_size`` byte frames and every frame is
+    zlib-compressed on its own, so a byte range can be served by decompressing only the frames
+    it touches. Frames live in the ``execution_outputs`` side table.
+    """
+
+    FIELDS = ("output", "logs")
+
+    def __init__(self, storage, frame_size=64 * 1024, level=6):
+        self.storage = storage
+        self.frame_size = frame_size
+        self.level = level
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS execution_outputs (
+                execution_id TEXT,
+                field TEXT,
+                frame INTEGER,
+                data BLOB,
+                PRIMARY KEY (execution_id, field, frame)
+            )
+        """)
+
+    def put_statements(self, execution_id, field, text):
+        """
+        Statements replacing the stored ``field`` of an execution, for use with
+        ``Storage.write_many`` so they commit together with the metadata update.
+        Returns (statements, size_in_bytes).
+        """
+        raw = (text or "").encode("utf-8", errors="replace")
+        statements = [("DELETE FROM execution_outputs WHERE execution_id = ? AND field = ?", (execution_id, field))]
+        for frame, offset in enumerate(range(0, len(raw), self.frame_size)):
+            chunk = zlib.compress(raw[offset:offset + self.frame_size], self.level)
+            statements.append((
+                "INSERT INTO execution_outputs (execution_id, field, frame, data) VALUES (?, ?, ?, ?)",
+                (execution_id, field, frame, chunk),
+            ))
+        return statements, len(raw)
+
+    def delete_statements(self, execution_id):
+        return [("DELETE FROM execution_outputs WHERE execution_id = ?", (execution_id,))]
+
+    def read(self, execution_id, field, start=0, end=None):
+        """
+        Bytes ``start``..``end`` (inclusive, like an HTTP Range) of a stored field.
+        Returns None when nothing is stored for it.
+        """
+        first = start // self.frame_size
+        params = [execution_id, field, first]
+        query = "SELECT frame, data FROM execution_outputs WHERE execution_id = ? AND field = ? AND frame >= ?"
+        if end is not None:
+            query += " AND frame <= ?"
+            params.append(end // self.frame_size)
+        rows = self.storage.query(query + " ORDER BY frame", params)
+        if not rows:
+            return None if start == 0 and not self.exists(execution_id, field) else b""
+        data = b"".join(zlib.decompress(row["data"]) for row in rows)
+        offset = start - first * self.frame_size
+        return data[offset:] if end is None else data[offset:offset + end - start + 1]
+
+    def read_text(self, execution_id, field):
+        data = self.read(execution_id, field)
+        return None if data is None else data.decode("utf-8", errors="replace")
+
+    def exists(self, execution_id, field):
+        return self.storage.query_one(
+            "SELECT 1 FROM execution_outputs WHERE execution_id = ? AND field = ? LIMIT 1",
+            (execution_id, field),
+        ) is not None
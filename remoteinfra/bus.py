@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+import time
+import uuid
+
+
+class EventBus:
+    """
+    Relays dashboard events between the processes of a multi-process dashboard.
+
+    Every process keeps its Socket.IO clients, notifier queues, log watchers and machine
+    registry in memory, so an event raised in one process (an execution finishing, a machine
+    added) has to reach the others. The bus is a table in the shared database: ``publish()``
+    appends a row through the group-commit writer, and a thread in each process reads rows
+    newer than the last one it saw every ``interval`` seconds and hands those written by other
+    processes to ``handler(kind, data)``. Rows older than ``retention`` seconds are removed.
+    Rows are visible in commit order, so events arrive in the order they were published.
+
+    While the handler runs, ``delivering()`` is true in the bus thread; relays check it so
+    applying another process's event does not publish it again.
+    """
+
+    def __init__(self, storage, interval=0.1, retention=300):
+        self.storage = storage
+        self.interval = interval
+        self.retention = retention
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.handler = None
+        self.published = 0
+        self.received = 0
+        self._last_id = None
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS bus_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                data TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+
+    def start(self, handler):
+        """Deliver other processes' events, from now on, to ``handler(kind, data)``."""
+        self.handler = handler
+        if self._thread and self._thread.is_alive():
+            return
+        self._last_id = self.storage.query_value("SELECT MAX(id) FROM bus_events", default=0) or 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="remoteinfra-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def delivering(self):
+        return getattr(self._local, "delivering", False)
+
+    def publish(self, kind, data):
+        self.storage.write(
+            "INSERT INTO bus_events (origin, kind, data, created_at) VALUES (?, ?, ?, ?)",
+            (self.origin, kind, json.dumps(data, default=str), time.time()),
+            wait=False,
+        )
+        self.published += 1
+
+    def _loop(self):
+        next_trim = time.time() + self.retention
+        while not self._stop.is_set():
+            try:
+                rows = self.storage.query(
+                    "SELECT id, origin, kind, data FROM bus_events WHERE id > ? ORDER BY id LIMIT 500",
+                    (self._last_id,),
+                )
+            except Exception as e:
+                print(f"Event bus read failed: {e}")
+                rows = []
+            for row in rows:
+                self._last_id = row["id"]
+                if row["origin"] == self.origin:
+                    continue
+                self.received += 1
+                self._local.delivering = True
+                try:
+                    self.handler(row["kind"], json.loads(row["data"]))
+                except Exception as e:
+                    print(f"Event bus handler error ({row['kind']}): {e}")
+                finally:
+                    self._local.delivering = False
+            if time.time() >= next_trim:
+                self.storage.write("DELETE FROM bus_events WHERE created_at < ?",
+                                   (time.time() - self.retention,), wait=False)
+                next_trim = time.time() + self.retention
+            if len(rows) < 500:
+                self._stop.wait(self.interval)
+
+    def stats(self):
+        return {"origin": self.origin, "last_id": self._last_id, "published": self.published,
+                "received": self.received}
@@ -1,6 +1,25 @@
 import sys
 from remoteinfra.remoteinfra import SSHClient
-import sqlite3
+from remoteinfra import retry, watchdog
+from remoteinfra.admission import AdmissionController
+from remoteinfra.retry import RetryPolicy
+from remoteinfra.watchdog import Watchdog
+from remoteinfra.scheduler import Scheduler, ScheduledJob
+from remoteinfra.storage import Storage
+from remoteinfra.blobs import OutputStore
+from remoteinfra.livelog import LogStore
+from remoteinfra.logstream import LogBroadcaster
+from remoteinfra.notify import Notifier
+from remoteinfra.bus import EventBus
+from remoteinfra.stats import StatsPublisher
+from remoteinfra.rollups import ExecutionRollups
+from remoteinfra.search import ExecutionSearch
+from remoteinfra.timings import METRICS as TIMING_METRICS, TimingStore
+from remoteinfra.health import HealthChecker
+from remoteinfra.assets import AssetBundle, IMMUTABLE
+from remoteinfra.retention import RetentionManager
+from remoteinfra.registry import MachineRegistry, parse_tags
+from remoteinfra import inventory, server
 import os
 import uuid
 import datetime
@@ -10,12 +29,57 @@ import shutil
 import threading
 import queue
 import json
+import gzip
+import shlex
+import socket
+import sqlite3
+import base64
+import contextlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class Dashboard:
     """A simple Flask-based dashboard to manage remote machines and execute commands."""
-    def __init__(self, host="", port=5000):
-        """Initialize the dashboard."""
+    # Execution history listings leave these large columns out unless asked for by name
+    HISTORY_BLOB_FIELDS = ("output", "logs")
+    # Columns the history API may return; the rest (archive location, search index row) are internal
+    HISTORY_FIELDS = ("id", "machine_id", "type", "status", "command", "output", "logs", "started_at", "completed_at",
+                      "duration", "retry_count", "failure_class", "output_size", "logs_size")
+    HISTORY_PAGE_SIZE = 100
+    HISTORY_MAX_PAGE_SIZE = 1000
+    # JSON responses at least this large are gzipped for clients that accept it
+    JSON_GZIP_MIN_BYTES = 1024
+
+    def __init__(self, host="", port=5000, max_workers=10, max_queue_depth=100, client_rate=1.0, client_burst=30,
+                 retry_policy=None, execution_timeout=3600, retention=None, role="primary"):
+        """Initialize the dashboard.
+
+        Args:
+            max_workers (int): Number of executions that may run concurrently.
+            max_queue_depth (int): Maximum number of submitted executions waiting for a worker.
+                Further submissions are rejected with HTTP 429.
+            client_rate (float): Sustained submissions per second allowed for each client address (> 0).
+            client_burst (int): Number of submissions a client may make in a burst.
+            retry_policy (RetryPolicy, optional): Backoff for transient SSH failures, used both by
+                SSHClient.login() and for re-running idempotent executions. Defaults to
+                RetryPolicy().
+            execution_timeout (int): Default deadline of an execution in seconds, counted from
+                when it starts running. Its SSH channels and subprocesses are torn down when it
+                passes. Submissions may override it with a ``deadline`` field; None disables it.
+            retention (RetentionPolicy, optional): Age/row limits and archiving of execution
+                history, applied in the background. Defaults to keeping everything.
+            role (str): "primary", or "worker" for the extra processes started by
+                ``serve(workers=N)``. Workers skip startup recovery, migrations, the scheduler,
+                retention and health checks, which the primary runs for all of them. They
+                serve the schedule API from the stored jobs and leave running them to the
+                primary.
+        """
+        if role not in ("primary", "worker"):
+            raise ValueError("role must be 'primary' or 'worker'")
+        self.role = role
+        # Passed to the worker processes of serve(workers=N)
+        self._init_kwargs = dict(host=host, port=port, max_workers=max_workers, max_queue_depth=max_queue_depth,
+                                 client_rate=client_rate, client_burst=client_burst, retry_policy=retry_policy,
+                                 execution_timeout=execution_timeout, retention=retention)
         self.host = "0.0.0.0" if not host else host
         self.port = 5000 if not port else port
 
@@ -26,12 +90,26 @@ class Dashboard:
         
         # Set up base paths for directories
         self.directories_base_path = os.path.join(scripts_path, "projects")
+        self.archive_dir = os.path.join(scripts_path, "archive")
 
         # Background execution management
         self.execution_threads = {}  # {execution_id: {"thread": thread, "future": future, "status": status}}
-        self.executor = ThreadPoolExecutor(max_workers=10)  # Allow 10 concurrent executions
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.execution_queue = queue.Queue()
+        self.admission = AdmissionController(
+            max_queue_depth=max_queue_depth,
+            client_rate=client_rate,
+            client_burst=client_burst,
+            workers=max_workers,
+        )
         self.socketio = None  # Will be set when Flask-SocketIO is initialized
+        self.draining = False  # Set by shutdown(); new executions are refused while it waits
+        self.bus = None  # Cross-process relay, set up by serve(workers=N)
+        # Only the clients this dashboard creates use the given policy; others keep SSHClient's
+        self.ssh_retry_policy = retry_policy
+        self.retry_policy = retry_policy or SSHClient.RETRY_POLICY or RetryPolicy()
+        self.execution_timeout = execution_timeout
+        self.watchdog = Watchdog(on_expire=self._on_deadline_expired)
         
         # Overview data caching
         self.overview_cache = {
@@ -41,17 +119,57 @@ class Dashboard:
             'os_info': {}    # {machine_id: os_info_data}
         }
         
-        # Thread safety lock for database operations
-        self.db_lock = threading.Lock()
+        # SQLite access: WAL, pooled per-thread connections, grouped writes
+        self.storage = Storage(self.db_path)
+        # Output and logs are kept compressed outside execution_history
+        self.outputs = OutputStore(self.storage)
+        # Coalesced per-client delivery of execution events; started by serve()
+        self.notifier = Notifier()
+        # Coalesced, flow-controlled 'log' frames for clients watching an execution; started by serve()
+        self.log_stream = LogBroadcaster()
+        # Output of running executions, appended in numbered chunks as it arrives
+        self.logs = LogStore(self.storage, on_chunks=self.log_stream.publish)
+        # Per minute/hour execution counts behind the stats endpoints
+        self.rollups = ExecutionRollups(self.storage)
+        # Full-text index over commands and outputs of finished executions
+        self.search = ExecutionSearch(self.storage)
+        # Per host/type histograms of queue wait, connect, transfer and run time
+        self.timings = TimingStore(self.storage)
+        # Archiving, expiry and incremental vacuum; the thread is started by serve()
+        self.retention = RetentionManager(self.storage, self.outputs, retention, self.archive_dir, search=self.search)
 
-        # Connect to SQLite and ensure table exists
+        # Ensure tables exist
         self._init_db()
-        self.machines = self._fetch_all_machines()
+        if role == "primary":
+            threading.Thread(target=self._run_background_migrations, name="remoteinfra-migrations", daemon=True).start()
+        # Machines indexed by id/host/tag, kept in step with the machines table
+        self.machines = MachineRegistry(self._fetch_all_machines())
+        # Dashboard stats pushed to subscribed clients when they change; started by serve()
+        self.stats_publisher = StatsPublisher({
+            "executions": self._get_execution_stats,
+            "queue": self.admission.metrics,
+        })
+        self.machines.subscribe(lambda event, machine: self.stats_publisher.mark_dirty("executions"))
+        # Periodic TCP/SSH-banner checks of every machine into machine_state; started by serve()
+        self.health = HealthChecker(self.storage, self.machines, on_change=self._publish_machine_status)
+
+        # Recurring jobs; the scheduler thread is started by serve()
+        self.scheduler = Scheduler(
+            submit=self._submit_scheduled_job,
+            is_running=lambda execution_id: execution_id in self.execution_threads,
+            on_change=self._save_scheduled_job,
+        )
+        if role == "primary":
+            # Only the primary schedules; workers read and write the stored jobs (see _put_scheduled_job)
+            for job in self._fetch_scheduled_jobs():
+                self.scheduler.add(job)
+            self._recover_interrupted_executions()
 
     def _init_db(self):
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        c = self.conn.cursor()
+        with self.storage.transaction() as conn:
+            self._create_schema(conn.cursor())
+
+    def _create_schema(self, c):
         # Add 'name' column if not exists
         c.execute("""
             CREATE TABLE IF NOT EXISTS machines (
@@ -70,6 +188,14 @@ class Dashboard:
         if 'name' not in columns:
             c.execute("ALTER TABLE machines ADD COLUMN name TEXT")
             c.execute("UPDATE machines SET name = host || '@' || username WHERE name IS NULL")
+        if 'tags' not in columns:
+            c.execute("ALTER TABLE machines ADD COLUMN tags TEXT")
+        try:
+            c.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_machines_login ON machines (lower(trim(host)), lower(trim(username)))")
+        except sqlite3.IntegrityError:
+            # Older databases may already hold duplicates; imports still dedupe through the registry
+            print("Duplicate machines found; (host, username) is indexed without a uniqueness constraint")
+            c.execute("CREATE INDEX IF NOT EXISTS ix_machines_login ON machines (lower(trim(host)), lower(trim(username)))")
         # New: execution_history table
         c.execute("""
             CREATE TABLE IF NOT EXISTS execution_history (
@@ -85,6 +211,72 @@ class Dashboard:
                 logs TEXT
             )
         """)
+        c.execute("PRAGMA table_info(execution_history)")
+        columns = [row[1] for row in c.fetchall()]
+        if 'retry_count' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN retry_count INTEGER DEFAULT 0")
+        if 'failure_class' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN failure_class TEXT")
+        if 'output_size' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN output_size INTEGER")
+        if 'logs_size' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN logs_size INTEGER")
+        # History is listed newest first, optionally filtered by machine, type and status
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_history_started ON execution_history (started_at, id)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_history_machine ON execution_history (machine_id, started_at, id)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_history_status ON execution_history (status, started_at)")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_history_type_status ON execution_history (type, status, started_at)")
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS ix_execution_history_machine_type_status "
+            "ON execution_history (machine_id, type, status, started_at)"
+        )
+        # Compressed output/logs frames, see remoteinfra.blobs
+        OutputStore.create_schema(c)
+        LogStore.create_schema(c)
+        ExecutionSearch.create_schema(c)
+        TimingStore.create_schema(c)
+        RetentionManager.create_schema(c)
+        # Execution count rollups, filled from the existing history the first time
+        if ExecutionRollups.create_schema(c):
+            for sql, params in ExecutionRollups.rebuild_statements():
+                c.execute(sql, params)
+        # Per-step timings of pipeline executions
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS execution_steps (
+                execution_id TEXT,
+                step_name TEXT,
+                host TEXT,
+                status TEXT,
+                cached INTEGER DEFAULT 0,
+                depends_on TEXT,
+                started_at TIMESTAMP,
+                completed_at TIMESTAMP,
+                duration REAL,
+                PRIMARY KEY (execution_id, step_name)
+            )
+        """)
+        # Recurring jobs managed by the built-in scheduler
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                cron TEXT,
+                job_type TEXT,
+                machine_id TEXT,
+                payload TEXT,
+                enabled INTEGER DEFAULT 1,
+                jitter REAL DEFAULT 30,
+                spread REAL,
+                skip_if_running INTEGER DEFAULT 1,
+                next_run REAL,
+                last_run REAL,
+                last_duration REAL,
+                last_status TEXT,
+                last_execution_id TEXT,
+                run_count INTEGER DEFAULT 0,
+                skipped_runs INTEGER DEFAULT 0
+            )
+        """)
         # New: machine_state table
         c.execute("""
             CREATE TABLE IF NOT EXISTS machine_state (
@@ -93,85 +285,412 @@ class Dashboard:
                 last_checked TIMESTAMP
             )
         """)
-        self.conn.commit()
+        HealthChecker.create_schema(c)
+        EventBus.create_schema(c)
+
+    def _output_statements(self, execution_id, output, logs):
+        """Blob store statements for an execution's output and logs, plus their sizes."""
+        statements, output_size = self.outputs.put_statements(execution_id, "output", output)
+        logs_statements, logs_size = self.outputs.put_statements(execution_id, "logs", logs)
+        return statements + logs_statements, output_size, logs_size
+
     def _insert_execution(self, data):
-        with self.db_lock:
-            c = self.conn.cursor()
-            c.execute("""
-                INSERT INTO execution_history (id, machine_id, type, status, command, output, started_at, completed_at, duration, logs)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data['id'],
-                data['machine_id'],
-                data['type'],
-                data['status'],
-                data.get('command'),
-                data.get('output'),
-                data.get('started_at'),
-                data.get('completed_at'),
-                data.get('duration'),
-                data.get('logs'),
-            ))
-            self.conn.commit()
+        try:
+            self._write_execution(data)
+        except Exception:
+            # An admitted execution that is never recorded must not keep its queue slot
+            self.admission.mark_finished(data['id'])
+            raise
+
+    def _write_execution(self, data):
+        statements, output_size, logs_size = self._output_statements(data['id'], data.get('output'), data.get('logs'))
+        statements += self.rollups.record_statements(data['id'])
+        if data.get('completed_at'):
+            statements += self.search.index_statements(data['id'], data.get('output'), data.get('logs'))
+        self.storage.write_many([("""
+            INSERT INTO execution_history (id, machine_id, type, status, command, started_at, completed_at, duration,
+                                           output_size, logs_size)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            data['id'],
+            data['machine_id'],
+            data['type'],
+            data['status'],
+            data.get('command'),
+            data.get('started_at'),
+            data.get('completed_at'),
+            data.get('duration'),
+            output_size,
+            logs_size,
+        ))] + statements)
 
     def _update_execution_status(self, execution_id, status, output="", errors="", completed_at=None, duration=0):
         """Update execution status in database and notify via WebSocket."""
-        with self.db_lock:
-            c = self.conn.cursor()
-            if completed_at:
-                c.execute("""
-                    UPDATE execution_history 
-                    SET status = ?, output = ?, logs = ?, completed_at = ?, duration = ?
-                    WHERE id = ?
-                """, (status, output, errors, completed_at, duration, execution_id))
-            else:
-                c.execute("""
-                    UPDATE execution_history 
-                    SET status = ?
-                    WHERE id = ?
-                """, (status, execution_id))
-            self.conn.commit()
+        if completed_at:
+            # Output still buffered must reach the live log before its chunks are dropped below
+            log = self.logs.get(execution_id)
+            if log is not None:
+                log.close()
+            # Metadata, the compressed output and the stats rollups commit together; the live
+            # log chunks were only a working copy of the same output
+            statements, output_size, logs_size = self._output_statements(execution_id, output, errors)
+            statements += self.logs.delete_statements(execution_id)
+            self.storage.write_many(self.rollups.retract_statements(execution_id) + [("""
+                UPDATE execution_history 
+                SET status = ?, output = NULL, logs = NULL, output_size = ?, logs_size = ?, completed_at = ?, duration = ?
+                WHERE id = ?
+            """, (status, output_size, logs_size, completed_at, duration, execution_id))] + statements
+                + self.rollups.record_statements(execution_id)
+                + self.search.index_statements(execution_id, output, errors))
+        else:
+            self.storage.write("""
+                UPDATE execution_history 
+                SET status = ?
+                WHERE id = ?
+            """, (status, execution_id))
+
+        if completed_at:
+            self.scheduler.execution_finished(execution_id, status, duration)
+        self.stats_publisher.mark_dirty()
         
-        # Notify via WebSocket if available
+        # Everyone gets a slim delta; clients watching the execution also get its output
+        update = {
+            'execution_id': execution_id,
+            'status': status,
+            'completed_at': completed_at,
+            'duration': duration,
+        }
+        if completed_at:
+            update['output_size'] = output_size
+            update['logs_size'] = logs_size
+        watchers = self.log_stream.watchers(execution_id)
+        self.notifier.publish('execution_status_update', update, key=execution_id, exclude=watchers)
+        if watchers and self.socketio:
+            full = dict(update, output=output, errors=errors) if completed_at else update
+            self.socketio.emit('execution_status_update', full, room=LogBroadcaster.room(execution_id), namespace='/ws')
+
+    def _fetch_scheduled_jobs(self):
+        jobs = []
+        for row in self.storage.query("SELECT * FROM scheduled_jobs"):
+            data = dict(row)
+            data['payload'] = json.loads(data['payload'] or '{}')
+            try:
+                jobs.append(ScheduledJob(**data))
+            except ValueError as e:
+                print(f"Ignoring scheduled job {data['id']}: {e}")
+        return jobs
+
+    def _save_scheduled_job(self, job):
+        if self.bus and self.bus.delivering():
+            return  # loaded from the row another process just wrote
+        self.storage.write("""
+            INSERT OR REPLACE INTO scheduled_jobs (id, name, cron, job_type, machine_id, payload, enabled, jitter, spread,
+                skip_if_running, next_run, last_run, last_duration, last_status, last_execution_id, run_count, skipped_runs)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            job.id, job.name, job.cron, job.job_type, job.machine_id, json.dumps(job.payload),
+            1 if job.enabled else 0, job.jitter, job.spread, 1 if job.skip_if_running else 0,
+            job.next_run, job.last_run, job.last_duration, job.last_status, job.last_execution_id,
+            job.run_count, job.skipped_runs,
+        ))
+        if self.bus:
+            self.bus.publish("schedule", {"job_id": job.id})
+
+    def _delete_scheduled_job(self, job_id):
+        self.storage.write("DELETE FROM scheduled_jobs WHERE id = ?", (job_id,))
+        if self.bus:
+            self.bus.publish("schedule", {"job_id": job_id})
+
+    def _list_scheduled_jobs(self):
+        if self.role == "primary":
+            return self.scheduler.list()
+        return sorted(self._fetch_scheduled_jobs(), key=lambda j: (j.next_run or float("inf")))
+
+    def _get_scheduled_job(self, job_id):
+        if self.role == "primary":
+            return self.scheduler.get(job_id)
+        return next((j for j in self._fetch_scheduled_jobs() if j.id == job_id), None)
+
+    def _put_scheduled_job(self, job):
+        """
+        Add or replace a job. The primary's scheduler persists it; a worker stores the row
+        itself and the primary picks it up from the bus.
+        """
+        if self.role == "primary":
+            return self.scheduler.add(job)
+        if job.next_run is None or job.next_run < time.time():
+            job.compute_next_run()
+        self._save_scheduled_job(job)
+        return job
+
+    def _command_task(self, machine, command, timeout, idempotent=False):
+        """
+        Build the worker function that runs a shell command on a machine. Idempotent commands
+        are re-run after transient failures even when they had already started.
+        """
+        def execute_command_task():
+            client = SSHClient(
+                machine["host"],
+                machine["username"],
+                machine.get("password"),
+                machine.get("port", 22),
+                machine.get("key"),
+            )
+            client.login()
+            output, errors = client.run_command(command, timeout=timeout)
+            client.close()
+            return {'success': not errors, 'output': output, 'errors': errors}
+        return retry.idempotent(execute_command_task) if idempotent else execute_command_task
+
+    def _submit_scheduled_job(self, job):
+        """Submit one run of a scheduled job into the execution pipeline; returns the execution id."""
+        payload = job.payload or {}
+        execution_id = str(uuid.uuid4())
+        machine = self.machines.get(job.machine_id)
+
+        if job.job_type == "command":
+            if not machine:
+                raise ValueError("Machine not found")
+            command = payload.get("command")
+            exec_type, command_desc = "command", command
+            task = self._command_task(machine, command, int(payload.get("timeout", 30)), payload.get("idempotent", False))
+
+        elif job.job_type == "terraform":
+            action = payload.get("action", "plan")
+            directory_name = payload.get("directory_name")
+            work_dir = os.path.join(self.directories_base_path, "terraform", directory_name or "")
+            if not directory_name or not os.path.isdir(work_dir):
+                raise ValueError(f"Terraform directory '{directory_name}' not found")
+            exec_type, command_desc = "terraform", f"terraform {action} (scheduled) - directory: {directory_name}"
+            actions = {"init": ("init",), "plan": ("init", "plan"), "apply": ("init", "plan", "apply")}[action]
+
+            def task():
+                return SSHClient("localhost", "local").run_terraform_pipeline(
+                    work_dir, actions, listener=lambda step: self._record_execution_step(execution_id, step))
+
+        elif job.job_type == "docker_prune":
+            all_unused = payload.get("all", False)
+            volumes = payload.get("volumes", False)
+            containers = payload.get("containers", False)
+            exec_type, command_desc = "docker_system_prune", "docker system prune (scheduled)"
+            if job.machine_id == "localhost":
+                def task():
+                    # Through the watchdog like other local runs: deadline, cancel and live log apply
+                    output = ""
+                    if containers:
+                        output = watchdog.run_process(["docker", "container", "prune", "-f"], timeout=300).stdout
+                    cmd = ["docker", "system", "prune", "-f"] + (["-a"] if all_unused else []) + (["--volumes"] if volumes else [])
+                    result = watchdog.run_process(cmd, timeout=300)
+                    return {"success": result.returncode == 0, "output": output + result.stdout,
+                            "errors": result.stderr if result.returncode else ""}
+            else:
+                if not machine:
+                    raise ValueError("Machine not found")
+
+                def task():
+                    client = SSHClient(
+                        machine["host"],
+                        machine["username"],
+                        machine.get("password"),
+                        machine.get("port", 22),
+                        machine.get("key"),
+                    )
+                    client.login()
+                    result = client.docker_system_prune(all_unused, volumes, containers)
+                    client.close()
+                    return result
+        else:
+            raise ValueError(f"Unsupported job type: {job.job_type}")
+
+        if not self.admission.admit("scheduler", execution_id):
+            return None
+
+        exec_data = {
+            "id": execution_id,
+            "machine_id": job.machine_id or "local",
+            "type": exec_type,
+            "status": "queued",
+            "command": command_desc,
+            "output": "",
+            "started_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+            "completed_at": None,
+            "duration": 0,
+            "logs": "",
+        }
+        self._insert_execution(exec_data)
+        self._submit_execution(exec_data, task)
+
         if self.socketio:
-            self.socketio.emit('execution_status_update', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
-                'status': status,
-                'output': output,
-                'errors': errors,
-                'completed_at': completed_at,
-                'duration': duration
-            }, namespace='/ws')
+                'type': exec_type,
+                'command': command_desc,
+                'machine_id': exec_data['machine_id'],
+                'scheduled_job_id': job.id,
+            })
+        return execution_id
+
+    def _record_execution_step(self, execution_id, step):
+        """Insert or update the timing record of one pipeline step under its parent execution."""
+        def _fmt(ts):
+            return datetime.datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else None
+
+        # Step records are frequent and only read later, so they are not waited for
+        self.storage.write("""
+            INSERT INTO execution_steps (execution_id, step_name, host, status, cached, depends_on, started_at, completed_at, duration)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(execution_id, step_name) DO UPDATE SET
+                status=excluded.status, cached=excluded.cached, started_at=excluded.started_at,
+                completed_at=excluded.completed_at, duration=excluded.duration
+        """, (
+            execution_id,
+            step['name'],
+            step.get('host'),
+            step.get('status'),
+            1 if step.get('cached') else 0,
+            json.dumps(step.get('depends_on') or []),
+            _fmt(step.get('started_at')),
+            _fmt(step.get('completed_at')),
+            step.get('duration') or 0,
+        ), wait=False)
+
+    def _get_execution_steps(self, execution_id):
+        self.storage.flush()
+        rows = self.storage.query("""
+            SELECT step_name, host, status, cached, depends_on, started_at, completed_at, duration
+            FROM execution_steps WHERE execution_id = ?
+            ORDER BY started_at IS NULL, started_at, rowid
+        """, (execution_id,))
+        steps = []
+        for row in rows:
+            step = dict(row)
+            step['cached'] = bool(step['cached'])
+            step['depends_on'] = json.loads(step['depends_on'] or '[]')
+            steps.append(step)
+        return steps
+
+    def _submit_execution(self, execution_data, execution_function, *args, **kwargs):
+        """Hand an admitted execution to the worker pool and start tracking it."""
+        execution_id = execution_data['id']
+        label = f"{execution_data.get('type')}: {execution_data.get('command') or ''}"[:120]
+        watch = self.watchdog.watch(execution_id, label=label, state="queued")
+        try:
+            future = self.executor.submit(self._execute_async, execution_data, execution_function, *args, **kwargs)
+        except Exception:
+            # e.g. the pool is shutting down: the execution never runs, so release its slot
+            self.admission.mark_finished(execution_id)
+            watch.finish()
+            raise
+        self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+        self.stats_publisher.mark_dirty()
+        return future
+
+    @staticmethod
+    def _normalize_result(result):
+        """Return (success, output, errors) for any result shape an execution function may return."""
+        if isinstance(result, dict):
+            return result.get('success', False), result.get('output', ''), result.get('errors', '') or result.get('error', '')
+        if isinstance(result, tuple) and len(result) == 2:
+            output, errors = result
+            return not errors, output, errors
+        return True, str(result) if result else '', ''
+
+    def _record_execution_retries(self, execution_id, retry_count, failure_class):
+        self.storage.write(
+            "UPDATE execution_history SET retry_count = ?, failure_class = ? WHERE id = ?",
+            (retry_count, failure_class, execution_id),
+        )
+
+    def _ssh_policy(self):
+        """Context in which new SSH clients use this dashboard's retry policy, if it was given one."""
+        if self.ssh_retry_policy is None:
+            return contextlib.nullcontext()
+        return retry.use_policy(self.ssh_retry_policy)
+
+    def _run_with_retries(self, execution_id, tracker, execution_function, *args, **kwargs):
+        """
+        Run an execution function, re-running idempotent ones after transient failures.
+
+        Connection failures are already retried inside SSHClient.login(); this handles failures
+        after work reached the remote side (e.g. the session dropped mid-command), which is only
+        safe for functions marked with ``retry.idempotent``.
+        """
+        idempotent = retry.is_idempotent(execution_function)
+        attempt = 1
+        while True:
+            tracker.begin_attempt()
+            error = None
+            try:
+                result = execution_function(*args, **kwargs)
+            except Exception as e:
+                error, result = e, None
+            if error is None and self._normalize_result(result)[0]:
+                tracker.failure_class = None
+                return result
+
+            tracker.failure_class = retry.classify_failure(error or tracker.last_failure)
+            watch = watchdog.current()
+            if watch is not None and watch.expired:
+                tracker.failure_class = retry.TIMEOUT
+            if not (tracker.dispatched and self.retry_policy.should_retry(
+                    tracker.failure_class, attempt, idempotent, dispatched=True)):
+                if error is not None:
+                    raise error
+                return result
+
+            delay = self.retry_policy.delay(attempt)
+            tracker.record_retry(attempt, tracker.failure_class, error or tracker.last_failure, delay)
+            self._record_execution_retries(execution_id, tracker.retries, tracker.failure_class)
+            self.notifier.publish('execution_retry', {
+                'execution_id': execution_id,
+                'attempt': attempt + 1,
+                'max_attempts': self.retry_policy.max_attempts,
+                'failure_class': tracker.failure_class,
+                'delay': delay,
+            }, key=execution_id)
+            print(f"Execution {execution_id} failed ({tracker.failure_class}); retrying in {delay:.1f}s")
+            watchdog.enter_state("retry_backoff")
+            time.sleep(delay)
+            attempt += 1
 
     def _execute_async(self, execution_data, execution_function, *args, **kwargs):
         """Execute a function asynchronously and track its progress."""
         execution_id = execution_data['id']
+        self.admission.mark_started(execution_id)
+        tracker = None
+        watch = self.watchdog.get(execution_id) or self.watchdog.watch(execution_id)
+        deadline = execution_data.get('deadline') or self.execution_timeout
+        watch.set_deadline(float(deadline) if deadline else None)
+        watch.enter("running")
+        log = self.logs.open(execution_id)
         
         try:
             # Update status to running
             self._update_execution_status(execution_id, 'running')
             
-            # Execute the function
+            # Execute the function, retrying transient failures
             start_time = time.time()
-            result = execution_function(*args, **kwargs)
+            with watch.bind(), log.bind(), retry.track() as tracker, self._ssh_policy():
+                result = self._run_with_retries(execution_id, tracker, execution_function, *args, **kwargs)
             end_time = time.time()
             
             # Determine success/failure
-            if isinstance(result, dict):
-                success = result.get('success', False)
-                output = result.get('output', '')
-                errors = result.get('errors', '') or result.get('error', '')
-            elif isinstance(result, tuple) and len(result) == 2:
-                output, errors = result
-                success = not errors
-            else:
-                output = str(result) if result else ''
-                errors = ''
-                success = True
+            success, output, errors = self._normalize_result(result)
+            if watch.expired:
+                success = False
+                errors = self._deadline_message(watch, errors)
+            self._record_execution_retries(execution_id, tracker.retries, None if success else tracker.failure_class)
             
             status = 'success' if success else 'failed'
+            if watch.expired_reason == 'cancelled':
+                status = 'cancelled'
             completed_at = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
             duration = end_time - start_time
+
+            # Pipeline executions report per-step timings
+            if isinstance(result, dict) and result.get('steps'):
+                for step in result['steps']:
+                    self._record_execution_step(execution_id, step)
             
             # Update final status
             self._update_execution_status(execution_id, status, output, errors, completed_at, duration)
@@ -186,14 +705,50 @@ class Dashboard:
             # Handle execution error
             completed_at = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
             duration = time.time() - start_time if 'start_time' in locals() else 0
+            if tracker is not None:
+                self._record_execution_retries(execution_id, tracker.retries, tracker.failure_class or retry.classify_failure(e))
+            errors = self._deadline_message(watch, str(e)) if watch.expired else str(e)
+            status = 'cancelled' if watch.expired_reason == 'cancelled' else 'failed'
             
-            self._update_execution_status(execution_id, 'failed', '', str(e), completed_at, duration)
+            self._update_execution_status(execution_id, status, '', errors, completed_at, duration)
             
             # Clean up thread tracking
             if execution_id in self.execution_threads:
                 del self.execution_threads[execution_id]
             
-            return {'success': False, 'output': '', 'errors': str(e)}
+            return {'success': False, 'output': '', 'errors': errors}
+        finally:
+            log.close()
+            watch.finish()
+            self.admission.mark_finished(execution_id)
+            self._record_execution_timings(execution_data, watch)
+
+    def _record_execution_timings(self, execution_data, watch):
+        """Add the queue/connect/transfer/run split of a finished execution to the timing store."""
+        try:
+            snapshot = watch.snapshot()
+            metrics = TimingStore.metrics_from_states(snapshot["states"], snapshot["elapsed"])
+            machine_id = execution_data.get('machine_id')
+            machine = self.machines.get(machine_id)
+            host = machine['host'] if machine else machine_id
+            self.storage.write_many(
+                self.timings.record_statements(host, execution_data.get('type'), metrics), wait=False
+            )
+            self.timings.maybe_prune()
+        except Exception as e:
+            print(f"Error recording timings of {execution_data.get('id')}: {e}")
+
+    @staticmethod
+    def _deadline_message(watch, errors):
+        if watch.expired_reason == 'cancelled':
+            message = f"Execution cancelled in state '{watch.expired_in_state}'"
+        else:
+            message = f"Execution deadline of {watch.timeout:.0f}s exceeded in state '{watch.expired_in_state}'"
+        return f"{errors}\n{message}".strip() if errors else message
+
+    def _on_deadline_expired(self, watch):
+        """Tell clients an execution or step hit its deadline; the worker finishes the record."""
+        self.notifier.publish('execution_deadline', watch.snapshot(), key=watch.key)
 
     def cancel_execution(self, execution_id):
         """Cancel a running execution."""
@@ -204,6 +759,10 @@ class Dashboard:
                 # Try to cancel the future first
                 if future.cancel():
                     # Successfully cancelled before it started
+                    watch = self.watchdog.get(execution_id)
+                    if watch:
+                        watch.finish("cancelled")
+                    self.admission.mark_finished(execution_id)
                     self._update_execution_status(execution_id, 'cancelled')
                     del self.execution_threads[execution_id]
                     return True
@@ -212,6 +771,11 @@ class Dashboard:
                     try:
                         # Mark as cancelling
                         self._update_execution_status(execution_id, 'cancelled')
+
+                        # Tear down its channels and subprocesses so the worker is released
+                        watch = self.watchdog.get(execution_id)
+                        if watch:
+                            watch.expire("cancelled")
                         
                         # Get the thread
                         if 'thread' in thread_info:
@@ -228,9 +792,130 @@ class Dashboard:
                         return False
         return False
 
-    def _get_execution_history(self, filters=None):
-        c = self.conn.cursor()
-        query = "SELECT * FROM execution_history WHERE 1=1"
+    def shutdown(self, drain_timeout=300):
+        """
+        Stop taking new executions, wait up to ``drain_timeout`` seconds for the accepted ones
+        to finish, then stop the background threads and flush pending writes. Returns the ids
+        of executions still running when the time ran out; the next start marks them
+        interrupted, as after a crash.
+        """
+        self.draining = True
+        self.scheduler.stop()
+        self.health.stop()
+        if self.execution_threads:
+            print(f"Waiting up to {drain_timeout}s for {len(self.execution_threads)} execution(s) to finish")
+            if self.socketio:
+                self.socketio.emit('notification', {
+                    'type': 'warning',
+                    'message': 'Dashboard is shutting down; running executions are finishing',
+                    'duration': 10000,
+                }, namespace='/ws')
+        deadline = time.time() + drain_timeout
+        while self.execution_threads and time.time() < deadline:
+            time.sleep(0.5)
+        remaining = list(self.execution_threads)
+        if remaining:
+            print(f"Shutting down with {len(remaining)} execution(s) still running")
+        self.retention.stop()
+        if self.bus:
+            self.bus.stop()
+        self.storage.flush()
+        return remaining
+
+    def _start_bus(self):
+        """Relay events between the processes of serve(workers=N) through the shared database."""
+        self.bus = EventBus(self.storage)
+
+        def relay_notification(event, data, key):
+            if not self.bus.delivering():
+                self.bus.publish("notify", {"event": event, "data": data, "key": key})
+
+        def relay_chunks(execution_id, chunks):
+            self.log_stream.publish(execution_id, chunks)
+            self.bus.publish("log", {"execution_id": execution_id,
+                                     "from_seq": chunks[0]["seq"], "to_seq": chunks[-1]["seq"]})
+
+        self.notifier.on_publish = relay_notification
+        self.logs.on_chunks = relay_chunks
+        self.bus.start(self._on_bus_event)
+
+    def _on_bus_event(self, kind, data):
+        """Apply an event another dashboard process published."""
+        if kind == "notify":
+            event, payload, key = data["event"], data["data"], data.get("key")
+            payload.pop("seq", None)
+            if event == "machines_changed":
+                # The registry update below is announced to this process's clients by its subscription
+                self._apply_machine_change(payload)
+                return
+            if event == "machine_status":
+                self.health.remember(payload)
+            if event.startswith("execution_"):
+                self.stats_publisher.mark_dirty("executions")
+            self.notifier.publish(event, payload, key=key)
+        elif kind == "log":
+            # The chunks are committed before the bus row that announces them
+            execution_id = data["execution_id"]
+            if self.log_stream.watchers(execution_id):
+                chunks = self.logs.tail(execution_id, from_seq=data["from_seq"])["chunks"]
+                chunks = [c for c in chunks if c["seq"] <= data["to_seq"]]
+                if chunks:
+                    self.log_stream.publish(execution_id, chunks)
+        elif kind == "schedule" and self.role == "primary":
+            job_id = data["job_id"]
+            job = next((j for j in self._fetch_scheduled_jobs() if j.id == job_id), None)
+            if job is None:
+                self.scheduler.remove(job_id)
+            else:
+                self.scheduler.add(job)
+        elif kind == "schedule_run" and self.role == "primary":
+            self.scheduler.run_now(data["job_id"])
+        elif kind == "cancel":
+            if data["execution_id"] in self.execution_threads:
+                self.cancel_execution(data["execution_id"])
+
+    def _apply_machine_change(self, change):
+        if change["event"] == "bulk":
+            self.machines.load(self._fetch_all_machines())
+            self.notifier.publish('machines_changed', {'event': 'bulk', 'machine': change['machine'],
+                                                       'version': self.machines.version})
+        elif change["event"] == "removed":
+            self.machines.remove(change["machine"]["id"])
+        else:
+            row = self.storage.query_one("SELECT * FROM machines WHERE id = ?", (change["machine"]["id"],))
+            if row is not None:
+                self.machines.put(self._machine_from_row(row))
+
+    @staticmethod
+    def _encode_history_cursor(row):
+        return base64.urlsafe_b64encode(json.dumps([row["started_at"], row["id"]]).encode()).decode()
+
+    @staticmethod
+    def _decode_history_cursor(cursor):
+        try:
+            started_at, execution_id = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except Exception:
+            raise ValueError("Invalid cursor")
+        return started_at, execution_id
+
+    def _get_execution_history(self, filters=None, limit=None, cursor=None, fields=None):
+        """
+        One page of execution history, newest first. Returns (rows, next_cursor).
+
+        Pages are keyset-paginated on (started_at, id): ``cursor`` is the opaque value returned
+        for the previous page, so deep pages cost the same as the first one. ``fields`` selects
+        columns; by default the large output/logs columns are left out.
+        """
+        if fields:
+            unknown = [f for f in fields if f not in self.HISTORY_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            selected = list(dict.fromkeys(["id", "started_at"] + list(fields)))
+        else:
+            selected = [col for col in self.HISTORY_FIELDS if col not in self.HISTORY_BLOB_FIELDS]
+        limit = max(1, min(int(limit or self.HISTORY_PAGE_SIZE), self.HISTORY_MAX_PAGE_SIZE))
+
+        query = f"SELECT {', '.join(selected)} FROM execution_history WHERE 1=1"
         params = []
         if filters:
             if 'machine_id' in filters and filters['machine_id']:
@@ -244,121 +929,520 @@ class Dashboard:
                 params.append(filters['status'])
             if 'last_24h' in filters and filters['last_24h']:
                 query += " AND started_at >= datetime('now', '-1 day')"
-        query += " ORDER BY started_at DESC"
-        c.execute(query, params)
-        rows = c.fetchall()
-        return [dict(row) for row in rows]
-
-    def _get_execution_stats(self):
-        c = self.conn.cursor()
-        # Successful executions
-        c.execute("SELECT COUNT(*) FROM execution_history WHERE status = 'success' AND started_at >= datetime('now', '-1 day')")
-        success_24h = c.fetchone()[0]
-        c.execute("SELECT COUNT(*) FROM execution_history WHERE status = 'failed' AND started_at >= datetime('now', '-1 day')")
-        failed_24h = c.fetchone()[0]
-        c.execute("SELECT COUNT(*) FROM execution_history WHERE started_at >= datetime('now', '-1 day')")
-        total_24h = c.fetchone()[0]
+        if cursor:
+            started_at, execution_id = self._decode_history_cursor(cursor)
+            # The first term bounds the index range; the second breaks ties on the same second
+            query += " AND started_at <= ? AND (started_at < ? OR id < ?)"
+            params.extend([started_at, started_at, execution_id])
+        query += " ORDER BY started_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = [dict(row) for row in self.storage.query(query, params)]
+        next_cursor = self._encode_history_cursor(rows[limit - 1]) if len(rows) > limit else None
+        rows = rows[:limit]
+        for field in self.HISTORY_BLOB_FIELDS:
+            if field in selected:
+                for row in rows:
+                    row[field] = self._load_execution_output(row["id"], field, row[field])
+        return rows, next_cursor
+
+    def _get_execution_record(self, execution_id):
+        """Public columns of one execution with its full output and logs, or None."""
+        row = self.storage.query_one(
+            f"SELECT {', '.join(self.HISTORY_FIELDS)} FROM execution_history WHERE id = ?", (execution_id,)
+        )
+        if row is None:
+            return None
+        data = dict(row)
+        for field in self.HISTORY_BLOB_FIELDS:
+            data[field] = self._load_execution_output(execution_id, field, data[field])
+        return data
+
+    def _load_execution_output(self, execution_id, field, inline=None):
+        """
+        Full text of a stored field; rows not yet moved to the blob store use ``inline`` and
+        archived rows are read back from their archive file.
+        """
+        text = self.outputs.read_text(execution_id, field)
+        if text is None and not inline:
+            archived = self._load_archived_execution(execution_id)
+            if archived is not None:
+                return archived.get(field) or ""
+        return (inline or "") if text is None else text
+
+    def _load_archived_execution(self, execution_id):
+        row = self.storage.query_one(
+            "SELECT archive_file, archive_offset FROM execution_history WHERE id = ?", (execution_id,)
+        )
+        if not row or not row["archive_file"]:
+            return None
+        try:
+            return self.retention.read_archive(row["archive_file"], row["archive_offset"])
+        except (OSError, ValueError) as e:
+            print(f"Error reading archived output of {execution_id}: {e}")
+            return None
+
+    def _read_execution_output(self, execution_id, field, start=0, end=None):
+        """
+        Bytes ``start``..``end`` (inclusive) of an execution's output or logs. A negative ``start``
+        means the last ``-start`` bytes. Returns (data, start, size), or None when the execution
+        does not exist.
+        """
+        row = self.storage.query_one(
+            f"SELECT {field}, {field}_size, archive_file FROM execution_history WHERE id = ?", (execution_id,)
+        )
+        if row is None:
+            return None
+        inline = None
+        if row[f"{field}_size"] is None:
+            # Not migrated yet: serve the slice from the inline column
+            inline = (row[field] or "").encode("utf-8", errors="replace")
+        elif row["archive_file"]:
+            inline = self._load_execution_output(execution_id, field).encode("utf-8", errors="replace")
+        size = len(inline) if inline is not None else row[f"{field}_size"]
+        if start < 0:
+            start = max(0, size + start)
+        if start >= size:
+            return b"", start, size
+        if inline is not None:
+            return (inline[start:] if end is None else inline[start:end + 1]), start, size
+        return self.outputs.read(execution_id, field, start, end) or b"", start, size
+
+    def _recover_interrupted_executions(self):
+        """
+        Close out executions left queued or running by a previous process, keeping whatever
+        output their live logs had recorded.
+        """
+        rows = self.storage.query(
+            "SELECT id, started_at FROM execution_history WHERE status IN ('queued', 'running')"
+        )
+        completed_at = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        for row in rows:
+            output = self.logs.text(row["id"], "stdout")
+            errors = self.logs.text(row["id"], "stderr")
+            errors = (errors + "\n" if errors else "") + "Interrupted: the dashboard stopped before the execution finished"
+            self._update_execution_status(row["id"], "failed", output, errors, completed_at, 0)
+        if rows:
+            print(f"Marked {len(rows)} interrupted executions as failed")
+
+    def _run_background_migrations(self):
+        self._migrate_inline_outputs()
+        self._drop_finished_log_chunks()
+        self._backfill_search_index()
+
+    def _backfill_search_index(self, batch_size=200):
+        """Index finished executions recorded before full-text search existed, in batches."""
+        if not self.search.available:
+            return
+        indexed = 0
+        try:
+            while True:
+                rows = self.storage.query(
+                    "SELECT id, output, logs, archive_file FROM execution_history "
+                    "WHERE search_rowid IS NULL AND completed_at IS NOT NULL LIMIT ?",
+                    (batch_size,),
+                )
+                if not rows:
+                    break
+                statements = []
+                for row in rows:
+                    if row["archive_file"]:
+                        # Archived outputs stay out of the index, like on archiving
+                        output = logs = ""
+                    else:
+                        output = self._load_execution_output(row["id"], "output", row["output"])
+                        logs = self._load_execution_output(row["id"], "logs", row["logs"])
+                    statements.extend(self.search.index_statements(row["id"], output, logs))
+                self.storage.write_many(statements)
+                indexed += len(rows)
+        except Exception as e:
+            print(f"Error building the search index: {e}")
+        if indexed:
+            print(f"Indexed {indexed} executions for full-text search")
+
+    def _migrate_inline_outputs(self, batch_size=200):
+        """
+        Move output/logs still stored inline in execution_history into the blob store.
+        Runs in small batches in the background so startup is not held up by large histories.
+        """
+        moved = 0
+        try:
+            while True:
+                rows = self.storage.query(
+                    "SELECT id, output, logs FROM execution_history "
+                    "WHERE output_size IS NULL AND status NOT IN ('queued', 'running') LIMIT ?",
+                    (batch_size,),
+                )
+                if not rows:
+                    break
+                statements = []
+                for row in rows:
+                    row_statements, output_size, logs_size = self._output_statements(row["id"], row["output"], row["logs"])
+                    statements.extend(row_statements)
+                    statements.append((
+                        "UPDATE execution_history SET output = NULL, logs = NULL, output_size = ?, logs_size = ? WHERE id = ?",
+                        (output_size, logs_size, row["id"]),
+                    ))
+                self.storage.write_many(statements)
+                moved += len(rows)
+        except Exception as e:
+            print(f"Error migrating execution output: {e}")
+        if moved:
+            print(f"Moved output of {moved} executions to the compressed output store")
+
+    def _drop_finished_log_chunks(self):
+        """Drop live log chunks that finished executions kept from before they were removed on completion."""
+        try:
+            self.storage.write(
+                "DELETE FROM execution_log_chunks WHERE execution_id IN "
+                "(SELECT id FROM execution_history WHERE completed_at IS NOT NULL)"
+            )
+        except Exception as e:
+            print(f"Error dropping finished live logs: {e}")
+
+    def _stored_log(self, execution_id, offset=0, from_seq=None, max_bytes=1024 * 1024):
+        """
+        ``LogStore.tail()`` of a finished execution, whose live chunks are gone: its stored output
+        as chunk 0 (``stdout``) followed by its errors as chunk 1 (``stderr``).
+        """
+        chunks = []
+        base = 0
+        remaining = max_bytes
+        for seq, (field, stream) in enumerate((("output", "stdout"), ("logs", "stderr"))):
+            if from_seq is not None and seq < from_seq:
+                # Only its size is needed (a one-byte read)
+                base += self._read_execution_output(execution_id, field, -1)[2]
+                continue
+            if remaining <= 0:
+                break
+            start = 0 if from_seq is not None else max(0, offset - base)
+            data, start, size = self._read_execution_output(execution_id, field, start, start + remaining - 1)
+            if data:
+                chunks.append({
+                    "seq": seq, "stream": stream, "offset": base + start, "end_offset": base + start + len(data),
+                    "data": data.decode("utf-8", errors="ignore"),
+                })
+                remaining -= len(data)
+            base += size
+        if chunks:
+            next_offset, next_seq = chunks[-1]["end_offset"], chunks[-1]["seq"] + 1
+        elif from_seq is not None:
+            next_offset, next_seq = None, from_seq
+        else:
+            next_offset, next_seq = offset, None
+        return {"chunks": chunks, "next_offset": next_offset, "next_seq": next_seq}
+
+    def _get_execution_stats(self, window=86400, machine_id=None, execution_type=None):
+        """
+        Execution counters for the last ``window`` seconds, answered from the rollup buckets
+        rather than by scanning execution_history.
+        """
+        self.rollups.maybe_prune()
+        counts = self.rollups.window(window, machine_id=machine_id, execution_type=execution_type)
+        completed = sum(entry["count"] for entry in counts.values())
+        # Queued and running executions only reach the rollups when they finish
+        since = (datetime.datetime.utcnow() - datetime.timedelta(seconds=window)).strftime("%Y-%m-%d %H:%M:%S")
+        query = "SELECT COUNT(*) FROM execution_history WHERE status IN ('queued', 'running') AND started_at >= ?"
+        params = [since]
+        if machine_id:
+            query += " AND machine_id = ?"
+            params.append(machine_id)
+        if execution_type:
+            query += " AND type = ?"
+            params.append(execution_type)
+        unfinished = self.storage.query_value(query, params, default=0)
         # Active machines: count all machines
-        c.execute("SELECT COUNT(*) FROM machines")
-        active_machines = c.fetchone()[0]
+        active_machines = len(self.machines)
         # Running executions: count currently executing threads
         running_executions = len(self.execution_threads)
         return {
-            'successful_executions': success_24h,
-            'failed_executions': failed_24h,
-            'recent_executions': total_24h,
+            'successful_executions': counts.get('success', {}).get('count', 0),
+            'failed_executions': counts.get('failed', {}).get('count', 0),
+            'recent_executions': completed + unfinished,
             'active_machines': active_machines,
-            'running_executions': running_executions
+            'running_executions': running_executions,
+            'by_status': counts,
         }
 
-    def _set_machine_state(self, machine_id, status):
-        c = self.conn.cursor()
-        c.execute("""
-            INSERT INTO machine_state (machine_id, status, last_checked)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(machine_id) DO UPDATE SET status=excluded.status, last_checked=CURRENT_TIMESTAMP
-        """, (machine_id, status))
-        self.conn.commit()
+    def _publish_machine_status(self, machine_id, state):
+        """Tell clients a machine went online or offline."""
+        self.notifier.publish('machine_status', state, key=machine_id)
+
+    @staticmethod
+    def _machine_from_row(row):
+        d = dict(row)
+        if not d.get('name'):
+            d['name'] = f"{d['host']}@{d['username']}"
+        d['tags'] = parse_tags(d.get('tags'))
+        return d
 
     def _fetch_all_machines(self):
-        c = self.conn.cursor()
-        c.execute("SELECT * FROM machines")
-        rows = c.fetchall()
-        result = []
-        for row in rows:
-            d = dict(row)
-            if not d.get('name'):
-                d['name'] = f"{d['host']}@{d['username']}"
-            result.append(d)
-        return result
+        rows = self.storage.query("SELECT * FROM machines ORDER BY rowid")
+        return [self._machine_from_row(row) for row in rows]
 
-    def _insert_machine(self, data):
-        c = self.conn.cursor()
+    @staticmethod
+    def _machine_row(data):
         name = data.get('name')
         if not name:
             name = f"{data['host']}@{data['username']}"
-        c.execute("""
-            INSERT INTO machines (id, name, host, username, password, port, key)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+        return {
+            'id': data['id'],
+            'name': name,
+            'host': data['host'],
+            'username': data['username'],
+            'password': data.get('password'),
+            'port': data.get('port', 22),
+            'key': data.get('key'),
+            'tags': parse_tags(data.get('tags')),
+        }
+
+    def _insert_machine(self, data):
+        """Store a new machine and add it to the registry; returns the registry entry."""
+        machine = self._machine_row(data)
+        self.storage.write("""
+            INSERT INTO machines (id, name, host, username, password, port, key, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (
-            data['id'],
-            name,
-            data['host'],
-            data['username'],
-            data.get('password'),
-            data.get('port', 22),
-            data.get('key')
+            machine['id'],
+            machine['name'],
+            machine['host'],
+            machine['username'],
+            machine['password'],
+            machine['port'],
+            machine['key'],
+            json.dumps(machine['tags'])
         ))
-        self.conn.commit()
+        return self.machines.put(machine)
 
     def _update_machine(self, machine_id, data):
-        c = self.conn.cursor()
-        name = data.get('name')
-        if not name:
-            name = f"{data['host']}@{data['username']}"
-        c.execute("""
-            UPDATE machines SET name=?, host=?, username=?, password=?, port=?, key=?
+        """Update a stored machine and its registry entry; returns the registry entry."""
+        machine = self._machine_row(dict(data, id=machine_id))
+        self.storage.write("""
+            UPDATE machines SET name=?, host=?, username=?, password=?, port=?, key=?, tags=?
             WHERE id=?
         """, (
-            name,
-            data['host'],
-            data['username'],
-            data.get('password'),
-            data.get('port', 22),
-            data.get('key'),
+            machine['name'],
+            machine['host'],
+            machine['username'],
+            machine['password'],
+            machine['port'],
+            machine['key'],
+            json.dumps(machine['tags']),
             machine_id
         ))
-        self.conn.commit()
+        return self.machines.put(machine)
 
     def _delete_machine(self, machine_id):
-        c = self.conn.cursor()
-        c.execute("DELETE FROM machines WHERE id=?", (machine_id,))
-        self.conn.commit()
+        self.storage.write("DELETE FROM machines WHERE id=?", (machine_id,))
+        return self.machines.remove(machine_id)
+
+    def import_machines(self, machines, on_conflict="skip", validate=False, skip_unreachable=False,
+                        default_username=None, dry_run=False, workers=32, timeout=3.0):
+        """Add many machines in one transaction.
+
+        Machines are deduplicated on (host, username), case-insensitively, against the existing
+        fleet and within the batch.
+
+        Args:
+            machines (list | str): Machine dicts, or inventory text (CSV, JSON or ssh_config).
+            on_conflict (str): "skip" keeps existing machines, "update" overwrites them with the
+                imported fields (keeping their id).
+            validate (bool): Check that every new machine answers with an SSH banner, using up to
+                ``workers`` parallel connections of ``timeout`` seconds.
+            skip_unreachable (bool): With ``validate``, leave unreachable machines out.
+            default_username (str, optional): Username for entries that have none.
+            dry_run (bool): Report what would happen without writing anything.
+
+        Returns:
+            dict: ``added``, ``updated``, ``skipped`` and ``invalid`` counts, plus ``errors`` and
+            (when validating) ``unreachable`` entries with the index of the offending input row.
 
-    def serve(self):
+        Raises:
+            ValueError: For an unknown format or conflict mode, or unparseable input.
+        """
+        if on_conflict not in ("skip", "update"):
+            raise ValueError("on_conflict must be 'skip' or 'update'")
+        if isinstance(machines, str):
+            machines = inventory.parse(machines, default_username=default_username)
+
+        report = {"added": 0, "updated": 0, "skipped": 0, "invalid": 0, "errors": []}
+        new, changed, seen = [], [], set()
+        for index, raw in enumerate(machines):
+            try:
+                machine = inventory.normalize(raw, default_username)
+            except ValueError as e:
+                report["invalid"] += 1
+                report["errors"].append({"index": index, "error": str(e)})
+                continue
+            login = (machine["host"].lower(), machine["username"].lower())
+            if login in seen:
+                report["skipped"] += 1
+                continue
+            seen.add(login)
+            existing = self.machines.find_login(machine["host"], machine["username"])
+            if existing is None:
+                machine["id"] = machine.get("id") or str(uuid.uuid4())
+                new.append((index, machine))
+            elif on_conflict == "update":
+                fields = {k: v for k, v in machine.items() if v is not None and k != "id"}
+                changed.append((index, dict(existing, **fields)))
+            else:
+                report["skipped"] += 1
+
+        if validate:
+            report["unreachable"] = []
+            candidates = new + changed
+            results = inventory.check_all([m for _, m in candidates], workers=workers, timeout=timeout)
+            unreachable = set()
+            for (index, machine), (ok, detail) in zip(candidates, results):
+                if not ok:
+                    unreachable.add(index)
+                    report["unreachable"].append({"index": index, "host": machine["host"], "error": detail})
+            if skip_unreachable:
+                report["skipped"] += len(unreachable)
+                new = [(i, m) for i, m in new if i not in unreachable]
+                changed = [(i, m) for i, m in changed if i not in unreachable]
+
+        rows = [self._machine_row(m) for _, m in new]
+        updates = [self._machine_row(m) for _, m in changed]
+        if dry_run:
+            report["added"], report["updated"] = len(rows), len(updates)
+            return report
+
+        stored = []
+        with self.storage.transaction() as conn:
+            for row in rows:
+                cursor = conn.execute("""
+                    INSERT INTO machines (id, name, host, username, password, port, key, tags)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT DO NOTHING
+                """, (row['id'], row['name'], row['host'], row['username'], row['password'], row['port'],
+                      row['key'], json.dumps(row['tags'])))
+                if cursor.rowcount:
+                    stored.append(row)
+                    report["added"] += 1
+                else:
+                    # Added by someone else since the registry was checked
+                    report["skipped"] += 1
+            for row in updates:
+                conn.execute("""
+                    UPDATE machines SET name=?, host=?, username=?, password=?, port=?, key=?, tags=?
+                    WHERE id=?
+                """, (row['name'], row['host'], row['username'], row['password'], row['port'], row['key'],
+                      json.dumps(row['tags']), row['id']))
+                stored.append(row)
+                report["updated"] += 1
+        self.machines.put_many(stored)
+        return report
+
+    def serve(self, mode="development", workers=1, threads=256, async_mode=None, drain_timeout=300):
         """
         Start a Flask API server that exposes endpoints for all SSHClient operations and serves the UI.
+
+        Args:
+            mode (str): "development" runs Flask-SocketIO's development server. "production"
+                serves with a fixed pool of ``threads`` connection threads (or eventlet/gevent
+                when ``async_mode`` asks for it and the process is monkey-patched), and on
+                SIGTERM/SIGINT stops taking executions, waits up to ``drain_timeout`` seconds
+                for running ones, then exits.
+            workers (int): Number of processes in production mode. They share the port
+                (SO_REUSEPORT, threading mode only) and relay events to each other through the
+                database, so every client sees every execution. The calling process is the
+                primary; the script must start the dashboard under ``if __name__ == "__main__":``.
+                The kernel spreads connections over the processes without sticky sessions, so
+                Socket.IO long-polling (a session spread over many requests) is refused and the
+                UI connects over WebSocket only; other Socket.IO clients must do the same.
+                ``max_workers``, ``max_queue_depth`` and the per-client rate limits apply to
+                each process, so with N workers the dashboard runs up to N times as many
+                executions and admits N times as many submissions.
         """
         import os
-        from flask import Flask, request, jsonify, send_from_directory
+        import multiprocessing
+        from flask import Flask, Response, g, request, jsonify, send_from_directory
         from flask_cors import CORS
         from flask_socketio import SocketIO, emit, join_room, leave_room
 
+        if mode not in ("development", "production"):
+            raise ValueError("mode must be 'development' or 'production'")
+        if mode == "production":
+            async_mode = server.check_async_mode(async_mode)
+        workers = max(1, int(workers))
+        if workers > 1:
+            if mode != "production" or async_mode != "threading":
+                raise ValueError("workers > 1 needs mode='production' with the threading async mode")
+            if not hasattr(socket, "SO_REUSEPORT"):
+                raise ValueError("workers > 1 needs SO_REUSEPORT, which this platform does not have")
+            if self.role == "primary" and multiprocessing.parent_process() is not None:
+                raise RuntimeError("Dashboard.serve(workers=N) must be called under if __name__ == '__main__':")
+
         app = Flask(__name__, static_folder=None)
-        CORS(app)
+        CORS(app, expose_headers=["X-Next-Cursor", "Accept-Ranges", "Content-Range", "X-Content-Size", "ETag"])
 
-        # Add Flask-SocketIO for WebSocket support
-        socketio = SocketIO(app, cors_allowed_origins="*")
+        # Add Flask-SocketIO for WebSocket support. Across worker processes only a WebSocket stays
+        # on the process that holds its session; polling requests could land on any of them
+        transports = ["websocket"] if workers > 1 else ["polling", "websocket"]
+        socketio = SocketIO(app, cors_allowed_origins="*", async_mode=async_mode, transports=transports)
         self.socketio = socketio  # Store reference for use in other methods
 
+        def _broadcast_machine_change(event, machine):
+            machine.pop('password', None)
+            self.notifier.publish('machines_changed', {'event': event, 'machine': machine, 'version': self.machines.version},
+                                  key=machine.get('id'))
+
+        self.machines.subscribe(_broadcast_machine_change)
+
+        def _reject_if_over_capacity(execution_id):
+            """Run admission control for a new execution; returns a 429 response when rejected."""
+            if self.draining:
+                response = jsonify({"success": False, "message": "Dashboard is shutting down", "reason": "draining"})
+                response.status_code = 503
+                return response
+            decision = self.admission.admit(request.remote_addr or "unknown", execution_id)
+            if decision:
+                return None
+            if decision.reason == "queue_full":
+                message = "Execution queue is full. Please retry later."
+            else:
+                message = "Too many submissions from this client. Please retry later."
+            response = jsonify({
+                "success": False,
+                "message": message,
+                "reason": decision.reason,
+                "retry_after": decision.retry_after,
+            })
+            response.status_code = 429
+            response.headers["Retry-After"] = str(decision.retry_after)
+            return response
+
         # Serve index.html and static files
         UI_DIR = os.path.join(os.path.dirname(__file__), "UI")
         # Define scripts directory relative to this file (UI/scripts)
         self.scripts_dir = os.path.join(UI_DIR, "scripts")
 
+        self.assets = assets = AssetBundle(UI_DIR, settings={"socketTransports": transports})
+
+        def _asset_response(asset, cache_control):
+            body, encoding = asset.select(request.accept_encodings)
+            response = Response(body, mimetype=asset.mimetype)
+            response.headers["Cache-Control"] = cache_control
+            response.vary.add("Accept-Encoding")
+            if encoding:
+                response.headers["Content-Encoding"] = encoding
+            # Each encoding is its own representation, so it gets its own validator
+            response.set_etag(f"{asset.etag}-{encoding}" if encoding else asset.etag)
+            return response.make_conditional(request)
+
         @app.route("/")
         def index():
-            return send_from_directory(UI_DIR, "index.html")
+            # Revalidated on every load; it names the hashed asset URLs of the current build
+            return _asset_response(assets.index(), "no-cache")
+
+        @app.route("/assets/<path:name>")
+        def hashed_asset(name):
+            asset = assets.get(name)
+            if asset is None or asset.url != f"/assets/{name}":
+                return jsonify({"success": False, "message": "Asset not found"}), 404
+            return _asset_response(asset, IMMUTABLE)
 
         @app.route("/static/<path:filename>")
         def static_files(filename):
@@ -366,43 +1450,179 @@ class Dashboard:
 
         @app.route("/styles.css")
         def styles_css():
-            return send_from_directory(UI_DIR, "styles.css")
+            return _asset_response(assets.get("styles.css"), "no-cache")
 
         @app.route("/script.js")
         def script_js():
-            return send_from_directory(UI_DIR, "script.js")
+            return _asset_response(assets.get("script.js"), "no-cache")
+
+        @app.before_request
+        def apply_ssh_policy():
+            g.ssh_policy = self._ssh_policy()
+            g.ssh_policy.__enter__()
+
+        @app.teardown_request
+        def restore_ssh_policy(exc):
+            scope = g.pop("ssh_policy", None)
+            if scope is not None:
+                scope.__exit__(None, None, None)
+
+        @app.after_request
+        def compress_json(response):
+            """gzip large JSON bodies (machine and history listings) for clients that accept it."""
+            if (response.status_code != 200 or response.mimetype != "application/json"
+                    or response.direct_passthrough or response.is_streamed
+                    or "Content-Encoding" in response.headers
+                    or request.accept_encodings.quality("gzip") <= 0):
+                return response
+            body = response.get_data()
+            if len(body) < self.JSON_GZIP_MIN_BYTES:
+                return response
+            response.set_data(gzip.compress(body, compresslevel=5))
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+            etag, weak = response.get_etag()
+            if etag and not weak:
+                # Same content, different bytes: still matches If-None-Match (weak comparison)
+                response.set_etag(etag, weak=True)
+            return response
 
 
         # WebSocket endpoints for real-time updates
         @socketio.on('connect', namespace='/ws')
-        def ws_connect():
+        def ws_connect(auth=None):
             print(f"Client connected: {request.sid}")
-            emit('connected', {'message': 'Connected to remoteinfra Dashboard'})
+            emit('connected', {'message': 'Connected to remoteinfra Dashboard',
+                               'epoch': self.notifier.epoch, 'seq': self.notifier.seq})
+            # A reconnecting client passes the last event it saw and gets only what it missed
+            auth = auth if isinstance(auth, dict) else {}
+            last_seq = auth.get('last_seq')
+            replayed = self.notifier.connect(request.sid, int(last_seq) if last_seq is not None else None,
+                                             auth.get('epoch'))
+            if last_seq is not None:
+                if replayed is None:
+                    emit('resync', {'epoch': self.notifier.epoch, 'seq': self.notifier.seq})
+                else:
+                    emit('resumed', {'replayed': replayed, 'seq': self.notifier.seq})
 
         @socketio.on('disconnect', namespace='/ws')
         def ws_disconnect():
             print(f"Client disconnected: {request.sid}")
+            self.log_stream.unwatch(request.sid)
+            self.notifier.disconnect(request.sid)
+            self.stats_publisher.unsubscribe(request.sid)
+
+        @socketio.on('subscribe_stats', namespace='/ws')
+        def subscribe_stats(data):
+            """Join stats sections; the current snapshot of each is sent back right away."""
+            sections = (data or {}).get('sections') or ['executions']
+            try:
+                snapshots = self.stats_publisher.subscribe(request.sid, sections)
+            except ValueError as e:
+                emit('stats_error', {'message': str(e)})
+                return
+            for name, snapshot in zip(sections, snapshots):
+                join_room(StatsPublisher.room(name))
+                emit('stats', snapshot)
+
+        @socketio.on('unsubscribe_stats', namespace='/ws')
+        def unsubscribe_stats(data):
+            sections = (data or {}).get('sections') or list(self.stats_publisher.sections)
+            for name in sections:
+                leave_room(StatsPublisher.room(name))
+            self.stats_publisher.unsubscribe(request.sid, sections)
 
         @socketio.on('join_execution', namespace='/ws')
         def join_execution_room(data):
             execution_id = data.get('execution_id')
             if execution_id:
-                join_room(f"execution_{execution_id}")
+                offset = int(data['offset']) if data.get('offset') is not None else None
+                join_room(LogBroadcaster.room(execution_id))
+                self.log_stream.watch(request.sid, execution_id, offset=offset,
+                                      ack=bool(data.get('ack')), binary=bool(data.get('binary')))
                 emit('joined_execution', {'execution_id': execution_id})
+                if offset is not None:
+                    # Catch up on output logged before joining; live frames continue from there
+                    backlog = self.logs.tail(execution_id, offset=offset,
+                                             max_bytes=self.log_stream.max_batch_bytes * 4)
+                    emit('log', self.log_stream.catch_up(request.sid, execution_id, backlog))
+
+        @socketio.on('ack_log', namespace='/ws')
+        def ack_execution_log(data):
+            """The client has applied a watched execution's output up to ``offset``."""
+            execution_id = (data or {}).get('execution_id')
+            if execution_id and data.get('offset') is not None:
+                self.log_stream.ack(request.sid, execution_id, data['offset'])
+
+        @socketio.on('get_execution', namespace='/ws')
+        def get_execution_payload(data):
+            """Full output and logs of one execution, sent only to the client asking."""
+            execution_id = (data or {}).get('execution_id')
+            row = self.storage.query_one(
+                "SELECT id, status, output, logs, completed_at, duration FROM execution_history WHERE id = ?",
+                (execution_id,),
+            ) if execution_id else None
+            if row is None:
+                emit('execution_detail', {'execution_id': execution_id, 'error': 'Execution not found'})
+                return
+            emit('execution_detail', {
+                'execution_id': row['id'],
+                'status': row['status'],
+                'output': self._load_execution_output(row['id'], 'output', row['output']),
+                'errors': self._load_execution_output(row['id'], 'logs', row['logs']),
+                'completed_at': row['completed_at'],
+                'duration': row['duration'],
+            })
 
         @socketio.on('leave_execution', namespace='/ws')
         def leave_execution_room(data):
             execution_id = data.get('execution_id')
             if execution_id:
-                leave_room(f"execution_{execution_id}")
+                leave_room(LogBroadcaster.room(execution_id))
+                self.log_stream.unwatch(request.sid, execution_id)
                 emit('left_execution', {'execution_id': execution_id})
 
         # Machine management (in-memory for demo)
 
         @app.route("/api/machines", methods=["GET"])
         def get_machines():
-            self.machines = self._fetch_all_machines()
-            return jsonify(self.machines)
+            # Optional ?host= and ?tag= filters are answered from the registry indexes
+            machines = self.machines.all(host=request.args.get("host"), tag=request.args.get("tag"))
+            states = self.health.all()
+            for m in machines:
+                state = states.get(m["id"]) or {}
+                m["status"] = state.get("status", "unknown")
+                m["last_checked"] = state.get("last_checked")
+                m["latency_ms"] = state.get("latency_ms")
+            # Pollers that already have this listing get a bodiless 304
+            response = jsonify(machines)
+            response.headers["Cache-Control"] = "no-cache"
+            response.add_etag()
+            return response.make_conditional(request)
+
+        @app.route("/api/machines/health", methods=["GET"])
+        def get_machine_health():
+            """Last check result of every machine, from the health checker's cache."""
+            states = self.health.all()
+            return jsonify({
+                "machines": [states.get(m["id"]) or {"machine_id": m["id"], "status": "unknown"} for m in self.machines],
+                "last_round": self.health.last_round,
+                "interval": self.health.interval,
+            })
+
+        @app.route("/api/machines/health/check", methods=["POST"])
+        def check_machine_health():
+            """Queue a check of some machines (``machine_ids``) or all of them, ahead of the next round."""
+            data = request.get_json(silent=True) or {}
+            machine_ids = data.get("machine_ids")
+            if machine_ids is not None and not isinstance(machine_ids, list):
+                return jsonify({"success": False, "message": "machine_ids must be a list"}), 400
+            self.health.trigger(machine_ids)
+            return jsonify({"success": True, "queued": len(machine_ids) if machine_ids else len(self.machines)}), 202
+
+        @app.route("/api/machines/tags", methods=["GET"])
+        def get_machine_tags():
+            return jsonify(self.machines.tags())
 
         @app.route("/api/machines", methods=["POST"])
         def add_machine():
@@ -411,16 +1631,65 @@ class Dashboard:
                 data['key'] = data['key_path']
                 del data['key_path']
             # Check for existing machine with the same host and username
-            self.machines = self._fetch_all_machines()
-            for m in self.machines:
-                if m['host'].strip().lower() == data['host'].strip().lower() and \
-                   m['username'].strip().lower() == data['username'].strip().lower():
-                    return jsonify({"success": False, "message": "Machine with the same host and username already exists."}), 400
+            if self.machines.find_login(data['host'], data['username']):
+                return jsonify({"success": False, "message": "Machine with the same host and username already exists."}), 400
             if 'id' not in data or not data['id']:
                 data['id'] = str(uuid.uuid4())
-            self._insert_machine(data)
-            self.machines = self._fetch_all_machines()
-            return jsonify({"success": True, "machine": data, "created": True})
+            machine = self._insert_machine(data)
+            return jsonify({"success": True, "machine": machine, "created": True})
+
+        @app.route("/api/machines/import", methods=["POST"])
+        def import_machines():
+            """
+            Bulk import from an uploaded inventory file (``file``, multipart) or a JSON body with
+            ``machines`` (list) or ``data`` (inventory text) and an optional ``format``.
+            """
+            def flag(value):
+                return str(value).lower() in ("1", "true", "yes", "on")
+
+            if request.files.get("file"):
+                upload = request.files["file"]
+                options = request.form
+                text = upload.read().decode("utf-8-sig", errors="replace")
+                fmt = options.get("format") or inventory.detect_format(upload.filename, text)
+                machines = None
+            else:
+                options = request.get_json(silent=True) or {}
+                machines = options.get("machines")
+                text = options.get("data")
+                fmt = options.get("format")
+                if machines is None and not text:
+                    return jsonify({"success": False, "message": "Provide machines, data or a file"}), 400
+            try:
+                if machines is None:
+                    machines = inventory.parse(text, fmt, default_username=options.get("default_username"))
+                report = self.import_machines(
+                    machines,
+                    on_conflict=options.get("on_conflict", "skip"),
+                    validate=flag(options.get("validate", False)),
+                    skip_unreachable=flag(options.get("skip_unreachable", False)),
+                    default_username=options.get("default_username"),
+                    dry_run=flag(options.get("dry_run", False)),
+                    workers=int(options.get("workers", 32)),
+                    timeout=float(options.get("timeout", 3.0)),
+                )
+            except ValueError as e:
+                return jsonify({"success": False, "message": str(e)}), 400
+            return jsonify(dict(report, success=True))
+
+        @app.route("/api/machines/export", methods=["GET"])
+        def export_machines():
+            fmt = request.args.get("format", "json")
+            if fmt not in ("csv", "json"):
+                return jsonify({"success": False, "message": "format must be csv or json"}), 400
+            machines = self.machines.all(host=request.args.get("host"), tag=request.args.get("tag"))
+            include_secrets = request.args.get("include_secrets", "").lower() in ("1", "true", "yes")
+            mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+            extension = "csv" if fmt == "csv" else "jsonl"
+            return Response(
+                inventory.export(machines, fmt, include_secrets), mimetype=mimetype,
+                headers={"Content-Disposition": f"attachment; filename=machines.{extension}"},
+            )
 
         @app.route("/api/upload-key", methods=["POST"])
         def upload_ssh_key():
@@ -458,39 +1727,35 @@ class Dashboard:
             if 'key_path' in data:
                 data['key'] = data['key_path']
                 del data['key_path']
-            self.machines = self._fetch_all_machines()
-            machine = next((m for m in self.machines if m['id'] == machine_id), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "message": "Machine not found."}), 404
-            for m in self.machines:
-                if m['id'] != machine_id and \
-                   m['host'].strip().lower() == data['host'].strip().lower() and \
-                   m['username'].strip().lower() == data['username'].strip().lower():
-                    return jsonify({"success": False, "message": "Another machine with the same host and username already exists."}), 400
-            self._update_machine(machine_id, data)
-            self.machines = self._fetch_all_machines()
-            updated = next((m for m in self.machines if m['id'] == machine_id), None)
+            existing = self.machines.find_login(data['host'], data['username'])
+            if existing and existing['id'] != machine_id:
+                return jsonify({"success": False, "message": "Another machine with the same host and username already exists."}), 400
+            updated = self._update_machine(machine_id, data)
             return jsonify({"success": True, "machine": updated, "updated": True})
 
         @app.route("/api/machines/<machine_id>", methods=["DELETE"])
         def delete_machine_by_id(machine_id):
             self._delete_machine(machine_id)
-            self.machines = self._fetch_all_machines()
             return jsonify({"success": True})
 
-        @app.route("/api/machines/<int:idx>/test", methods=["POST"])
-        def test_machine(idx):
-            if 0 <= idx < len(self.machines):
-                m = self.machines[idx]
-                try:
-                    client = SSHClient(m["host"], m["username"], m.get("password"), m.get("port", 22), m.get("key"))
-                    client.login()
-                    online = client.ping()
-                    client.close()
-                    return jsonify({"success": online})
-                except Exception as e:
-                    return jsonify({"success": False, "error": str(e)}), 500
-            return jsonify({"success": False, "error": "Invalid index"}), 400
+        @app.route("/api/machines/<machine_id>/test", methods=["POST"])
+        def test_machine(machine_id):
+            m = self.machines.get(machine_id)
+            if m is None and machine_id.isdigit() and int(machine_id) < len(self.machines):
+                # Older clients addressed machines by list position
+                m = self.machines[int(machine_id)]
+            if m is None:
+                return jsonify({"success": False, "error": "Machine not found"}), 404
+            # Banner probe plus one login attempt; ?attempts= connects more often for RTT stats
+            attempts = max(1, min(request.args.get("attempts", 3, type=int), 20))
+            client = SSHClient(m["host"], m["username"], m.get("password"), m.get("port", 22), m.get("key"))
+            result = client.probe(attempts=attempts, auth=True)
+            self.health.record([(m["id"], result)])
+            success = result["reachable"] and result.get("auth", False)
+            return jsonify(dict(result, success=success, error=result.get("auth_error") or result["error"]))
 
         # Command execution
         @app.route("/api/commands/execute", methods=["POST"])
@@ -513,7 +1778,7 @@ class Dashboard:
 
         @app.route("/api/execute-command", methods=["POST"])
         def execute_command_v2():
-            # Accepts: {machine_id, command, timeout}
+            # Accepts: {machine_id, command, timeout, idempotent}
             import datetime
             data = request.json
             machine_id = data.get("machine_id")
@@ -521,11 +1786,7 @@ class Dashboard:
             timeout = int(data.get("timeout", 30))
             
             # Find machine by id (not index)
-            machine = None
-            for m in self.machines:
-                if str(m.get("id")) == str(machine_id):
-                    machine = m
-                    break
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "message": "Machine not found"}), 404
             
@@ -544,26 +1805,15 @@ class Dashboard:
                 "completed_at": None,
                 "duration": 0,
                 "logs": "",
+                "deadline": data.get("deadline"),
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
-            # Define the execution function
-            def execute_command_task():
-                client = SSHClient(
-                    machine["host"],
-                    machine["username"],
-                    machine.get("password"),
-                    machine.get("port", 22),
-                    machine.get("key"),
-                )
-                client.login()
-                output, errors = client.run_command(command, timeout=timeout)
-                client.close()
-                return {'success': not errors, 'output': output, 'errors': errors}
-            
             # Submit to thread pool
-            future = self.executor.submit(self._execute_async, exec_data, execute_command_task)
-            self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+            self._submit_execution(exec_data, self._command_task(machine, command, timeout, bool(data.get("idempotent", False))))
             
             # Emit notification
             socketio.emit('notification', {
@@ -573,12 +1823,12 @@ class Dashboard:
             }, namespace='/ws')
             
             # Emit execution started event
-            socketio.emit('execution_started', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
                 'type': 'command',
                 'command': command,
                 'machine_id': machine_id
-            }, namespace='/ws')
+            })
             
             return jsonify({
                 "success": True, 
@@ -596,18 +1846,129 @@ class Dashboard:
                     'status': request.args.get('status'),
                     'last_24h': request.args.get('last_24h') == '1',
                 }
-                history = self._get_execution_history(filters)
-                return jsonify(history)
+                fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+                try:
+                    history, next_cursor = self._get_execution_history(
+                        filters,
+                        limit=request.args.get('limit', type=int),
+                        cursor=request.args.get('cursor'),
+                        fields=fields or None,
+                    )
+                except ValueError as ve:
+                    return jsonify({"success": False, "message": str(ve)}), 400
+                response = jsonify(history)
+                if next_cursor:
+                    # The body stays a plain list; the next page is announced in a header
+                    response.headers['X-Next-Cursor'] = next_cursor
+                response.headers['Cache-Control'] = 'no-cache'
+                response.add_etag()
+                return response.make_conditional(request)
             elif request.method == "DELETE":
-                c = self.conn.cursor()
-                c.execute("DELETE FROM execution_history")
-                self.conn.commit()
-                return jsonify({"success": True})
+                # Chunked so running jobs can keep writing; their rows are kept
+                deleted = self.retention.delete_all()
+                self.storage.write_many(ExecutionRollups.clear_statements())
+                self.stats_publisher.mark_dirty("executions")
+                return jsonify({"success": True, "deleted": deleted})
+
+        @app.route("/api/retention", methods=["GET", "PUT"])
+        def retention_settings():
+            """Retention policy, last pass report and database size; PUT changes the policy."""
+            if request.method == "PUT":
+                try:
+                    self.retention.policy = self.retention.policy.updated(request.json or {})
+                except (TypeError, ValueError) as ve:
+                    return jsonify({"success": False, "message": str(ve)}), 400
+            return jsonify(self.retention.report())
+
+        @app.route("/api/retention/run", methods=["POST"])
+        def retention_run():
+            """Run a retention pass now. ``full_vacuum`` rebuilds the file (blocks writers)."""
+            data = request.get_json(silent=True) or {}
+            if data.get("background", True) and not data.get("full_vacuum"):
+                self.retention.trigger()
+                return jsonify({"success": True, "message": "Retention pass started"}), 202
+            report = self.retention.run(full_vacuum=bool(data.get("full_vacuum")))
+            return jsonify({"success": True, "report": report})
+
+        @app.route("/api/execution-history/search", methods=["GET"])
+        def search_execution_history():
+            """Full-text search over commands and outputs, best match first, with snippets."""
+            text = request.args.get('q', '')
+            filters = {
+                'machine_id': request.args.get('machine_id'),
+                'type': request.args.get('type'),
+                'status': request.args.get('status'),
+                'since': request.args.get('since'),
+            }
+            try:
+                results = self.search.search(
+                    text,
+                    raw=request.args.get('raw') == '1',
+                    filters=filters,
+                    limit=max(1, min(request.args.get('limit', 20, type=int), 200)),
+                    offset=max(0, request.args.get('offset', 0, type=int)),
+                )
+            except ValueError as ve:
+                return jsonify({"success": False, "message": str(ve)}), 400
+            return jsonify(results)
+
+        @app.route("/api/timings", methods=["GET"])
+        def get_timings():
+            """p50/p90/p99 of queue wait, connect, transfer, run and total time per host and type."""
+            window = request.args.get('window', 86400, type=int)
+            metric = request.args.get('metric')
+            group_by = [g.strip() for g in request.args.get('group_by', 'host,type').split(',') if g.strip()]
+            if window <= 0:
+                return jsonify({"success": False, "message": "window must be positive"}), 400
+            if metric and metric not in TIMING_METRICS:
+                return jsonify({"success": False, "message": f"metric must be one of: {', '.join(TIMING_METRICS)}"}), 400
+            if any(g not in ('host', 'type') for g in group_by):
+                return jsonify({"success": False, "message": "group_by may contain host and type"}), 400
+            return jsonify(self.timings.percentiles(
+                window, host=request.args.get('host'), execution_type=request.args.get('type'),
+                metric=metric, group_by=group_by,
+            ))
+
+        @app.route("/api/timings/series", methods=["GET"])
+        def get_timing_series():
+            """Percentiles of one metric per minute/hour/day bucket."""
+            metric = request.args.get('metric', 'run')
+            if metric not in TIMING_METRICS:
+                return jsonify({"success": False, "message": f"metric must be one of: {', '.join(TIMING_METRICS)}"}), 400
+            try:
+                series = self.timings.series(
+                    metric,
+                    window=request.args.get('window', 7 * 86400, type=int),
+                    resolution=request.args.get('resolution', 'hour'),
+                    host=request.args.get('host'),
+                    execution_type=request.args.get('type'),
+                )
+            except ValueError as ve:
+                return jsonify({"success": False, "message": str(ve)}), 400
+            return jsonify(series)
 
         @app.route("/api/execution-stats", methods=["GET"])
         def get_execution_stats():
-            stats = self._get_execution_stats()
+            window = request.args.get('window', 86400, type=int)
+            if window <= 0:
+                return jsonify({"success": False, "message": "window must be positive"}), 400
+            stats = self._get_execution_stats(
+                window, machine_id=request.args.get('machine_id'), execution_type=request.args.get('type'),
+            )
             return jsonify(stats)
+
+        @app.route("/api/execution-stats/series", methods=["GET"])
+        def get_execution_stats_series():
+            """Execution counts by status per minute or hour bucket."""
+            resolution = request.args.get('resolution', 'hour')
+            if resolution not in ('minute', 'hour'):
+                return jsonify({"success": False, "message": "resolution must be minute or hour"}), 400
+            return jsonify(self.rollups.series(
+                request.args.get('window', 86400, type=int),
+                resolution=resolution,
+                machine_id=request.args.get('machine_id'),
+                execution_type=request.args.get('type'),
+            ))
         
         # New endpoints for async execution management
         @app.route("/api/executions/running", methods=["GET"])
@@ -616,20 +1977,27 @@ class Dashboard:
             running = []
             for exec_id, thread_info in self.execution_threads.items():
                 # Get execution details from database
-                with self.db_lock:
-                    c = self.conn.cursor()
-                    c.execute("SELECT * FROM execution_history WHERE id = ?", (exec_id,))
-                    row = c.fetchone()
-                    if row:
-                        exec_data = dict(row)
-                        exec_data['can_cancel'] = not thread_info.get('future', {}).running() if 'future' in thread_info else False
-                        running.append(exec_data)
+                exec_data = self._get_execution_record(exec_id)
+                if exec_data:
+                    exec_data['can_cancel'] = not thread_info.get('future', {}).running() if 'future' in thread_info else False
+                    running.append(exec_data)
             return jsonify(running)
 
+        @app.route("/api/executions/queue", methods=["GET"])
+        def get_execution_queue_metrics():
+            """Get queue depth/age and admission control counters."""
+            return jsonify(self.admission.metrics())
+
         @app.route("/api/executions/<execution_id>/cancel", methods=["POST"])
         def cancel_execution_endpoint(execution_id):
             """Cancel a running execution."""
             if execution_id not in self.execution_threads:
+                if self.bus and self.storage.query_value(
+                        "SELECT 1 FROM execution_history WHERE id = ? AND status IN ('queued', 'running')",
+                        (execution_id,)):
+                    # Running in another dashboard process, which cancels it
+                    self.bus.publish("cancel", {"execution_id": execution_id})
+                    return jsonify({"success": True, "message": "Cancellation requested"}), 202
                 return jsonify({"success": False, "message": "Execution not found or already completed"}), 404
             
             success = self.cancel_execution(execution_id)
@@ -653,16 +2021,296 @@ class Dashboard:
         @app.route("/api/executions/<execution_id>/status", methods=["GET"])
         def get_execution_status(execution_id):
             """Get current status of an execution."""
-            with self.db_lock:
-                c = self.conn.cursor()
-                c.execute("SELECT * FROM execution_history WHERE id = ?", (execution_id,))
-                row = c.fetchone()
-                if row:
-                    exec_data = dict(row)
-                    exec_data['is_running'] = execution_id in self.execution_threads
-                    return jsonify(exec_data)
-                else:
-                    return jsonify({"error": "Execution not found"}), 404
+            exec_data = self._get_execution_record(execution_id)
+            if not exec_data:
+                return jsonify({"error": "Execution not found"}), 404
+            exec_data['is_running'] = execution_id in self.execution_threads
+            return jsonify(exec_data)
+
+        @app.route("/api/executions/watchdog", methods=["GET"])
+        def get_watchdog_report():
+            """Deadlines and time-in-state of active and recently finished executions."""
+            include_finished = request.args.get("finished", "true").lower() != "false"
+            return jsonify(self.watchdog.report(include_finished))
+
+        @app.route("/api/executions/<execution_id>/states", methods=["GET"])
+        def get_execution_states(execution_id):
+            """Time spent in each state (queued, connecting, running_command, ...) by an execution."""
+            watch = self.watchdog.get(execution_id)
+            if not watch:
+                return jsonify({"error": "Execution is not tracked by the watchdog"}), 404
+            data = watch.snapshot()
+            data["steps"] = [child.snapshot() for child in watch.children]
+            return jsonify(data)
+
+        @app.route("/api/executions/<execution_id>/log", methods=["GET"])
+        def tail_execution_log(execution_id):
+            """
+            Live log chunks from byte ``offset`` (or from sequence number ``seq``) on. Poll again
+            with ``next_offset``/``next_seq`` to follow a running execution. A finished execution's
+            log is read from its stored output: the output, then the errors.
+            """
+            row = self.storage.query_one(
+                "SELECT status, completed_at FROM execution_history WHERE id = ?", (execution_id,)
+            )
+            if row is None:
+                return jsonify({"error": "Execution not found"}), 404
+            offset = request.args.get('offset', 0, type=int)
+            from_seq = request.args.get('seq', type=int)
+            if offset < 0:
+                return jsonify({"error": "offset must not be negative"}), 400
+            max_bytes = max(1, min(request.args.get('max_bytes', 1024 * 1024, type=int), 8 * 1024 * 1024))
+            if row["completed_at"]:
+                data = self._stored_log(execution_id, offset=offset, from_seq=from_seq, max_bytes=max_bytes)
+            else:
+                data = self.logs.tail(execution_id, offset=offset, from_seq=from_seq, max_bytes=max_bytes)
+            status = row["status"]
+            data["execution_id"] = execution_id
+            data["status"] = status
+            data["running"] = execution_id in self.execution_threads
+            return jsonify(data)
+
+        @app.route("/api/executions/<execution_id>/steps", methods=["GET"])
+        def get_execution_steps(execution_id):
+            """Get per-step timings of a pipeline execution."""
+            return jsonify(self._get_execution_steps(execution_id))
+
+        @app.route("/api/run-pipeline", methods=["POST"])
+        def run_pipeline():
+            """
+            Run a DAG of commands across machines as one tracked execution.
+            JSON body: {name, steps: [{name, machine_id, command, depends_on: [], cache: bool, timeout}],
+                        directory_name, project_type, max_parallel, deadline}
+            When directory_name is given, the project directory is uploaded once per machine and
+            every step on that machine runs inside the uploaded workspace.
+            """
+            data = request.json or {}
+            name = data.get("name") or "pipeline"
+            step_specs = data.get("steps") or []
+            directory_name = data.get("directory_name")
+            project_type = data.get("project_type", "python")
+            max_parallel = int(data.get("max_parallel", 4))
+
+            if not step_specs:
+                return jsonify({"success": False, "message": "At least one step is required"}), 400
+
+            machines = {}
+            for spec in step_specs:
+                if not spec.get("name") or not spec.get("command"):
+                    return jsonify({"success": False, "message": "Each step needs a name and a command"}), 400
+                machine_id = str(spec.get("machine_id") or "")
+                machine = self.machines.get(machine_id)
+                if not machine:
+                    return jsonify({"success": False, "message": f"Machine not found for step '{spec['name']}'"}), 404
+                machines[machine_id] = machine
+
+            project_dir = None
+            if directory_name:
+                project_dir = os.path.join(self.directories_base_path, project_type, directory_name)
+                if not os.path.isdir(project_dir):
+                    return jsonify({"success": False, "message": f"Project directory not found: {directory_name}"}), 404
+
+            from remoteinfra.pipeline import Pipeline, PipelineContext, PipelineStep, directory_fingerprint
+            import hashlib
+
+            def run_step_command(machine_id, command):
+                def action(context, inputs):
+                    remote_dir = context.workspace.get(f"remote_dir:{machine_id}")
+                    full_command = f"cd {shlex.quote(remote_dir)} && {command}" if remote_dir else command
+                    output, errors = context.client(machine_id).run_command(full_command)
+                    return {
+                        "success": not errors,
+                        "output": output or "",
+                        "errors": errors or "",
+                        "value": hashlib.sha256((output or "").encode()).hexdigest(),
+                    }
+                return action
+
+            def upload_workspace(machine_id):
+                def action(context, inputs):
+                    remote_dir = context.client(machine_id).send_Directory(project_dir)
+                    if not remote_dir:
+                        return {"success": False, "output": "", "errors": "Failed to upload project directory"}
+                    context.workspace[f"remote_dir:{machine_id}"] = remote_dir
+                    return {"success": True, "output": f"Uploaded {directory_name} to {remote_dir}", "errors": "", "value": remote_dir}
+                return action
+
+            def workspace_still_present(machine_id):
+                def validate(context, result):
+                    remote_dir = result["value"]
+                    out, _ = context.client(machine_id).run_command(
+                        f"test -d {shlex.quote(remote_dir)} && echo present", timeout=15, verbose=False)
+                    if out and "present" in out:
+                        context.workspace[f"remote_dir:{machine_id}"] = remote_dir
+                        return True
+                    return False
+                return validate
+
+            try:
+                steps = []
+                if project_dir:
+                    fingerprint = directory_fingerprint(project_dir)
+                    for machine_id in machines:
+                        steps.append(PipelineStep(
+                            f"upload@{machines[machine_id]['name']}",
+                            upload_workspace(machine_id),
+                            host=machine_id,
+                            cache_inputs={"project_dir": project_dir, "fingerprint": fingerprint},
+                            validate_cached=workspace_still_present(machine_id),
+                        ))
+                for spec in step_specs:
+                    machine_id = str(spec["machine_id"])
+                    depends_on = list(spec.get("depends_on") or [])
+                    if project_dir:
+                        depends_on.append(f"upload@{machines[machine_id]['name']}")
+                    steps.append(PipelineStep(
+                        spec["name"],
+                        run_step_command(machine_id, spec["command"]),
+                        depends_on=depends_on,
+                        host=machine_id,
+                        cache_inputs={"command": spec["command"]} if spec.get("cache") else None,
+                        timeout=spec.get("timeout"),
+                    ))
+            except Exception as e:
+                return jsonify({"success": False, "message": str(e)}), 400
+
+            execution_id = str(uuid.uuid4())
+            started_at = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            command_desc = f"pipeline {name}: " + ", ".join(spec["name"] for spec in step_specs)
+            exec_data = {
+                "id": execution_id,
+                "machine_id": next(iter(machines)) if len(machines) == 1 else "multiple",
+                "type": "pipeline",
+                "status": "queued",
+                "command": command_desc,
+                "output": "",
+                "started_at": started_at,
+                "completed_at": None,
+                "duration": 0,
+                "logs": "",
+                "deadline": data.get("deadline"),
+            }
+
+            try:
+                pipeline = Pipeline(
+                    name,
+                    steps,
+                    max_parallel=max_parallel,
+                    cache=SSHClient.STEP_CACHE,
+                    listener=lambda step: self._record_execution_step(execution_id, step),
+                )
+            except ValueError as ve:
+                return jsonify({"success": False, "message": str(ve)}), 400
+
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
+            self._insert_execution(exec_data)
+
+            def open_client(machine_id):
+                machine = machines[machine_id]
+                client = SSHClient(
+                    machine["host"],
+                    machine["username"],
+                    machine.get("password"),
+                    machine.get("port", 22),
+                    machine.get("key"),
+                )
+                client.login()
+                return client
+
+            def execute_pipeline_task():
+                context = PipelineContext(client_factory=open_client)
+                try:
+                    return pipeline.run(context)
+                finally:
+                    context.close()
+
+            self._submit_execution(exec_data, execute_pipeline_task)
+
+            self.notifier.publish('execution_started', {
+                'execution_id': execution_id,
+                'type': 'pipeline',
+                'command': command_desc,
+                'machine_id': exec_data['machine_id']
+            })
+
+            return jsonify({
+                "success": True,
+                "execution_id": execution_id,
+                "message": f"Pipeline '{name}' started in background",
+                "status": "queued"
+            })
+
+        # --- Recurring job scheduler ---
+        SCHEDULE_JOB_TYPES = ("command", "terraform", "docker_prune")
+
+        def _job_from_request(data, existing=None):
+            fields = {
+                "name": data.get("name", existing.name if existing else None),
+                "cron": data.get("cron", existing.cron if existing else None),
+                "job_type": data.get("job_type", existing.job_type if existing else None),
+                "machine_id": data.get("machine_id", existing.machine_id if existing else None),
+                "payload": data.get("payload", existing.payload if existing else {}),
+                "enabled": data.get("enabled", existing.enabled if existing else True),
+                "jitter": data.get("jitter", existing.jitter if existing else 30),
+                "spread": data.get("spread", existing.spread if existing else None),
+                "skip_if_running": data.get("skip_if_running", existing.skip_if_running if existing else True),
+            }
+            if not fields["name"] or not fields["cron"]:
+                raise ValueError("name and cron are required")
+            if fields["job_type"] not in SCHEDULE_JOB_TYPES:
+                raise ValueError(f"job_type must be one of: {', '.join(SCHEDULE_JOB_TYPES)}")
+            if existing:
+                for attr in ("id", "last_run", "last_duration", "last_status", "last_execution_id", "run_count", "skipped_runs"):
+                    fields[attr] = getattr(existing, attr)
+            return ScheduledJob(**fields)
+
+        @app.route("/api/schedules", methods=["GET", "POST"])
+        def schedules():
+            """List scheduled jobs with next-run/last-duration, or create one."""
+            if request.method == "GET":
+                return jsonify([job.to_dict() for job in self._list_scheduled_jobs()])
+            try:
+                job = _job_from_request(request.json or {})
+            except ValueError as ve:
+                return jsonify({"success": False, "message": str(ve)}), 400
+            self._put_scheduled_job(job)
+            return jsonify({"success": True, "job": job.to_dict()})
+
+        @app.route("/api/schedules/<job_id>", methods=["GET", "PUT", "DELETE"])
+        def schedule_detail(job_id):
+            job = self._get_scheduled_job(job_id)
+            if not job:
+                return jsonify({"success": False, "message": "Scheduled job not found"}), 404
+            if request.method == "GET":
+                return jsonify(job.to_dict())
+            if request.method == "DELETE":
+                self.scheduler.remove(job_id)  # no-op on workers, which hold no jobs
+                self._delete_scheduled_job(job_id)
+                return jsonify({"success": True})
+            try:
+                updated = _job_from_request(request.json or {}, existing=job)
+            except ValueError as ve:
+                return jsonify({"success": False, "message": str(ve)}), 400
+            self._put_scheduled_job(updated)
+            return jsonify({"success": True, "job": updated.to_dict()})
+
+        @app.route("/api/schedules/<job_id>/run", methods=["POST"])
+        def schedule_run_now(job_id):
+            """Trigger a scheduled job immediately."""
+            job = self._get_scheduled_job(job_id)
+            if not job:
+                return jsonify({"success": False, "message": "Scheduled job not found"}), 404
+            if self.role != "primary":
+                # The primary's scheduler runs it and keeps its bookkeeping
+                self.bus.publish("schedule_run", {"job_id": job_id})
+                return jsonify({"success": True, "message": "Run requested", "job": job.to_dict()}), 202
+            execution_id = self.scheduler.run_now(job_id)
+            if not execution_id:
+                return jsonify({"success": False, "message": f"Job not started ({job.last_status})", "job": job.to_dict()}), 409
+            return jsonify({"success": True, "execution_id": execution_id, "job": job.to_dict()})
+
         # Python script execution
         @app.route("/api/python/run", methods=["POST"])
         def run_python():
@@ -771,11 +2419,7 @@ class Dashboard:
             timeout = int(data.get("timeout", 60))
             
             # Find machine by id
-            machine = None
-            for m in self.machines:
-                if str(m.get("id")) == str(machine_id):
-                    machine = m
-                    break
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "message": "Machine not found"}), 404
             
@@ -794,7 +2438,11 @@ class Dashboard:
                 "completed_at": None,
                 "duration": 0,
                 "logs": "",
+                "deadline": data.get("deadline"),
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
             # Define the execution function
@@ -825,8 +2473,7 @@ class Dashboard:
                 return {'success': not errors, 'output': output, 'errors': errors}
             
             # Submit to thread pool
-            future = self.executor.submit(self._execute_async, exec_data, execute_python_task)
-            self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+            self._submit_execution(exec_data, execute_python_task)
             
             # Emit notification
             socketio.emit('notification', {
@@ -836,12 +2483,12 @@ class Dashboard:
             }, namespace='/ws')
             
             # Emit execution started event
-            socketio.emit('execution_started', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
                 'type': 'python',
                 'command': filename,
                 'machine_id': machine_id
-            }, namespace='/ws')
+            })
             
             return jsonify({
                 "success": True, 
@@ -865,11 +2512,7 @@ class Dashboard:
             become = data.get("become", False)
             
             # Find machine by id
-            machine = None
-            for m in self.machines:
-                if str(m.get("id")) == str(machine_id):
-                    machine = m
-                    break
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "message": "Machine not found"}), 404
             
@@ -891,6 +2534,9 @@ class Dashboard:
                 "duration": 0,
                 "logs": "",
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
             # Define the execution function
@@ -929,6 +2575,7 @@ class Dashboard:
             
             # Execute synchronously so frontend waits for real output
             start_time = time.time()
+            self.admission.mark_started(execution_id)
             self._update_execution_status(execution_id, 'running')
             try:
                 result = execute_ansible_task()
@@ -939,6 +2586,8 @@ class Dashboard:
                 success = False
                 output = ''
                 errors = str(e)
+            finally:
+                self.admission.mark_finished(execution_id)
             end_time = time.time()
             status = 'success' if success and not errors else 'failed'
             completed_at = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
@@ -989,7 +2638,11 @@ class Dashboard:
                 "completed_at": None,
                 "duration": 0,
                 "logs": "",
+                "deadline": data.get("deadline"),
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
             # Define the execution function
@@ -1015,23 +2668,22 @@ class Dashboard:
                         temp_dir = tempfile.mkdtemp(prefix="terraform_init_")
                         work_dir = temp_dir
                     
-                    # Execute terraform command
-                    if action == "init":
-                        success, output, error = self._run_terraform_init_local(work_dir)
-                    elif action == "plan":
-                        if not script_content.strip() and not directory_name:
-                            return {"success": False, "output": "", "errors": "Terraform configuration content or directory is required for plan action"}
-                        success, output, error = self._run_terraform_plan_local(work_dir)
-                    elif action == "apply":
-                        if not script_content.strip() and not directory_name:
-                            return {"success": False, "output": "", "errors": "Terraform configuration content or directory is required for apply action"}
-                        success, output, error = self._run_terraform_apply_local(work_dir)
+                    if action != "init" and not script_content.strip() and not directory_name:
+                        return {"success": False, "output": "", "errors": f"Terraform configuration content or directory is required for {action} action"}
+
+                    # Execute terraform as an init -> plan -> apply pipeline with per-step timings
+                    actions = {"init": ("init",), "plan": ("init", "plan"), "apply": ("init", "plan", "apply")}[action]
+                    result = SSHClient("localhost", "local").run_terraform_pipeline(
+                        work_dir,
+                        actions,
+                        listener=lambda step: self._record_execution_step(execution_id, step),
+                    )
                     
-                    captured_output = output
-                    if error:
-                        captured_output += f"\nErrors: {error}"
+                    captured_output = result["output"]
+                    if result["errors"]:
+                        captured_output += f"\nErrors: {result['errors']}"
                     
-                    return {"success": success, "output": captured_output, "errors": error}
+                    return {"success": result["success"], "output": captured_output, "errors": result["errors"]}
                     
                 finally:
                     # Clean up temporary directory
@@ -1043,8 +2695,7 @@ class Dashboard:
                             print(f"Warning: Failed to clean up temp directory {temp_dir}: {cleanup_error}")
             
             # Submit to thread pool
-            future = self.executor.submit(self._execute_async, exec_data, execute_terraform_task)
-            self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+            self._submit_execution(exec_data, execute_terraform_task)
             
             # Emit notification
             socketio.emit('notification', {
@@ -1054,12 +2705,12 @@ class Dashboard:
             }, namespace='/ws')
             
             # Emit execution started event
-            socketio.emit('execution_started', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
                 'type': 'terraform',
                 'command': command_desc,
                 'machine_id': machine_id or "local"
-            }, namespace='/ws')
+            })
             
             return jsonify({
                 "success": True, 
@@ -1807,6 +3458,7 @@ This directory contains {script_type} files and configurations.
             custom_command = data.get("custom_command")  # Optional custom execution command
             remote = data.get("remote", True)  # Execute remotely by default
             extra_args = data.get("extra_args")  # Optional extra arguments
+            local_timeout = data.get("timeout")  # Optional local execution timeout in seconds
             
             if not directory_name:
                 return jsonify({"success": False, "message": "Directory name is required"}), 400
@@ -1836,7 +3488,11 @@ This directory contains {script_type} files and configurations.
                 "completed_at": None,
                 "duration": 0,
                 "logs": "",
+                "deadline": data.get("deadline"),
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
             # Define the execution function
@@ -1844,11 +3500,7 @@ This directory contains {script_type} files and configurations.
                 try:
                     if remote and machine_id:
                         # Find machine for remote execution
-                        machine = None
-                        for m in self.machines:
-                            if str(m.get("id")) == str(machine_id):
-                                machine = m
-                                break
+                        machine = self.machines.get(machine_id)
                         if not machine:
                             return {"success": False, "error": "Machine not found"}
                         
@@ -1861,6 +3513,7 @@ This directory contains {script_type} files and configurations.
                             machine.get("key"),
                         )
                         client.login()
+                        client.pipeline_listener = lambda step: self._record_execution_step(execution_id, step)
                         
                         result = client.run_project_directory(
                             project_dir=project_dir,
@@ -1876,11 +3529,7 @@ This directory contains {script_type} files and configurations.
                     elif project_type == "ansible":
                         # Ansible always runs locally (on dashboard host) targeting remote machines
                         if machine_id:
-                            machine = None
-                            for m in self.machines:
-                                if str(m.get("id")) == str(machine_id):
-                                    machine = m
-                                    break
+                            machine = self.machines.get(machine_id)
                             if not machine:
                                 return {"success": False, "error": "Machine not found for Ansible targeting"}
                             
@@ -1903,13 +3552,15 @@ This directory contains {script_type} files and configurations.
                     else:
                         # Local execution (for terraform and other types)
                         client = SSHClient("localhost", "local")  # Dummy client for local execution
+                        client.pipeline_listener = lambda step: self._record_execution_step(execution_id, step)
                         result = client.run_project_directory(
                             project_dir=project_dir,
                             main_file=main_file,
                             project_type=project_type,
                             custom_command=custom_command,
                             remote=False,
-                            extra_args=extra_args
+                            extra_args=extra_args,
+                            timeout=local_timeout,
                         )
                     
                     return result
@@ -1918,8 +3569,7 @@ This directory contains {script_type} files and configurations.
                     return {"success": False, "error": str(e)}
             
             # Submit to thread pool
-            future = self.executor.submit(self._execute_async, exec_data, execute_project_task)
-            self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+            self._submit_execution(exec_data, execute_project_task)
             
             # Emit notification
             socketio.emit('notification', {
@@ -1929,12 +3579,12 @@ This directory contains {script_type} files and configurations.
             }, namespace='/ws')
             
             # Emit execution started event
-            socketio.emit('execution_started', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
                 'type': f'{project_type}_project',
                 'command': command_desc,
                 'machine_id': machine_id or "local"
-            }, namespace='/ws')
+            })
             
             return jsonify({
                 "success": True, 
@@ -1997,7 +3647,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"error": "Missing required parameters"}), 400
                 
                 # Find machine
-                machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                machine = self.machines.get(machine_id)
                 if not machine:
                     return jsonify({"error": "Machine not found"}), 404
                 
@@ -2032,7 +3682,11 @@ This directory contains {script_type} files and configurations.
                     "completed_at": None,
                     "duration": 0,
                     "logs": "",
+                    "deadline": data.get("deadline"),
                 }
+                rejection = _reject_if_over_capacity(execution_id)
+                if rejection is not None:
+                    return rejection
                 self._insert_execution(exec_data)
                 
                 # Define the execution function
@@ -2189,8 +3843,7 @@ This directory contains {script_type} files and configurations.
                         return {"success": False, "errors": str(e)}
                 
                 # Submit to thread pool
-                future = self.executor.submit(self._execute_async, exec_data, execute_directory_task)
-                self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+                self._submit_execution(exec_data, execute_directory_task)
                 
                 # Emit notification
                 socketio.emit('notification', {
@@ -2200,12 +3853,12 @@ This directory contains {script_type} files and configurations.
                 }, namespace='/ws')
                 
                 # Emit execution started event
-                socketio.emit('execution_started', {
+                self.notifier.publish('execution_started', {
                     'execution_id': execution_id,
                     'type': f'{script_type}_directory',
                     'command': command_desc,
                     'machine_id': machine_id
-                }, namespace='/ws')
+                })
                 
                 return jsonify({
                     "success": True, 
@@ -2226,40 +3879,35 @@ This directory contains {script_type} files and configurations.
                 return jsonify({'error': 'Machine ID is required'}), 400
 
             # Find the machine by ID
-            machine = next((m for m in self.machines if str(m.get('id')) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'error': 'Machine not found'}), 404
 
 
-            try:
-                client = SSHClient(
-                    machine["host"],
-                    machine["username"],
-                    machine.get("password"),
-                    machine.get("port", 22),
-                    machine.get("key"),
-                )
-                # No need to login for ping (ping is local)
-                online = client.ping()
-                if online:
-                    return jsonify({'success': True, 'message': f'{machine["host"]} is reachable'}), 200
-                else:
-                    return jsonify({'success': False, 'message': f'{machine["host"]} is not reachable'}), 400
-            except Exception as e:
-                return jsonify({'success': False, 'message': 'An error occurred', 'error': str(e)}), 500
+            # Answered from the health checker's cache; probed now only when never checked or asked to
+            state = self.health.get(machine_id)
+            if state is None or data.get('fresh'):
+                state = self.health.check([machine_id]).get(machine_id)
+            if state is None:
+                return jsonify({'error': 'Machine not found'}), 404
+            payload = {
+                'status': state['status'],
+                'last_checked': state['last_checked'],
+                'latency_ms': state.get('latency_ms'),
+                'detail': state.get('detail'),
+            }
+            if state['status'] == 'online':
+                return jsonify(dict(payload, success=True, message=f'{machine["host"]} is reachable')), 200
+            return jsonify(dict(payload, success=False, message=f'{machine["host"]} is not reachable')), 400
 
 
         @app.route("/api/execution/<exec_id>", methods=["GET"])
         def get_execution_detail(exec_id):
-            c = self.conn.cursor()
-            c.execute("SELECT * FROM execution_history WHERE id = ?", (exec_id,))
-            row = c.fetchone()
-            if not row:
+            data = self._get_execution_record(exec_id)
+            if not data:
                 return jsonify({"error": "Not found"}), 404
-            data = dict(row)
             # Add machine host and name
-            c.execute("SELECT host, name FROM machines WHERE id = ?", (data["machine_id"],))
-            mrow = c.fetchone()
+            mrow = self.machines.get(data["machine_id"])
             if mrow:
                 data["machine_host"] = mrow["host"]
                 data["machine_name"] = mrow["name"]
@@ -2268,6 +3916,53 @@ This directory contains {script_type} files and configurations.
                 data["machine_name"] = ""
             return jsonify(data)
 
+        @app.route("/api/execution/<exec_id>/<field>", methods=["GET"])
+        def get_execution_output(exec_id, field):
+            """
+            Raw output or logs of an execution as text. Honors ``Range: bytes=a-b`` (206 Partial
+            Content); ``offset``/``length`` query parameters do the same for plain clients.
+            """
+            if field not in OutputStore.FIELDS:
+                return jsonify({"error": "Unknown field"}), 404
+            start, end = 0, None
+            range_header = request.headers.get("Range")
+            try:
+                if range_header:
+                    unit, _, spec = range_header.partition("=")
+                    first, _, last = spec.strip().partition("-")
+                    if unit.strip() != "bytes" or "," in spec or not (first or last):
+                        raise ValueError
+                    # "bytes=-N" asks for the last N bytes
+                    start = int(first) if first else -int(last)
+                    end = int(last) if first and last else None
+                else:
+                    start = int(request.args.get("offset", 0))
+                    length = request.args.get("length", type=int)
+                    end = start + length - 1 if length else None
+                    if start < 0:
+                        raise ValueError
+                if end is not None and end < start:
+                    raise ValueError
+            except ValueError:
+                return jsonify({"error": "Invalid range"}), 400
+
+            result = self._read_execution_output(exec_id, field, start, end)
+            if result is None:
+                return jsonify({"error": "Not found"}), 404
+            data, start, size = result
+            if range_header and start >= size > 0:
+                response = Response(status=416)
+                response.headers["Content-Range"] = f"bytes */{size}"
+                return response
+            # An empty output has no byte range to describe; it is sent whole (and empty)
+            partial = bool(range_header and data)
+            response = Response(data, status=206 if partial else 200, mimetype="text/plain")
+            response.headers["Accept-Ranges"] = "bytes"
+            response.headers["X-Content-Size"] = str(size)
+            if partial:
+                response.headers["Content-Range"] = f"bytes {start}-{start + len(data) - 1}/{size}"
+            return response
+
         # === DOCKER API ENDPOINTS ===
         
         @app.route("/api/docker/info", methods=["POST"])
@@ -2296,7 +3991,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker info
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2342,7 +4037,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker images
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2395,7 +4090,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker containers
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2441,7 +4136,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker networks
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2487,7 +4182,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker volumes
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2534,7 +4229,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker logs
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2580,7 +4275,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker inspect
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -2627,7 +4322,7 @@ This directory contains {script_type} files and configurations.
                     errors = result.stderr
                 else:
                     # Remote Docker pull
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -2721,7 +4416,11 @@ This directory contains {script_type} files and configurations.
                 "completed_at": None,
                 "duration": 0,
                 "logs": "",
+                "deadline": data.get("deadline"),
             }
+            rejection = _reject_if_over_capacity(execution_id)
+            if rejection is not None:
+                return rejection
             self._insert_execution(exec_data)
             
             # Define the execution function
@@ -2765,7 +4464,7 @@ This directory contains {script_type} files and configurations.
                     return {"success": success, "output": output, "errors": errors, "command": command}
                 else:
                     # Remote Docker run
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return {"success": False, "output": "", "errors": "Machine not found"}
                     
@@ -2785,8 +4484,7 @@ This directory contains {script_type} files and configurations.
                     return result
             
             # Submit to thread pool
-            future = self.executor.submit(self._execute_async, exec_data, execute_docker_run_task)
-            self.execution_threads[execution_id] = {"future": future, "status": "queued"}
+            self._submit_execution(exec_data, execute_docker_run_task)
             
             # Emit notification
             socketio.emit('notification', {
@@ -2796,12 +4494,12 @@ This directory contains {script_type} files and configurations.
             }, namespace='/ws')
             
             # Emit execution started event
-            socketio.emit('execution_started', {
+            self.notifier.publish('execution_started', {
                 'execution_id': execution_id,
                 'type': 'docker_run',
                 'command': f"docker run {image_name}",
                 'machine_id': machine_id
-            }, namespace='/ws')
+            })
             
             return jsonify({
                 "success": True, 
@@ -2942,7 +4640,7 @@ This directory contains {script_type} files and configurations.
                             errors = f"Container start command succeeded but container is not running. {errors}"
                 else:
                     # Remote Docker action
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3048,7 +4746,7 @@ This directory contains {script_type} files and configurations.
                     exec_command = " ".join(cmd)
                 else:
                     # Remote Docker exec
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3141,7 +4839,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({"success": False, "error": str(e)})
             
             # Remote Docker stats
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({"success": False, "error": "Machine not found"}), 404
             
@@ -3210,7 +4908,7 @@ This directory contains {script_type} files and configurations.
                     command = " ".join(cmd)
                 else:
                     # Remote Docker Compose
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3324,7 +5022,7 @@ This directory contains {script_type} files and configurations.
                     })
                 else:
                     # Save to remote machine
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3416,7 +5114,7 @@ This directory contains {script_type} files and configurations.
                         command = f"docker container prune -f && {command}"
                 else:
                     # Remote Docker system prune
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3568,7 +5266,7 @@ This directory contains {script_type} files and configurations.
                     command = " ".join(cmd)
                 else:
                     # Remote execution
-                    machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+                    machine = self.machines.get(machine_id)
                     if not machine:
                         return jsonify({"success": False, "error": "Machine not found"}), 404
                     
@@ -3751,7 +5449,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({'success': False, 'error': str(e)}), 500
             
             # Remote Python overview
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'success': False, 'error': 'Machine not found'}), 404
             
@@ -3866,7 +5564,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({'success': False, 'error': str(e)}), 500
             
             # Remote Ansible overview
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'success': False, 'error': 'Machine not found'}), 404
             
@@ -3990,7 +5688,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({'success': False, 'error': str(e)}), 500
             
             # Remote Terraform overview
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'success': False, 'error': 'Machine not found'}), 404
             
@@ -4111,7 +5809,7 @@ This directory contains {script_type} files and configurations.
                     return jsonify({'success': False, 'error': str(e)}), 500
             
             # Remote OS info
-            machine = next((m for m in self.machines if str(m.get("id")) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'success': False, 'error': 'Machine not found'}), 404
             
@@ -4143,29 +5841,74 @@ This directory contains {script_type} files and configurations.
             machine_id = data.get('machine_id')
             if not machine_id:
                 return jsonify({'success': False, 'message': 'Machine ID is required'}), 400
-            machine = next((m for m in self.machines if str(m.get('id')) == str(machine_id)), None)
+            machine = self.machines.get(machine_id)
             if not machine:
                 return jsonify({'success': False, 'message': 'Machine not found'}), 404
-            try:
-                client = SSHClient(
-                    machine["host"],
-                    machine["username"],
-                    machine.get("password"),
-                    machine.get("port", 22),
-                    machine.get("key"),
-                )
-                client.login()
-                online = client.ping()
-                client.close()
-                if online:
-                    return jsonify({'success': True, 'message': f'{machine["host"]} is reachable'}), 200
-                else:
-                    return jsonify({'success': False, 'message': f'{machine["host"]} is not reachable'}), 200
-            except Exception as e:
-                return jsonify({'success': False, 'message': str(e)}), 500
+            client = SSHClient(
+                machine["host"],
+                machine["username"],
+                machine.get("password"),
+                machine.get("port", 22),
+                machine.get("key"),
+            )
+            result = client.probe(attempts=3, auth=not data.get('skip_auth'))
+            self.health.record([(machine_id, result)])
+            if not result['reachable']:
+                message = f'{machine["host"]} is not reachable: {result["error"]}'
+            elif result.get('auth') is False:
+                message = f'{machine["host"]} is reachable but login failed: {result["auth_error"]}'
+            else:
+                message = f'{machine["host"]} is reachable ({result["rtt_ms"]["avg"]} ms)'
+            success = result['reachable'] and result.get('auth', True)
+            return jsonify(dict(result, success=success, message=message)), 200
+
+        if self.role == "primary":
+            self.scheduler.start()
+            self.retention.start()
+            self.health.start()
+        self.log_stream.start(lambda event, data, room: socketio.emit(event, data, room=room, namespace='/ws'))
+        self.notifier.start(lambda event, data, sid: socketio.emit(event, data, to=sid, namespace='/ws'))
+        self.stats_publisher.start(lambda event, data, room: socketio.emit(event, data, room=room, namespace='/ws'))
+        if workers > 1:
+            self._start_bus()
 
-        print(f"Starting Flask server at http://{self.host}:{self.port}")
-        socketio.run(app, host=self.host, port=self.port)
+        if mode == "development":
+            print(f"Starting Flask server at http://{self.host}:{self.port}")
+            socketio.run(app, host=self.host, port=self.port)
+            return
+
+        processes = []
+        if workers > 1 and self.role == "primary":
+            context = multiprocessing.get_context("spawn")
+            serve_kwargs = dict(mode=mode, workers=workers, threads=threads, async_mode=async_mode,
+                                drain_timeout=drain_timeout)
+            for n in range(1, workers):
+                process = context.Process(target=_run_worker, args=(self._init_kwargs, serve_kwargs),
+                                          name=f"remoteinfra-worker-{n}")
+                process.start()
+                processes.append(process)
+
+        def drain():
+            for process in processes:
+                process.terminate()  # SIGTERM: each worker drains its own executions
+            self.shutdown(drain_timeout)
+            for process in processes:
+                process.join(timeout=30)
+
+        print(f"Starting production server ({async_mode}, {workers} process(es)) at http://{self.host}:{self.port}"
+              if self.role == "primary" else f"Worker process {os.getpid()} serving at http://{self.host}:{self.port}")
+        if async_mode == "threading":
+            server.run(app, self.host, self.port, threads=threads, reuse_port=workers > 1, on_shutdown=drain)
+        else:
+            import signal
+
+            def handle_signal(signum, frame):
+                # The event loop has no clean stop from a signal handler; exit once drained
+                threading.Thread(target=lambda: (drain(), os._exit(0)), daemon=True).start()
+
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, handle_signal)
+            socketio.run(app, host=self.host, port=self.port, log_output=False)
 
     def _execute_ansible_project_local(self, project_dir, main_file, custom_command, extra_args, target_client):
         """Execute Ansible project locally targeting remote machine."""
@@ -4289,123 +6032,7 @@ This directory contains {script_type} files and configurations.
                 "execution_location": "local"
             }
 
-    # --- Local Terraform execution helper methods ---
-    def _run_terraform_init_local(self, work_dir):
-        """Run terraform init locally and return (success, output, error)"""
-        import subprocess
-        import shutil
-        
-        # Check if terraform is installed
-        if not shutil.which("terraform"):
-            return False, "", "Terraform is not installed or not in PATH on the dashboard host."
-        
-        try:
-            cmd = ["terraform", "init", "-lock=false"]
-            result = subprocess.run(
-                cmd, 
-                cwd=work_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=300  # 5 minute timeout
-            )
-            
-            success = result.returncode == 0
-            output = result.stdout or ""
-            error = result.stderr or ""
-            
-            return success, output, error
-            
-        except subprocess.TimeoutExpired:
-            return False, "", "Terraform init timed out after 5 minutes"
-        except Exception as e:
-            return False, "", f"Failed to execute terraform init: {str(e)}"
-
-    def _run_terraform_plan_local(self, work_dir):
-        """Run terraform plan locally and return (success, output, error)"""
-        import subprocess
-        import shutil
-        
-        # Check if terraform is installed
-        if not shutil.which("terraform"):
-            return False, "", "Terraform is not installed or not in PATH on the dashboard host."
-        
-        try:
-            # First run init, then plan
-            init_cmd = ["terraform", "init", "-lock=false"]
-            init_result = subprocess.run(
-                init_cmd, 
-                cwd=work_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=300
-            )
-            
-            if init_result.returncode != 0:
-                return False, init_result.stdout or "", f"Init failed: {init_result.stderr}"
-            
-            # Now run plan
-            plan_cmd = ["terraform", "plan", "-lock=false"]
-            plan_result = subprocess.run(
-                plan_cmd, 
-                cwd=work_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=300
-            )
-            
-            success = plan_result.returncode == 0
-            combined_output = f"INIT OUTPUT:\n{init_result.stdout}\n\nPLAN OUTPUT:\n{plan_result.stdout}"
-            error = plan_result.stderr or ""
-            
-            return success, combined_output, error
-            
-        except subprocess.TimeoutExpired:
-            return False, "", "Terraform plan timed out after 5 minutes"
-        except Exception as e:
-            return False, "", f"Failed to execute terraform plan: {str(e)}"
-
-    def _run_terraform_apply_local(self, work_dir):
-        """Run terraform apply locally and return (success, output, error)"""
-        import subprocess
-        import shutil
-        
-        # Check if terraform is installed
-        if not shutil.which("terraform"):
-            return False, "", "Terraform is not installed or not in PATH on the dashboard host."
-        
-        try:
-            # First run init, then apply
-            init_cmd = ["terraform", "init", "-lock=false"]
-            init_result = subprocess.run(
-                init_cmd, 
-                cwd=work_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=300
-            )
-            
-            if init_result.returncode != 0:
-                return False, init_result.stdout or "", f"Init failed: {init_result.stderr}"
-            
-            # Now run apply with auto-approve
-            apply_cmd = ["terraform", "apply", "-auto-approve", "-lock=false"]
-            apply_result = subprocess.run(
-                apply_cmd, 
-                cwd=work_dir, 
-                capture_output=True, 
-                text=True, 
-                timeout=600  # 10 minute timeout for apply
-            )
-            
-            success = apply_result.returncode == 0
-            combined_output = f"INIT OUTPUT:\n{init_result.stdout}\n\nAPPLY OUTPUT:\n{apply_result.stdout}"
-            error = apply_result.stderr or ""
-            
-            return success, combined_output, error
-            
-        except subprocess.TimeoutExpired:
-            return False, "", "Terraform apply timed out after 10 minutes"
-        except Exception as e:
-            return False, "", f"Failed to execute terraform apply: {str(e)}"
-
 
+def _run_worker(init_kwargs, serve_kwargs):
+    """Entry point of the extra processes started by ``Dashboard.serve(workers=N)``."""
+    Dashboard(role="worker", **init_kwargs).serve(**serve_kwargs)
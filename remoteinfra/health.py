@@ -0,0 +1,163 @@
+import datetime
+import threading
+import time
+
+from remoteinfra.probe import probe_many
+
+
+class HealthChecker:
+    """
+    Background reachability checks of every registered machine.
+
+    Every ``interval`` seconds all machines are probed concurrently (``max_open`` sockets at a
+    time, ``timeout`` seconds each) with ``probe_many()``, a TCP connect plus SSH banner read
+    that takes milliseconds instead of the seconds of an ICMP ``ping -c 5``. Results land in the
+    ``machine_state`` table in one grouped write and in an in-memory cache that answers
+    status requests instantly. ``on_change(machine_id, state)`` is called when a machine
+    goes online or offline. Added or edited machines are checked right away.
+    """
+
+    def __init__(self, storage, registry, interval=60, timeout=3.0, max_open=512, on_change=None):
+        self.storage = storage
+        self.registry = registry
+        self.interval = interval
+        self.timeout = timeout
+        self.max_open = max_open
+        self.on_change = on_change
+        self.last_round = None  # {"started_at", "duration", "checked", "online"}
+        self._states = {}
+        self._lock = threading.Lock()
+        self._queue = set()  # machine ids to check before the next full round
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        self._load()
+        registry.subscribe(self._on_registry_change)
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("PRAGMA table_info(machine_state)")
+        columns = [row[1] for row in c.fetchall()]
+        for column, kind in (("latency_ms", "REAL"), ("detail", "TEXT"), ("changed_at", "TIMESTAMP")):
+            if column not in columns:
+                c.execute(f"ALTER TABLE machine_state ADD COLUMN {column} {kind}")
+
+    def _load(self):
+        for row in self.storage.query("SELECT * FROM machine_state"):
+            self._states[row["machine_id"]] = dict(row)
+
+    # -- background thread -------------------------------------------------
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="remoteinfra-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self, machine_ids=None):
+        """Check some machines (or all) now instead of waiting for the interval."""
+        with self._lock:
+            self._queue.update(machine_ids or [m["id"] for m in self.registry])
+        self._wake.set()
+
+    def _loop(self):
+        next_round = time.monotonic()
+        while not self._stop.is_set():
+            self._wake.wait(max(0.0, next_round - time.monotonic()))
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            with self._lock:
+                queued, self._queue = self._queue, set()
+            try:
+                if time.monotonic() >= next_round:
+                    self.check()
+                    next_round = time.monotonic() + self.interval
+                elif queued:
+                    self.check(queued)
+            except Exception as e:
+                print(f"Health check failed: {e}")
+
+    def _on_registry_change(self, event, machine):
+        if event == "removed":
+            with self._lock:
+                self._states.pop(machine["id"], None)
+            self.storage.write("DELETE FROM machine_state WHERE machine_id = ?", (machine["id"],), wait=False)
+        elif self._thread is not None:
+            self.trigger(machine.get("ids") or [machine["id"]])
+
+    # -- checks ------------------------------------------------------------
+
+    def check(self, machine_ids=None):
+        """Probe machines (all when None) concurrently and record the results. Returns them."""
+        if machine_ids is None:
+            machines = self.registry.all()
+        else:
+            machines = [m for m in (self.registry.get(i) for i in machine_ids) if m]
+        started = time.time()
+        states = {}
+        if machines:
+            results = probe_many([(m["host"], m.get("port")) for m in machines],
+                                 timeout=self.timeout, max_open=self.max_open)
+            states = self.record(zip((m["id"] for m in machines), results))
+        if machine_ids is None:
+            self.last_round = {
+                "started_at": datetime.datetime.utcfromtimestamp(started).strftime("%Y-%m-%d %H:%M:%S"),
+                "duration": round(time.time() - started, 3),
+                "checked": len(states),
+                "online": sum(1 for s in states.values() if s["status"] == "online"),
+            }
+        return states
+
+    def record(self, results):
+        """Store ``[(machine_id, probe_result)]`` in the cache and machine_state; notify changes."""
+        now = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        states, changed = {}, []
+        with self._lock:
+            for machine_id, result in results:
+                status = "online" if result["reachable"] else "offline"
+                previous = self._states.get(machine_id)
+                state = {
+                    "machine_id": machine_id,
+                    "status": status,
+                    "latency_ms": result["rtt_ms"]["avg"],
+                    "detail": result["banner"] or result["error"],
+                    "last_checked": now,
+                    "changed_at": now if not previous or previous["status"] != status else previous.get("changed_at"),
+                }
+                self._states[machine_id] = states[machine_id] = state
+                if not previous or previous["status"] != status:
+                    changed.append(state)
+        self.storage.write_many([(
+            "INSERT INTO machine_state (machine_id, status, last_checked, latency_ms, detail, changed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(machine_id) DO UPDATE SET status=excluded.status, last_checked=excluded.last_checked, "
+            "latency_ms=excluded.latency_ms, detail=excluded.detail, changed_at=excluded.changed_at",
+            (s["machine_id"], s["status"], s["last_checked"], s["latency_ms"], s["detail"], s["changed_at"]),
+        ) for s in states.values()], wait=False)
+        if self.on_change:
+            for state in changed:
+                try:
+                    self.on_change(state["machine_id"], dict(state))
+                except Exception as e:
+                    print(f"Health change listener error: {e}")
+        return states
+
+    def remember(self, state):
+        """Cache a state recorded elsewhere (another dashboard process) without probing or storing it."""
+        with self._lock:
+            self._states[state["machine_id"]] = dict(state)
+
+    def get(self, machine_id):
+        with self._lock:
+            state = self._states.get(machine_id)
+            return dict(state) if state else None
+
+    def all(self):
+        with self._lock:
+            return {machine_id: dict(state) for machine_id, state in self._states.items()}
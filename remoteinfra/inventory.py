@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import shlex
+
+from remoteinfra.probe import probe_many
+from remoteinfra.registry import parse_tags
+
+FORMATS = ("csv", "json", "ssh_config")
+# Columns of CSV exports, in order; imports accept any subset with a header row
+EXPORT_FIELDS = ("id", "name", "host", "username", "port", "key", "tags", "password")
+
+
+def detect_format(filename=None, text=""):
+    """Guess the format of an inventory from its file name, falling back to its content."""
+    name = (filename or "").lower()
+    if name.endswith(".json") or name.endswith(".jsonl"):
+        return "json"
+    if name.endswith(".csv"):
+        return "csv"
+    if "ssh_config" in name or name.endswith("config"):
+        return "ssh_config"
+    head = text.lstrip()[:1]
+    if head in ("[", "{"):
+        return "json"
+    first = text.lstrip().split("\n", 1)[0].strip().lower()
+    if first.startswith("host ") or first.startswith("host\t") or first.startswith("#"):
+        return "ssh_config"
+    return "csv"
+
+
+def parse_csv(text):
+    """Machines from CSV with a header row (``host,username[,port,password,key,name,tags]``)."""
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        return []
+    return [{k.strip().lower(): (v or "").strip() for k, v in row.items() if k} for row in reader]
+
+
+def parse_json(text):
+    """Machines from a JSON array, ``{"machines": [...]}`` or one object per line."""
+    text = text.strip()
+    if not text:
+        return []
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict):
+        data = data.get("machines", [data])
+    if not isinstance(data, list):
+        raise ValueError("JSON inventory must be a list of machines")
+    return data
+
+
+def parse_ssh_config(text, default_username=None):
+    """
+    Machines from an OpenSSH client config: one per ``Host`` alias without wildcards, using
+    its HostName, User, Port and first IdentityFile. ``Host *`` defaults apply to all.
+    """
+    blocks = []
+    defaults = {}
+    current = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, _, value = line.replace("=", " ", 1).partition(" ")
+        key, value = key.lower(), value.strip().strip('"')
+        if key == "host":
+            aliases = shlex.split(value)
+            if aliases == ["*"]:
+                current = defaults
+            else:
+                current = {}
+                blocks.append(([a for a in aliases if not any(c in a for c in "*?!")], current))
+        elif key == "match":
+            current = None  # conditional blocks are not evaluated
+        elif current is not None:
+            current.setdefault(key, value)
+    machines = []
+    for aliases, options in blocks:
+        options = dict(defaults, **options)
+        for alias in aliases:
+            machines.append({
+                "name": alias,
+                "host": options.get("hostname", alias),
+                "username": options.get("user") or default_username or "",
+                "port": options.get("port", 22),
+                "key": options.get("identityfile"),
+            })
+    return machines
+
+
+def parse(text, fmt=None, filename=None, default_username=None):
+    """Raw machine dicts from an inventory in ``fmt`` (one of FORMATS, guessed if None)."""
+    fmt = fmt or detect_format(filename, text)
+    if fmt == "csv":
+        return parse_csv(text)
+    if fmt == "json":
+        return parse_json(text)
+    if fmt == "ssh_config":
+        return parse_ssh_config(text, default_username)
+    raise ValueError(f"format must be one of: {', '.join(FORMATS)}")
+
+
+def normalize(raw, default_username=None):
+    """A machine dict ready to store, or raise ValueError saying what is wrong with it."""
+    if not isinstance(raw, dict):
+        raise ValueError("not an object")
+    machine = {k: v for k, v in raw.items() if v not in (None, "")}
+    if "key_path" in machine:
+        machine.setdefault("key", machine.pop("key_path"))
+    machine["host"] = str(machine.get("host") or machine.get("hostname") or "").strip()
+    machine["username"] = str(machine.get("username") or machine.get("user") or default_username or "").strip()
+    if not machine["host"]:
+        raise ValueError("missing host")
+    if not machine["username"]:
+        raise ValueError("missing username")
+    try:
+        machine["port"] = int(machine.get("port") or 22)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid port {machine.get('port')!r}")
+    if not 0 < machine["port"] < 65536:
+        raise ValueError(f"invalid port {machine['port']}")
+    machine["tags"] = parse_tags(machine.get("tags"))
+    return {k: machine.get(k) for k in ("id", "name", "host", "username", "password", "port", "key", "tags")}
+
+
+def check_reachable(host, port=22, timeout=3.0):
+    """Open a TCP connection and read the SSH banner. Returns (ok, detail)."""
+    return check_all([{"host": host, "port": port}], timeout=timeout)[0]
+
+
+def check_all(machines, workers=512, timeout=3.0):
+    """
+    Reachability of many machines at once (``workers`` sockets open at a time), as a list of
+    (ok, detail) aligned with ``machines``.
+    """
+    results = probe_many([(m["host"], m.get("port")) for m in machines], timeout=timeout, max_open=workers)
+    return [(r["reachable"], r["banner"] or r["error"]) for r in results]
+
+
+def export(machines, fmt="json", include_secrets=False):
+    """
+    Yield an inventory in ``fmt`` ("csv" or "json", the latter one object per line) piece by
+    piece, so large fleets can be streamed. Passwords are left out unless asked for.
+    """
+    fields = [f for f in EXPORT_FIELDS if include_secrets or f != "password"]
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for machine in machines:
+            writer.writerow(dict(machine, tags=",".join(machine.get("tags") or [])))
+            if buffer.tell() >= 16 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+    elif fmt == "json":
+        for machine in machines:
+            yield json.dumps({f: machine.get(f) for f in fields}) + "\n"
+    else:
+        raise ValueError("format must be csv or json")
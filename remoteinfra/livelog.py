@@ -0,0 +1,239 @@
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+class LiveLog:
+    """
+    Output of one running execution, appended in numbered chunks.
+
+    ``append()`` only buffers. Buffered text becomes chunks (one per run of the same stream)
+    when it reaches ``flush_bytes`` or when the store's flusher thread finds it older than
+    ``flush_interval``, so a chatty command costs a handful of grouped writes per second
+    rather than one per line. Every chunk has a sequence number and the byte range it covers
+    in the execution's log, so readers can resume from any offset.
+    """
+
+    def __init__(self, store, execution_id, next_seq=0, offset=0):
+        self.store = store
+        self.execution_id = execution_id
+        self.next_seq = next_seq
+        self.offset = offset
+        self.closed = False
+        self._pending = []  # [(stream, text)]
+        self._pending_bytes = 0
+        self._pending_since = None
+        self._lock = threading.Lock()
+
+    def append(self, text, stream="stdout"):
+        if not text or self.closed:
+            return
+        with self._lock:
+            if not self._pending:
+                self._pending_since = time.time()
+            self._pending.append((stream, text))
+            self._pending_bytes += len(text)
+            full = self._pending_bytes >= self.store.flush_bytes
+        if full:
+            self.flush()
+
+    def due(self, now):
+        return self._pending_since is not None and now - self._pending_since >= self.store.flush_interval
+
+    def flush(self, wait=False):
+        """Write buffered text as chunks. Returns the new chunks."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._pending_bytes = 0
+            self._pending_since = None
+            chunks = []
+            for stream, text in pending:
+                if chunks and chunks[-1]["stream"] == stream:
+                    chunks[-1]["data"] += text
+                else:
+                    chunks.append({"stream": stream, "data": text})
+            for chunk in chunks:
+                size = len(chunk["data"].encode("utf-8", errors="replace"))
+                chunk.update(seq=self.next_seq, offset=self.offset, end_offset=self.offset + size)
+                self.next_seq += 1
+                self.offset += size
+            if chunks:
+                # Written under the lock so chunks reach the writer queue in sequence order
+                self.store.storage.write_many([(
+                    "INSERT INTO execution_log_chunks (execution_id, seq, stream, offset, end_offset, data, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.execution_id, c["seq"], c["stream"], c["offset"], c["end_offset"], c["data"], time.time()),
+                ) for c in chunks], wait=wait)
+        if chunks and self.store.on_chunks:
+            try:
+                self.store.on_chunks(self.execution_id, chunks)
+            except Exception as e:
+                print(f"Live log listener error: {e}")
+        return chunks
+
+    def close(self):
+        """Flush what is left and stop accepting output."""
+        self.flush(wait=True)
+        self.closed = True
+        self.store._release(self)
+
+    @contextmanager
+    def bind(self):
+        """Make this the live log of the calling thread (see ``current()``)."""
+        previous = getattr(_local, "log", None)
+        _local.log = self
+        try:
+            yield self
+        finally:
+            _local.log = previous
+
+
+class LogStore:
+    """
+    Append-only ``execution_log_chunks`` table with one LiveLog per running execution.
+    Chunks only outlive their execution until its output is stored (see ``delete_statements()``).
+
+    A single flusher thread (started with the first log) writes buffered output of every open
+    log at least every ``flush_interval`` seconds. ``on_chunks(execution_id, chunks)`` is called
+    after each flush, e.g. to forward new output to clients.
+    """
+
+    def __init__(self, storage, flush_interval=0.5, flush_bytes=32 * 1024, on_chunks=None):
+        self.storage = storage
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.on_chunks = on_chunks
+        self._logs = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS execution_log_chunks (
+                execution_id TEXT,
+                seq INTEGER,
+                stream TEXT,
+                offset INTEGER,
+                end_offset INTEGER,
+                data TEXT,
+                created_at REAL,
+                PRIMARY KEY (execution_id, seq)
+            )
+        """)
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS ix_execution_log_chunks_end ON execution_log_chunks (execution_id, end_offset)"
+        )
+
+    def open(self, execution_id):
+        """LiveLog of an execution, continuing after any chunks already stored for it."""
+        with self._lock:
+            log = self._logs.get(execution_id)
+            if log is None:
+                last = self.storage.query_one(
+                    "SELECT seq, end_offset FROM execution_log_chunks WHERE execution_id = ? ORDER BY seq DESC LIMIT 1",
+                    (execution_id,),
+                )
+                log = LiveLog(self, execution_id, last["seq"] + 1 if last else 0, last["end_offset"] if last else 0)
+                self._logs[execution_id] = log
+        self._ensure_flusher()
+        return log
+
+    def get(self, execution_id):
+        with self._lock:
+            return self._logs.get(execution_id)
+
+    def _release(self, log):
+        with self._lock:
+            if self._logs.get(log.execution_id) is log:
+                del self._logs[log.execution_id]
+
+    def _ensure_flusher(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._flush_loop, name="remoteinfra-live-log", daemon=True)
+        self._thread.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval / 2)
+            now = time.time()
+            with self._lock:
+                due = [log for log in self._logs.values() if log.due(now)]
+            for log in due:
+                try:
+                    log.flush()
+                except Exception as e:
+                    print(f"Error writing live log of {log.execution_id}: {e}")
+
+    def tail(self, execution_id, offset=0, from_seq=None, max_bytes=1024 * 1024):
+        """
+        Chunks from byte ``offset`` (or from sequence number ``from_seq``) on, at most about
+        ``max_bytes`` of them. The first chunk is trimmed to start exactly at ``offset``.
+        Returns {"chunks": [...], "next_offset": int, "next_seq": int}.
+        """
+        log = self.get(execution_id)
+        if log is not None:
+            log.flush()
+        self.storage.flush()
+        if from_seq is not None:
+            rows = self.storage.query(
+                "SELECT seq, stream, offset, end_offset, data FROM execution_log_chunks "
+                "WHERE execution_id = ? AND seq >= ? ORDER BY seq",
+                (execution_id, from_seq),
+            )
+        else:
+            rows = self.storage.query(
+                "SELECT seq, stream, offset, end_offset, data FROM execution_log_chunks "
+                "WHERE execution_id = ? AND end_offset > ? ORDER BY seq",
+                (execution_id, offset),
+            )
+        chunks = []
+        total = 0
+        for row in rows:
+            chunk = dict(row)
+            if from_seq is None and chunk["offset"] < offset:
+                skip = offset - chunk["offset"]
+                chunk["data"] = chunk["data"].encode("utf-8", errors="replace")[skip:].decode("utf-8", errors="ignore")
+                chunk["offset"] = offset
+            chunks.append(chunk)
+            total += chunk["end_offset"] - chunk["offset"]
+            if total >= max_bytes:
+                break
+        if chunks:
+            next_offset, next_seq = chunks[-1]["end_offset"], chunks[-1]["seq"] + 1
+        elif from_seq is not None:
+            next_offset, next_seq = None, from_seq
+        else:
+            next_offset, next_seq = offset, None
+        return {"chunks": chunks, "next_offset": next_offset, "next_seq": next_seq}
+
+    def delete_statements(self, execution_id):
+        """
+        Statements dropping an execution's chunks, for use with ``Storage.write_many`` once its
+        output is stored for good.
+        """
+        return [("DELETE FROM execution_log_chunks WHERE execution_id = ?", (execution_id,))]
+
+    def text(self, execution_id, stream=None):
+        """Everything logged so far, optionally only one stream."""
+        query = "SELECT data FROM execution_log_chunks WHERE execution_id = ?"
+        params = [execution_id]
+        if stream:
+            query += " AND stream = ?"
+            params.append(stream)
+        return "".join(row["data"] for row in self.storage.query(query + " ORDER BY seq", params))
+
+
+def current():
+    """The live log bound to the calling thread, if any."""
+    return getattr(_local, "log", None)
+
+
+def write(text, stream="stdout", log=None):
+    """Append to the given or current live log; a no-op outside executions."""
+    log = log or current()
+    if log is not None:
+        log.append(text, stream)
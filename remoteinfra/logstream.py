@@ -0,0 +1,303 @@
+import json
+import threading
+import time
+import zlib
+
+from remoteinfra.admission import TokenBucket
+
+
+class FramePacker:
+    """
+    Packs a run of log chunks into one ``log`` frame.
+
+    Frames for clients that accept binary frames carry their chunks as zlib-compressed JSON
+    (``"encoding": "zlib"``, ``"payload"``: bytes, sent as a Socket.IO binary attachment)
+    once the chunks come to ``min_compress_bytes``; smaller frames, and every frame for other
+    clients, carry the ``chunks`` list as is.
+    """
+
+    def __init__(self, level=6, min_compress_bytes=1024):
+        self.level = level
+        self.min_compress_bytes = min_compress_bytes
+
+    def pack(self, execution_id, chunks, gap=None, binary=False):
+        """``(frame, wire_bytes)``: the event data and roughly what it costs on the wire."""
+        frame = {
+            "execution_id": execution_id,
+            "next_offset": chunks[-1]["end_offset"] if chunks else (gap[1] if gap else None),
+            "next_seq": chunks[-1]["seq"] + 1 if chunks else None,
+            "gap": gap,
+        }
+        size = sum(chunk["end_offset"] - chunk["offset"] for chunk in chunks)
+        if binary and size >= self.min_compress_bytes:
+            frame["encoding"] = "zlib"
+            frame["payload"] = zlib.compress(json.dumps(chunks, separators=(",", ":")).encode("utf-8"), self.level)
+            return frame, len(frame["payload"])
+        frame["chunks"] = chunks
+        return frame, size
+
+
+class _Client:
+    __slots__ = ("sent", "acked", "ack", "binary", "bucket", "last_emit")
+
+    def __init__(self, sent, ack, binary, rate, burst):
+        self.sent = sent  # offset the next frame continues from; None until the first frame
+        self.acked = sent  # offset the client confirmed (equals ``sent`` without acks)
+        self.ack = ack
+        self.binary = binary
+        self.bucket = TokenBucket(rate, burst)
+        self.last_emit = 0.0
+
+
+class _Room:
+    def __init__(self):
+        self.chunks = []  # recent chunks in sequence order, shared by all watchers
+        self.bytes = 0
+        self.clients = {}  # sid -> _Client
+
+
+class LogBroadcaster:
+    """
+    Sends live log chunks to the clients watching an execution as ``log`` frames.
+
+    ``publish()`` (wired to ``LogStore.on_chunks``) buffers chunks of executions someone is
+    watching, up to ``max_pending_bytes`` per execution however many clients watch it. A
+    sender thread packs what each client has not been sent into one frame of up to
+    ``max_batch_bytes``, at most every ``interval`` seconds, and charges it to the client's
+    token bucket (``client_rate`` bytes per second, bursts of ``client_burst``).
+
+    Each client's position is tracked separately. Clients that join with ``ack`` confirm
+    what they have applied with ``ack()`` and are sent at most ``window`` bytes ahead of
+    that; other clients count as having applied every frame sent. A client that falls
+    behind the buffer (or more than ``max_lag_bytes`` behind the newest output) gets a
+    summarized frame instead: the skipped byte range as ``gap`` and the newest output from
+    there on. Clients can fetch a gap from ``GET /api/executions/<id>/log?offset=``. A slow
+    client thus never costs the server more than the shared buffer.
+
+    Every frame is ``{"execution_id", "chunks": [{"seq", "stream", "offset", "end_offset",
+    "data"}], "next_offset", "next_seq", "gap"}``, with ``chunks`` replaced by ``encoding``
+    and ``payload`` when packed as binary (see FramePacker).
+    """
+
+    def __init__(self, interval=0.25, max_batch_bytes=64 * 1024, client_rate=128 * 1024,
+                 client_burst=512 * 1024, max_pending_bytes=1024 * 1024, window=256 * 1024,
+                 max_lag_bytes=512 * 1024, packer=None):
+        self.interval = interval
+        self.max_batch_bytes = max_batch_bytes
+        self.client_rate = client_rate
+        self.client_burst = max(client_burst, max_batch_bytes)
+        self.max_pending_bytes = max_pending_bytes
+        self.window = max(window, max_batch_bytes)
+        self.max_lag_bytes = max(max_lag_bytes, max_batch_bytes)
+        self.packer = packer or FramePacker()
+        self.emit = None
+        self.events = 0
+        self.bytes_sent = 0
+        self.wire_bytes = 0
+        self.bytes_skipped = 0
+        self.summarized = 0
+        self._sids = {}  # sid -> set of execution_ids
+        self._rooms = {}  # execution_id -> _Room
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, emit):
+        """Begin sending with ``emit(event, data, room)``; frames go to the client's sid."""
+        self.emit = emit
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="remoteinfra-log-stream", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def room(execution_id):
+        return f"execution_{execution_id}"
+
+    def watch(self, sid, execution_id, offset=None, ack=False, binary=False):
+        """
+        Start sending a client an execution's output from ``offset`` (or from the next chunk
+        published). With ``ack`` the client confirms frames with ``ack()``; with ``binary``
+        it accepts compressed frames.
+        """
+        with self._lock:
+            room = self._rooms.get(execution_id)
+            if room is None:
+                room = self._rooms[execution_id] = _Room()
+            if offset is None and room.chunks:
+                offset = room.chunks[-1]["end_offset"]
+            room.clients[sid] = _Client(offset, bool(ack), bool(binary), self.client_rate, self.client_burst)
+            self._sids.setdefault(sid, set()).add(execution_id)
+        self._wake.set()
+
+    def catch_up(self, sid, execution_id, backlog):
+        """
+        The frame of a ``LogStore.tail()`` page a client is sent on joining; live frames
+        continue after it.
+        """
+        with self._lock:
+            client = self._client(sid, execution_id)
+            frame, _ = self.packer.pack(execution_id, backlog["chunks"], binary=client is not None and client.binary)
+            frame["next_offset"], frame["next_seq"] = backlog["next_offset"], backlog["next_seq"]
+            if client is not None:
+                client.sent = max(client.sent or 0, backlog["next_offset"])
+                if not client.ack or client.acked is None:
+                    client.acked = client.sent
+            return frame
+
+    def ack(self, sid, execution_id, offset):
+        """Record that a client has applied an execution's output up to ``offset``."""
+        with self._lock:
+            client = self._client(sid, execution_id)
+            if client is None or client.sent is None:
+                return
+            client.acked = max(client.acked or 0, min(int(offset), client.sent))
+        self._wake.set()
+
+    def unwatch(self, sid, execution_id=None):
+        """Stop sending a client one execution's output, or everything (on disconnect)."""
+        with self._lock:
+            ids = [execution_id] if execution_id else list(self._sids.get(sid, ()))
+            for eid in ids:
+                room = self._rooms.get(eid)
+                if room is not None:
+                    room.clients.pop(sid, None)
+                    if not room.clients:
+                        del self._rooms[eid]
+                self._sids.get(sid, set()).discard(eid)
+            if not self._sids.get(sid):
+                self._sids.pop(sid, None)
+
+    def watchers(self, execution_id):
+        """Sids of the clients watching an execution."""
+        with self._lock:
+            room = self._rooms.get(execution_id)
+            return set(room.clients) if room else set()
+
+    def _client(self, sid, execution_id):
+        room = self._rooms.get(execution_id)
+        return room.clients.get(sid) if room else None
+
+    def publish(self, execution_id, chunks):
+        """Buffer new chunks of an execution; dropped at once when nobody watches it."""
+        with self._lock:
+            room = self._rooms.get(execution_id)
+            if room is None:
+                return
+            for chunk in chunks:
+                room.chunks.append(chunk)
+                room.bytes += chunk["end_offset"] - chunk["offset"]
+            # Clients still behind the dropped chunks get a gap in their next frame
+            while room.bytes > self.max_pending_bytes and len(room.chunks) > 1:
+                self._drop(room)
+        self._wake.set()
+
+    @staticmethod
+    def _drop(room):
+        dropped = room.chunks.pop(0)
+        room.bytes -= dropped["end_offset"] - dropped["offset"]
+
+    def _take(self, execution_id, room, client, now):
+        """Next frame for one client, or None if it has nothing to send yet."""
+        if not room.chunks or now - client.last_emit < self.interval:
+            return None
+        newest = room.chunks[-1]["end_offset"]
+        if client.sent is None:
+            client.sent = client.acked = room.chunks[0]["offset"]
+        start = client.sent
+        if start >= newest:
+            return None
+        in_flight = start - client.acked
+        if client.ack and in_flight >= self.window:
+            return None
+        gap = None
+        if start < room.chunks[0]["offset"]:
+            # Output the client was not sent has left the buffer
+            gap = [start, room.chunks[0]["offset"]]
+        if newest - start > self.max_lag_bytes:
+            # Too far behind to catch up chunk by chunk: skip to the newest output
+            skip_to = start
+            for chunk in room.chunks:
+                if newest - chunk["offset"] <= self.max_batch_bytes:
+                    break
+                skip_to = chunk["end_offset"]
+            if skip_to > start:
+                gap = [start, skip_to]
+        if gap:
+            start = gap[1]
+        budget = self.max_batch_bytes
+        if client.ack:
+            budget = min(budget, self.window - in_flight)
+        batch, size = [], 0
+        for chunk in room.chunks:
+            if chunk["end_offset"] <= start:
+                continue
+            chunk_size = chunk["end_offset"] - chunk["offset"]
+            if batch and size + chunk_size > budget:
+                break
+            # A chunk larger than the bucket goes out once the bucket is full
+            allowed, _ = client.bucket.consume(min(chunk_size, client.bucket.capacity))
+            if not allowed:
+                break
+            batch.append(chunk)
+            size += chunk_size
+        if not batch and gap is None:
+            return None
+        frame, wire = self.packer.pack(execution_id, batch, gap=gap, binary=client.binary)
+        client.last_emit = now
+        client.sent = frame["next_offset"]
+        if not client.ack:
+            client.acked = client.sent
+        elif gap:
+            # Skipped output is never in flight
+            client.acked += gap[1] - gap[0]
+        if gap:
+            self.summarized += 1
+            self.bytes_skipped += gap[1] - gap[0]
+        return frame, size, wire
+
+    def _trim(self, room):
+        """Forget chunks every client of a room has been sent."""
+        sent = [c.sent for c in room.clients.values()]
+        if None in sent:
+            return
+        while room.chunks and room.chunks[0]["end_offset"] <= min(sent):
+            self._drop(room)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            now = time.time()
+            frames = []
+            with self._lock:
+                for eid, room in list(self._rooms.items()):
+                    for sid, client in room.clients.items():
+                        item = self._take(eid, room, client, now)
+                        if item is not None:
+                            frames.append((sid, item))
+                    self._trim(room)
+            for sid, (frame, size, wire) in frames:
+                try:
+                    self.emit("log", frame, sid)
+                    self.events += 1
+                    self.bytes_sent += size
+                    self.wire_bytes += wire
+                except Exception as e:
+                    print(f"Error streaming log of {frame['execution_id']}: {e}")
+
+    def stats(self):
+        with self._lock:
+            clients = [c for room in self._rooms.values() for c in room.clients.values()]
+            return {
+                "watched_executions": len(self._rooms),
+                "clients": len(self._sids),
+                "buffered_bytes": sum(room.bytes for room in self._rooms.values()),
+                "clients_waiting_for_ack": sum(
+                    1 for c in clients if c.ack and c.sent is not None and c.sent - c.acked >= self.window),
+                "events": self.events,
+                "bytes_sent": self.bytes_sent,
+                "wire_bytes": self.wire_bytes,
+                "summarized_frames": self.summarized,
+                "bytes_skipped": self.bytes_skipped,
+            }
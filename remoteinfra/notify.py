@@ -0,0 +1,148 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+
+class Notifier:
+    """
+    Per-client, coalescing delivery of dashboard events over Socket.IO.
+
+    Every connected client has its own queue of pending events, drained by one sender thread
+    every ``interval`` seconds. An event published with a ``key`` replaces a pending event
+    of the same name and key, so a client that has not been sent ``queued``/``running`` yet
+    only gets the latest status of an execution, and a burst of updates costs each client a
+    single emit per execution. Events without a key are all delivered, in order. A client
+    that falls more than ``max_pending`` events behind loses its oldest ones.
+
+    Every event gets a ``seq`` number, increasing for the lifetime of the process (``epoch``
+    tells processes apart), and the last ``replay_size`` events (at most ``replay_age``
+    seconds old) are kept. A client that reconnects passes the last ``seq`` (and epoch) it
+    saw to ``connect()`` and is sent only what it missed, coalesced like live events and
+    ahead of anything newer. When that is no longer in the buffer, or the server
+    restarted, it has to reload instead.
+
+    ``on_publish(event, data, key)``, if set, is called for every published event, e.g. to
+    relay it to other processes.
+    """
+
+    def __init__(self, interval=0.1, max_pending=1000, replay_size=5000, replay_age=600, on_publish=None):
+        self.interval = interval
+        self.max_pending = max_pending
+        self.replay_age = replay_age
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self.emit = None
+        self.on_publish = on_publish
+        self.published = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending = {}  # sid -> OrderedDict((event, key) -> data)
+        self._replay = deque(maxlen=replay_size)  # (seq, published_at, slot, data)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, emit):
+        """Begin delivering with ``emit(event, data, sid)``."""
+        self.emit = emit
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="remoteinfra-notifier", daemon=True)
+        self._thread.start()
+
+    def connect(self, sid, last_seq=None, epoch=None):
+        """
+        Start delivering to a client. With ``last_seq``, first queue the events it missed since.
+        Returns the number of replayed events, or None if it must reload (nothing to resume
+        from, other epoch, or events already dropped from the buffer).
+        """
+        with self._lock:
+            pending = self._pending.setdefault(sid, OrderedDict())
+            if last_seq is None:
+                return None
+            self._expire(time.time())
+            oldest = self._replay[0][0] if self._replay else self.seq + 1
+            if epoch != self.epoch or last_seq > self.seq or last_seq < oldest - 1:
+                return None
+            missed = 0
+            for seq, _, slot, data in self._replay:
+                if seq > last_seq:
+                    self._enqueue(pending, slot, data)
+                    missed += 1
+        if missed:
+            self._wake.set()
+        return missed
+
+    def disconnect(self, sid):
+        with self._lock:
+            self._pending.pop(sid, None)
+
+    def publish(self, event, data, key=None, exclude=()):
+        """Queue ``event`` for every connected client except the sids in ``exclude``."""
+        if self.emit is None:
+            return
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+            self.seq += 1
+            self.published += 1
+            slot = (event, key if key is not None else ("#", self.seq))
+            data = dict(data, seq=self.seq)
+            self._replay.append((self.seq, now, slot, data))
+            for sid, pending in self._pending.items():
+                if sid not in exclude:
+                    self._enqueue(pending, slot, data)
+        self._wake.set()
+        if self.on_publish:
+            try:
+                self.on_publish(event, data, key)
+            except Exception as e:
+                print(f"Notifier relay error: {e}")
+
+    def _enqueue(self, pending, slot, data):
+        if slot in pending:
+            # Superseded; the newer payload goes out in the older one's place
+            del pending[slot]
+            self.coalesced += 1
+        pending[slot] = data
+        while len(pending) > self.max_pending:
+            pending.popitem(last=False)
+            self.dropped += 1
+
+    def _expire(self, now):
+        while self._replay and now - self._replay[0][1] > self.replay_age:
+            self._replay.popleft()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                batches = [(sid, pending) for sid, pending in self._pending.items() if pending]
+                for sid, _ in batches:
+                    self._pending[sid] = OrderedDict()
+            for sid, pending in batches:
+                for (event, _), data in pending.items():
+                    try:
+                        self.emit(event, data, sid)
+                        self.sent += 1
+                    except Exception as e:
+                        print(f"Error notifying client {sid}: {e}")
+            # Let events published meanwhile accumulate (and coalesce) for one interval
+            time.sleep(self.interval)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "epoch": self.epoch,
+                "seq": self.seq,
+                "replay_buffer": len(self._replay),
+                "clients": len(self._pending),
+                "pending": sum(len(p) for p in self._pending.values()),
+                "published": self.published,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+            }
@@ -0,0 +1,309 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import watchdog
+
+
+def directory_fingerprint(path):
+    """Return a content hash for a local file or directory tree (names, sizes and bytes)."""
+    digest = hashlib.sha256()
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        # Terraform state and provider caches change on every run and are not inputs
+        dirs[:] = [d for d in dirs if d != ".terraform"]
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            rel = os.path.relpath(full, path).replace(os.sep, "/")
+            if rel.endswith((".tfstate", ".tfstate.backup")) or name == "tfplan":
+                continue
+            digest.update(rel.encode())
+            digest.update(b"\0")
+            with open(full, "rb") as f:
+                for block in iter(lambda: f.read(65536), b""):
+                    digest.update(block)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PipelineStep:
+    """
+    A single node of a pipeline.
+
+    Args:
+        name (str): Unique step name within the pipeline.
+        action (callable): ``action(context, inputs)`` returning a dict with at least ``success``;
+            ``output``, ``errors`` and ``value`` are optional. ``inputs`` maps each dependency
+            name to its result.
+        depends_on (list): Names of steps that must succeed first.
+        host (str, optional): Host key the step runs against; used for grouping and cache keys.
+        cache_inputs (optional): JSON-serialisable inputs of the step. When given, a successful
+            result is cached and reused while these inputs and the dependency values are unchanged.
+        validate_cached (callable, optional): ``validate_cached(context, result)`` returning False
+            when a cached result can no longer be trusted (e.g. the remote workspace disappeared).
+        timeout (float, optional): Deadline of the step in seconds. Channels and subprocesses the
+            step opened are torn down by the watchdog when it passes.
+    """
+
+    def __init__(self, name, action, depends_on=None, host=None, cache_inputs=None, validate_cached=None,
+                 timeout=None):
+        self.name = name
+        self.action = action
+        self.depends_on = list(depends_on or [])
+        self.host = host
+        self.cache_inputs = cache_inputs
+        self.validate_cached = validate_cached
+        self.timeout = timeout
+
+    def cache_key(self, inputs):
+        if self.cache_inputs is None:
+            return None
+        upstream = {name: inputs[name].get("value") for name in sorted(inputs)}
+        payload = json.dumps(
+            {"step": self.name, "host": self.host, "inputs": self.cache_inputs, "upstream": upstream},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class StepCache:
+    """Thread-safe LRU cache of successful step results keyed by input hash."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class PipelineContext:
+    """
+    State shared by all steps of one pipeline run.
+
+    ``workspace`` is a free-form dict steps use to hand values to each other. Connections are
+    opened lazily through ``client_factory(host)`` and reused by every step on the same host.
+    """
+
+    def __init__(self, client_factory=None, workspace=None):
+        self.client_factory = client_factory
+        self.workspace = workspace if workspace is not None else {}
+        self._clients = {}
+        self._client_locks = {}
+        self._lock = threading.Lock()
+
+    def client(self, host):
+        """Return the shared connection for ``host``, opening it on first use."""
+        with self._lock:
+            lock = self._client_locks.setdefault(host, threading.Lock())
+        with lock:
+            if host not in self._clients:
+                if self.client_factory is None:
+                    raise RuntimeError("Pipeline context has no client factory")
+                self._clients[host] = self.client_factory(host)
+            return self._clients[host]
+
+    def add_client(self, host, client):
+        with self._lock:
+            self._clients[host] = client
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+class Pipeline:
+    """
+    A DAG of steps. Independent branches run in parallel; a failed step skips its dependents
+    while unrelated branches carry on. Steps run under a watchdog watch that is a child of the
+    caller's current watch, so both step and execution deadlines apply.
+    """
+
+    def __init__(self, name, steps, max_parallel=4, cache=None, listener=None):
+        self.name = name
+        self.steps = OrderedDict()
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicate pipeline step: {step.name}")
+            self.steps[step.name] = step
+        self.max_parallel = max(1, max_parallel)
+        self.cache = cache
+        self.listener = listener
+        self._validate()
+
+    def _validate(self):
+        for step in self.steps.values():
+            for dep in step.depends_on:
+                if dep not in self.steps:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+        # Kahn's algorithm; anything left over is part of a cycle
+        remaining = {name: set(step.depends_on) for name, step in self.steps.items()}
+        self._order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Pipeline '{self.name}' has a dependency cycle: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+                self._order.append(name)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _notify(self, record):
+        if self.listener:
+            try:
+                self.listener(dict(record))
+            except Exception as e:
+                print(f"Pipeline listener error: {e}")
+
+    def run(self, context=None):
+        """
+        Execute the pipeline and return a dict with ``success``, ``output``, ``errors``,
+        ``results`` (per step) and ``steps`` (timing records in completion order).
+        """
+        context = context or PipelineContext()
+        results = {}
+        records = OrderedDict(
+            (name, {"name": name, "host": step.host, "status": "pending", "cached": False,
+                    "depends_on": step.depends_on, "started_at": None, "completed_at": None,
+                    "duration": 0})
+            for name, step in self.steps.items()
+        )
+        pending = set(self.steps)
+        running = {}
+        start = time.time()
+        parent_watch = watchdog.current()
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            while pending or running:
+                # Skip steps whose dependencies did not succeed (steps are in topological order
+                # after validation, so one pass also catches transitive dependents)
+                for name in self._order:
+                    if name not in pending:
+                        continue
+                    step = self.steps[name]
+                    if any(records[d]["status"] in ("failed", "skipped") for d in step.depends_on):
+                        pending.discard(name)
+                        records[name]["status"] = "skipped"
+                        results[name] = {"success": False, "output": "", "errors": "Skipped: dependency failed"}
+                        self._notify(records[name])
+
+                ready = [n for n in self.steps if n in pending
+                         and all(records[d]["status"] == "success" for d in self.steps[n].depends_on)]
+                for name in ready:
+                    pending.discard(name)
+                    step = self.steps[name]
+                    inputs = {d: results[d] for d in step.depends_on}
+                    records[name]["status"] = "running"
+                    records[name]["started_at"] = time.time()
+                    self._notify(records[name])
+                    running[pool.submit(self._run_step, step, context, inputs, parent_watch)] = name
+
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result, cached = future.result()
+                    results[name] = result
+                    record = records[name]
+                    record["completed_at"] = time.time()
+                    record["duration"] = record["completed_at"] - record["started_at"]
+                    record["cached"] = cached
+                    record["status"] = "success" if result.get("success") else "failed"
+                    if result.get("timed_out"):
+                        record["timed_out"] = True
+                    self._notify(record)
+
+        success = all(r["status"] == "success" for r in records.values())
+        output = "\n\n".join(
+            f"=== {name}{' (cached)' if records[name]['cached'] else ''} ===\n{results[name].get('output') or ''}"
+            for name in self.steps if records[name]["status"] in ("success", "failed")
+        )
+        errors = "\n".join(
+            f"{name}: {results[name].get('errors')}" for name in self.steps
+            if records[name]["status"] == "failed" and results[name].get("errors")
+        )
+        return {
+            "success": success,
+            "output": output,
+            "errors": errors,
+            "results": results,
+            "steps": list(records.values()),
+            "duration": time.time() - start,
+        }
+
+    def _run_step(self, step, context, inputs, parent_watch=None):
+        if parent_watch is not None:
+            watch = parent_watch.child(step.name, timeout=step.timeout)
+        elif step.timeout:
+            watch = watchdog.default_watchdog().watch(f"{self.name}/{step.name}", timeout=step.timeout)
+        else:
+            return self._run_step_unwatched(step, context, inputs)
+        watch.enter("running")
+        try:
+            with watch.bind():
+                result, cached = self._run_step_unwatched(step, context, inputs)
+        finally:
+            watch.finish()
+        if watch.expired:
+            errors = result.get("errors") or ""
+            result = dict(result, success=False, timed_out=True,
+                          errors=f"{errors}\nStep deadline exceeded in state '{watch.expired_in_state}'".strip())
+        return result, cached
+
+    def _run_step_unwatched(self, step, context, inputs):
+        key = step.cache_key(inputs) if self.cache is not None else None
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                valid = True
+                if step.validate_cached:
+                    try:
+                        valid = step.validate_cached(context, cached)
+                    except Exception:
+                        valid = False
+                if valid:
+                    return cached, True
+                self.cache.invalidate(key)
+        try:
+            result = step.action(context, inputs) or {}
+        except Exception as e:
+            result = {"success": False, "output": "", "errors": str(e)}
+        if not isinstance(result, dict):
+            result = {"success": bool(result), "output": "", "errors": ""}
+        if key and result.get("success"):
+            self.cache.put(key, result)
+        return result, False
@@ -0,0 +1,170 @@
+import errno
+import os
+import selectors
+import socket
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Longest banner line read; RFC 4253 allows 255 bytes plus CR LF
+BANNER_BYTES = 256
+# connect_ex() results meaning the non-blocking connect is under way
+_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+
+def rtt_stats(samples, lost=0):
+    """Min/avg/max/jitter (mean absolute deviation) in ms of connect times, like ping's summary."""
+    if not samples:
+        return {"min": None, "avg": None, "max": None, "jitter": None, "samples": 0, "lost": lost}
+    avg = sum(samples) / len(samples)
+    return {
+        "min": round(min(samples), 2),
+        "avg": round(avg, 2),
+        "max": round(max(samples), 2),
+        "jitter": round(sum(abs(s - avg) for s in samples) / len(samples), 2),
+        "samples": len(samples),
+        "lost": lost,
+    }
+
+
+def _resolve(hosts, workers=32):
+    """{host: (family, sockaddr) or error string}, looked up in parallel (getaddrinfo blocks)."""
+
+    def lookup(host):
+        try:
+            family, _, _, _, sockaddr = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0]
+            return family, sockaddr[0]
+        except OSError as e:
+            return f"cannot resolve {host}: {e.strerror or e}"
+
+    hosts = list(hosts)
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(hosts)))) as pool:
+        return dict(zip(hosts, pool.map(lookup, hosts)))
+
+
+class _Attempt:
+    __slots__ = ("index", "sock", "started", "deadline", "rtt", "buffer")
+
+    def __init__(self, index, sock, started, deadline):
+        self.index = index
+        self.sock = sock
+        self.started = started
+        self.deadline = deadline
+        self.rtt = None  # connect time in ms, once connected
+        self.buffer = b""
+
+
+def probe_many(targets, attempts=1, timeout=3.0, max_open=512):
+    """
+    TCP connect plus SSH banner read against many ``(host, port)`` targets at once.
+
+    All sockets are non-blocking and driven by one selector, so thousands of hosts cost one
+    thread and at most ``max_open`` file descriptors rather than a thread each. Every target is
+    connected ``attempts`` times, one attempt after the other; each attempt has ``timeout``
+    seconds for connect and banner together. Returns a list aligned with ``targets`` of
+    ``{"host", "port", "reachable", "banner", "error", "rtt_ms"}``, where ``reachable`` means
+    some attempt got an SSH banner and ``rtt_ms`` holds the ``rtt_stats()`` of connect times.
+    """
+    targets = [(host, int(port or 22)) for host, port in targets]
+    results = [{"host": host, "port": port, "reachable": False, "banner": None, "error": None,
+                "samples": [], "lost": 0} for host, port in targets]
+    addresses = _resolve({host for host, _ in targets})
+    queue = deque()
+    for index, (host, port) in enumerate(targets):
+        if isinstance(addresses[host], str):
+            results[index]["error"] = addresses[host]
+            results[index]["lost"] = attempts
+        else:
+            queue.append(index)
+    remaining = [attempts] * len(targets)
+    selector = selectors.DefaultSelector()
+    open_attempts = {}  # fileno -> _Attempt
+
+    def finish(attempt, error=None, banner=None):
+        selector.unregister(attempt.sock)
+        del open_attempts[attempt.sock.fileno()]
+        attempt.sock.close()
+        result = results[attempt.index]
+        if banner is not None:
+            result["reachable"] = True
+            result["banner"] = banner
+            result["error"] = None
+        elif not result["reachable"]:
+            result["error"] = error
+        if attempt.rtt is not None:
+            result["samples"].append(attempt.rtt)
+        else:
+            result["lost"] += 1
+        remaining[attempt.index] -= 1
+        if remaining[attempt.index] > 0:
+            queue.append(attempt.index)
+
+    def banner_of(attempt):
+        """The banner line if complete, '' while more is needed, None if it is not SSH."""
+        data = attempt.buffer
+        if b"\n" not in data and len(data) < BANNER_BYTES:
+            return ""
+        # Servers may send other lines before the identification string (RFC 4253 4.2)
+        for line in data.split(b"\n"):
+            line = line.strip().decode("ascii", errors="replace")
+            if line.startswith("SSH-"):
+                return line
+        return None if len(data) >= BANNER_BYTES else ""
+
+    try:
+        while queue or open_attempts:
+            while queue and len(open_attempts) < max_open:
+                index = queue.popleft()
+                family, address = addresses[targets[index][0]]
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                now = time.monotonic()
+                attempt = _Attempt(index, sock, now, now + timeout)
+                open_attempts[sock.fileno()] = attempt
+                selector.register(sock, selectors.EVENT_WRITE, attempt)
+                code = sock.connect_ex((address, targets[index][1]))
+                if code not in _IN_PROGRESS:
+                    finish(attempt, error=f"[Errno {code}] {os.strerror(code)}")
+            now = time.monotonic()
+            wait = min(a.deadline for a in open_attempts.values()) - now if open_attempts else 0
+            for key, events in selector.select(max(0.0, wait)):
+                attempt = key.data
+                now = time.monotonic()
+                if attempt.rtt is None:
+                    code = attempt.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if code:
+                        finish(attempt, error=f"[Errno {code}] {os.strerror(code)}")
+                        continue
+                    attempt.rtt = (now - attempt.started) * 1000
+                    selector.modify(attempt.sock, selectors.EVENT_READ, attempt)
+                    continue
+                try:
+                    data = attempt.sock.recv(BANNER_BYTES)
+                except OSError as e:
+                    finish(attempt, error=str(e))
+                    continue
+                attempt.buffer += data
+                banner = banner_of(attempt)
+                if not data or banner is None:
+                    text = attempt.buffer.strip().decode("ascii", errors="replace")
+                    finish(attempt, error=f"no SSH banner ({text[:40]!r})" if text else "no SSH banner")
+                elif banner:
+                    finish(attempt, banner=banner)
+            now = time.monotonic()
+            for attempt in [a for a in open_attempts.values() if a.deadline <= now]:
+                finish(attempt, error="timed out" if attempt.rtt is None else "timed out waiting for SSH banner")
+    finally:
+        for attempt in list(open_attempts.values()):
+            attempt.sock.close()
+        selector.close()
+
+    for result in results:
+        result["rtt_ms"] = rtt_stats(result.pop("samples"), result.pop("lost"))
+    return results
+
+
+def probe(host, port=22, attempts=1, timeout=3.0):
+    """``probe_many()`` for a single host."""
+    return probe_many([(host, port)], attempts=attempts, timeout=timeout)[0]
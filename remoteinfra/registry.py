@@ -0,0 +1,206 @@
+import json
+import re
+import threading
+
+
+def _norm(value):
+    return (value or "").strip().lower()
+
+
+def parse_tags(value):
+    """Tags from a list, a comma/semicolon separated string or the JSON stored in the machines table."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            value = re.split(r"[,;]", value)
+        if isinstance(value, str):
+            value = [value]
+    tags = []
+    for tag in value:
+        tag = str(tag).strip()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+class MachineRegistry:
+    """
+    In-memory copy of the ``machines`` table, indexed by id, host, (host, username) and tag.
+
+    The dashboard loads it once and keeps it current on every create/update/delete, so lookups
+    are dict reads instead of scans or database queries. All access goes through one lock;
+    callers get copies of the machine dicts, never the indexed ones. Listeners registered with
+    ``subscribe()`` are called with ``(event, machine)`` after each change, where event is
+    "added", "updated" or "removed" (or "bulk", with ``{"ids": [...]}``, after ``put_many()``).
+
+    Iterating and indexing by position (``registry[0]``) follow insertion order and exist for
+    the older ``machine_idx`` routes; prefer ids.
+    """
+
+    def __init__(self, machines=()):
+        self._lock = threading.RLock()
+        self._listeners = []
+        self.version = 0
+        self.load(machines)
+
+    def load(self, machines):
+        """Replace the whole registry, e.g. from ``SELECT * FROM machines``."""
+        with self._lock:
+            self._by_id = {}
+            self._by_host = {}
+            self._by_login = {}
+            self._by_tag = {}
+            self._position = {}  # id -> insertion counter, to keep index lookups in order
+            self._next_position = 0
+            for machine in machines:
+                self._index(self._normalize(machine))
+            self.version += 1
+
+    @staticmethod
+    def _normalize(machine):
+        machine = dict(machine)
+        if not machine.get("name"):
+            machine["name"] = f"{machine['host']}@{machine['username']}"
+        machine["tags"] = parse_tags(machine.get("tags"))
+        return machine
+
+    def _index(self, machine):
+        machine_id = machine["id"]
+        self._by_id[machine_id] = machine
+        if machine_id not in self._position:
+            self._position[machine_id] = self._next_position
+            self._next_position += 1
+        self._by_host.setdefault(_norm(machine["host"]), set()).add(machine_id)
+        self._by_login[(_norm(machine["host"]), _norm(machine["username"]))] = machine_id
+        for tag in machine["tags"]:
+            self._by_tag.setdefault(tag.lower(), set()).add(machine_id)
+
+    def _unindex(self, machine, keep_slot=False):
+        machine_id = machine["id"]
+        if not keep_slot:
+            self._by_id.pop(machine_id, None)
+            self._position.pop(machine_id, None)
+        host = _norm(machine["host"])
+        ids = self._by_host.get(host)
+        if ids is not None:
+            ids.discard(machine_id)
+            if not ids:
+                del self._by_host[host]
+        login = (host, _norm(machine["username"]))
+        if self._by_login.get(login) == machine_id:
+            del self._by_login[login]
+        for tag in machine["tags"]:
+            ids = self._by_tag.get(tag.lower())
+            if ids is not None:
+                ids.discard(machine_id)
+                if not ids:
+                    del self._by_tag[tag.lower()]
+
+    def get(self, machine_id):
+        """Copy of the machine with this id (compared as a string), or None."""
+        if machine_id is None:
+            return None
+        with self._lock:
+            machine = self._by_id.get(str(machine_id))
+            return dict(machine) if machine else None
+
+    def by_host(self, host):
+        with self._lock:
+            return [dict(self._by_id[i]) for i in self._ordered(self._by_host.get(_norm(host), ()))]
+
+    def by_tag(self, tag):
+        with self._lock:
+            return [dict(self._by_id[i]) for i in self._ordered(self._by_tag.get(_norm(tag), ()))]
+
+    def find_login(self, host, username):
+        """Machine with this host and username (case-insensitive), or None."""
+        with self._lock:
+            machine_id = self._by_login.get((_norm(host), _norm(username)))
+            return dict(self._by_id[machine_id]) if machine_id else None
+
+    def _ordered(self, ids):
+        return sorted(ids, key=self._position.__getitem__)
+
+    def all(self, host=None, tag=None):
+        """Copies of all machines in insertion order, optionally only those with a host/tag."""
+        with self._lock:
+            if host is None and tag is None:
+                return [dict(m) for m in self._by_id.values()]
+            ids = None
+            for index, key in ((self._by_host, host), (self._by_tag, tag)):
+                if key is not None:
+                    matches = index.get(_norm(key), set())
+                    ids = matches if ids is None else ids & matches
+            return [dict(self._by_id[i]) for i in self._ordered(ids)]
+
+    def tags(self):
+        """Tag -> number of machines carrying it."""
+        with self._lock:
+            return {tag: len(ids) for tag, ids in sorted(self._by_tag.items())}
+
+    def put(self, machine):
+        """Add or replace a machine. Returns a copy of the stored entry."""
+        machine = self._normalize(machine)
+        with self._lock:
+            old = self._by_id.get(machine["id"])
+            if old is not None:
+                # Keep the machine's position in the insertion order
+                self._unindex(old, keep_slot=True)
+            self._index(machine)
+            self.version += 1
+        self._notify("updated" if old is not None else "added", machine)
+        return dict(machine)
+
+    def put_many(self, machines):
+        """
+        Add or replace many machines under one lock. Listeners get a single "bulk" event with
+        the affected ids instead of one event per machine.
+        """
+        machines = [self._normalize(m) for m in machines]
+        with self._lock:
+            for machine in machines:
+                old = self._by_id.get(machine["id"])
+                if old is not None:
+                    self._unindex(old, keep_slot=True)
+                self._index(machine)
+            self.version += 1
+        if machines:
+            self._notify("bulk", {"ids": [m["id"] for m in machines]})
+        return [dict(m) for m in machines]
+
+    def remove(self, machine_id):
+        """Drop a machine. Returns the removed entry, or None if it was not there."""
+        with self._lock:
+            machine = self._by_id.get(str(machine_id))
+            if machine is None:
+                return None
+            self._unindex(machine)
+            self.version += 1
+        self._notify("removed", machine)
+        return dict(machine)
+
+    def subscribe(self, listener):
+        """Call ``listener(event, machine)`` after every change. Returns an unsubscribe function."""
+        with self._lock:
+            self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self, event, machine):
+        for listener in list(self._listeners):
+            try:
+                listener(event, dict(machine))
+            except Exception as e:
+                print(f"Machine registry listener error: {e}")
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def __getitem__(self, index):
+        with self._lock:
+            return dict(list(self._by_id.values())[index])
@@ -1,11 +1,13 @@
+import codecs
 import io
 import platform
-import subprocess
+import shlex
 import sys
 import threading
 import time
 import traceback
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from cryptography.utils import CryptographyDeprecationWarning
 
@@ -14,11 +16,26 @@ with warnings.catch_warnings():
     import paramiko
     import paramiko.ssh_exception
 
-from .utils import AuthenticationFailed, Singleton, SSHException, UnableToConnect
+from . import livelog, retry, watchdog
+from .pipeline import Pipeline, PipelineContext, PipelineStep, StepCache, directory_fingerprint
+from .probe import probe_many
+from .retry import RetryPolicy
+from .utils import (AuthenticationFailed, CommandTimeout, NetworkError, RemoteCommandFailed, Singleton, SSHException,
+                    UnableToConnect)
 
 
 class SSHClient:
     TIMEOUT = 360
+    # Upper bound for TCP connect, SSH banner and authentication in login()
+    CONNECT_TIMEOUT = 30
+    # Default timeout of local project executions
+    LOCAL_TIMEOUT = 600
+    # How long run_command waits for its reader thread after closing a timed-out channel
+    CLOSE_GRACE = 5
+    # Results of cacheable pipeline steps (uploads, terraform init), shared by all clients
+    STEP_CACHE = StepCache()
+    # Backoff applied to transient connection failures in login()
+    RETRY_POLICY = RetryPolicy()
 
     def __init__(self, hostname, username, password=None, port=22, key_file=None):
         self.hostname = hostname
@@ -27,21 +44,59 @@ class SSHClient:
         self.password = password
         self.key_file = key_file
         self.client = None
+        self._workspaces = {}  # {local_dir: (fingerprint, remote_dir)}
+        self._initialized_workspaces = {}  # {remote_dir: backend config key}
+        self.pipeline_listener = None  # Receives step records of pipelines run by this client
+        self.last_exit_status = None  # Exit status of the last run_command, None if unknown
+        # Backoff of this client's login(): the creating thread's (see retry.use_policy) or the class default
+        self.retry_policy = retry.current_policy(self.RETRY_POLICY)
 
     @classmethod
     def change_default_timeout(cls, new_timeout):
         cls.TIMEOUT = new_timeout
 
+    @classmethod
+    def change_retry_policy(cls, policy):
+        """Set the RetryPolicy of clients created from now on; None disables retries."""
+        cls.RETRY_POLICY = policy
+
     def login(self):
-        """Establish an SSH connection to the server."""
+        """
+        Establish an SSH connection to the server.
+
+        Network and SSH protocol failures (e.g. sshd restarting) are retried with exponential
+        backoff according to ``retry_policy``; authentication failures are raised immediately.
+        """
+        try:
+            with watchdog.state("connecting"):
+                if self.retry_policy:
+                    return self.retry_policy.call(self._connect)
+                return self._connect()
+        except Exception as e:
+            retry.record_failure(e)
+            raise
+
+    def _connect(self):
         self.client = paramiko.SSHClient()
+        self._workspaces = {}
+        self._initialized_workspaces = {}
         self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-        try:
-            if self.key_file:
+        key = None
+        if self.key_file:
+            try:
                 key = paramiko.RSAKey.from_private_key_file(self.key_file)
+            except (OSError, paramiko.SSHException) as e:
+                print(f"Unable to load key file {self.key_file}: {e}")
+                raise AuthenticationFailed(f"Unable to load key file {self.key_file}: {e}")
+
+        connect_timeout = watchdog.remaining(self.CONNECT_TIMEOUT)
+        timeouts = {"timeout": connect_timeout, "banner_timeout": connect_timeout, "auth_timeout": connect_timeout}
+        unregister = watchdog.register(self.client.close)
+        try:
+            if key:
                 self.client.connect(
-                    self.hostname, port=self.port, username=self.username, pkey=key
+                    self.hostname, port=self.port, username=self.username, pkey=key, **timeouts
                 )
             else:
                 self.client.connect(
@@ -49,6 +104,7 @@ class SSHClient:
                     port=self.port,
                     username=self.username,
                     password=self.password,
+                    **timeouts,
                 )
             print("Connected successfully.")
         except paramiko.AuthenticationException:
@@ -59,14 +115,29 @@ class SSHClient:
         except paramiko.SSHException as sshException:
             print(f"Unable to establish SSH connection: {sshException}")
             raise SSHException(f"Unable to establish SSH connection: {sshException}")
+        except (OSError, EOFError) as e:
+            # Refused, reset, unreachable or timed out (includes NoValidConnectionsError)
+            print(f"Network error connecting to {self.hostname}: {e}")
+            raise NetworkError(f"Unable to connect {self.hostname}:{self.port}: {e}")
         except Exception as e:
             print(f"Exception in connecting: {e}")
             raise UnableToConnect(
                 f"Unable to connect {self.hostname}. Please check correct details"
             )
+        finally:
+            unregister()
+        # Keep the connection tied to the current deadline until the work is done
+        watchdog.register(self.client.close)
 
     def run_command(self, command, timeout=TIMEOUT, verbose=True):
-        """Run a command on the remote server with timeout and live output."""
+        """
+        Run a command on the remote server with timeout and live output.
+
+        The timeout is also bounded by the deadline of the current watchdog watch. When it
+        passes, the channel is closed and the reader thread gets ``CLOSE_GRACE`` seconds to
+        finish; a channel that still does not return is abandoned so the caller is never blocked.
+        Output is also appended to the current live log as it arrives.
+        """
         if self.client:
             try:
                 if verbose:
@@ -76,46 +147,105 @@ class SSHClient:
                     sys.stdout = io.StringIO()
                     sys.stderr = io.StringIO()
 
+                timeout = watchdog.remaining(timeout if timeout is not None else self.TIMEOUT)
+                watch = watchdog.current()
+                log = livelog.current()
+                channel = None
+
                 def target():
-                    nonlocal output, errors
+                    nonlocal output, errors, failure, channel
+                    unregister = None
                     try:
                         print(f"\nRun_Command: {command}")
                         _, stdout, stderr = self.client.exec_command(command)
+                        channel = stdout.channel
+                        unregister = watchdog.register(channel.close, watch)
                         start_time = time.time()
-                        while not stdout.channel.exit_status_ready():
+                        streamed = []
+                        streamed_errors = []
+                        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                        error_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                        while not channel.exit_status_ready():
+                            if channel.closed:
+                                failure = CommandTimeout("Command channel was closed by the watchdog")
+                                break
                             if time.time() - start_time > timeout:
                                 # Timeout occurred, kill the command
-                                stdout.channel.close()  # Send termination signal
+                                channel.close()  # Send termination signal
+                                failure = CommandTimeout(f"Command timed out after {timeout:.0f} seconds")
                                 print(
-                                    f"\nCommand timed out after {timeout} seconds and has been terminated."
+                                    f"\nCommand timed out after {timeout:.0f} seconds and has been terminated."
                                 )
                                 break
-                            if stdout.channel.recv_ready():
-                                sys.stdout.write(stdout.channel.recv(1024).decode())
+                            # Drain everything that arrived since the last poll
+                            while channel.recv_ready():
+                                data = channel.recv(32768)
+                                streamed.append(data)
+                                text = decoder.decode(data)
+                                sys.stdout.write(text)
                                 sys.stdout.flush()
-                            if stderr.channel.recv_ready():
-                                sys.stderr.write(stderr.channel.recv(1024).decode())
+                                livelog.write(text, log=log)
+                            while channel.recv_stderr_ready():
+                                data = channel.recv_stderr(32768)
+                                streamed_errors.append(data)
+                                text = error_decoder.decode(data)
+                                sys.stderr.write(text)
                                 sys.stderr.flush()
+                                livelog.write(text, "stderr", log=log)
                             time.sleep(0.5)
-                        output = stdout.read().decode()
-                        errors = stderr.read().decode()
+                        # Keep what was streamed above; read() only returns the remainder
+                        rest = stdout.read()
+                        rest_errors = stderr.read()
+                        livelog.write(decoder.decode(rest, final=True), log=log)
+                        livelog.write(error_decoder.decode(rest_errors, final=True), "stderr", log=log)
+                        output = (b"".join(streamed) + rest).decode()
+                        errors = (b"".join(streamed_errors) + rest_errors).decode()
+                        if channel.exit_status_ready():
+                            self.last_exit_status = channel.recv_exit_status()
                     except Exception as e:
                         errors = str(e)
+                        if failure is None:
+                            failure = e
+                    finally:
+                        if unregister is not None:
+                            unregister()
 
                 output = ""
                 errors = ""
-                thread = threading.Thread(target=target)
+                failure = None
+                self.last_exit_status = None
+                retry.mark_dispatched()
+                watchdog.enter_state("running_command")
+                thread = threading.Thread(target=target, daemon=True)
                 thread.start()
 
-                start_time = time.time()
-                while thread.is_alive():
-                    if time.time() - start_time > timeout:
-                        # Timeout has occurred
-                        thread.join(timeout=0)  # Ensure the thread terminates
+                # The reader enforces the timeout itself; allow it a little slack, then step in
+                deadline = time.time() + timeout + self.CLOSE_GRACE
+                while thread.is_alive() and time.time() < deadline:
+                    thread.join(timeout=0.5)
+                    if watch is not None and watch.expired:
                         break
-                    time.sleep(0.5)
 
-                thread.join()  # Wait for the thread to finish
+                if thread.is_alive():
+                    # Hung channel: close it and wait a bounded time for the reader to notice
+                    if channel is not None:
+                        channel.close()
+                    thread.join(timeout=self.CLOSE_GRACE)
+                    if thread.is_alive():
+                        print("\nCommand did not stop after its channel was closed; abandoning it.")
+                    if failure is None:
+                        failure = CommandTimeout(f"Command timed out after {timeout:.0f} seconds")
+                    if not errors:
+                        errors = str(failure)
+                elif isinstance(failure, CommandTimeout) and not errors:
+                    errors = str(failure)
+
+                if failure is None and self.last_exit_status:
+                    failure = RemoteCommandFailed(
+                        f"Command exited with status {self.last_exit_status}", self.last_exit_status
+                    )
+                if failure is not None:
+                    retry.record_failure(failure)
 
                 if output:
                     print("\nOutput:")
@@ -197,7 +327,8 @@ class SSHClient:
                     else:
                         self.run_command(f"mkdir -p {path}", verbose=False)
                         remote_script_path = f"{path}/{os.path.basename(file)}"
-                    sftp.put(file, remote_script_path)
+                    with watchdog.state("transferring"):
+                        sftp.put(file, remote_script_path)
                 else:
                     # Use get_remote_home for user-specific temp directory
                     remote_home = self.get_remote_home()
@@ -228,7 +359,8 @@ class SSHClient:
                     else:
                         print("Unknown remote OS. Cannot determine temp path.")
                         return None
-                    sftp.put(file, remote_script_path)
+                    with watchdog.state("transferring"):
+                        sftp.put(file, remote_script_path)
                 print(f"Sent file : {remote_script_path}")
                 return remote_script_path
             except Exception as e:
@@ -307,7 +439,8 @@ class SSHClient:
                     else:
                         sftp.put(lpath, rpath)
 
-            _recursive_upload(local_dir, remote_path)
+            with watchdog.state("transferring"):
+                _recursive_upload(local_dir, remote_path)
             print(f"Sent directory: {local_dir} to {remote_path}")
             return remote_path
         except Exception as e:
@@ -327,7 +460,8 @@ class SSHClient:
                 sftp = self.client.open_sftp()
 
                 # Retrieve the file from the remote machine
-                sftp.get(remote_path, local_path)
+                with watchdog.state("transferring"):
+                    sftp.get(remote_path, local_path)
 
                 print(f"Received file and saved as: {local_path}")
                 return True
@@ -661,7 +795,7 @@ class SSHClient:
             if not remote_dir:
                 print("Failed to send working directory to remote host.")
                 return False
-            remote_cmd = f"cd {remote_dir} && {cmd_str}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
             result = self.run_command(remote_cmd)
             if result is None:
                 print("Failed to execute remote command.")
@@ -730,7 +864,7 @@ class SSHClient:
             # Always run remote terraform init before plan
             init_cmd = "terraform init -lock=false"
             print(f"[Terraform] Running remote init: {init_cmd}")
-            remote_init_cmd = f"cd {remote_dir} && {init_cmd}"
+            remote_init_cmd = f"cd {shlex.quote(remote_dir)} && {init_cmd}"
             init_result = self.run_command(remote_init_cmd)
             if init_result is None:
                 print("Remote terraform init failed. Aborting.")
@@ -743,7 +877,7 @@ class SSHClient:
                 print(err)
                 print("Remote terraform init failed. Aborting.")
                 return False
-            remote_cmd = f"cd {remote_dir} && {cmd_str}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
             result = self.run_command(remote_cmd)
             if result is None:
                 print("Failed to execute remote command.")
@@ -803,7 +937,7 @@ class SSHClient:
             # Always run remote terraform init before apply
             init_cmd = "terraform init -lock=false"
             print(f"[Terraform] Running remote init: {init_cmd}")
-            remote_init_cmd = f"cd {remote_dir} && {init_cmd}"
+            remote_init_cmd = f"cd {shlex.quote(remote_dir)} && {init_cmd}"
             init_result = self.run_command(remote_init_cmd)
             if init_result is None:
                 print("Remote terraform init failed. Aborting.")
@@ -816,7 +950,7 @@ class SSHClient:
                 print(err)
                 print("Remote terraform init failed. Aborting.")
                 return False
-            remote_cmd = f"cd {remote_dir} && {cmd_str}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
             result = self.run_command(remote_cmd)
             if result is None:
                 print("Failed to execute remote command.")
@@ -871,7 +1005,7 @@ class SSHClient:
             if not remote_dir:
                 print("Failed to send working directory to remote host.")
                 return False
-            remote_cmd = f"cd {remote_dir} && {cmd_str}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
             result = self.run_command(remote_cmd)
             if result is None:
                 print("Failed to execute remote command.")
@@ -921,7 +1055,7 @@ class SSHClient:
             # Always run remote terraform init before import
             init_cmd = "terraform init -lock=false"
             print(f"[Terraform] Running remote init: {init_cmd}")
-            remote_init_cmd = f"cd {remote_dir} && {init_cmd}"
+            remote_init_cmd = f"cd {shlex.quote(remote_dir)} && {init_cmd}"
             init_result = self.run_command(remote_init_cmd)
             if init_result is None:
                 print("Remote terraform init failed. Aborting.")
@@ -934,7 +1068,7 @@ class SSHClient:
                 print(err)
                 print("Remote terraform init failed. Aborting.")
                 return False
-            remote_cmd = f"cd {remote_dir} && {cmd_str}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
             result = self.run_command(remote_cmd)
             if result is None:
                 print("Failed to execute remote command.")
@@ -955,26 +1089,58 @@ class SSHClient:
             return proc.returncode == 0
 
     def ping(self):
-        """Check the connectivity to the remote server by running the ping command locally."""
+        """Check that the server accepts TCP connections on its SSH port and answers with an SSH banner."""
+        result = self.probe()
+        if not result["reachable"]:
+            print(f"Ping failed: {result['error']}")
+        return result["reachable"]
+
+    def probe(self, attempts=1, timeout=3.0, auth=False):
+        """
+        Check reachability without a shell: TCP connect to the SSH port and read the SSH banner.
+
+        Takes milliseconds, works where ICMP is filtered and tells whether sshd answers.
+        ``attempts`` connects in a row give RTT statistics. With ``auth=True`` a reachable host
+        is also logged in to (once, without retries) to verify the credentials.
+
+        Returns:
+            dict: ``{"host", "port", "reachable", "banner", "error", "rtt_ms": {"min", "avg",
+            "max", "jitter", "samples", "lost"}}``, plus ``"auth"`` (True/False) and
+            ``"auth_ms"`` or ``"auth_error"`` when ``auth`` was requested.
+        """
+        return self.probe_all([self], attempts=attempts, timeout=timeout, auth=auth)[0]
 
-        count_flag = "-n" if platform.system().lower() == "windows" else "-c"
+    @classmethod
+    def probe_all(cls, clients, attempts=1, timeout=3.0, auth=False, auth_workers=32, max_open=512):
+        """
+        ``probe()`` many clients at once. The network checks share one selector loop, so
+        thousands of hosts are probed concurrently; logins (``auth=True``) only go to the
+        reachable ones, ``auth_workers`` at a time. Results are aligned with ``clients``.
+        """
+        clients = list(clients)
+        results = probe_many([(c.hostname, c.port) for c in clients], attempts=attempts,
+                             timeout=timeout, max_open=max_open)
+        reachable = [(c, r) for c, r in zip(clients, results) if r["reachable"]]
+        if auth and reachable:
+            with ThreadPoolExecutor(max_workers=max(1, min(auth_workers, len(reachable)))) as pool:
+                list(pool.map(lambda item: item[0]._probe_auth(item[1], timeout), reachable))
+        return results
+
+    def _probe_auth(self, result, timeout):
+        """Log in once with ``timeout`` for each phase and record the outcome in ``result``."""
+        started = time.monotonic()
+        client = SSHClient(self.hostname, self.username, self.password, self.port, self.key_file)
+        client.CONNECT_TIMEOUT = timeout
         try:
-            result = subprocess.run(
-                ["ping", count_flag, "5", self.hostname],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30,
-            )
-            print(result.stdout)
-            if result.returncode == 0:
-                return True
-            else:
-                print(result.stderr)
-                return False
+            client._connect()
+            result["auth"] = True
+            result["auth_ms"] = round((time.monotonic() - started) * 1000, 2)
         except Exception as e:
-            print(f"Ping failed: {e}")
-            return False
+            result["auth"] = False
+            result["auth_error"] = str(e)
+        finally:
+            if client.client:
+                client.client.close()
 
     def reboot(self, wait_until=300):
         """Reboot remote machine immediately, using appropriate command for Windows or Linux (no sudo)."""
@@ -1055,6 +1221,50 @@ class SSHClient:
             print("Connection was not established.")
 
     # Enhanced Terraform methods that return both success status and output
+    def _ensure_remote_workspace(self, work_dir):
+        """
+        Upload ``work_dir`` to the remote host unless an identical copy was already sent
+        over this connection. Returns the remote directory or None on failure.
+        """
+        import os
+
+        fingerprint = directory_fingerprint(work_dir)
+        known = self._workspaces.get(os.path.abspath(work_dir))
+        if known and known[0] == fingerprint:
+            out, _ = self.run_command(f"test -d {shlex.quote(known[1])} && echo present", timeout=15, verbose=False)
+            if out and "present" in out:
+                print(f"Reusing uploaded workspace: {known[1]}")
+                return known[1]
+        remote_dir = self.send_Directory(work_dir)
+        if remote_dir:
+            self._workspaces[os.path.abspath(work_dir)] = (fingerprint, remote_dir)
+            self._initialized_workspaces.pop(remote_dir, None)
+        return remote_dir
+
+    def _ensure_remote_terraform_init(self, remote_dir, backend_config=None):
+        """
+        Run ``terraform init`` in ``remote_dir`` once per backend configuration.
+        Returns: (success: bool, output: str, error: str)
+        """
+        import json
+        import shlex
+
+        init_key = json.dumps(backend_config or {}, sort_keys=True)
+        if self._initialized_workspaces.get(remote_dir) == init_key:
+            return True, "Terraform already initialized in this workspace.", ""
+        tf_cmd = ["terraform", "init", "-lock=false"]
+        for k, v in (backend_config or {}).items():
+            tf_cmd.extend(["-backend-config", f"{k}={v}"])
+        cmd_str = " ".join(shlex.quote(x) for x in tf_cmd)
+        result = self.run_command(f"cd {shlex.quote(remote_dir)} && {cmd_str}")
+        if result is None:
+            return False, "", "Remote terraform init failed."
+        out, err = result if isinstance(result, tuple) else (str(result), "")
+        if err:
+            return False, out or "", err
+        self._initialized_workspaces[remote_dir] = init_key
+        return True, out or "", ""
+
     def run_terraform_init_with_output(self, work_dir, backend_config=None, env_vars=None, remote=False):
         """
         Initialize Terraform in the given directory with output capture.
@@ -1077,17 +1287,15 @@ class SSHClient:
         cmd_str = " ".join(shlex.quote(x) for x in tf_cmd)
         
         if remote:
-            # Send working dir to remote, run init
-            remote_dir = self.send_Directory(work_dir) if (work_dir and os.path.isdir(work_dir)) else None
+            # Send working dir to remote (reusing an identical upload), run init
+            remote_dir = self._ensure_remote_workspace(work_dir) if (work_dir and os.path.isdir(work_dir)) else None
             if work_dir and not remote_dir:
                 return False, "", "Failed to send working directory to remote host."
             
             if remote_dir:
-                remote_cmd = f"cd {remote_dir} && {cmd_str}"
-            else:
-                remote_cmd = cmd_str
-                
-            result = self.run_command(remote_cmd)
+                return self._ensure_remote_terraform_init(remote_dir, backend_config)
+
+            result = self.run_command(cmd_str)
             if result is None:
                 return False, "", "Failed to execute remote command."
             
@@ -1131,40 +1339,7 @@ class SSHClient:
         cmd_str = " ".join(shlex.quote(x) for x in tf_cmd)
         
         if remote:
-            # Send working dir to remote
-            remote_dir = self.send_Directory(work_dir) if (work_dir and os.path.isdir(work_dir)) else None
-            if work_dir and not remote_dir:
-                return False, "", "Failed to send working directory to remote host."
-            
-            # Always run init first for remote execution
-            init_cmd = "terraform init -lock=false"
-            if remote_dir:
-                remote_init_cmd = f"cd {remote_dir} && {init_cmd}"
-            else:
-                remote_init_cmd = init_cmd
-                
-            init_result = self.run_command(remote_init_cmd)
-            if init_result is None:
-                return False, "", "Remote terraform init failed."
-            
-            init_out, init_err = init_result if isinstance(init_result, tuple) else (str(init_result), "")
-            if init_err:
-                return False, init_out or "", f"Init failed: {init_err}"
-            
-            # Now run plan
-            if remote_dir:
-                remote_cmd = f"cd {remote_dir} && {cmd_str}"
-            else:
-                remote_cmd = cmd_str
-                
-            result = self.run_command(remote_cmd)
-            if result is None:
-                return False, init_out or "", "Failed to execute remote plan command."
-            
-            out, err = result if isinstance(result, tuple) else (str(result), "")
-            combined_output = f"INIT OUTPUT:\n{init_out}\n\nPLAN OUTPUT:\n{out or ''}"
-            success = not bool(err)
-            return success, combined_output, err or ""
+            return self._run_remote_terraform_step(work_dir, cmd_str, "PLAN")
         else:
             # Check if terraform is installed locally
             if not shutil.which("terraform"):
@@ -1199,40 +1374,7 @@ class SSHClient:
         cmd_str = " ".join(shlex.quote(x) for x in tf_cmd)
         
         if remote:
-            # Send working dir to remote
-            remote_dir = self.send_Directory(work_dir) if (work_dir and os.path.isdir(work_dir)) else None
-            if work_dir and not remote_dir:
-                return False, "", "Failed to send working directory to remote host."
-            
-            # Always run init first for remote execution
-            init_cmd = "terraform init -lock=false"
-            if remote_dir:
-                remote_init_cmd = f"cd {remote_dir} && {init_cmd}"
-            else:
-                remote_init_cmd = init_cmd
-                
-            init_result = self.run_command(remote_init_cmd)
-            if init_result is None:
-                return False, "", "Remote terraform init failed."
-            
-            init_out, init_err = init_result if isinstance(init_result, tuple) else (str(init_result), "")
-            if init_err:
-                return False, init_out or "", f"Init failed: {init_err}"
-            
-            # Now run apply
-            if remote_dir:
-                remote_cmd = f"cd {remote_dir} && {cmd_str}"
-            else:
-                remote_cmd = cmd_str
-                
-            result = self.run_command(remote_cmd)
-            if result is None:
-                return False, init_out or "", "Failed to execute remote apply command."
-            
-            out, err = result if isinstance(result, tuple) else (str(result), "")
-            combined_output = f"INIT OUTPUT:\n{init_out}\n\nAPPLY OUTPUT:\n{out or ''}"
-            success = not bool(err)
-            return success, combined_output, err or ""
+            return self._run_remote_terraform_step(work_dir, cmd_str, "APPLY")
         else:
             # Check if terraform is installed locally
             if not shutil.which("terraform"):
@@ -1244,6 +1386,162 @@ class SSHClient:
             success = proc.returncode == 0
             return success, proc.stdout or "", proc.stderr or ""
 
+    def _run_remote_terraform_step(self, work_dir, cmd_str, label):
+        """
+        Run a terraform command in the remote copy of ``work_dir``. The directory is uploaded
+        and initialized only when this connection has not already done so for the same content.
+        Returns: (success: bool, output: str, error: str)
+        """
+        import os
+
+        remote_dir = self._ensure_remote_workspace(work_dir) if (work_dir and os.path.isdir(work_dir)) else None
+        if work_dir and not remote_dir:
+            return False, "", "Failed to send working directory to remote host."
+
+        if remote_dir:
+            init_ok, init_out, init_err = self._ensure_remote_terraform_init(remote_dir)
+            if not init_ok:
+                return False, init_out, f"Init failed: {init_err}"
+            remote_cmd = f"cd {shlex.quote(remote_dir)} && {cmd_str}"
+        else:
+            init_out = ""
+            remote_cmd = cmd_str
+
+        result = self.run_command(remote_cmd)
+        if result is None:
+            return False, init_out or "", f"Failed to execute remote {label.lower()} command."
+
+        out, err = result if isinstance(result, tuple) else (str(result), "")
+        combined_output = f"INIT OUTPUT:\n{init_out}\n\n{label} OUTPUT:\n{out or ''}"
+        success = not bool(err)
+        return success, combined_output, err or ""
+
+    def build_terraform_pipeline(self, work_dir, actions=("init", "plan", "apply"), remote=False,
+                                 backend_config=None, apply_args=None, listener=None, step_timeout=None):
+        """
+        Build a Terraform pipeline (upload -> init -> plan -> apply) over ``work_dir``.
+
+        All steps share one workspace and this client's connection. Upload and init results
+        are cached in ``SSHClient.STEP_CACHE`` and reused while the directory content and
+        backend configuration are unchanged.
+
+        Args:
+            work_dir (str): Local Terraform directory.
+            actions (tuple): Subset of ("init", "plan", "apply"); later actions imply earlier ones.
+            remote (bool): Run on the remote host (after uploading) instead of locally.
+            backend_config (dict, optional): Backend config passed to init.
+            apply_args (str, optional): Extra arguments appended to the apply command.
+            listener (callable, optional): Called with each step record as it changes state.
+            step_timeout (int, optional): Deadline of each step in seconds.
+
+        Returns:
+            Pipeline
+        """
+        import json
+        import os
+        import shlex
+        import shutil
+        import subprocess
+
+        host_key = f"{self.username}@{self.hostname}:{self.port}" if remote else "local"
+        fingerprint = directory_fingerprint(work_dir)
+        full_apply = "apply" in actions
+        with_plan = full_apply or "plan" in actions
+
+        init_cmd = ["terraform", "init", "-lock=false"]
+        for k, v in (backend_config or {}).items():
+            init_cmd.extend(["-backend-config", f"{k}={v}"])
+        commands = {"init": init_cmd}
+        if with_plan:
+            commands["plan"] = ["terraform", "plan", "-lock=false"] + (["-out=tfplan"] if full_apply else [])
+        if full_apply:
+            commands["apply"] = ["terraform", "apply", "-lock=false", "-auto-approve"] + \
+                (shlex.split(apply_args) if apply_args else []) + ["tfplan"]
+
+        def run_in_workspace(name):
+            def action(context, inputs):
+                cmd = commands[name]
+                if remote:
+                    client = context.client(host_key)
+                    remote_dir = context.workspace["remote_dir"]
+                    out, err = client.run_command(f"cd {shlex.quote(remote_dir)} && {' '.join(shlex.quote(x) for x in cmd)}")
+                    if name == "init" and not err:
+                        client._initialized_workspaces[remote_dir] = json.dumps(backend_config or {}, sort_keys=True)
+                    return {"success": not err, "output": out or "", "errors": err or "",
+                            "value": remote_dir}
+                if not shutil.which("terraform"):
+                    return {"success": False, "output": "", "errors": "Terraform is not installed or not in PATH."}
+                try:
+                    proc = watchdog.run_process(cmd, cwd=work_dir)
+                except subprocess.TimeoutExpired:
+                    return {"success": False, "output": "", "errors": f"terraform {name} exceeded its deadline"}
+                return {"success": proc.returncode == 0, "output": proc.stdout or "",
+                        "errors": proc.stderr or "", "value": work_dir}
+            return action
+
+        steps = []
+        init_deps = []
+        if remote:
+            def upload(context, inputs):
+                remote_dir = context.client(host_key)._ensure_remote_workspace(work_dir)
+                if not remote_dir:
+                    return {"success": False, "output": "", "errors": "Failed to send working directory to remote host."}
+                context.workspace["remote_dir"] = remote_dir
+                return {"success": True, "output": f"Uploaded {work_dir} to {remote_dir}", "errors": "",
+                        "value": remote_dir}
+
+            def upload_still_present(context, result):
+                remote_dir = result["value"]
+                out, _ = context.client(host_key).run_command(
+                    f"test -d {shlex.quote(remote_dir)} && echo present", timeout=15, verbose=False)
+                if out and "present" in out:
+                    context.workspace["remote_dir"] = remote_dir
+                    return True
+                return False
+
+            steps.append(PipelineStep("upload", upload, host=host_key,
+                                      cache_inputs={"work_dir": os.path.abspath(work_dir), "fingerprint": fingerprint},
+                                      validate_cached=upload_still_present, timeout=step_timeout))
+            init_deps = ["upload"]
+
+        def init_still_present(context, result):
+            if remote:
+                # The upload may have been reused while its .terraform was removed on the host
+                out, _ = context.client(host_key).run_command(
+                    f"test -d {shlex.quote(result['value'] + '/.terraform')} && echo present", timeout=15, verbose=False)
+                return bool(out and "present" in out)
+            return os.path.isdir(os.path.join(work_dir, ".terraform"))
+
+        steps.append(PipelineStep("init", run_in_workspace("init"), depends_on=init_deps, host=host_key,
+                                  cache_inputs={"work_dir": os.path.abspath(work_dir), "fingerprint": fingerprint,
+                                                "backend": backend_config or {}},
+                                  validate_cached=init_still_present, timeout=step_timeout))
+        if with_plan:
+            steps.append(PipelineStep("plan", run_in_workspace("plan"), depends_on=["init"], host=host_key,
+                                      timeout=step_timeout))
+        if full_apply:
+            steps.append(PipelineStep("apply", run_in_workspace("apply"), depends_on=["plan"], host=host_key,
+                                      timeout=step_timeout))
+
+        return Pipeline(f"terraform:{os.path.basename(os.path.abspath(work_dir))}", steps,
+                        max_parallel=1, cache=self.STEP_CACHE, listener=listener)
+
+    def run_terraform_pipeline(self, work_dir, actions=("init", "plan", "apply"), remote=False,
+                               backend_config=None, apply_args=None, listener=None, step_timeout=None):
+        """
+        Run Terraform over ``work_dir`` as a tracked pipeline on this client's connection.
+
+        Returns:
+            dict: success, output, errors, steps (per-step timing records) and duration
+        """
+        pipeline = self.build_terraform_pipeline(work_dir, actions, remote, backend_config, apply_args, listener,
+                                                 step_timeout)
+        context = PipelineContext()
+        if remote:
+            context.add_client(f"{self.username}@{self.hostname}:{self.port}", self)
+        # The connection belongs to the caller, so the context is not closed here
+        return pipeline.run(context)
+
     def run_project_directory(
         self,
         project_dir,
@@ -1252,6 +1550,7 @@ class SSHClient:
         custom_command=None,
         remote=True,
         extra_args=None,
+        timeout=None,
     ):
         """
         Execute a project directory by copying it and running the main file.
@@ -1263,6 +1562,8 @@ class SSHClient:
             custom_command (str, optional): Custom command to execute instead of default
             remote (bool): Whether to run on remote host (True) or locally (False)
             extra_args (str, optional): Additional arguments to pass to the execution command
+            timeout (int, optional): Seconds before local execution is killed
+                (default ``LOCAL_TIMEOUT``); remote execution uses the run_command timeout
         
         Returns:
             dict: Execution result with success, output, error, and execution details
@@ -1307,12 +1608,16 @@ class SSHClient:
         execution_location = "remote" if remote else "local"
         
         try:
+            if project_type == "terraform" and not custom_command and main_file.endswith('.tf'):
+                # Terraform runs as a tracked upload -> init -> plan -> apply pipeline
+                return self._execute_terraform_project(project_dir, main_file, extra_args, bool(remote and self.client))
             if remote and self.client:
                 # Remote execution: upload directory and execute
                 return self._execute_project_remote(project_dir, main_file, project_type, custom_command, extra_args)
             else:
                 # Local execution: execute in local directory
-                return self._execute_project_local(project_dir, main_file, project_type, custom_command, extra_args)
+                return self._execute_project_local(project_dir, main_file, project_type, custom_command, extra_args,
+                                                   timeout)
                 
         except Exception as e:
             return {
@@ -1410,7 +1715,7 @@ class SSHClient:
         # Build execution command
         if custom_command:
             # Use custom command
-            exec_cmd = f"cd '{remote_dir}' && {custom_command}"
+            exec_cmd = f"cd {shlex.quote(remote_dir)} && {custom_command}"
             if extra_args:
                 exec_cmd += f" {extra_args}"
         else:
@@ -1434,8 +1739,33 @@ class SSHClient:
             "command": exec_cmd
         }
     
-    def _execute_project_local(self, project_dir, main_file, project_type, custom_command, extra_args):
-        """Execute project locally."""
+    def _execute_terraform_project(self, project_dir, main_file, extra_args, remote):
+        """Execute a Terraform project directory as a pipeline, locally or on the remote host."""
+        extra_args = extra_args or ""
+        if "init-only" in extra_args:
+            actions = ("init",)
+        elif "plan-only" in extra_args:
+            actions = ("init", "plan")
+        else:
+            actions = ("init", "plan", "apply")
+        apply_args = extra_args.replace("init-only", "").replace("plan-only", "").strip() or None
+
+        result = self.run_terraform_pipeline(
+            project_dir, actions, remote=remote, apply_args=apply_args, listener=self.pipeline_listener
+        )
+        return {
+            "success": result["success"],
+            "output": result["output"],
+            "error": result["errors"],
+            "main_file": main_file,
+            "execution_location": "remote" if remote else "local",
+            "execution_time": result["duration"],
+            "command": " -> ".join(step["name"] for step in result["steps"]),
+            "steps": result["steps"],
+        }
+
+    def _execute_project_local(self, project_dir, main_file, project_type, custom_command, extra_args, timeout=None):
+        """Execute project locally; the process group is killed after ``timeout`` seconds."""
         import subprocess
         import time
         import os
@@ -1453,16 +1783,16 @@ class SSHClient:
             exec_cmd = self._build_execution_command(project_dir, main_file, project_type, "linux", extra_args)
         
         print(f"Executing locally: {exec_cmd}")
+        timeout = timeout or self.LOCAL_TIMEOUT
         
         try:
             # Execute locally
-            result = subprocess.run(
+            watchdog.enter_state("running_local")
+            result = watchdog.run_process(
                 exec_cmd,
                 shell=True,
                 cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
+                timeout=timeout,
             )
             
             end_time = time.time()
@@ -1478,11 +1808,11 @@ class SSHClient:
                 "return_code": result.returncode
             }
             
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as e:
             return {
                 "success": False,
                 "output": "",
-                "error": "Command execution timed out after 10 minutes",
+                "error": f"Command execution timed out after {e.timeout:.0f} seconds",
                 "main_file": main_file,
                 "execution_location": "local",
                 "command": exec_cmd
@@ -1513,7 +1843,7 @@ class SSHClient:
             
             # For remote execution, include cd command
             if not work_dir.endswith(main_file):
-                cmd = f"cd '{work_dir}' && {cmd}"
+                cmd = f"cd {shlex.quote(work_dir)} && {cmd}"
                 
         elif project_type == "ansible":
             # Ansible execution (always runs locally, targeting remote)
@@ -1537,7 +1867,7 @@ class SSHClient:
                     cmd = f"cat {main_file}"
                 
                 if not work_dir.endswith(main_file):
-                    cmd = f"cd '{work_dir}' && {cmd}"
+                    cmd = f"cd {shlex.quote(work_dir)} && {cmd}"
                     
         elif project_type == "terraform":
             # Terraform execution with proper workflow
@@ -1565,7 +1895,7 @@ class SSHClient:
                     
             # For remote execution, include cd command
             if not work_dir.endswith(main_file):
-                cmd = f"cd '{work_dir}' && {cmd}"
+                cmd = f"cd {shlex.quote(work_dir)} && {cmd}"
         else:
             # Generic execution - just display the file
             if os_type == "windows":
@@ -1574,7 +1904,7 @@ class SSHClient:
                 cmd = f"cat {main_file}"
                 
             if not work_dir.endswith(main_file):
-                cmd = f"cd '{work_dir}' && {cmd}"
+                cmd = f"cd {shlex.quote(work_dir)} && {cmd}"
         
         return cmd
 
@@ -0,0 +1,332 @@
+import datetime
+import gzip
+import json
+import os
+import threading
+import time
+import zlib
+
+# Executions in these states are never archived or deleted
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class RetentionPolicy:
+    """
+    How long execution history is kept.
+
+    Args:
+        max_age_days (float, optional): Delete executions started longer ago than this.
+        max_rows (int, optional): Keep at most this many executions, deleting the oldest.
+        archive_after_days (float, optional): Move output/logs of executions started longer ago
+            than this into compressed archive files. The history row stays and its output is
+            still served, read back from the archive.
+        chunk_size (int): Rows archived or deleted per write transaction.
+        vacuum_pages (int): Free pages returned to the file system per vacuum step.
+        interval (float): Seconds between background retention passes.
+        pause (float): Seconds slept between chunks so running jobs get the write lock.
+    """
+
+    FIELDS = ("max_age_days", "max_rows", "archive_after_days", "chunk_size", "vacuum_pages", "interval", "pause")
+
+    def __init__(self, max_age_days=None, max_rows=None, archive_after_days=None, chunk_size=500,
+                 vacuum_pages=256, interval=3600, pause=0.05):
+        self.max_age_days = max_age_days
+        self.max_rows = max_rows
+        self.archive_after_days = archive_after_days
+        self.chunk_size = chunk_size
+        self.vacuum_pages = vacuum_pages
+        self.interval = interval
+        self.pause = pause
+        self.validate()
+
+    def validate(self):
+        for name in ("max_age_days", "max_rows", "archive_after_days"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive or null")
+        for name in ("chunk_size", "vacuum_pages", "interval"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if self.pause < 0:
+            raise ValueError("pause must not be negative")
+
+    def updated(self, data):
+        """A copy with the fields present in ``data`` replaced."""
+        fields = self.to_dict()
+        for name in self.FIELDS:
+            if name in data:
+                fields[name] = data[name]
+        return RetentionPolicy(**fields)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class RetentionManager:
+    """
+    Applies a RetentionPolicy to the dashboard database in the background.
+
+    Each pass archives old outputs, deletes expired executions and then returns freed pages
+    to the file system with incremental vacuum. All of it happens in ``chunk_size`` batches
+    with short pauses in between, so no step holds the write lock for long.
+
+    Archives are gzip files per month of ``started_at`` (``executions-YYYY-MM.jsonl.gz``). Every
+    execution is its own gzip member holding one JSON line; execution_history records the file
+    and member offset, so a single archived output is read without scanning the file.
+    """
+
+    def __init__(self, storage, outputs, policy=None, archive_dir="archive", on_report=None, search=None):
+        self.storage = storage
+        self.outputs = outputs
+        self.search = search
+        self.policy = policy or RetentionPolicy()
+        self.archive_dir = archive_dir
+        self.on_report = on_report
+        self.last_report = None
+        self.totals = {"runs": 0, "archived": 0, "deleted_rows": 0, "reclaimed_bytes": 0}
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("PRAGMA table_info(execution_history)")
+        columns = [row[1] for row in c.fetchall()]
+        if 'archive_file' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN archive_file TEXT")
+        if 'archive_offset' not in columns:
+            c.execute("ALTER TABLE execution_history ADD COLUMN archive_offset INTEGER")
+        # Only rows still waiting to be archived are indexed
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS ix_execution_history_unarchived "
+            "ON execution_history (started_at) WHERE archive_file IS NULL"
+        )
+
+    # -- background thread -------------------------------------------------
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="remoteinfra-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        """Run a pass now instead of waiting for the interval."""
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.policy.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.run()
+            except Exception as e:
+                print(f"Retention pass failed: {e}")
+
+    # -- passes ------------------------------------------------------------
+
+    def run(self, full_vacuum=False):
+        """
+        One retention pass. ``full_vacuum`` additionally rebuilds the file with a blocking
+        VACUUM, which is needed once to switch an existing database to incremental vacuum.
+        Returns the report of the pass.
+        """
+        with self._run_lock:
+            policy = self.policy
+            started = time.time()
+            before = self.storage.space()
+            report = {"started_at": datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")}
+            if policy.archive_after_days:
+                report.update(self._archive(self._cutoff(policy.archive_after_days), policy))
+            deleted = 0
+            if policy.max_age_days:
+                deleted += self._delete_older(self._cutoff(policy.max_age_days), policy)
+            if policy.max_rows:
+                deleted += self._delete_beyond(policy.max_rows, policy)
+            report["deleted_rows"] = deleted
+            if deleted and self.search:
+                # Fold the deletions into the index segments so it shrinks too
+                self.storage.write_many(self.search.merge_statements())
+            if full_vacuum:
+                self.storage.vacuum()
+                report["vacuumed_pages"] = None
+            else:
+                report["vacuumed_pages"] = self._vacuum(policy)
+            self.storage.checkpoint()
+            after = self.storage.space()
+            report.update({
+                "size_before": before["size_bytes"],
+                "size_after": after["size_bytes"],
+                "reclaimed_bytes": max(0, before["size_bytes"] - after["size_bytes"]),
+                # Pages that are free but stay in the file (auto_vacuum off)
+                "reusable_bytes": after["free_bytes"],
+                "duration": round(time.time() - started, 3),
+            })
+            self.last_report = report
+            self.totals["runs"] += 1
+            self.totals["archived"] += report.get("archived", 0)
+            self.totals["deleted_rows"] += deleted
+            self.totals["reclaimed_bytes"] += report["reclaimed_bytes"]
+        if report.get("archived") or deleted or report["reclaimed_bytes"]:
+            print(f"Retention: archived {report.get('archived', 0)}, deleted {deleted} executions, "
+                  f"reclaimed {report['reclaimed_bytes']} bytes")
+        if self.on_report:
+            self.on_report(report)
+        return report
+
+    @staticmethod
+    def _cutoff(days):
+        return (datetime.datetime.utcnow() - datetime.timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+    def _sleep(self, policy):
+        if policy.pause:
+            self._stop.wait(policy.pause)
+
+    def _archive(self, cutoff, policy):
+        archived = raw_bytes = written = 0
+        os.makedirs(self.archive_dir, exist_ok=True)
+        while not self._stop.is_set():
+            rows = self.storage.query(f"""
+                SELECT id, machine_id, type, status, command, started_at, completed_at, duration,
+                       output_size, logs_size
+                FROM execution_history
+                WHERE archive_file IS NULL AND started_at < ? AND output_size IS NOT NULL
+                  AND status NOT IN ({', '.join('?' * len(ACTIVE_STATUSES))})
+                ORDER BY started_at LIMIT ?
+            """, (cutoff, *ACTIVE_STATUSES, policy.chunk_size))
+            if not rows:
+                break
+            locations = {}
+            files = {}
+            try:
+                for row in rows:
+                    if not row["output_size"] and not row["logs_size"]:
+                        # Nothing to keep; mark it so it is not looked at again
+                        locations[row["id"]] = ("", None)
+                        continue
+                    record = dict(row)
+                    for field in self.outputs.FIELDS:
+                        record[field] = self.outputs.read_text(row["id"], field) or ""
+                    name = f"executions-{(row['started_at'] or '')[:7] or 'unknown'}.jsonl.gz"
+                    if name not in files:
+                        files[name] = open(os.path.join(self.archive_dir, name), "ab")
+                    handle = files[name]
+                    member = gzip.compress((json.dumps(record) + "\n").encode("utf-8"))
+                    locations[row["id"]] = (name, handle.tell())
+                    handle.write(member)
+                    raw_bytes += (row["output_size"] or 0) + (row["logs_size"] or 0)
+                    written += len(member)
+                # The archive must be durable before the blobs it replaces are deleted
+                for handle in files.values():
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            finally:
+                for handle in files.values():
+                    handle.close()
+            statements = []
+            for execution_id, (name, offset) in locations.items():
+                statements.extend(self.outputs.delete_statements(execution_id))
+                # The live log is a copy of the same output
+                statements.append(("DELETE FROM execution_log_chunks WHERE execution_id = ?", (execution_id,)))
+                if self.search:
+                    statements.extend(self.search.strip_statements(execution_id))
+                statements.append((
+                    "UPDATE execution_history SET archive_file = ?, archive_offset = ? WHERE id = ?",
+                    (name, offset, execution_id),
+                ))
+            self.storage.write_many(statements)
+            archived += len(locations)
+            self._sleep(policy)
+        return {"archived": archived, "archived_output_bytes": raw_bytes, "archive_bytes_written": written}
+
+    def _delete_statements(self, ids):
+        placeholders = ", ".join("?" * len(ids))
+        statements = self.search.delete_statements(ids) if self.search else []
+        return statements + [
+            (f"DELETE FROM execution_outputs WHERE execution_id IN ({placeholders})", ids),
+            (f"DELETE FROM execution_log_chunks WHERE execution_id IN ({placeholders})", ids),
+            (f"DELETE FROM execution_steps WHERE execution_id IN ({placeholders})", ids),
+            (f"DELETE FROM execution_history WHERE id IN ({placeholders})", ids),
+        ]
+
+    def _delete_where(self, condition, params, policy):
+        """Delete finished executions matching ``condition``, oldest first, a chunk at a time."""
+        deleted = 0
+        while not self._stop.is_set():
+            ids = [row["id"] for row in self.storage.query(f"""
+                SELECT id FROM execution_history
+                WHERE {condition} AND status NOT IN ({', '.join('?' * len(ACTIVE_STATUSES))})
+                ORDER BY started_at, id LIMIT ?
+            """, (*params, *ACTIVE_STATUSES, policy.chunk_size))]
+            if not ids:
+                break
+            self.storage.write_many(self._delete_statements(ids))
+            deleted += len(ids)
+            self._sleep(policy)
+        return deleted
+
+    def _delete_older(self, cutoff, policy):
+        return self._delete_where("started_at < ?", (cutoff,), policy)
+
+    def _delete_beyond(self, max_rows, policy):
+        # The newest row that falls outside the limit; it and everything older goes
+        boundary = self.storage.query_one(
+            "SELECT started_at, id FROM execution_history ORDER BY started_at DESC, id DESC LIMIT 1 OFFSET ?",
+            (max_rows,),
+        )
+        if boundary is None:
+            return 0
+        return self._delete_where(
+            "started_at <= ? AND (started_at < ? OR id <= ?)",
+            (boundary["started_at"], boundary["started_at"], boundary["id"]),
+            policy,
+        )
+
+    def delete_all(self, policy=None):
+        """Delete every finished execution in chunks; running ones are kept."""
+        with self._run_lock:
+            return self._delete_where("1=1", (), policy or self.policy)
+
+    def _vacuum(self, policy):
+        freed = 0
+        while not self._stop.is_set():
+            pages = self.storage.incremental_vacuum(policy.vacuum_pages)
+            if not pages:
+                break
+            freed += pages
+            self._sleep(policy)
+        return freed
+
+    # -- archive access ----------------------------------------------------
+
+    def read_archive(self, name, offset):
+        """The archived record (metadata, output and logs) stored at ``offset`` of ``name``."""
+        path = os.path.join(self.archive_dir, os.path.basename(name))
+        decompressor = zlib.decompressobj(wbits=31)
+        chunks = []
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            while not decompressor.eof:
+                data = handle.read(64 * 1024)
+                if not data:
+                    break
+                chunks.append(decompressor.decompress(data))
+        return json.loads(b"".join(chunks).decode("utf-8"))
+
+    def report(self):
+        return {
+            "policy": self.policy.to_dict(),
+            "archive_dir": self.archive_dir,
+            "last_run": self.last_report,
+            "totals": dict(self.totals),
+            "database": self.storage.space(),
+            "search_index": self.search.stats() if self.search else None,
+        }
@@ -0,0 +1,200 @@
+import random
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+import paramiko.ssh_exception
+
+from .utils import AuthenticationFailed, CommandTimeout, NetworkError, RemoteCommandFailed, SSHException
+
+# Failure classes
+AUTH = "auth"                # bad credentials or key; retrying will not help
+NETWORK = "network"          # refused, reset, unreachable, timed out; usually transient
+PROTOCOL = "protocol"        # SSH negotiation/session errors, e.g. sshd restarting
+REMOTE_EXIT = "remote_exit"  # the remote command ran and exited non-zero
+TIMEOUT = "timeout"          # a command timeout or execution deadline passed
+UNKNOWN = "unknown"
+
+
+def classify_failure(error):
+    """Map an exception (or None) to one of the failure classes above."""
+    if error is None:
+        return None
+    if isinstance(error, (AuthenticationFailed, paramiko.ssh_exception.AuthenticationException)):
+        return AUTH
+    if isinstance(error, RemoteCommandFailed):
+        return REMOTE_EXIT
+    if isinstance(error, CommandTimeout):
+        return TIMEOUT
+    if isinstance(error, (NetworkError, socket.timeout, ConnectionError, EOFError, OSError)):
+        return NETWORK
+    if isinstance(error, (SSHException, paramiko.ssh_exception.SSHException)):
+        return PROTOCOL
+    return UNKNOWN
+
+
+def idempotent(func):
+    """Mark an operation as safe to run again after it has already reached the remote side."""
+    func.idempotent = True
+    return func
+
+
+def is_idempotent(func):
+    """Whether ``func`` was marked with ``idempotent``; unmarked operations are not."""
+    return getattr(func, "idempotent", False)
+
+
+class RetryTracker:
+    """Retries and the last classified failure of one logical operation (e.g. an execution)."""
+
+    def __init__(self):
+        self.retries = 0
+        self.history = []  # [{attempt, failure_class, error, delay}]
+        self.dispatched = False
+        self.last_failure = None
+        self.failure_class = None  # Class of the failure that ended the operation, if any
+
+    def begin_attempt(self):
+        self.dispatched = False
+        self.last_failure = None
+
+    def record_retry(self, attempt, failure_class, error, delay):
+        self.retries += 1
+        self.history.append({
+            "attempt": attempt,
+            "failure_class": failure_class,
+            "error": str(error),
+            "delay": round(delay, 3),
+        })
+
+
+_local = threading.local()
+_UNSET = object()
+
+
+@contextmanager
+def track():
+    """Collect retries and failures reported by this thread into a new tracker."""
+    previous = getattr(_local, "tracker", None)
+    tracker = RetryTracker()
+    _local.tracker = tracker
+    try:
+        yield tracker
+    finally:
+        _local.tracker = previous
+
+
+def current_tracker():
+    return getattr(_local, "tracker", None)
+
+
+def mark_dispatched():
+    """Note that the current attempt has started running something on the remote side."""
+    tracker = current_tracker()
+    if tracker:
+        tracker.dispatched = True
+
+
+@contextmanager
+def use_policy(policy):
+    """Make ``policy`` the retry policy of SSH clients this thread creates in the block."""
+    previous = getattr(_local, "policy", _UNSET)
+    _local.policy = policy
+    try:
+        yield policy
+    finally:
+        if previous is _UNSET:
+            del _local.policy
+        else:
+            _local.policy = previous
+
+
+def current_policy(default=None):
+    """Retry policy set for this thread by ``use_policy()``, or ``default``."""
+    return getattr(_local, "policy", default)
+
+
+def record_failure(error):
+    """Remember the failure behind an operation that reports errors instead of raising."""
+    tracker = current_tracker()
+    if tracker:
+        tracker.last_failure = error
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for transient failures.
+
+    Args:
+        max_attempts (int): Total attempts including the first one.
+        base_delay (float): Delay before the first retry, in seconds.
+        max_delay (float): Upper bound of any single delay.
+        multiplier (float): Growth factor of the delay per attempt.
+        jitter (bool): Use "full jitter" (uniform between 0 and the computed delay) so clients
+            retrying the same host do not reconnect in lockstep.
+        retry_on (tuple): Failure classes that may be retried.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, multiplier=2.0, jitter=True,
+                 retry_on=(NETWORK, PROTOCOL)):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.multiplier = float(multiplier)
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+
+    def should_retry(self, failure_class, attempt, idempotent=False, dispatched=False):
+        """Whether a failure on ``attempt`` (1-based) may be retried."""
+        if attempt >= self.max_attempts or failure_class not in self.retry_on:
+            return False
+        # Once a non-idempotent operation reached the remote side, running it again could
+        # repeat its effects
+        return idempotent or not dispatched
+
+    def delay(self, attempt):
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def call(self, operation, *args, **kwargs):
+        """
+        Run ``operation(*args, **kwargs)``, retrying exceptions the policy considers transient.
+        An attempt that reached the remote side (``mark_dispatched()``) is only retried when the
+        operation is marked with ``idempotent``.
+        """
+        op_idempotent = is_idempotent(operation)
+        tracker = current_tracker()
+        # Dispatch is judged per attempt; whatever the surrounding operation had dispatched stays
+        outer_dispatched = tracker.dispatched if tracker else False
+        attempt = 1
+        try:
+            while True:
+                if tracker:
+                    tracker.dispatched = False
+                try:
+                    return operation(*args, **kwargs)
+                except Exception as e:
+                    failure_class = classify_failure(e)
+                    dispatched = tracker.dispatched if tracker else False
+                    if not self.should_retry(failure_class, attempt, op_idempotent, dispatched):
+                        raise
+                    delay = self.delay(attempt)
+                    if tracker:
+                        tracker.record_retry(attempt, failure_class, e, delay)
+                    print(f"Attempt {attempt}/{self.max_attempts} failed ({failure_class}: {e}); retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    attempt += 1
+        finally:
+            if tracker:
+                tracker.dispatched = tracker.dispatched or outer_dispatched
+
+    def to_dict(self):
+        return {
+            "max_attempts": self.max_attempts,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "multiplier": self.multiplier,
+            "jitter": self.jitter,
+            "retry_on": list(self.retry_on),
+        }
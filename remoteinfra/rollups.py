@@ -0,0 +1,172 @@
+import datetime
+import time
+
+
+class ExecutionRollups:
+    """
+    Incrementally maintained execution counts per (bucket, machine, type, status).
+
+    Two tables are kept: ``execution_rollup_minute`` (bucket ``YYYY-MM-DD HH:MM``) and
+    ``execution_rollup_hour`` (bucket ``YYYY-MM-DD HH``), bucketed on ``started_at`` in UTC like
+    the rest of execution_history. They are updated by statements that run in the same grouped
+    write as the completion of an execution, so they never drift from the history. A rolling
+    window reads whole hours from the hour table and the partial first hour from the minute
+    table, which bounds the work by the window length rather than by the size of the history.
+
+    Args:
+        storage (Storage): Database access.
+        minute_retention (int): Seconds of minute buckets to keep. Older windows fall back to
+            hour granularity.
+        prune_interval (int): Minimum seconds between prunes of old minute buckets.
+    """
+
+    TABLES = {
+        # table: number of characters of the timestamp forming the bucket
+        "execution_rollup_minute": 16,
+        "execution_rollup_hour": 13,
+    }
+
+    def __init__(self, storage, minute_retention=2 * 86400, prune_interval=600):
+        self.storage = storage
+        self.minute_retention = minute_retention
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+
+    @classmethod
+    def create_schema(cls, c):
+        """Create the rollup tables. Returns True when they did not exist yet and need a rebuild."""
+        c.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'execution_rollup_hour'")
+        created = c.fetchone() is None
+        for table in cls.TABLES:
+            c.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    bucket TEXT,
+                    machine_id TEXT,
+                    type TEXT,
+                    status TEXT,
+                    count INTEGER DEFAULT 0,
+                    duration REAL DEFAULT 0,
+                    PRIMARY KEY (bucket, machine_id, type, status)
+                )
+            """)
+        return created
+
+    @staticmethod
+    def _bucket_sql(width):
+        return f"substr(COALESCE(started_at, completed_at), 1, {width})"
+
+    @classmethod
+    def rebuild_statements(cls):
+        """Statements recomputing every bucket from execution_history."""
+        statements = []
+        for table, width in cls.TABLES.items():
+            statements.append((f"DELETE FROM {table}", ()))
+            statements.append((f"""
+                INSERT INTO {table} (bucket, machine_id, type, status, count, duration)
+                SELECT {cls._bucket_sql(width)}, COALESCE(machine_id, ''), COALESCE(type, ''), status,
+                       COUNT(*), COALESCE(SUM(duration), 0)
+                FROM execution_history WHERE completed_at IS NOT NULL
+                GROUP BY 1, 2, 3, 4
+            """, ()))
+        return statements
+
+    @classmethod
+    def clear_statements(cls):
+        return [(f"DELETE FROM {table}", ()) for table in cls.TABLES]
+
+    def retract_statements(self, execution_id):
+        """
+        Statements removing a completed execution from its buckets. Run them before the row is
+        changed; they do nothing for executions that have not completed yet.
+        """
+        statements = []
+        for table, width in self.TABLES.items():
+            statements.append((f"""
+                UPDATE {table}
+                SET count = count - 1,
+                    duration = duration - COALESCE((SELECT duration FROM execution_history WHERE id = ?), 0)
+                WHERE (bucket, machine_id, type, status) = (
+                    SELECT {self._bucket_sql(width)}, COALESCE(machine_id, ''), COALESCE(type, ''), status
+                    FROM execution_history WHERE id = ? AND completed_at IS NOT NULL
+                )
+            """, (execution_id, execution_id)))
+        return statements
+
+    def record_statements(self, execution_id):
+        """Statements adding a completed execution to its buckets. Run them after the row is written."""
+        statements = []
+        for table, width in self.TABLES.items():
+            statements.append((f"""
+                INSERT INTO {table} (bucket, machine_id, type, status, count, duration)
+                SELECT {self._bucket_sql(width)}, COALESCE(machine_id, ''), COALESCE(type, ''), status,
+                       1, COALESCE(duration, 0)
+                FROM execution_history WHERE id = ? AND completed_at IS NOT NULL
+                ON CONFLICT (bucket, machine_id, type, status)
+                DO UPDATE SET count = count + 1, duration = duration + excluded.duration
+            """, (execution_id,)))
+        return statements
+
+    def window(self, seconds, machine_id=None, execution_type=None, now=None):
+        """
+        Completed executions that started in the last ``seconds``, as
+        ``{status: {"count": n, "duration": total_seconds}}``.
+        """
+        now = now or datetime.datetime.utcnow()
+        since = now - datetime.timedelta(seconds=seconds)
+        next_hour = since.replace(minute=0, second=0, microsecond=0)
+        if next_hour < since:
+            next_hour += datetime.timedelta(hours=1)
+
+        parts = [("execution_rollup_hour", "bucket >= ?", [next_hour.strftime("%Y-%m-%d %H")])]
+        if (now - since).total_seconds() <= self.minute_retention:
+            parts.append(("execution_rollup_minute", "bucket >= ? AND bucket < ?",
+                          [since.strftime("%Y-%m-%d %H:%M"), next_hour.strftime("%Y-%m-%d %H:%M")]))
+        else:
+            # Minute buckets are gone; count the partial first hour whole
+            parts[0] = ("execution_rollup_hour", "bucket >= ?", [since.strftime("%Y-%m-%d %H")])
+
+        totals = {}
+        with self.storage.read() as conn:
+            for table, condition, params in parts:
+                query = f"SELECT status, SUM(count), SUM(duration) FROM {table} WHERE {condition}"
+                if machine_id:
+                    query += " AND machine_id = ?"
+                    params.append(machine_id)
+                if execution_type:
+                    query += " AND type = ?"
+                    params.append(execution_type)
+                for status, count, duration in conn.execute(query + " GROUP BY status", params):
+                    entry = totals.setdefault(status, {"count": 0, "duration": 0.0})
+                    entry["count"] += count or 0
+                    entry["duration"] += duration or 0.0
+        return {status: entry for status, entry in totals.items() if entry["count"]}
+
+    def series(self, seconds, resolution="hour", machine_id=None, execution_type=None, now=None):
+        """Per-bucket counts by status for the last ``seconds``, oldest bucket first."""
+        now = now or datetime.datetime.utcnow()
+        since = now - datetime.timedelta(seconds=seconds)
+        table, fmt = (("execution_rollup_minute", "%Y-%m-%d %H:%M") if resolution == "minute"
+                      else ("execution_rollup_hour", "%Y-%m-%d %H"))
+        query = f"SELECT bucket, status, SUM(count) AS count FROM {table} WHERE bucket >= ?"
+        params = [since.strftime(fmt)]
+        if machine_id:
+            query += " AND machine_id = ?"
+            params.append(machine_id)
+        if execution_type:
+            query += " AND type = ?"
+            params.append(execution_type)
+        buckets = {}
+        for row in self.storage.query(query + " GROUP BY bucket, status ORDER BY bucket", params):
+            if row["count"]:
+                buckets.setdefault(row["bucket"], {})[row["status"]] = row["count"]
+        return [{"bucket": bucket, "counts": counts} for bucket, counts in buckets.items()]
+
+    def maybe_prune(self):
+        """Drop expired minute buckets and emptied rows, at most every ``prune_interval`` seconds."""
+        if time.time() - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = time.time()
+        cutoff = (datetime.datetime.utcnow() - datetime.timedelta(seconds=self.minute_retention)).strftime("%Y-%m-%d %H:%M")
+        statements = [("DELETE FROM execution_rollup_minute WHERE bucket < ? OR count <= 0", (cutoff,))]
+        statements.append(("DELETE FROM execution_rollup_hour WHERE count <= 0", ()))
+        self.storage.write_many(statements, wait=False)
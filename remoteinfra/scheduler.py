@@ -0,0 +1,281 @@
+import datetime
+import hashlib
+import random
+import threading
+import time
+import uuid
+
+
+class CronExpression:
+    """
+    Standard five-field cron expression: minute hour day-of-month month day-of-week.
+
+    Supports ``*``, lists (``1,15``), ranges (``1-5``), steps (``*/10``, ``0-30/5``), month and
+    weekday names, and the ``@hourly``, ``@daily``, ``@weekly``, ``@monthly`` and ``@yearly`` aliases.
+    Times are evaluated in the dashboard host's local time, like cron itself.
+    """
+
+    ALIASES = {
+        "@yearly": "0 0 1 1 *",
+        "@annually": "0 0 1 1 *",
+        "@monthly": "0 0 1 * *",
+        "@weekly": "0 0 * * 0",
+        "@daily": "0 0 * * *",
+        "@midnight": "0 0 * * *",
+        "@hourly": "0 * * * *",
+    }
+    MONTHS = {name: i for i, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+    WEEKDAYS = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        fields = self.ALIASES.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+        self.minutes = self._parse(fields[0], 0, 59)
+        self.hours = self._parse(fields[1], 0, 23)
+        self.days = self._parse(fields[2], 1, 31)
+        self.months = self._parse(fields[3], 1, 12, self.MONTHS)
+        weekdays = self._parse(fields[4], 0, 7, self.WEEKDAYS)
+        self.weekdays = {0 if d == 7 else d for d in weekdays}
+        # Vixie cron semantics: when both day fields are restricted, either may match
+        self._dom_any = fields[2] == "*"
+        self._dow_any = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field, low, high, names=None):
+        values = set()
+        for part in field.lower().split(","):
+            step = 1
+            if "/" in part:
+                part, step_str = part.split("/", 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"Invalid cron step: {field}")
+            if part in ("*", ""):
+                start, end = low, high
+            elif "-" in part:
+                start_str, end_str = part.split("-", 1)
+                start = names[start_str] if names and start_str in names else int(start_str)
+                end = names[end_str] if names and end_str in names else int(end_str)
+            else:
+                start = names[part] if names and part in names else int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field '{field}' out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt):
+        dom = dt.day in self.days
+        dow = (dt.isoweekday() % 7) in self.weekdays
+        if self._dom_any and self._dow_any:
+            return True
+        if self._dom_any:
+            return dow
+        if self._dow_any:
+            return dom
+        return dom or dow
+
+    def next_after(self, after):
+        """Return the first matching local datetime strictly after ``after``."""
+        dt = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        limit = after + datetime.timedelta(days=366 * 5)
+        while dt <= limit:
+            if dt.month not in self.months:
+                # Jump to the first day of the next month
+                dt = (dt.replace(day=1) + datetime.timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = (dt + datetime.timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.hours:
+                dt = (dt + datetime.timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.minutes:
+                dt += datetime.timedelta(minutes=1)
+                continue
+            return dt
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+
+class ScheduledJob:
+    """A recurring job definition plus its run bookkeeping."""
+
+    FIELDS = (
+        "id", "name", "cron", "job_type", "machine_id", "payload", "enabled", "jitter", "spread",
+        "skip_if_running", "next_run", "last_run", "last_duration", "last_status",
+        "last_execution_id", "run_count", "skipped_runs",
+    )
+
+    def __init__(self, name, cron, job_type, machine_id=None, payload=None, enabled=True, jitter=30,
+                 spread=None, skip_if_running=True, id=None, next_run=None, last_run=None,
+                 last_duration=None, last_status=None, last_execution_id=None, run_count=0, skipped_runs=0):
+        self.id = id or str(uuid.uuid4())
+        self.name = name
+        self.cron = cron
+        self.schedule = CronExpression(cron)
+        self.job_type = job_type
+        self.machine_id = machine_id
+        self.payload = payload or {}
+        self.enabled = bool(enabled)
+        self.jitter = float(jitter or 0)
+        self.spread = spread  # seconds; None means 10% of the cron interval, capped at 15 minutes
+        self.skip_if_running = bool(skip_if_running)
+        self.next_run = next_run  # epoch seconds
+        self.last_run = last_run
+        self.last_duration = last_duration
+        self.last_status = last_status
+        self.last_execution_id = last_execution_id
+        self.run_count = run_count or 0
+        self.skipped_runs = skipped_runs or 0
+
+    def spread_offset(self, fire_time):
+        """Stable per-job offset so jobs sharing a cron slot fan out across the interval."""
+        spread = self.spread
+        if spread is None:
+            following = self.schedule.next_after(fire_time)
+            spread = min((following - fire_time).total_seconds() * 0.1, 900)
+        if not spread:
+            return 0.0
+        digest = hashlib.sha256(self.id.encode()).digest()
+        return (int.from_bytes(digest[:8], "big") / 2 ** 64) * float(spread)
+
+    def compute_next_run(self, now=None):
+        now = now if now is not None else time.time()
+        fire_time = self.schedule.next_after(datetime.datetime.fromtimestamp(now))
+        jitter = random.uniform(0, self.jitter) if self.jitter else 0.0
+        self.next_run = fire_time.timestamp() + self.spread_offset(fire_time) + jitter
+        return self.next_run
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        for field in ("next_run", "last_run"):
+            ts = data[field]
+            data[f"{field}_ts"] = ts
+            data[field] = datetime.datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else None
+        return data
+
+
+class Scheduler:
+    """
+    Background scheduler for recurring jobs.
+
+    The scheduler only decides *when* a job runs. Running it is delegated to ``submit(job)``,
+    which returns the execution id (or None when the submission was refused). Overlapping runs
+    are skipped while ``is_running(execution_id)`` reports the previous run as active.
+    ``on_change(job)`` is called whenever a job's bookkeeping changes so it can be persisted.
+    """
+
+    def __init__(self, submit, is_running, on_change=None):
+        self.submit = submit
+        self.is_running = is_running
+        self.on_change = on_change
+        self.jobs = {}
+        self._by_execution = {}  # {execution_id: (job_id, submitted_at)}
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="remoteinfra-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def add(self, job):
+        with self._lock:
+            if job.next_run is None or job.next_run < time.time():
+                job.compute_next_run()
+            self.jobs[job.id] = job
+        self._changed(job)
+        self._wake.set()
+        return job
+
+    def remove(self, job_id):
+        with self._lock:
+            job = self.jobs.pop(job_id, None)
+        self._wake.set()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda j: (j.next_run or float("inf")))
+
+    def run_now(self, job_id):
+        """Trigger a job immediately, outside its schedule."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        return self._fire(job, reschedule=False)
+
+    def execution_finished(self, execution_id, status, duration):
+        """Record the outcome of an execution started by the scheduler."""
+        with self._lock:
+            entry = self._by_execution.pop(execution_id, None)
+            job = self.jobs.get(entry[0]) if entry else None
+            if job is None:
+                return
+            job.last_status = status
+            job.last_duration = duration
+        self._changed(job)
+
+    def _changed(self, job):
+        if self.on_change:
+            try:
+                self.on_change(job)
+            except Exception as e:
+                print(f"Error persisting scheduled job {job.id}: {e}")
+
+    def _fire(self, job, reschedule=True):
+        with self._lock:
+            if reschedule:
+                job.compute_next_run()
+            if job.skip_if_running and job.last_execution_id and self.is_running(job.last_execution_id):
+                job.skipped_runs += 1
+                print(f"Skipping scheduled job '{job.name}': previous run still active")
+                execution_id = None
+            else:
+                try:
+                    execution_id = self.submit(job)
+                except Exception as e:
+                    print(f"Scheduled job '{job.name}' failed to submit: {e}")
+                    execution_id = None
+                job.last_run = time.time()
+                if execution_id:
+                    job.run_count += 1
+                    job.last_execution_id = execution_id
+                    job.last_status = "queued"
+                    self._by_execution[execution_id] = (job.id, job.last_run)
+                else:
+                    job.last_status = "rejected"
+        self._changed(job)
+        return execution_id
+
+    def _loop(self):
+        while not self._stop.is_set():
+            now = time.time()
+            due = []
+            with self._lock:
+                for job in self.jobs.values():
+                    if job.enabled and job.next_run is not None and job.next_run <= now:
+                        due.append(job)
+                upcoming = [j.next_run for j in self.jobs.values() if j.enabled and j.next_run]
+            for job in due:
+                self._fire(job)
+            if due:
+                continue
+            timeout = min(upcoming) - now if upcoming else 60
+            self._wake.wait(timeout=max(0.05, min(timeout, 60)))
+            self._wake.clear()
@@ -0,0 +1,157 @@
+import re
+import sqlite3
+
+
+class ExecutionSearch:
+    """
+    SQLite FTS5 index over the command, output and logs of finished executions.
+
+    Each indexed execution has one row in the ``execution_search`` FTS table; its rowid is kept
+    in ``execution_history.search_rowid`` so entries can be replaced and deleted by execution
+    without scanning the index. Only the first and last ``max_field_bytes / 2`` of each output
+    are indexed, which is where commands and errors show up, so huge logs do not bloat it.
+
+    When the SQLite build has no FTS5 the index is simply absent and ``available`` is False.
+    """
+
+    # bm25 weights per column: a hit in the command outranks one in the output
+    WEIGHTS = (4.0, 1.0, 1.0)
+
+    def __init__(self, storage, max_field_bytes=64 * 1024):
+        self.storage = storage
+        self.max_field_bytes = max_field_bytes
+        self._available = None
+
+    @staticmethod
+    def create_schema(c):
+        """Create the FTS table. Returns False when FTS5 is not available."""
+        c.execute("PRAGMA table_info(execution_history)")
+        if 'search_rowid' not in [row[1] for row in c.fetchall()]:
+            c.execute("ALTER TABLE execution_history ADD COLUMN search_rowid INTEGER")
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_history_search ON execution_history (search_rowid)")
+        try:
+            c.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS execution_search "
+                "USING fts5(command, output, logs, tokenize = 'unicode61')"
+            )
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search disabled: {e}")
+            return False
+        return True
+
+    @property
+    def available(self):
+        if self._available is None:
+            self._available = self.storage.query_one(
+                "SELECT 1 FROM sqlite_master WHERE name = 'execution_search'"
+            ) is not None
+        return self._available
+
+    def _excerpt(self, text):
+        text = text or ""
+        if len(text) <= self.max_field_bytes:
+            return text
+        half = self.max_field_bytes // 2
+        return text[:half] + "\n…\n" + text[-half:]
+
+    def index_statements(self, execution_id, output, logs):
+        """
+        Statements (re)indexing an execution, its command taken from the history row. They must
+        run after that row is written and stay together, since the last one reads
+        ``last_insert_rowid()``.
+        """
+        if not self.available:
+            return []
+        return [
+            ("DELETE FROM execution_search WHERE rowid = (SELECT search_rowid FROM execution_history WHERE id = ?)",
+             (execution_id,)),
+            ("INSERT INTO execution_search (command, output, logs) "
+             "SELECT COALESCE(command, ''), ?, ? FROM execution_history WHERE id = ?",
+             (self._excerpt(output), self._excerpt(logs), execution_id)),
+            ("UPDATE execution_history SET search_rowid = last_insert_rowid() WHERE id = ?", (execution_id,)),
+        ]
+
+    def delete_statements(self, execution_ids):
+        """Statements dropping executions from the index; run them before the rows are deleted."""
+        if not self.available or not execution_ids:
+            return []
+        placeholders = ", ".join("?" * len(execution_ids))
+        return [(
+            f"DELETE FROM execution_search WHERE rowid IN "
+            f"(SELECT search_rowid FROM execution_history WHERE id IN ({placeholders}))",
+            list(execution_ids),
+        )]
+
+    def strip_statements(self, execution_id):
+        """Statements keeping only the command of an execution searchable (used on archiving)."""
+        if not self.available:
+            return []
+        return [(
+            "UPDATE execution_search SET output = '', logs = '' "
+            "WHERE rowid = (SELECT search_rowid FROM execution_history WHERE id = ?)",
+            (execution_id,),
+        )]
+
+    def merge_statements(self, pages=500):
+        """Incrementally merge index segments, e.g. after a retention pass deleted rows."""
+        if not self.available:
+            return []
+        return [("INSERT INTO execution_search (execution_search, rank) VALUES ('merge', ?)", (pages,))]
+
+    @staticmethod
+    def to_match(text):
+        """Plain search text as an FTS5 query: every word must appear (prefix match on the last)."""
+        terms = [term for term in re.split(r"\s+", text.strip()) if term]
+        if not terms:
+            raise ValueError("Empty search query")
+        quoted = ['"' + term.replace('"', '""') + '"' for term in terms]
+        quoted[-1] += "*"
+        return " AND ".join(quoted)
+
+    def search(self, text, raw=False, filters=None, limit=20, offset=0, highlight=("<mark>", "</mark>")):
+        """
+        Best matching executions first, each with a snippet around the match. ``raw`` passes
+        ``text`` to FTS5 as is (phrases, NEAR, column filters); otherwise it is treated as words.
+        Raises ValueError for an unusable query.
+        """
+        if not self.available:
+            raise ValueError("Full-text search is not available in this SQLite build")
+        match = text if raw else self.to_match(text)
+        weights = ", ".join(str(w) for w in self.WEIGHTS)
+        query = f"""
+            SELECT h.id, h.machine_id, h.type, h.status, h.command, h.started_at, h.completed_at, h.duration,
+                   m.name AS machine_name, m.host AS machine_host,
+                   bm25(execution_search, {weights}) AS rank,
+                   snippet(execution_search, -1, ?, ?, '…', 16) AS snippet
+            FROM execution_search
+            JOIN execution_history h ON h.search_rowid = execution_search.rowid
+            LEFT JOIN machines m ON m.id = h.machine_id
+            WHERE execution_search MATCH ?
+        """
+        params = [highlight[0], highlight[1], match]
+        filters = filters or {}
+        for column in ("machine_id", "type", "status"):
+            if filters.get(column):
+                query += f" AND h.{column} = ?"
+                params.append(filters[column])
+        if filters.get("since"):
+            query += " AND h.started_at >= ?"
+            params.append(filters["since"])
+        query += " ORDER BY rank LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        try:
+            rows = self.storage.query(query, params)
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}")
+        return [dict(row) for row in rows]
+
+    def stats(self):
+        if not self.available:
+            return {"available": False}
+        return {
+            "available": True,
+            "documents": self.storage.query_value("SELECT COUNT(*) FROM execution_search", default=0),
+            "index_pages": self.storage.query_value(
+                "SELECT COUNT(*) FROM execution_search_data", default=0
+            ),
+        }
@@ -0,0 +1,121 @@
+import signal
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+ASYNC_MODES = ("threading", "eventlet", "gevent")
+
+
+def check_async_mode(async_mode=None):
+    """
+    The async mode to serve with ("threading" unless asked otherwise). eventlet and gevent
+    only work when the process was monkey-patched before remoteinfra was imported: the
+    dashboard runs executions, the storage writer and its publishers on threads, and those
+    must be green threads for the event loop to emit safely. Raises ValueError otherwise.
+    """
+    async_mode = async_mode or "threading"
+    if async_mode not in ASYNC_MODES:
+        raise ValueError(f"async_mode must be one of: {', '.join(ASYNC_MODES)}")
+    if async_mode == "eventlet":
+        try:
+            import eventlet.patcher
+        except ImportError:
+            raise ValueError("async_mode='eventlet' needs the eventlet package")
+        if not eventlet.patcher.is_monkey_patched("thread"):
+            raise ValueError("async_mode='eventlet' needs eventlet.monkey_patch() at the top of the script")
+    elif async_mode == "gevent":
+        try:
+            from gevent import monkey
+        except ImportError:
+            raise ValueError("async_mode='gevent' needs the gevent package")
+        if not monkey.is_module_patched("threading"):
+            raise ValueError("async_mode='gevent' needs gevent.monkey.patch_all() at the top of the script")
+    return async_mode
+
+
+class _QuietHandler(WSGIRequestHandler):
+    # Access logging costs more than most API requests; errors are still logged
+    def log_request(self, code="-", size="-"):
+        pass
+
+
+class PooledWSGIServer(socketserver.ThreadingMixIn, BaseWSGIServer):
+    """
+    Werkzeug's WSGI server with connections handled by a fixed pool of ``threads`` instead
+    of a new thread each, and a listen backlog of ``backlog``. A WebSocket holds its thread
+    while open, so ``threads`` must cover the expected clients plus concurrent requests.
+    With ``reuse_port`` several processes can listen on the same port (SO_REUSEPORT) and the
+    kernel spreads new connections over them.
+    """
+
+    multithread = True
+    daemon_threads = True
+
+    def __init__(self, host, port, app, threads=256, backlog=1024, reuse_port=False):
+        self.request_queue_size = backlog
+        self.reuse_port = reuse_port
+        self.pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="remoteinfra-http")
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(host, port, app, handler=_QuietHandler)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            self._connections.add(request)
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+
+    def server_close(self):
+        super().server_close()
+        # Open WebSockets and keep-alive connections would hold their threads (and the exit) forever
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.pool.shutdown(wait=False)
+
+
+def run(app, host, port, threads=256, backlog=1024, reuse_port=False, on_shutdown=None):
+    """
+    Serve ``app`` with a PooledWSGIServer until SIGTERM or SIGINT. The server keeps answering
+    while ``on_shutdown()`` runs (e.g. waiting for executions to finish), then stops. A second
+    signal stops it at once.
+    """
+    server = PooledWSGIServer(host, port, app, threads=threads, backlog=backlog, reuse_port=reuse_port)
+
+    def stop():
+        try:
+            if on_shutdown:
+                on_shutdown()
+        finally:
+            server.shutdown()
+
+    def handle_signal(signum, frame):
+        print(f"Received signal {signum}; shutting down")
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        threading.Thread(target=stop, name="remoteinfra-shutdown", daemon=True).start()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, handle_signal)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
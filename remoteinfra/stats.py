@@ -0,0 +1,122 @@
+import threading
+import time
+
+
+class StatsPublisher:
+    """
+    Server-side dashboard stats, computed once per change and pushed to subscribed clients.
+
+    Each section (e.g. "executions", "queue") has a compute function. Changes are announced
+    with ``mark_dirty(section)``; a publisher thread waits ``debounce`` seconds for more,
+    then recomputes the dirty sections that have subscribers and emits ``stats`` events
+    (``{"section", "data", "updated_at"}``) to the room ``stats_<section>``, only when the
+    result differs from what was last sent. Sections with subscribers are also refreshed
+    every ``refresh_interval`` seconds, since rolling windows change without any event.
+    Sections nobody subscribes to are never computed, so idle tabs cost nothing.
+    """
+
+    def __init__(self, sections, debounce=1.0, refresh_interval=60.0):
+        self.sections = dict(sections)
+        self.debounce = debounce
+        self.refresh_interval = refresh_interval
+        self.emit = None
+        self.computed = 0
+        self.published = 0
+        self._subscribers = {name: set() for name in self.sections}
+        self._last = {}  # section -> (payload, computed_at)
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, emit):
+        """Begin publishing with ``emit(event, data, room_or_sid)``."""
+        self.emit = emit
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="remoteinfra-stats", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def room(section):
+        return f"stats_{section}"
+
+    def subscribe(self, sid, sections):
+        """
+        Add a client to sections (unknown names raise ValueError) and return the current
+        snapshot of each, computed now if nothing recent is cached.
+        """
+        unknown = [name for name in sections if name not in self.sections]
+        if unknown:
+            raise ValueError(f"Unknown stats section(s): {', '.join(unknown)}")
+        with self._lock:
+            for name in sections:
+                self._subscribers[name].add(sid)
+        return [self.snapshot(name) for name in sections]
+
+    def unsubscribe(self, sid, sections=None):
+        """Remove a client from some sections, or all of them (on disconnect)."""
+        with self._lock:
+            for name in sections or self.sections:
+                self._subscribers.get(name, set()).discard(sid)
+
+    def mark_dirty(self, *sections):
+        """Note that sections (all when none given) may have changed."""
+        with self._lock:
+            self._dirty.update(sections or self.sections)
+        self._wake.set()
+
+    def snapshot(self, section):
+        with self._lock:
+            cached = self._last.get(section)
+            fresh = cached and section not in self._dirty and time.time() - cached[1] < self.refresh_interval
+        if fresh:
+            return self._event(section, *cached)
+        payload = self._compute(section)
+        return self._event(section, payload, time.time())
+
+    @staticmethod
+    def _event(section, payload, computed_at):
+        return {"section": section, "data": payload,
+                "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(computed_at))}
+
+    def _compute(self, section):
+        payload = self.sections[section]()
+        self.computed += 1
+        with self._lock:
+            self._last[section] = (payload, time.time())
+        return payload
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.refresh_interval)
+            # Debounce: let the burst of changes that woke us settle
+            time.sleep(self.debounce)
+            self._wake.clear()
+            now = time.time()
+            with self._lock:
+                stale = {name for name, (_, at) in self._last.items() if now - at >= self.refresh_interval}
+                due = [name for name in self._dirty | stale if self._subscribers[name]]
+                self._dirty.clear()
+                previous = {name: self._last.get(name, (None, 0))[0] for name in due}
+            for name in due:
+                try:
+                    payload = self._compute(name)
+                except Exception as e:
+                    print(f"Error computing {name} stats: {e}")
+                    continue
+                if payload == previous[name]:
+                    continue
+                try:
+                    self.emit("stats", self._event(name, payload, time.time()), self.room(name))
+                    self.published += 1
+                except Exception as e:
+                    print(f"Error publishing {name} stats: {e}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "subscribers": {name: len(sids) for name, sids in self._subscribers.items()},
+                "computed": self.computed,
+                "published": self.published,
+            }
@@ -0,0 +1,315 @@
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _PendingWrite:
+    """A write waiting for the group-commit thread."""
+
+    def __init__(self, statements):
+        self.statements = statements  # [(sql, params)]
+        self.done = threading.Event()
+        self.error = None
+        self.rowcount = 0
+
+
+class Storage:
+    """
+    Thread-safe SQLite access.
+
+    * WAL journaling, so readers never block the writer and vice versa.
+    * A small pool of connections. A thread checks one out for the duration of a ``read()`` or
+      ``transaction()`` block (nested blocks on the same thread reuse it), so connections are
+      never shared between threads and Flask's per-request threads do not open new ones.
+    * A busy timeout instead of immediate ``database is locked`` errors.
+    * Grouped writes: ``write()`` hands statements to a single writer thread that commits
+      everything queued at that moment in one transaction (group commit). Callers block until
+      their statements are durable unless they pass ``wait=False``.
+    * Incremental auto-vacuum on new databases, so free pages can be returned to the file
+      system a few at a time with ``incremental_vacuum()`` instead of a blocking ``VACUUM``.
+
+    Args:
+        path (str): SQLite database file.
+        pool_size (int): Maximum number of pooled reader connections.
+        busy_timeout (float): Seconds to wait for a lock before failing.
+        max_batch (int): Maximum number of queued writes committed together.
+        auto_vacuum (str): ``auto_vacuum`` mode given to newly created databases. Existing ones
+            keep theirs until ``vacuum()`` is run.
+    """
+
+    def __init__(self, path, pool_size=8, busy_timeout=5.0, max_batch=256, auto_vacuum="INCREMENTAL"):
+        self.path = path
+        self.pool_size = max(1, pool_size)
+        self.busy_timeout = busy_timeout
+        self.max_batch = max(1, max_batch)
+        self.auto_vacuum = auto_vacuum
+
+        self._pool = queue.LifoQueue()
+        self._opened = 0
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+
+        self._writes = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        # Counters for diagnostics
+        self.batches = 0
+        self.batched_writes = 0
+
+    # -- connections -------------------------------------------------------
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False,
+                               isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if self.auto_vacuum:
+            # Only takes effect before the first table exists (or on the next VACUUM)
+            conn.execute(f"PRAGMA auto_vacuum={self.auto_vacuum}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        return conn
+
+    def _checkout(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self._opened < self.pool_size:
+                self._opened += 1
+                return self._connect()
+        try:
+            return self._pool.get(timeout=self.busy_timeout * 6)
+        except queue.Empty:
+            raise sqlite3.OperationalError("connection pool exhausted") from None
+
+    @contextmanager
+    def connection(self):
+        """Connection bound to the calling thread for the duration of the block."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+        conn = self._checkout()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    def read(self):
+        return self.connection()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the block in one ``BEGIN IMMEDIATE`` transaction, committed on success.
+        Nested blocks join the outer transaction.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def query(self, sql, params=()):
+        """Run a read query and return all rows."""
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def query_value(self, sql, params=(), default=None):
+        row = self.query_one(sql, params)
+        return row[0] if row is not None and row[0] is not None else default
+
+    # -- grouped writes ----------------------------------------------------
+
+    def write(self, sql, params=(), wait=True):
+        """Queue one statement for the writer thread. Returns the affected row count when waiting."""
+        return self.write_many([(sql, params)], wait=wait)
+
+    def write_many(self, statements, wait=True):
+        """Queue statements that must commit atomically together."""
+        if getattr(self._local, "conn", None) is not None and self._local.conn.in_transaction:
+            # Inside an explicit transaction: run inline so the caller's transaction sees it
+            conn = self._local.conn
+            return sum(max(conn.execute(sql, params).rowcount, 0) for sql, params in statements)
+        pending = _PendingWrite(list(statements))
+        self._ensure_writer()
+        self._writes.put(pending)
+        if not wait:
+            return None
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.rowcount
+
+    def flush(self):
+        """Block until every write queued so far has been committed."""
+        self.write_many([], wait=True)
+
+    def _ensure_writer(self):
+        if self._writer and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(target=self._writer_loop, name="remoteinfra-db-writer", daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self):
+        conn = self._connect()
+        while True:
+            first = self._writes.get()
+            if first is None:
+                break
+            batch = [first]
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._writes.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._writes.put(None)
+                    break
+                batch.append(item)
+            self._commit_batch(conn, batch)
+        conn.close()
+
+    def _commit_batch(self, conn, batch):
+        try:
+            self._apply_batch(conn, batch)
+        except Exception as e:
+            # BEGIN, a savepoint or COMMIT itself failed (locked, disk full, ...). The whole group
+            # is rolled back and fails, but the thread lives on for the writes queued after it
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                pass
+            for pending in batch:
+                pending.error = e
+        finally:
+            for pending in batch:
+                pending.done.set()
+
+    def _apply_batch(self, conn, batch):
+        for attempt in range(3):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                break
+            except sqlite3.OperationalError:
+                # Busy beyond busy_timeout; back off briefly and try again
+                if attempt == 2:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+        for pending in batch:
+            # A savepoint per write keeps one bad statement from failing the whole group
+            conn.execute("SAVEPOINT w")
+            try:
+                rowcount = 0
+                for sql, params in pending.statements:
+                    rowcount += max(conn.execute(sql, params).rowcount, 0)
+                pending.rowcount = rowcount
+                conn.execute("RELEASE w")
+            except Exception as e:
+                conn.execute("ROLLBACK TO w")
+                conn.execute("RELEASE w")
+                pending.error = e
+        conn.commit()
+        self.batches += 1
+        self.batched_writes += len(batch)
+
+    # -- space management --------------------------------------------------
+
+    def space(self):
+        """Page counts of the database file, in pages and bytes."""
+        with self.connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        return {
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_count": freelist,
+            "size_bytes": page_count * page_size,
+            "free_bytes": freelist * page_size,
+            "auto_vacuum": {0: "none", 1: "full", 2: "incremental"}.get(auto_vacuum, auto_vacuum),
+        }
+
+    def incremental_vacuum(self, pages):
+        """
+        Return up to ``pages`` free pages to the file system in one short write transaction.
+        Returns the number of pages released (always 0 unless auto_vacuum is incremental).
+        """
+        with self.connection() as conn:
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # executescript steps the pragma to completion; execute() would free a single page
+            conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            return before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def vacuum(self):
+        """
+        Rebuild the whole file with a blocking ``VACUUM``, also switching an existing database
+        to the configured ``auto_vacuum`` mode.
+        """
+        self.flush()
+        with self.connection() as conn:
+            if self.auto_vacuum:
+                conn.execute(f"PRAGMA auto_vacuum={self.auto_vacuum}")
+            conn.execute("VACUUM")
+
+    def checkpoint(self):
+        """Copy the WAL back into the database file and truncate it."""
+        with self.connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def close(self):
+        """Stop the writer (after draining queued writes) and close pooled connections."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer and self._writer.is_alive():
+            self._writes.put(None)
+            self._writer.join(timeout=self.busy_timeout * 2)
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "pool_size": self.pool_size,
+            "open_connections": self._opened,
+            "idle_connections": self._pool.qsize(),
+            "pending_writes": self._writes.qsize(),
+            "write_batches": self.batches,
+            "batched_writes": self.batched_writes,
+            "avg_batch_size": round(self.batched_writes / self.batches, 2) if self.batches else 0,
+        }
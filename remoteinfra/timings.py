@@ -0,0 +1,182 @@
+import datetime
+import math
+import time
+
+# Watchdog states folded into each timing metric; whatever else an execution did after leaving
+# the queue counts as "run"
+STATE_METRICS = {
+    "queued": "queue_wait",
+    "connecting": "connect",
+    "transferring": "transfer",
+}
+IGNORED_STATES = ("retry_backoff", "pending", "finished")
+METRICS = ("queue_wait", "connect", "transfer", "run", "total")
+
+
+class TimingStore:
+    """
+    Per-host execution timings as bounded, downsampled histograms.
+
+    Every finished execution adds one sample per metric (queue wait, connect, transfer, run,
+    total) to the series ``(host, type, metric)``. Samples are not stored individually; each
+    lands in a log-scale bin (ratio ``2 ** (1 / 8)``, so percentiles are within about 5%) of a
+    minute, an hour and a day bucket. Each resolution is a ring: minute buckets are kept for
+    a day, hour buckets for 30 days and day buckets for a year, so the table size depends on
+    the number of series and retention, not on the number of executions. A percentile query
+    reads the finest resolution that still covers its window.
+    """
+
+    MIN_VALUE = 0.001  # seconds; faster samples share bin 0
+    RATIO = 2 ** (1 / 8)
+    LEVELS = (
+        # (name, bucket format, seconds kept)
+        ("minute", "%Y-%m-%d %H:%M", 86400),
+        ("hour", "%Y-%m-%d %H", 30 * 86400),
+        ("day", "%Y-%m-%d", 365 * 86400),
+    )
+
+    def __init__(self, storage, prune_interval=600):
+        self.storage = storage
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+
+    @staticmethod
+    def create_schema(c):
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS execution_timings (
+                level TEXT,
+                bucket TEXT,
+                host TEXT,
+                type TEXT,
+                metric TEXT,
+                bin INTEGER,
+                count INTEGER DEFAULT 0,
+                PRIMARY KEY (level, host, type, metric, bucket, bin)
+            )
+        """)
+        c.execute("CREATE INDEX IF NOT EXISTS ix_execution_timings_bucket ON execution_timings (level, bucket)")
+
+    @classmethod
+    def to_bin(cls, value):
+        if value < cls.MIN_VALUE:
+            return 0
+        return int(math.floor(math.log(value / cls.MIN_VALUE, cls.RATIO))) + 1
+
+    @classmethod
+    def from_bin(cls, index):
+        """Representative value (geometric middle) of a bin."""
+        if index <= 0:
+            return 0.0
+        return cls.MIN_VALUE * cls.RATIO ** (index - 0.5)
+
+    @staticmethod
+    def metrics_from_states(states, total):
+        """Split a watch's time-in-state report into the timing metrics."""
+        metrics = {"queue_wait": 0.0, "connect": 0.0, "transfer": 0.0, "run": 0.0}
+        for name, seconds in states.items():
+            if name in IGNORED_STATES:
+                continue
+            metrics[STATE_METRICS.get(name, "run")] += seconds
+        metrics["total"] = total if total is not None else sum(metrics.values())
+        return metrics
+
+    def record_statements(self, host, execution_type, metrics, when=None):
+        """Statements adding one execution's metrics to every resolution."""
+        when = when or datetime.datetime.utcnow()
+        statements = []
+        for metric, value in metrics.items():
+            if value is None:
+                continue
+            index = self.to_bin(max(0.0, float(value)))
+            for level, fmt, _ in self.LEVELS:
+                statements.append((
+                    "INSERT INTO execution_timings (level, bucket, host, type, metric, bin, count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 1) "
+                    "ON CONFLICT (level, host, type, metric, bucket, bin) DO UPDATE SET count = count + 1",
+                    (level, when.strftime(fmt), host or "", execution_type or "", metric, index),
+                ))
+        return statements
+
+    def _level_for(self, window):
+        for level, fmt, kept in self.LEVELS:
+            if window <= kept:
+                return level, fmt
+        return self.LEVELS[-1][0], self.LEVELS[-1][1]
+
+    @classmethod
+    def summarize(cls, bins, percentiles=(50, 90, 99)):
+        """Count, mean and percentiles of ``[(bin, count)]`` sorted by bin."""
+        total = sum(count for _, count in bins)
+        if not total:
+            return {"count": 0}
+        summary = {
+            "count": total,
+            "mean": round(sum(cls.from_bin(index) * count for index, count in bins) / total, 4),
+            "max": round(cls.from_bin(bins[-1][0]), 4),
+        }
+        for p in percentiles:
+            rank = max(1, math.ceil(p / 100 * total))
+            seen = 0
+            for index, count in bins:
+                seen += count
+                if seen >= rank:
+                    summary[f"p{p}"] = round(cls.from_bin(index), 4)
+                    break
+        return summary
+
+    def percentiles(self, window=86400, host=None, execution_type=None, metric=None, group_by=("host", "type")):
+        """
+        p50/p90/p99 per group over the last ``window`` seconds. ``group_by`` may contain
+        "host" and "type"; the metric is always a grouping key.
+        """
+        level, fmt = self._level_for(window)
+        since = (datetime.datetime.utcnow() - datetime.timedelta(seconds=window)).strftime(fmt)
+        keys = [key for key in ("host", "type") if key in group_by] + ["metric"]
+        query = (f"SELECT {', '.join(keys)}, bin, SUM(count) AS count FROM execution_timings "
+                 f"WHERE level = ? AND bucket >= ?")
+        params = [level, since]
+        for column, value in (("host", host), ("type", execution_type), ("metric", metric)):
+            if value:
+                query += f" AND {column} = ?"
+                params.append(value)
+        query += f" GROUP BY {', '.join(keys)}, bin ORDER BY {', '.join(keys)}, bin"
+        groups = {}
+        for row in self.storage.query(query, params):
+            group = tuple(row[key] for key in keys)
+            groups.setdefault(group, []).append((row["bin"], row["count"]))
+        results = []
+        for group, bins in groups.items():
+            entry = dict(zip(keys, group))
+            entry.update(self.summarize(bins))
+            results.append(entry)
+        return {"window": window, "resolution": level, "series": results}
+
+    def series(self, metric, window=7 * 86400, resolution="hour", host=None, execution_type=None):
+        """Percentiles of one metric per bucket, oldest first, to spot regressions over time."""
+        fmt = {level: fmt for level, fmt, _ in self.LEVELS}.get(resolution)
+        if fmt is None:
+            raise ValueError(f"resolution must be one of: {', '.join(l for l, _, _ in self.LEVELS)}")
+        since = (datetime.datetime.utcnow() - datetime.timedelta(seconds=window)).strftime(fmt)
+        query = ("SELECT bucket, bin, SUM(count) AS count FROM execution_timings "
+                 "WHERE level = ? AND bucket >= ? AND metric = ?")
+        params = [resolution, since, metric]
+        for column, value in (("host", host), ("type", execution_type)):
+            if value:
+                query += f" AND {column} = ?"
+                params.append(value)
+        buckets = {}
+        for row in self.storage.query(query + " GROUP BY bucket, bin ORDER BY bucket, bin", params):
+            buckets.setdefault(row["bucket"], []).append((row["bin"], row["count"]))
+        return [dict(bucket=bucket, **self.summarize(bins)) for bucket, bins in buckets.items()]
+
+    def maybe_prune(self):
+        """Drop buckets that fell out of their ring, at most every ``prune_interval`` seconds."""
+        if time.time() - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = time.time()
+        now = datetime.datetime.utcnow()
+        self.storage.write_many([
+            ("DELETE FROM execution_timings WHERE level = ? AND bucket < ?",
+             (level, (now - datetime.timedelta(seconds=kept)).strftime(fmt)))
+            for level, fmt, kept in self.LEVELS
+        ], wait=False)
@@ -5,15 +5,35 @@ import threading
 class UnableToConnect(Exception):
     pass
 
+class NetworkError(UnableToConnect):
+    """
+    Transport-level connection failure (refused, reset, unreachable, timed out), usually transient.
+    """
+    pass
+
 class AuthenticationFailed(Exception):
     pass
 
+class RemoteCommandFailed(Exception):
+    """
+    A remote command ran to completion but exited with a non-zero status.
+    """
+    def __init__(self, message, exit_status=None):
+        super().__init__(message)
+        self.exit_status = exit_status
+
 class SSHException(Exception):
     """
     Exception raised by failures in SSH2 protocol negotiation or logic errors.
     """
     pass
 
+class CommandTimeout(Exception):
+    """
+    A command or execution was stopped because its timeout or deadline passed.
+    """
+    pass
+
 class Singleton(type):
     _instances = {}
     _lock = threading.Lock()  # Ensure thread-safety during instance creation
@@ -0,0 +1,364 @@
+import itertools
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from . import livelog
+
+_local = threading.local()
+
+
+class Watch:
+    """
+    Deadline and state timeline of one execution or step.
+
+    Resources registered with ``add_resource`` (channel/connection closers, subprocess killers)
+    are torn down when the deadline passes or the watch is expired explicitly, which is what
+    unblocks the worker thread. Child watches (e.g. pipeline steps) expire with their parent.
+    """
+
+    def __init__(self, watchdog, key, label=None, timeout=None, parent=None, state="pending"):
+        self.watchdog = watchdog
+        self.key = key
+        self.label = label or key
+        self.parent = parent
+        self.children = []
+        self.created_at = time.time()
+        self.timeout = None
+        self.deadline = None
+        self.state = state
+        self.state_since = self.created_at
+        self.time_in_state = {}
+        self.expired = False
+        self.expired_reason = None
+        self.expired_in_state = None
+        self.finished_at = None
+        self._resources = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        if timeout:
+            self.set_deadline(timeout)
+
+    def set_deadline(self, timeout):
+        """Start (or restart) the deadline ``timeout`` seconds from now; None removes it."""
+        self.timeout = timeout
+        self.deadline = time.time() + timeout if timeout else None
+
+    def enter(self, state):
+        """Record a state transition for time-in-state reporting."""
+        now = time.time()
+        with self._lock:
+            self.time_in_state[self.state] = self.time_in_state.get(self.state, 0.0) + (now - self.state_since)
+            self.state = state
+            self.state_since = now
+
+    def remaining(self):
+        """Seconds until the nearest deadline of this watch or its parents, or None."""
+        deadlines = []
+        watch = self
+        while watch is not None:
+            if watch.deadline:
+                deadlines.append(watch.deadline)
+            watch = watch.parent
+        return max(0.0, min(deadlines) - time.time()) if deadlines else None
+
+    def add_resource(self, closer):
+        """Register ``closer()`` to run on expiry. Returns a token for ``remove_resource``."""
+        with self._lock:
+            if self.expired:
+                expired = True
+            else:
+                expired = False
+                token = next(self._ids)
+                self._resources[token] = closer
+        if expired:
+            # Already past the deadline; tear the new resource down right away
+            _safe_close(closer)
+            return None
+        return token
+
+    def remove_resource(self, token):
+        if token is None:
+            return
+        with self._lock:
+            self._resources.pop(token, None)
+
+    def child(self, name, timeout=None, label=None):
+        watch = self.watchdog.watch(f"{self.key}/{name}", timeout=timeout, label=label or name, parent=self)
+        with self._lock:
+            self.children.append(watch)
+        return watch
+
+    def expire(self, reason="deadline"):
+        """Mark the watch expired and tear down its resources and those of its children."""
+        with self._lock:
+            if self.expired or self.finished_at:
+                return False
+            self.expired = True
+            self.expired_reason = reason
+            self.expired_in_state = self.state
+            resources = list(self._resources.values())
+            self._resources.clear()
+            children = list(self.children)
+        print(f"Watchdog: {self.label} expired ({reason}) in state '{self.expired_in_state}'")
+        for closer in resources:
+            _safe_close(closer)
+        for child in children:
+            child.expire(reason)
+        return True
+
+    def finish(self, state="finished"):
+        self.enter(state)
+        with self._lock:
+            self.finished_at = time.time()
+            self._resources.clear()
+        self.watchdog._release(self)
+
+    @contextmanager
+    def bind(self):
+        """Make this the current watch of the calling thread."""
+        previous = getattr(_local, "watch", None)
+        _local.watch = self
+        try:
+            yield self
+        finally:
+            _local.watch = previous
+
+    def snapshot(self):
+        now = self.finished_at or time.time()
+        with self._lock:
+            states = dict(self.time_in_state)
+            if not self.finished_at:
+                states[self.state] = states.get(self.state, 0.0) + (now - self.state_since)
+            return {
+                "key": self.key,
+                "label": self.label,
+                "state": self.state,
+                "time_in_state": round(now - self.state_since, 3),
+                "states": {k: round(v, 3) for k, v in states.items()},
+                "elapsed": round(now - self.created_at, 3),
+                "timeout": self.timeout,
+                "deadline_in": round(self.deadline - time.time(), 3) if self.deadline and not self.finished_at else None,
+                "expired": self.expired,
+                "expired_reason": self.expired_reason,
+                "expired_in_state": self.expired_in_state,
+                "finished": bool(self.finished_at),
+                "resources": len(self._resources),
+            }
+
+
+class Watchdog:
+    """
+    Background thread enforcing deadlines of registered watches.
+
+    The checker thread starts lazily with the first watch. Finished watches are kept in a
+    bounded history so time-in-state of recent executions can still be inspected.
+    """
+
+    def __init__(self, interval=1.0, history=200, on_expire=None):
+        self.interval = interval
+        self.on_expire = on_expire
+        self._watches = OrderedDict()
+        self._finished = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, key, timeout=None, label=None, parent=None, state="pending"):
+        watch = Watch(self, key, label, timeout, parent, state)
+        with self._lock:
+            self._watches[key] = watch
+        self.start()
+        return watch
+
+    def get(self, key):
+        with self._lock:
+            watch = self._watches.get(key)
+            if watch is None:
+                watch = next((w for w in self._finished if w.key == key), None)
+            return watch
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="remoteinfra-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _release(self, watch):
+        with self._lock:
+            if self._watches.get(watch.key) is watch:
+                del self._watches[watch.key]
+                self._finished.append(watch)
+
+    def check(self):
+        """Expire every watch whose deadline has passed; returns the expired watches."""
+        now = time.time()
+        with self._lock:
+            overdue = [w for w in self._watches.values() if w.deadline and w.deadline <= now and not w.expired]
+        for watch in overdue:
+            if watch.expire("deadline") and self.on_expire:
+                try:
+                    self.on_expire(watch)
+                except Exception as e:
+                    print(f"Watchdog expiry handler error: {e}")
+        return overdue
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def report(self, include_finished=True):
+        """Time-in-state snapshots of active (and recently finished) watches."""
+        with self._lock:
+            active = list(self._watches.values())
+            finished = list(self._finished) if include_finished else []
+        return {
+            "active": [w.snapshot() for w in active],
+            "finished": [w.snapshot() for w in reversed(finished)],
+        }
+
+
+def _safe_close(closer):
+    try:
+        closer()
+    except Exception as e:
+        print(f"Watchdog: error tearing down resource: {e}")
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_watchdog():
+    """Process-wide watchdog used when no other one is supplied."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Watchdog()
+        return _default
+
+
+def current():
+    """The watch bound to the calling thread, if any."""
+    return getattr(_local, "watch", None)
+
+
+def enter_state(state):
+    watch = current()
+    if watch:
+        watch.enter(state)
+
+
+@contextmanager
+def state(name):
+    """Spend the block in state ``name`` of the current watch, then return to the previous state."""
+    watch = current()
+    if watch is None:
+        yield
+        return
+    previous = watch.state
+    watch.enter(name)
+    try:
+        yield
+    finally:
+        watch.enter(previous)
+
+
+def remaining(default=None):
+    """Seconds left before the current deadline, or ``default`` when there is none."""
+    watch = current()
+    left = watch.remaining() if watch else None
+    if left is None:
+        return default
+    return left if default is None else min(default, left)
+
+
+def register(closer, watch=None):
+    """
+    Tie a resource to the current (or given) watch. Returns a function that unregisters it;
+    call that once the resource has been released normally.
+    """
+    watch = watch or current()
+    if watch is None:
+        return lambda: None
+    token = watch.add_resource(closer)
+    return lambda: watch.remove_resource(token)
+
+
+def kill_process_tree(proc):
+    """Kill a subprocess started with ``start_new_session=True`` together with its children."""
+    if proc.poll() is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        proc.kill()
+
+
+def _communicate_live(proc, timeout, log):
+    """``proc.communicate()`` that also appends each line to ``log`` as it is read."""
+    collected = {"stdout": [], "stderr": []}
+
+    def pump(pipe, stream):
+        for line in iter(pipe.readline, ""):
+            collected[stream].append(line)
+            log.append(line, stream)
+        pipe.close()
+
+    readers = [threading.Thread(target=pump, args=(pipe, stream), daemon=True)
+               for pipe, stream in ((proc.stdout, "stdout"), (proc.stderr, "stderr")) if pipe is not None]
+    for reader in readers:
+        reader.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(proc)
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+    return "".join(collected["stdout"]), "".join(collected["stderr"]) if proc.stderr is not None else None
+
+
+def run_process(cmd, timeout=None, **kwargs):
+    """
+    ``subprocess.run`` with output captured as text, bounded by ``timeout`` and the current
+    deadline. The whole process group is killed on expiry so shell pipelines do not linger.
+    Raises ``subprocess.TimeoutExpired`` like ``subprocess.run``. Inside an execution with a
+    live log the output is forwarded to it line by line while the process runs.
+    """
+    timeout = remaining(timeout)
+    log = livelog.current()
+    kwargs.setdefault("stdout", subprocess.PIPE)
+    kwargs.setdefault("stderr", subprocess.PIPE)
+    kwargs.setdefault("text", True)
+    if os.name == "posix":
+        kwargs.setdefault("start_new_session", True)
+    proc = subprocess.Popen(cmd, **kwargs)
+    unregister = register(lambda: kill_process_tree(proc))
+    try:
+        if log is not None and kwargs["text"] and kwargs["stdout"] is subprocess.PIPE:
+            stdout, stderr = _communicate_live(proc, timeout, log)
+        else:
+            stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(proc)
+        proc.communicate()
+        raise
+    finally:
+        unregister()
+    watch = current()
+    if watch and watch.expired:
+        raise subprocess.TimeoutExpired(cmd, watch.timeout or 0, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)